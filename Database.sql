@@ -238,6 +238,31 @@ INSERT INTO `board_probation_extension` VALUES (3,3,'pending',NULL,NULL,NULL);
 /*!40000 ALTER TABLE `board_probation_extension` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `cache_versions`
+--
+
+DROP TABLE IF EXISTS `cache_versions`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `cache_versions` (
+  `name` varchar(50) NOT NULL,
+  `version` int NOT NULL DEFAULT '1',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `cache_versions`
+--
+
+LOCK TABLES `cache_versions` WRITE;
+/*!40000 ALTER TABLE `cache_versions` DISABLE KEYS */;
+INSERT INTO `cache_versions` (`name`, `version`) VALUES ('catalog',1),('curriculum',1),('parameters',1),('timetable',1);
+/*!40000 ALTER TABLE `cache_versions` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `course_elective_groups`
 --
@@ -264,6 +289,63 @@ LOCK TABLES `course_elective_groups` WRITE;
 INSERT INTO `course_elective_groups` VALUES (1,96,1),(2,101,1),(3,97,2),(4,102,2),(5,98,3),(6,103,3),(7,99,4),(8,104,4),(9,100,5),(10,105,5),(11,46,6),(12,50,6),(13,106,6),(14,94,7),(15,95,7),(16,50,7),(17,106,7),(18,84,7);
 /*!40000 ALTER TABLE `course_elective_groups` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_elective_groups_insert` AFTER INSERT ON `course_elective_groups` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_elective_groups_update` AFTER UPDATE ON `course_elective_groups` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_elective_groups_delete` AFTER DELETE ON `course_elective_groups` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `course_prerequisites`
@@ -293,6 +375,63 @@ LOCK TABLES `course_prerequisites` WRITE;
 INSERT INTO `course_prerequisites` VALUES (2,12,4),(1,13,6),(5,15,9),(6,17,11),(3,19,12),(4,25,19),(7,28,15),(8,29,9),(9,30,9),(10,31,9),(11,32,29),(12,33,15),(13,34,9),(14,34,20),(15,35,31),(16,37,2),(17,38,17),(18,39,17),(19,40,23),(20,41,39),(21,42,39),(22,43,38),(23,44,24),(24,45,24),(25,46,16),(26,47,24),(27,48,24),(28,49,24),(29,50,24),(30,51,20),(31,52,14),(32,53,26),(33,55,54),(34,56,54),(35,57,52),(36,59,22),(37,60,22),(38,61,22),(39,62,22),(40,63,22),(41,64,22),(42,65,22),(43,66,10),(44,66,16),(45,69,21),(46,69,22),(47,69,23),(48,69,24),(49,70,58),(50,71,56),(51,72,55),(57,74,23),(58,76,21),(59,76,23),(53,77,17),(52,77,22),(54,78,22),(55,79,22),(56,80,22),(65,81,32),(66,82,32),(67,83,32),(68,84,35),(60,85,24),(61,86,44),(62,87,44),(63,88,17),(64,88,48),(69,89,10),(70,89,16),(71,95,24);
 /*!40000 ALTER TABLE `course_prerequisites` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_prerequisites_insert` AFTER INSERT ON `course_prerequisites` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached prerequisite graph
+    INSERT INTO cache_versions (name, version) VALUES ('curriculum', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_prerequisites_update` AFTER UPDATE ON `course_prerequisites` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached prerequisite graph
+    INSERT INTO cache_versions (name, version) VALUES ('curriculum', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_prerequisites_delete` AFTER DELETE ON `course_prerequisites` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached prerequisite graph
+    INSERT INTO cache_versions (name, version) VALUES ('curriculum', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `course_sessions`
@@ -319,6 +458,63 @@ LOCK TABLES `course_sessions` WRITE;
 INSERT INTO `course_sessions` (`course_code`, `lecture_sessions`, `tutorial_sessions`) VALUES ('BA 350',2,1),('BCOR 111',2,1),('BCOR 130',2,1),('BCOR 140',2,1),('BCOR 150',2,1),('BCOR 200',2,0),('BCOR 210',2,0),('BCOR 230',2,1),('BCOR 260',2,1),('CS 120',2,0),('CS 220',2,0),('NBC 120',2,0),('NBC 130',1,0),('NBC 210',2,0);
 /*!40000 ALTER TABLE `course_sessions` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_sessions_insert` AFTER INSERT ON `course_sessions` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_sessions_update` AFTER UPDATE ON `course_sessions` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_course_sessions_delete` AFTER DELETE ON `course_sessions` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `courses`
@@ -421,6 +617,63 @@ LOCK TABLES `elective_group_requirements` WRITE;
 INSERT INTO `elective_group_requirements` VALUES (1,6,1,1,NULL,NULL),(2,1,1,1,NULL,NULL),(3,2,1,1,NULL,NULL),(4,3,1,1,NULL,NULL),(5,4,1,1,NULL,NULL),(6,7,2,1,'96,97,98,99,100',3),(7,5,1,1,NULL,1);
 /*!40000 ALTER TABLE `elective_group_requirements` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_elective_group_requirements_insert` AFTER INSERT ON `elective_group_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_elective_group_requirements_update` AFTER UPDATE ON `elective_group_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_elective_group_requirements_delete` AFTER DELETE ON `elective_group_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `forgiveness_requests`
@@ -518,6 +771,63 @@ LOCK TABLES `major_course_requirements` WRITE;
 INSERT INTO `major_course_requirements` VALUES (1,'BCOR 130','Financial Accounting',3.00,NULL,1),(2,'BCOR 225','Managerial Accounting',3.00,NULL,1),(3,'BCOR 110','Calculus for Business',3.00,NULL,2),(4,'BCOR 111','Linear Algebra for Business',3.00,NULL,2),(5,'BCOR 150','Probability & Statistics for Business I',3.00,NULL,2),(6,'BCOR 230','Business Optimization',3.00,NULL,2),(7,'BCOR 250','Probability and Statistics for Business II',3.00,NULL,2),(8,'BCOR 130','Financial Accounting',3.00,NULL,3),(9,'BCOR 150','Probability & Statistics for Business I',3.00,NULL,3),(10,'BCOR 250','Probability and Statistics for Business II',3.00,NULL,3),(11,'BCOR 260','Principles of Finance',3.00,NULL,3),(12,'BCOR 200','Introduction to Management of Information Systems (MIS)',3.00,NULL,4),(13,'CS 100','Algorithms and Initiation to Programming',3.00,NULL,4),(14,'CS 120','Database Design and Management',3.00,NULL,4),(15,'CS 200','Information System Analysis and Databases',3.00,NULL,4),(16,'CS 220','Advanced Web Development',3.00,NULL,4),(17,'BCOR 120','English Communication Skills',2.00,NULL,5),(18,'BCOR 150','Probability & Statistics for Business I',3.00,NULL,5),(19,'BCOR 210','Fundamentals of Marketing',3.00,2.00,5);
 /*!40000 ALTER TABLE `major_course_requirements` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_major_course_requirements_insert` AFTER INSERT ON `major_course_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_major_course_requirements_update` AFTER UPDATE ON `major_course_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_major_course_requirements_delete` AFTER DELETE ON `major_course_requirements` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `major_minor_requests`
@@ -608,6 +918,63 @@ LOCK TABLES `majors` WRITE;
 INSERT INTO `majors` VALUES (1,'ACCT','Accounting'),(2,'BA','Business Analytics'),(3,'FIN','Finance'),(4,'IT','Information Technology'),(5,'MRK','Marketing');
 /*!40000 ALTER TABLE `majors` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_majors_insert` AFTER INSERT ON `majors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_majors_update` AFTER UPDATE ON `majors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_majors_delete` AFTER DELETE ON `majors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `makeup_session`
@@ -665,6 +1032,63 @@ LOCK TABLES `minors` WRITE;
 INSERT INTO `minors` VALUES (1,'ACCT','Accounting'),(2,'BA','Business Analytics'),(3,'FIN','Finance'),(4,'IT','Information Technology'),(5,'MRK','Marketing'),(6,'IBE','International Business Economics');
 /*!40000 ALTER TABLE `minors` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_minors_insert` AFTER INSERT ON `minors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_minors_update` AFTER UPDATE ON `minors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_minors_delete` AFTER DELETE ON `minors` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached curriculum catalog
+    INSERT INTO cache_versions (name, version) VALUES ('catalog', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `parameter_changes_log`
@@ -852,6 +1276,63 @@ LOCK TABLES `schedule` WRITE;
 INSERT INTO `schedule` VALUES (1,'BCOR 150','Monday','08:30:00','10:00:00','D. Myriam','S32','F.1','tutorial',4,3,1,1,1,NULL),(2,'CS 120','Monday','10:00:00','11:30:00','M.Ilahi+chalghoun','Lab1+2','F.1','lecture',9,1,2,6,NULL,6),(3,'CS 120','Monday','11:30:00','13:00:00','M.Ilahi+chalghoun','Lab1+2','F.1','lecture',9,2,3,6,NULL,6),(4,'BCOR 130','Tuesday','10:00:00','11:30:00','Marwa Tlili','A9','F.1','tutorial',2,3,7,2,1,NULL),(5,'NBC 130','Tuesday','11:30:00','13:00:00','Ben alaya K.','S10','F.1','lecture',12,1,8,1,NULL,1),(6,'NBC 120','Tuesday','13:30:00','15:00:00','L. Mezghani','S11','F.1','lecture',11,1,9,3,NULL,3),(7,'NBC 120','Tuesday','15:00:00','16:30:00','L. Mezghani','S11','F.1','lecture',11,2,10,3,NULL,3),(8,'BCOR 111','Wednesday','10:00:00','11:30:00','I. Rassas','A8','F.1','lecture',1,1,12,3,NULL,3),(9,'BCOR 111','Wednesday','11:30:00','13:00:00','I. Rassas','A8','F.1','lecture',1,2,13,3,NULL,3),(10,'BCOR 150','Thursday','11:30:00','13:00:00','A. Dridi','A6','F.1','lecture',4,1,18,1,NULL,1),(11,'BCOR 140','Thursday','13:30:00','15:00:00','H. Medyouni','S10','F.1','tutorial',3,3,19,1,1,NULL),(12,'BCOR 111','Thursday','15:00:00','16:30:00','F. Fourati','S13','F.1','tutorial',1,3,20,1,1,NULL),(13,'BCOR 140','Friday','08:30:00','10:00:00','N. Khraief','A5','F.1','lecture',3,1,21,2,NULL,2),(14,'BCOR 140','Friday','10:00:00','11:30:00','N. Khraief','A5','F.1','lecture',3,2,22,2,NULL,2),(15,'BCOR 150','Friday','11:30:00','13:00:00','A. Dridi','A6','F.1','lecture',4,2,23,1,NULL,1),(16,'BCOR 130','Friday','13:30:00','15:00:00','Nejia Moumen','A6','F.1','lecture',2,1,24,4,NULL,4),(17,'BCOR 130','Friday','15:00:00','16:30:00','Nejia Moumen','A6','F.1','lecture',2,2,25,4,NULL,4),(18,'BCOR 140','Thursday','08:30:00','10:00:00','H. Medyouni','S11','F.2','tutorial',3,3,16,1,1,NULL),(19,'CS 120','Thursday','10:00:00','11:30:00','K.Safi+H.Alaya','Lab1+Lab6','F.2','lecture',9,1,17,3,NULL,3),(20,'CS 120','Thursday','11:30:00','13:00:00','K.Safi+H.Alaya','Lab1+Lab6','F.2','lecture',9,2,18,3,NULL,3),(21,'BCOR 130','Thursday','13:30:00','15:00:00','Marwa Tlili','S6','F.2','tutorial',2,3,19,2,1,NULL),(22,'BCOR 150','Monday','10:00:00','11:30:00','D. Myriam','S12','F.2','tutorial',4,3,2,1,1,NULL),(23,'BCOR 111','Monday','11:30:00','13:00:00','R. Ammar Ayachi','S8','F.2','tutorial',1,3,3,4,19,NULL),(24,'NBC 120','Monday','13:30:00','15:00:00','L. Mezghani','S5','F.2','lecture',11,1,4,3,NULL,3),(25,'NBC 120','Monday','15:00:00','16:30:00','L. Mezghani','S5','F.2','lecture',11,2,5,3,NULL,3),(26,'BCOR 140','Tuesday','10:00:00','11:30:00','S. Jouini','A4','F.2','lecture',3,1,7,4,NULL,4),(27,'BCOR 140','Tuesday','11:30:00','13:00:00','S. Jouini','A4','F.2','lecture',3,2,8,4,NULL,4),(28,'NBC 130','Tuesday','13:30:00','15:00:00','Eva Gmati','S2','F.2','lecture',12,1,9,3,NULL,3),(29,'BCOR 150','Wednesday','10:00:00','11:30:00','A. Messaoud','A7','F.2','lecture',4,1,12,2,NULL,2),(30,'BCOR 150','Wednesday','11:30:00','13:00:00','A. Messaoud','A7','F.2','lecture',4,2,13,2,NULL,2),(31,'BCOR 111','Friday','08:30:00','10:00:00','I. Rassas','A8','F.2','lecture',1,1,21,3,NULL,3),(32,'BCOR 111','Friday','10:00:00','11:30:00','I. Rassas','A8','F.2','lecture',1,2,22,3,NULL,3),(33,'BCOR 130','Friday','13:30:00','15:00:00','Nejia Moumen','A9','F.2','lecture',2,1,24,4,NULL,4),(34,'BCOR 130','Friday','15:00:00','16:30:00','Nejia Moumen','A9','F.2','lecture',2,2,25,4,NULL,4),(35,'BCOR 130','Monday','08:30:00','10:00:00','A. ZRIBI','A9','F.3','tutorial',2,3,1,1,1,NULL),(36,'BCOR 140','Monday','10:00:00','11:30:00','S. Asma','S9','F.3','tutorial',3,3,2,2,13,NULL),(37,'BCOR 150','Monday','11:30:00','13:00:00','R. Aloui','A4','F.3','lecture',4,1,3,3,NULL,3),(38,'NBC 120','Monday','13:30:00','15:00:00','A. Mejri','S7','F.3','lecture',11,1,4,1,NULL,1),(39,'BCOR 111','Tuesday','11:30:00','13:00:00','R. Ammar Ayachi','S3','F.3','tutorial',1,3,8,4,19,NULL),(40,'BCOR 150','Tuesday','13:30:00','15:00:00','R. Aloui','A3','F.3','lecture',4,2,9,3,NULL,3),(41,'NBC 120','Tuesday','15:00:00','16:30:00','A. Mejri','S13','F.3','lecture',11,2,10,1,NULL,1),(42,'CS 120','Wednesday','08:30:00','10:00:00','Ons+S.Omri','Lab1+Lab2','F.3','lecture',9,1,11,10,NULL,10),(43,'CS 120','Wednesday','10:00:00','11:30:00','Ons+S.Omri','Lab1+Lab2','F.3','lecture',9,2,12,10,NULL,10),(44,'BCOR 130','Thursday','08:30:00','10:00:00','A. ZRIBI','A6','F.3','lecture',2,1,16,1,NULL,1),(45,'BCOR 130','Thursday','10:00:00','11:30:00','A. ZRIBI','A6','F.3','lecture',2,2,17,1,NULL,1),(46,'BCOR 150','Thursday','11:30:00','13:00:00','Y. Msakni','S12','F.3','tutorial',4,3,18,3,49,NULL),(47,'NBC 130','Friday','08:30:00','10:00:00','Ben alaya K.','S10','F.3','lecture',12,1,21,1,NULL,1),(48,'BCOR 111','Friday','10:00:00','11:30:00','I. Khemir','A4','F.3','lecture',1,1,22,2,NULL,2),(49,'BCOR 111','Friday','11:30:00','13:00:00','I. Khemir','A4','F.3','lecture',1,2,23,2,NULL,2),(50,'BCOR 140','Friday','13:30:00','15:00:00','N. Khraief','A4','F.3','lecture',3,1,24,2,NULL,2),(51,'BCOR 140','Friday','15:00:00','16:30:00','N. Khraief','A4','F.3','lecture',3,2,25,2,NULL,2),(52,'BCOR 111','Monday','08:30:00','10:00:00','R. Ammar Ayachi','S4','F.4','tutorial',1,3,1,4,19,NULL),(53,'NBC 120','Monday','10:00:00','11:30:00','L. Mezghani','S11','F.4','lecture',11,1,2,3,NULL,3),(54,'NBC 120','Monday','11:30:00','13:00:00','L. Mezghani','S11','F.4','lecture',11,2,3,3,NULL,3),(55,'BCOR 130','Monday','13:30:00','15:00:00','A. ZRIBI','A9','F.4','tutorial',2,3,4,1,1,NULL),(56,'NBC 130','Tuesday','10:00:00','11:30:00','Kenz','S10','F.4','lecture',12,1,7,4,NULL,4),(57,'BCOR 140','Tuesday','11:30:00','13:00:00','S. Asma','S6','F.4','tutorial',3,3,8,2,13,NULL),(58,'CS 120','Tuesday','13:30:00','15:00:00','hem+S.Chalghou','Lab1+Lab2','F.4','lecture',9,1,9,2,NULL,2),(59,'CS 120','Tuesday','15:00:00','16:30:00','Sihem+S.Chalghou','Lab1+Lab2','F.4','lecture',9,2,10,11,NULL,11),(60,'BCOR 130','Thursday','08:30:00','10:00:00','A. ZRIBI','A6','F.4','lecture',2,1,16,1,NULL,1),(61,'BCOR 130','Thursday','10:00:00','11:30:00','A. ZRIBI','A6','F.4','lecture',2,2,17,1,NULL,1),(62,'BCOR 150','Thursday','11:30:00','13:00:00','A. Messaoud','A10','F.4','lecture',4,1,18,2,NULL,2),(63,'BCOR 150','Thursday','13:30:00','15:00:00','A. Messaoud','A10','F.4','lecture',4,2,19,2,NULL,2),(64,'BCOR 150','Thursday','15:00:00','16:30:00','Y. Msakni','S12','F.4','tutorial',4,3,20,3,49,NULL),(65,'BCOR 111','Friday','10:00:00','11:30:00','I. Khemir','A4','F.4','lecture',1,1,22,2,NULL,2),(66,'BCOR 111','Friday','11:30:00','13:00:00','I. Khemir','A4','F.4','lecture',1,2,23,2,NULL,2),(67,'BCOR 140','Friday','13:30:00','15:00:00','B. Guizani','A1','F.4','lecture',3,1,24,1,NULL,1),(68,'BCOR 140','Friday','15:00:00','16:30:00','B. Guizani','A1','F.4','lecture',3,2,25,1,NULL,1),(69,'BCOR 130','Monday','10:00:00','11:30:00','Karim Mhedhbi','A5','F.5','lecture',2,1,2,3,NULL,3),(70,'BCOR 130','Monday','11:30:00','13:00:00','Karim Mhedhbi','A5','F.5','lecture',2,2,3,3,NULL,3),(71,'CS 120','Monday','13:30:00','15:00:00','M.Ilahi+S.Chalghoumi','Lab1+4','F.5','lecture',9,1,4,7,NULL,7),(72,'CS 120','Monday','15:00:00','16:30:00','M.Ilahi+S.Chalghoumi','Lab1+4','F.5','lecture',9,2,5,7,NULL,7),(73,'NBC 120','Tuesday','08:30:00','10:00:00','A. Mejri','S1','F.5','lecture',11,1,6,1,NULL,1),(74,'NBC 120','Tuesday','10:00:00','11:30:00','A. Mejri','S1','F.5','lecture',11,2,7,1,NULL,1),(75,'BCOR 140','Tuesday','11:30:00','13:00:00','H. Medyouni','S32','F.5','tutorial',3,3,8,1,1,NULL),(76,'BCOR 130','Tuesday','13:30:00','15:00:00','Yosr Guirat','S9','F.5','tutorial',2,3,9,3,1,NULL),(77,'BCOR 150','Wednesday','10:00:00','11:30:00','A. Messaoud','A7','F.5','lecture',4,1,12,2,NULL,2),(78,'BCOR 150','Wednesday','11:30:00','13:00:00','A. Messaoud','A7','F.5','lecture',4,2,13,2,NULL,2),(79,'BCOR 150','Thursday','10:00:00','11:30:00','H. Bennour','S8','F.5','tutorial',4,3,17,2,17,NULL),(80,'BCOR 111','Thursday','11:30:00','13:00:00','I. Khemir','A4','F.5','lecture',1,1,18,2,NULL,2),(81,'BCOR 111','Thursday','13:30:00','15:00:00','I. Khemir','A4','F.5','lecture',1,2,19,2,NULL,2),(82,'BCOR 140','Friday','08:30:00','10:00:00','N. Khraief','A5','F.5','lecture',3,1,21,2,NULL,2),(83,'BCOR 140','Friday','10:00:00','11:30:00','N. Khraief','A5','F.5','lecture',3,2,22,2,NULL,2),(84,'BCOR 111','Friday','11:30:00','13:00:00','I. Rassas','S12','F.5','tutorial',1,3,23,3,1,NULL),(85,'NBC 130','Friday','13:30:00','15:00:00','Kenz','S10','F.5','lecture',12,1,24,4,NULL,4),(86,'BCOR 130','Monday','10:00:00','11:30:00','Karim Mhedhbi','A5','F.6','lecture',2,1,2,3,NULL,3),(87,'BCOR 130','Monday','11:30:00','13:00:00','Karim Mhedhbi','A5','F.6','lecture',2,2,3,3,NULL,3),(88,'BCOR 130','Monday','13:30:00','15:00:00','Yosr Guirat','S3','F.6','tutorial',2,3,4,3,1,NULL),(89,'NBC 120','Tuesday','10:00:00','11:30:00','L. Mezghani','S4','F.6','lecture',11,1,7,3,NULL,3),(90,'NBC 120','Tuesday','11:30:00','13:00:00','L. Mezghani','S4','F.6','lecture',11,2,8,3,NULL,3),(91,'BCOR 140','Tuesday','13:30:00','15:00:00','S. Asma','S12','F.6','tutorial',3,3,9,2,13,NULL),(92,'BCOR 111','Tuesday','15:00:00','16:30:00','R. Ayachi','S8','F.6','tutorial',1,3,10,5,121,NULL),(93,'BCOR 150','Wednesday','10:00:00','11:30:00','A. Messaoud','A7','F.6','lecture',4,1,12,2,NULL,2),(94,'BCOR 150','Wednesday','11:30:00','13:00:00','A. Messaoud','A7','F.6','lecture',4,2,13,2,NULL,2),(95,'BCOR 150','Thursday','08:30:00','10:00:00','H. Bennour','S13','F.6','tutorial',4,3,16,2,17,NULL),(96,'BCOR 140','Thursday','10:00:00','11:30:00','S. Jouini','A8','F.6','lecture',3,1,17,4,NULL,4),(97,'BCOR 140','Thursday','11:30:00','13:00:00','S. Jouini','A8','F.6','lecture',3,2,18,4,NULL,4),(98,'CS 120','Thursday','13:30:00','15:00:00','Khouloud+Sourour','Lab3+Lab6','F.6','lecture',9,1,19,5,NULL,5),(99,'CS 120','Thursday','15:00:00','16:30:00','Khouloud+Sourour','Lab3+Lab6','F.6','lecture',9,2,20,5,NULL,5),(100,'BCOR 111','Friday','08:30:00','10:00:00','I. Rassas','A8','F.6','lecture',1,1,21,3,NULL,3),(101,'BCOR 111','Friday','10:00:00','11:30:00','I. Rassas','A8','F.6','lecture',1,2,22,3,NULL,3),(102,'NBC 130','Friday','11:30:00','13:00:00','Kenz','S10','F.6','lecture',12,1,23,4,NULL,4),(137,'BCOR 140','Monday','08:30:00','10:00:00','S. Asma','S11','F.7','tutorial',3,3,1,2,13,NULL),(138,'BCOR 111','Monday','10:00:00','11:30:00','R. Ammar Ayachi','S10','F.7','tutorial',1,3,2,4,19,NULL),(139,'BCOR 150','Monday','11:30:00','13:00:00','D. Myriam','S10','F.7','tutorial',4,3,3,1,1,NULL),(140,'NBC 120','Monday','13:30:00','15:00:00','F. Lamloumi','S2','F.7','lecture',11,1,4,2,NULL,2),(141,'NBC 120','Monday','15:00:00','16:30:00','F. Lamloumi','S2','F.7','lecture',11,2,5,2,NULL,2),(142,'NBC 130','Tuesday','10:00:00','11:30:00','Eva Gmati','S2','F.7','lecture',12,1,7,3,NULL,3),(143,'BCOR 130','Tuesday','11:30:00','13:00:00','Marwa Tlili','A8','F.7','tutorial',2,3,8,2,1,NULL),(144,'BCOR 111','Wednesday','10:00:00','11:30:00','I. Rassas','A8','F.7','lecture',1,1,12,3,NULL,3),(145,'BCOR 111','Wednesday','11:30:00','13:00:00','I. Rassas','A8','F.7','lecture',1,2,13,3,NULL,3),(146,'BCOR 140','Thursday','10:00:00','11:30:00','N. Khraief','A8','F.7','lecture',3,1,17,2,NULL,2),(147,'BCOR 140','Thursday','11:30:00','13:00:00','N. Khraief','A8','F.7','lecture',3,2,18,2,NULL,2),(148,'BCOR 150','Thursday','13:30:00','15:00:00','A. Dridi','A6','F.7','lecture',4,1,19,1,NULL,1),(149,'BCOR 150','Thursday','15:00:00','16:30:00','A. Dridi','A6','F.7','lecture',4,2,20,1,NULL,1),(150,'CS 120','Friday','10:00:00','11:30:00','O.Dridi+H.Alaya','Lab1+Lab3','F.7','lecture',9,1,22,9,NULL,9),(151,'CS 120','Friday','11:30:00','13:00:00','O.Dridi+H.Alaya','Lab1+Lab3','F.7','lecture',9,2,23,9,NULL,9),(152,'BCOR 130','Friday','13:30:00','15:00:00','Nejia Moumen','A8','F.7','lecture',2,1,24,4,NULL,4),(153,'BCOR 130','Friday','15:00:00','16:30:00','Nejia Moumen','A8','F.7','lecture',2,2,25,4,NULL,4),(154,'BCOR 111','Monday','10:00:00','11:30:00','F.B.Yahya','A6','F.8','lecture',1,1,2,1,NULL,1),(155,'BCOR 111','Monday','11:30:00','13:00:00','F.B.Yahya','A6','F.8','lecture',1,2,3,1,NULL,1),(156,'BCOR 150','Monday','13:30:00','15:00:00','R. Aloui','A5','F.8','lecture',4,1,4,3,NULL,3),(157,'NBC 130','Tuesday','08:30:00','10:00:00','Kenz','S10','F.8','lecture',12,1,6,4,NULL,4),(158,'BCOR 150','Tuesday','10:00:00','11:30:00','R. Aloui','A3','F.8','lecture',4,2,7,3,NULL,3),(159,'BCOR 150','Tuesday','11:30:00','13:00:00','D. Myriam','S1','F.8','tutorial',4,3,8,1,1,NULL),(160,'BCOR 130','Tuesday','13:30:00','15:00:00','Marwa Tlili','A6','F.8','tutorial',2,3,9,2,1,NULL),(161,'NBC 120','Wednesday','10:00:00','11:30:00','F. Lamloumi','S5','F.8','lecture',11,1,12,2,NULL,2),(162,'NBC 120','Wednesday','11:30:00','13:00:00','F. Lamloumi','S5','F.8','lecture',11,2,13,2,NULL,2),(163,'BCOR 130','Thursday','08:30:00','10:00:00','Anas Ksontini','A8','F.8','lecture',2,1,16,2,NULL,2),(164,'BCOR 130','Thursday','10:00:00','11:30:00','Anas Ksontini','A8','F.8','lecture',2,2,17,2,NULL,2),(165,'BCOR 140','Thursday','11:30:00','13:00:00','H. Medyouni','S7','F.8','tutorial',3,3,18,1,1,NULL),(166,'BCOR 140','Friday','08:30:00','10:00:00','N. Khraief','A5','F.8','lecture',3,1,21,2,NULL,2),(167,'BCOR 140','Friday','10:00:00','11:30:00','N. Khraief','A5','F.8','lecture',3,2,22,2,NULL,2),(168,'BCOR 111','Friday','11:30:00','13:00:00','F.B.Yahya','S3','F.8','tutorial',1,3,23,2,1,NULL),(169,'CS 120','Friday','13:30:00','15:00:00','O.Dridi+H.Alaya','Lab1+Lab3','F.8','lecture',9,1,24,9,NULL,9),(170,'CS 120','Friday','15:00:00','16:30:00','O.Dridi+H.Alaya','Lab1+Lab3','F.8','lecture',9,2,25,9,NULL,9),(171,'NBC 120','Monday','08:30:00','10:00:00','F. Lamloumi','S5','F.9','lecture',11,1,1,2,NULL,2),(172,'BCOR 150','Monday','11:30:00','13:00:00','R. Aloui','A4','F.9','lecture',4,1,3,3,NULL,3),(173,'CS 120','Monday','13:30:00','15:00:00','Sourour+olfa+S.Benz','Lab1+5','F.9','lecture',9,1,4,12,NULL,12),(174,'CS 120','Monday','15:00:00','16:30:00','Sourour+olfa+S.Benz','Lab1+5','F.9','lecture',9,2,5,12,NULL,12),(175,'NBC 130','Tuesday','08:30:00','10:00:00','E. Gmati','S2','F.9','lecture',12,1,6,2,NULL,2),(176,'BCOR 140','Tuesday','10:00:00','11:30:00','S. Jouini','A4','F.9','lecture',3,1,7,4,NULL,4),(177,'BCOR 140','Tuesday','11:30:00','13:00:00','S. Jouini','A4','F.9','lecture',3,2,8,4,NULL,4),(178,'BCOR 150','Tuesday','13:30:00','15:00:00','R. Aloui','A3','F.9','lecture',4,2,9,3,NULL,3),(179,'BCOR 140','Tuesday','15:00:00','16:30:00','S. Asma','S2','F.9','tutorial',3,3,10,2,13,NULL),(180,'NBC 120','Wednesday','08:30:00','10:00:00','F. Lamloumi','S5','F.9','lecture',11,2,11,2,NULL,2),(181,'BCOR 111','Wednesday','10:00:00','11:30:00','I. Rassas','A8','F.9','lecture',1,1,12,3,NULL,3),(182,'BCOR 111','Wednesday','11:30:00','13:00:00','I. Rassas','A8','F.9','lecture',1,2,13,3,NULL,3),(183,'BCOR 150','Thursday','10:00:00','11:30:00','H. Bennour','S8','F.9','tutorial',4,3,17,2,17,NULL),(184,'BCOR 130','Thursday','11:30:00','13:00:00','Marwa Tlili','S6','F.9','tutorial',2,3,18,2,1,NULL),(185,'BCOR 111','Thursday','13:30:00','15:00:00','F. Fourati','S12','F.9','tutorial',1,3,19,1,1,NULL),(186,'BCOR 130','Friday','13:30:00','15:00:00','Nejia Moumen','A9','F.9','lecture',2,1,24,4,NULL,4),(187,'BCOR 130','Friday','15:00:00','16:30:00','Nejia Moumen','A9','F.9','lecture',2,2,25,4,NULL,4),(188,'NBC 120','Monday','11:30:00','13:00:00','A. Mejri','S13','F.10','lecture',11,1,3,1,NULL,1),(190,'BCOR 150','Tuesday','08:30:00','10:00:00','D. Myriam','S32','F.10','tutorial',4,3,6,1,1,NULL),(191,'BCOR 140','Tuesday','10:00:00','11:30:00','S. Asma','S7','F.10','tutorial',3,3,7,2,13,NULL),(192,'NBC 120','Tuesday','11:30:00','13:00:00','A. Mejri','S13','F.10','lecture',11,2,8,1,NULL,1),(193,'NBC 130','Tuesday','13:30:00','15:00:00','Kenz','S10','F.10','lecture',12,1,9,4,NULL,4),(194,'BCOR 130','Tuesday','15:00:00','16:30:00','Yosr Guirat','S1','F.10','tutorial',2,3,10,3,1,NULL),(195,'BCOR 130','Wednesday','10:00:00','11:30:00','Karim Mhedhbi','A5','F.10','lecture',2,1,12,3,NULL,3),(196,'BCOR 130','Wednesday','11:30:00','13:00:00','Karim Mhedhbi','A5','F.10','lecture',2,2,13,3,NULL,3),(197,'CS 120','Thursday','10:00:00','11:30:00','M.Nakouri+Sourour','Lab2+Lab3','F.10','lecture',9,1,17,8,NULL,8),(198,'CS 120','Thursday','11:30:00','13:00:00','M.Nakouri+Sourour','Lab2+Lab3','F.10','lecture',9,2,18,8,NULL,8),(199,'BCOR 150','Thursday','13:30:00','15:00:00','A. Dridi','A6','F.10','lecture',4,1,19,1,NULL,1),(200,'BCOR 150','Thursday','15:00:00','16:30:00','A. Dridi','A6','F.10','lecture',4,2,20,1,NULL,1),(201,'BCOR 111','Friday','10:00:00','11:30:00','I. Khemir','A4','F.10','lecture',1,1,22,2,NULL,2),(202,'BCOR 111','Friday','11:30:00','13:00:00','I. Khemir','A4','F.10','lecture',1,2,23,2,NULL,2),(203,'BCOR 140','Friday','13:30:00','15:00:00','B. Guizani','A1','F.10','lecture',3,1,24,1,NULL,1),(204,'BCOR 140','Friday','15:00:00','16:30:00','B. Guizani','A1','F.10','lecture',3,2,25,1,NULL,1),(205,'BCOR 111','Monday','10:00:00','11:30:00','F.B.Yahya','A6','F.11','lecture',1,1,2,1,NULL,1),(206,'BCOR 111','Monday','11:30:00','13:00:00','F.B.Yahya','A6','F.11','lecture',1,2,3,1,NULL,1),(207,'NBC 120','Monday','15:00:00','16:30:00','A. Mejri','S6','F.11','lecture',11,1,5,1,NULL,1),(208,'BCOR 150','Tuesday','10:00:00','11:30:00','D. Myriam','S6','F.11','tutorial',4,3,7,1,1,NULL),(209,'BCOR 130','Tuesday','11:30:00','13:00:00','Yosr Guirat','S10','F.11','tutorial',2,3,8,3,1,NULL),(210,'NBC 120','Tuesday','13:30:00','15:00:00','A. Mejri','S13','F.11','lecture',11,2,9,1,NULL,1),(211,'NBC 130','Tuesday','15:00:00','16:30:00','Kenz','S10','F.11','lecture',12,1,10,4,NULL,4),(212,'BCOR 130','Wednesday','10:00:00','11:30:00','Karim Mhedhbi','A5','F.11','lecture',2,1,12,3,NULL,3),(213,'BCOR 130','Wednesday','11:30:00','13:00:00','Karim Mhedhbi','A5','F.11','lecture',2,2,13,3,NULL,3),(214,'BCOR 140','Thursday','10:00:00','11:30:00','H. Medyouni','S2','F.11','tutorial',3,3,17,1,1,NULL),(215,'BCOR 150','Thursday','11:30:00','13:00:00','A. Dridi','A6','F.11','lecture',4,1,18,1,NULL,1),(216,'CS 120','Thursday','13:30:00','15:00:00','Khakouri+H.Alaya','Lab1+Lab2','F.11','lecture',9,1,19,4,NULL,4),(217,'CS 120','Thursday','15:00:00','16:30:00','Khakouri+H.Alaya','Lab1+Lab2','F.11','lecture',9,2,20,4,NULL,4),(218,'BCOR 111','Friday','10:00:00','11:30:00','F.B.Yahya','S9','F.11','tutorial',1,3,22,2,1,NULL),(219,'BCOR 150','Friday','11:30:00','13:00:00','A. Dridi','A6','F.11','lecture',4,2,23,1,NULL,1),(220,'BCOR 140','Friday','13:30:00','15:00:00','B. Guizani','A1','F.11','lecture',3,1,24,1,NULL,1),(221,'BCOR 140','Friday','15:00:00','16:30:00','B. Guizani','A1','F.11','lecture',3,2,25,1,NULL,1),(222,'BCOR 150','Monday','08:30:00','10:00:00','D. Myriam','S32','F.12','tutorial',4,3,1,1,1,NULL),(223,'CS 120','Monday','10:00:00','11:30:00','Benzarti+Sourour','Lab6+7','F.12','lecture',9,1,2,1,NULL,1),(224,'CS 120','Monday','11:30:00','13:00:00','Benzarti+Sourour','Lab6+7','F.12','lecture',9,2,3,1,NULL,1),(225,'BCOR 111','Monday','13:30:00','15:00:00','F.B.Yahya','S13','F.12','tutorial',1,3,4,2,1,NULL),(226,'BCOR 130','Monday','15:00:00','16:30:00','Yosr Guirat','S9','F.12','tutorial',2,3,5,3,1,NULL),(227,'BCOR 140','Tuesday','10:00:00','11:30:00','H. Medyouni','S32','F.12','tutorial',3,3,7,1,1,NULL),(228,'NBC 120','Tuesday','11:30:00','13:00:00','F. Lamloumi','S7','F.12','lecture',11,1,8,2,NULL,2),(229,'NBC 120','Tuesday','13:30:00','15:00:00','F. Lamloumi','S7','F.12','lecture',11,2,9,2,NULL,2),(230,'BCOR 130','Wednesday','10:00:00','11:30:00','Karim Mhedhbi','A5','F.12','lecture',2,1,12,3,NULL,3),(231,'BCOR 130','Wednesday','11:30:00','13:00:00','Karim Mhedhbi','A5','F.12','lecture',2,2,13,3,NULL,3),(232,'BCOR 150','Thursday','11:30:00','13:00:00','A. Dridi','A6','F.12','lecture',4,1,18,1,NULL,1),(233,'BCOR 111','Friday','08:30:00','10:00:00','I. Rassas','A8','F.12','lecture',1,1,21,3,NULL,3),(234,'BCOR 111','Friday','10:00:00','11:30:00','I. Rassas','A8','F.12','lecture',1,2,22,3,NULL,3),(235,'BCOR 150','Friday','11:30:00','13:00:00','A. Dridi','A6','F.12','lecture',4,2,23,1,NULL,1),(236,'BCOR 140','Friday','13:30:00','15:00:00','N. Khraief','A4','F.12','lecture',3,1,24,3,NULL,3),(237,'BCOR 140','Friday','15:00:00','16:30:00','N. Khraief','A4','F.12','lecture',3,2,25,3,NULL,3),(238,'BCOR 230','Monday','08:30:00','10:00:00','X','S7','SO.1','tutorial',7,3,1,1,1,NULL),(239,'BCOR 230','Monday','10:00:00','11:30:00','A. Gharbi','A2','SO.1','lecture',7,1,2,1,NULL,1),(240,'BCOR 230','Monday','11:30:00','13:00:00','A. Gharbi','A2','SO.1','lecture',7,2,3,1,NULL,1),(241,'888','Tuesday','10:00:00','11:30:00','A.Azouz','Lab6','SO.1','lecture',10,1,7,1,NULL,1),(242,'888','Tuesday','11:30:00','13:00:00','A.Azouz','Lab6','SO.1','lecture',10,2,8,1,NULL,1),(243,'NBC 210','Tuesday','13:30:00','15:00:00','L. Rezgui','S19','SO.1','lecture',13,1,9,3,NULL,3),(244,'NBC 210','Tuesday','15:00:00','16:30:00','L. Rezgui','S19','SO.1','lecture',13,2,10,3,NULL,3),(245,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.1','lecture',8,1,12,1,NULL,1),(246,'777','Wednesday','11:30:00','13:00:00','R. Esghaier','A6','SO.1','lecture',8,2,13,1,NULL,1),(247,'BCOR 200','Thursday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.1','lecture',5,1,17,4,NULL,3),(248,'BCOR 200','Thursday','11:30:00','13:00:00','S. BenbAbdallah','A8','SO.1','lecture',5,2,18,4,1,NULL),(249,'BCOR 210','Thursday','13:30:00','15:00:00','H. Zouaoui','A7','SO.1','lecture',6,1,19,1,NULL,1),(250,'BCOR 210','Thursday','15:00:00','16:30:00','H. Zouaoui','A7','SO.1','lecture',6,2,20,1,NULL,1),(251,'777','Friday','13:30:00','15:00:00','Sadok Laajimi','A4','SO.1','tutorial',8,3,24,5,673,NULL),(252,'BCOR 230','Monday','10:00:00','11:30:00','A. Gharbi','A2','SO.2','lecture',7,1,2,1,NULL,1),(253,'BCOR 230','Monday','11:30:00','13:00:00','A. Gharbi','A2','SO.2','lecture',7,2,3,1,NULL,1),(254,'BCOR 260','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.2','lecture',8,1,4,1,NULL,1),(255,'BCOR 260','Monday','15:00:00','16:30:00','R. Esghaier','A2','SO.2','lecture',8,2,5,1,NULL,1),(256,'BCOR 200','Tuesday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.2','lecture',5,1,7,3,NULL,3),(257,'BCOR 200','Tuesday','11:30:00','13:00:00','S. Ben Abdallah','A8','SO.2','lecture',5,2,8,3,NULL,3),(258,'BCOR 210','Wednesday','10:00:00','11:30:00','M. Ben Nouri','A1','SO.2','lecture',6,1,12,2,NULL,2),(259,'BCOR 210','Wednesday','11:30:00','13:00:00','M. Ben Nouri','A1','SO.2','lecture',6,2,13,2,NULL,2),(260,'NBC 210','Thursday','10:00:00','11:30:00','L. Rezgui','S16','SO.2','lecture',13,1,17,3,NULL,3),(261,'NBC 210','Thursday','11:30:00','13:00:00','L. Rezgui','S16','SO.2','lecture',13,2,18,3,NULL,3),(262,'888','Thursday','13:30:00','15:00:00','Amel B.Yaghlene','Lab6','SO.2','lecture',10,1,19,2,NULL,2),(263,'888','Thursday','15:00:00','16:30:00','Amel B.Yaghlene','Lab6','SO.2','lecture',10,2,20,2,NULL,2),(264,'BCOR 230','Friday','10:00:00','11:30:00','X','S11','SO.2','tutorial',7,3,22,1,1,NULL),(265,'777','Friday','11:30:00','13:00:00','Sadok Laajimi','A4','SO.2','tutorial',8,3,23,5,673,NULL),(266,'777','Monday','08:30:00','10:00:00','K. Soussou','S39','SO.3','tutorial',8,3,1,1,1,NULL),(267,'BCOR 230','Monday','10:00:00','11:30:00','A. Gharbi','A2','SO.3','lecture',7,1,2,1,NULL,1),(268,'BCOR 230','Monday','11:30:00','13:00:00','A. Gharbi','A2','SO.3','lecture',7,2,3,1,NULL,1),(269,'NBC 210','Monday','13:30:00','15:00:00','F. Marzouki','S17','SO.3','lecture',13,1,4,2,NULL,2),(270,'NBC 210','Monday','15:00:00','16:30:00','F. Marzouki','S17','SO.3','lecture',13,2,5,2,NULL,2),(271,'888','Tuesday','13:30:00','15:00:00','M.Abdelmoulah','Lab5','SO.3','lecture',10,1,9,4,NULL,4),(272,'888','Tuesday','15:00:00','16:30:00','M.Abdelmoulah','Lab5','SO.3','lecture',10,2,10,4,NULL,4),(273,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.3','lecture',8,1,12,1,NULL,1),(274,'777','Wednesday','11:30:00','13:00:00','R. Esghaier','A6','SO.3','lecture',8,2,13,1,NULL,1),(275,'BCOR 230','Thursday','08:30:00','10:00:00','X','S3','SO.3','tutorial',7,3,16,1,1,NULL),(276,'BCOR 200','Thursday','10:00:00','11:30:00','S. Ben Abdallah','A7','SO.3','lecture',5,1,17,3,NULL,3),(277,'BCOR 200','Thursday','11:30:00','13:00:00','S. Ben Abdallah','A7','SO.3','lecture',5,2,18,3,NULL,3),(278,'BCOR 210','Thursday','13:30:00','15:00:00','H. Zouaoui','A7','SO.3','lecture',6,1,19,1,NULL,1),(279,'BCOR 210','Thursday','15:00:00','16:30:00','H. Zouaoui','A7','SO.3','lecture',6,2,20,1,NULL,1),(280,'777','Monday','10:00:00','11:30:00','K. Soussou','A1','SO.4','tutorial',8,3,2,1,1,NULL),(281,'BCOR 230','Monday','11:30:00','13:00:00','X','S13','SO.4','tutorial',7,3,3,1,1,NULL),(282,'CS 220','Monday','13:30:00','15:00:00','M. Zayen','Lab3','SO.4','lecture',10,1,4,3,NULL,6),(283,'CS 220','Monday','15:00:00','16:30:00','M. Zayen','Lab3','SO.4','lecture',10,2,5,3,NULL,6),(284,'BCOR 210','Tuesday','13:30:00','15:00:00','M. Ben Nouri','A2','SO.4','lecture',6,1,9,2,NULL,2),(285,'BCOR 210','Tuesday','15:00:00','16:30:00','M. Ben Nouri','A2','SO.4','lecture',6,2,10,2,NULL,2),(286,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.4','lecture',8,1,12,1,NULL,1),(287,'777','Wednesday','11:30:00','13:00:00','R. Esghaier','A6','SO.4','lecture',8,2,13,1,NULL,1),(288,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.4','lecture',7,1,17,1,NULL,1),(289,'BCOR 230','Thursday','11:30:00','13:00:00','A. Gharbi','A2','SO.4','lecture',7,2,18,1,NULL,1),(290,'NBC 210','Thursday','13:30:00','15:00:00','B. Elkaou','S9','SO.4','lecture',13,1,19,1,NULL,1),(291,'NBC 210','Thursday','15:00:00','16:30:00','B. Elkaou','S9','SO.4','lecture',13,2,20,1,NULL,1),(292,'BCOR 200','Friday','10:00:00','11:30:00','G. Aydi','A2','SO.4','lecture',5,1,22,1,NULL,1),(293,'BCOR 200','Friday','11:30:00','13:00:00','G. Aydi','A2','SO.4','lecture',5,2,23,1,NULL,1),(294,'BCOR 230','Monday','10:00:00','11:30:00','X','S32','SO.5','tutorial',7,3,2,1,1,NULL),(295,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.5','lecture',8,1,4,1,NULL,1),(296,'777','Monday','15:00:00','16:30:00','R. Esghaier','A2','SO.5','lecture',8,2,5,1,NULL,1),(297,'888','Tuesday','10:00:00','11:30:00','M.Abdelmoulah','Lab5','SO.5','lecture',10,1,7,4,NULL,4),(298,'888','Tuesday','11:30:00','13:00:00','M.Abdelmoulah','Lab5','SO.5','lecture',10,2,8,4,NULL,4),(299,'NBC 210','Tuesday','13:30:00','15:00:00','F. Marzouki','S17','SO.5','lecture',13,1,9,2,NULL,2),(300,'NBC 210','Tuesday','15:00:00','16:30:00','F. Marzouki','S17','SO.5','lecture',13,2,10,2,NULL,2),(301,'BCOR 210','Wednesday','10:00:00','11:30:00','M. Ben Nouri','A1','SO.5','lecture',6,1,12,2,NULL,2),(302,'BCOR 210','Wednesday','11:30:00','13:00:00','M. Ben Nouri','A1','SO.5','lecture',6,2,13,2,NULL,2),(303,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.5','lecture',7,1,17,1,NULL,1),(304,'BCOR 230','Thursday','11:30:00','13:00:00','A. Gharbi','A2','SO.5','lecture',7,2,18,1,NULL,1),(305,'BCOR 200','Friday','10:00:00','11:30:00','I. Chakroun','A9','SO.5','lecture',5,1,22,2,NULL,2),(306,'BCOR 200','Friday','11:30:00','13:00:00','I. Chakroun','A9','SO.5','lecture',5,2,23,2,NULL,2),(307,'777','Friday','15:00:00','16:30:00','S. Bennouri','A1','SO.5','tutorial',8,3,25,4,617,NULL),(308,'BCOR 230','Monday','10:00:00','11:30:00','A. Gharbi','A2','SO.6','lecture',7,1,2,1,NULL,1),(309,'BCOR 230','Monday','11:30:00','13:00:00','A. Gharbi','A2','SO.6','lecture',7,2,3,1,NULL,1),(310,'NBC 210','Tuesday','10:00:00','11:30:00','L. Rezgui','S20','SO.6','lecture',13,1,7,3,NULL,3),(311,'NBC 210','Tuesday','11:30:00','13:00:00','L. Rezgui','S20','SO.6','lecture',13,2,8,3,NULL,3),(312,'888','Tuesday','13:30:00','15:00:00','Amel B.Yaghlene','Lab3','SO.6','lecture',10,1,9,2,NULL,2),(313,'888','Tuesday','15:00:00','16:30:00','Amel B.Yaghlene','Lab3','SO.6','lecture',10,2,10,2,NULL,2),(314,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.6','lecture',8,1,12,1,NULL,1),(315,'777','Wednesday','11:30:00','13:00:00','R. Esghaier','A6','SO.6','lecture',8,2,13,1,NULL,1),(316,'BCOR 230','Thursday','10:00:00','11:30:00','X','S32','SO.6','tutorial',7,3,17,1,1,NULL),(317,'BCOR 210','Thursday','13:30:00','15:00:00','N. Belaid','A7','SO.6','lecture',6,1,19,3,NULL,3),(318,'BCOR 210','Thursday','15:00:00','16:30:00','N. Belaid','A7','SO.6','lecture',6,2,20,3,NULL,3),(319,'777','Friday','10:00:00','11:30:00','Sadok Laajimi','A4','SO.6','tutorial',8,3,22,5,673,NULL),(320,'BCOR 200','Friday','13:30:00','15:00:00','G. Aydi','A2','SO.6','lecture',5,1,24,1,NULL,1),(321,'BCOR 200','Friday','15:00:00','16:30:00','G. Aydi','A2','SO.6','lecture',5,2,25,1,NULL,1),(322,'888','Monday','10:00:00','11:30:00','M. Zayen','Lab3','SO.7','lecture',10,1,2,3,NULL,3),(323,'888','Monday','11:30:00','13:00:00','M. Zayen','Lab3','SO.7','lecture',10,2,3,3,NULL,3),(324,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.7','lecture',8,1,4,1,NULL,1),(325,'777','Monday','15:00:00','16:30:00','R. Esghaier','A2','SO.7','lecture',8,2,5,1,NULL,1),(326,'BCOR 210','Tuesday','08:30:00','10:00:00','M. Ben Nouri','A2','SO.7','lecture',6,1,6,2,NULL,2),(327,'BCOR 210','Tuesday','10:00:00','11:30:00','M. Ben Nouri','A2','SO.7','lecture',6,2,7,2,NULL,2),(328,'NBC 210','Wednesday','10:00:00','11:30:00','B. Elkaou','S12','SO.7','lecture',13,1,12,1,NULL,1),(329,'NBC 210','Wednesday','11:30:00','13:00:00','B. Elkaou','S12','SO.7','lecture',13,2,13,1,NULL,1),(330,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.7','lecture',7,1,17,1,NULL,1),(331,'BCOR 230','Thursday','11:30:00','13:00:00','A. Gharbi','A2','SO.7','lecture',7,2,18,1,NULL,1),(332,'BCOR 230','Friday','08:30:00','10:00:00','X','S32','SO.7','tutorial',7,3,21,1,1,NULL),(333,'BCOR 200','Friday','10:00:00','11:30:00','I. Chakroun','A9','SO.7','lecture',5,1,22,2,NULL,2),(334,'BCOR 200','Friday','11:30:00','13:00:00','I. Chakroun','A9','SO.7','lecture',5,2,23,2,NULL,2),(335,'777','Friday','13:30:00','15:00:00','S. Bannouri','S14','SO.7','tutorial',8,3,24,3,561,NULL),(350,'BCOR 230','Monday','10:00:00','11:30:00','A. Gharbi','A2','SO.8','lecture',7,1,2,1,NULL,1),(351,'BCOR 230','Monday','11:30:00','13:00:00','A. Gharbi','A2','SO.8','lecture',7,2,3,1,NULL,1),(352,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.8','lecture',8,1,4,1,NULL,1),(353,'777','Monday','15:00:00','16:30:00','R. Esghaier','A2','SO.8','lecture',8,2,5,1,NULL,1),(354,'BCOR 210','Tuesday','08:30:00','10:00:00','M. Ben Nouri','A5','SO.8','lecture',6,1,6,2,NULL,2),(355,'BCOR 210','Tuesday','10:00:00','11:30:00','M. Ben Nouri','A5','SO.8','lecture',6,2,7,2,NULL,2),(356,'888','Tuesday','13:30:00','15:00:00','A.Azouz','Lab3','SO.8','lecture',10,1,9,1,NULL,1),(357,'888','Tuesday','15:00:00','16:30:00','A.Azouz','Lab3','SO.8','lecture',10,2,10,1,NULL,1),(358,'NBC 210','Thursday','10:00:00','11:30:00','B. Elkaou','S4','SO.8','lecture',13,1,17,1,NULL,1),(359,'NBC 210','Thursday','11:30:00','13:00:00','B. Elkaou','S4','SO.8','lecture',13,2,18,1,NULL,1),(360,'BCOR 230','Thursday','13:30:00','15:00:00','Unknown','S1','SO.8','tutorial',7,3,19,2,393,NULL),(361,'BCOR 200','Friday','10:00:00','11:30:00','G. Aydi','A2','SO.8','lecture',5,1,22,1,NULL,1),(362,'BCOR 200','Friday','11:30:00','13:00:00','G. Aydi','A3','SO.8','lecture',5,2,23,1,NULL,1),(363,'777','Friday','13:30:00','15:00:00','Sadok Laajimi','A4','SO.8','tutorial',8,3,24,5,673,NULL),(364,'777','Monday','10:00:00','11:30:00','Manara Toukabri','S39','SO.9','tutorial',8,3,2,2,113,NULL),(365,'BCOR 230','Monday','11:30:00','13:00:00','unknown','S13','SO.9','tutorial',7,3,3,2,393,NULL),(366,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.9','lecture',8,1,4,1,NULL,1),(368,'888','Tuesday','10:00:00','11:30:00','Amel B.Yaghlene','Lab3','SO.9','lecture',10,2,7,2,NULL,2),(370,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.9','lecture',7,1,17,1,NULL,1),(372,'BCOR 210','Thursday','13:30:00','15:00:00','N. Belaid','A1','SO.9','lecture',6,1,19,3,NULL,3),(374,'NBC 210','Friday','08:30:00','10:00:00','N. Manai','S17','SO.9','lecture',13,1,21,4,NULL,4),(376,'BCOR 200','Friday','13:30:00','15:00:00','G. Aydi','A2','SO.9','lecture',5,1,24,1,NULL,1),(380,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.9','lecture',8,2,4,1,NULL,1),(382,'888','Tuesday','10:00:00','11:30:00','Amel B.Yaghlene','Lab3','SO.9','lecture',10,1,7,2,NULL,2),(384,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.9','lecture',7,2,17,1,NULL,1),(386,'BCOR 210','Thursday','13:30:00','15:00:00','N. Belaid','A1','SO.9','lecture',6,2,19,3,NULL,3),(388,'NBC 210','Friday','08:30:00','10:00:00','N. Manai','S17','SO.9','lecture',13,2,21,4,NULL,4),(390,'BCOR 200','Friday','13:30:00','15:00:00','G. Aydi','A2','SO.9','lecture',5,2,24,1,NULL,1),(392,'NBC 210','Monday','10:00:00','11:30:00','F. Marzouki','S2','SO.10','lecture',13,1,2,2,NULL,2),(393,'NBC 210','Monday','11:30:00','13:00:00','F. Marzouki','S2','SO.10','lecture',13,2,3,2,NULL,2),(394,'888','Monday','13:30:00','15:00:00','A.Azouz','Lab6','SO.10','lecture',10,1,4,1,NULL,1),(395,'888','Monday','15:00:00','16:30:00','A.Azouz','Lab6','SO.10','lecture',10,2,5,1,NULL,1),(396,'BCOR 200','Tuesday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.10','lecture',5,1,7,3,NULL,3),(397,'BCOR 200','Tuesday','11:30:00','13:00:00','S. Ben Abdallah','A8','SO.10','lecture',5,2,8,3,NULL,3),(398,'BCOR 210','Tuesday','13:30:00','15:00:00','M. Ben Nouri','A2','SO.10','lecture',6,1,9,2,NULL,2),(399,'BCOR 210','Tuesday','15:00:00','16:30:00','M. Ben Nouri','A2','SO.10','lecture',6,2,10,2,NULL,2),(400,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.10','lecture',8,1,12,1,NULL,1),(401,'777','Wednesday','11:30:00','13:00:00','R. Esghaier','A6','SO.10','lecture',8,2,13,1,NULL,1),(402,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.10','lecture',7,1,17,1,NULL,1),(403,'BCOR 230','Thursday','11:30:00','13:00:00','A. Gharbi','A2','SO.10','lecture',7,2,18,1,NULL,1),(404,'777','Friday','10:00:00','11:30:00','Sadok Laajimi','A4','SO.10','tutorial',8,3,22,5,673,NULL),(405,'BCOR 230','Friday','11:30:00','13:00:00','unknown','S32','SO.10','tutorial',7,3,23,2,393,NULL),(406,'BCOR 230','Monday','10:00:00','11:30:00','unknown','S32','SO.11','tutorial',7,3,2,2,393,NULL),(407,'777','Monday','13:30:00','15:00:00','Manara Toukabri','S39','SO.11','tutorial',8,3,4,2,113,NULL),(408,'BCOR 200','Tuesday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.11','lecture',5,1,7,3,NULL,3),(410,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.11','lecture',8,1,12,1,NULL,1),(412,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.11','lecture',7,2,17,1,NULL,1),(414,'888','Thursday','13:30:00','15:00:00','M.Abdelmoulah','Lab6','SO.11','lecture',10,1,19,4,NULL,5),(416,'BCOR 210','Friday','08:30:00','10:00:00','N. Belaid','A1','SO.11','lecture',6,2,21,3,NULL,3),(422,'BCOR 200','Tuesday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.11','lecture',5,2,7,3,NULL,3),(424,'777','Wednesday','10:00:00','11:30:00','R. Esghaier','A6','SO.11','lecture',8,2,12,1,NULL,1),(426,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.11','lecture',7,1,17,1,NULL,1),(428,'888','Thursday','13:30:00','15:00:00','M.Abdelmoulah','Lab6','SO.11','lecture',10,2,19,4,NULL,5),(430,'BCOR 210','Friday','08:30:00','10:00:00','N. Belaid','A1','SO.11','lecture',6,1,21,3,NULL,3),(462,'777','Monday','13:30:00','15:00:00','R. Esghaier','A2','SO.12','lecture',8,1,4,1,NULL,1),(463,'777','Monday','15:00:00','16:30:00','R. Esghaier','A2','SO.12','lecture',8,2,5,1,NULL,1),(464,'BCOR 200','Tuesday','10:00:00','11:30:00','S. Ben Abdallah','A8','SO.12','lecture',5,1,7,3,NULL,3),(465,'BCOR 200','Tuesday','11:30:00','13:00:00','S. Ben Abdallah','A8','SO.12','lecture',5,2,8,3,NULL,3),(466,'888','Tuesday','13:30:00','15:00:00','M. Zayen','Lab6','SO.12','lecture',10,1,9,3,NULL,6),(467,'888','Tuesday','15:00:00','16:30:00','M. Zayen','Lab6','SO.12','lecture',10,2,10,3,NULL,6),(468,'BCOR 230','Thursday','10:00:00','11:30:00','A. Gharbi','A2','SO.12','lecture',7,1,17,1,NULL,1),(469,'BCOR 230','Thursday','11:30:00','13:00:00','A. Gharbi','A2','SO.12','lecture',7,2,18,1,NULL,1),(470,'BCOR 230','Thursday','15:00:00','16:30:00','unknown','S32','SO.12','tutorial',7,3,20,2,393,NULL),(471,'BCOR 210','Friday','08:30:00','10:00:00','N. Belaid','A1','SO.12','lecture',6,1,21,3,NULL,3),(472,'BCOR 210','Friday','10:00:00','11:30:00','N. Belaid','A1','SO.12','lecture',6,2,22,3,NULL,3),(473,'777','Friday','11:30:00','13:00:00','Sadok Laajimi','A4','SO.12','tutorial',8,3,23,5,673,NULL),(479,'BA 350','Thursday','10:00:00','11:30:00','A. Dridi','A5','Ju. BA/IT','lecture',16,1,17,1,NULL,1),(480,'BA 350','Thursday','11:30:00','13:00:00','A. Dridi','A5','Ju. BA/IT','lecture',16,2,18,1,NULL,1),(481,'BA 350','Friday','10:00:00','11:30:00','L. Issaoui','32','Ju. BA/IT','tutorial',16,3,22,7,7,NULL),(485,'BA 350','Tuesday','10:00:00','11:30:00','F. Talmoudi','A7','Ju. BA/IBE','lecture',16,1,7,3,NULL,3),(486,'BA 350','Tuesday','11:30:00','13:00:00','F. Talmoudi','A7','Ju. BA/IBE','lecture',16,2,8,2,NULL,2),(487,'BA 350','Friday','11:30:00','13:00:00','L. Issaoui','S15','Ju. BA/IBE','tutorial',16,3,23,7,7,NULL),(488,'BA 350','Thursday','10:00:00','11:30:00','A. Dridi','A5','Ju. BA/MRK','lecture',16,1,17,1,NULL,1),(489,'BA 350','Thursday','11:30:00','13:00:00','A. Dridi','A5','Ju. BA/MRK','lecture',16,2,18,1,NULL,1),(490,'BA 350','Tuesday','10:00:00','11:30:00','L. Issaoui','32','Ju. BA/MRK','tutorial',16,3,7,7,7,NULL),(491,'BA 350','Tuesday','10:00:00','11:30:00','F. Talmoudi','A7','Ju. IT/BA','lecture',16,1,7,3,NULL,3),(492,'BA 350','Tuesday','11:30:00','13:00:00','F. Talmoudi','A7','Ju. IT/BA','lecture',16,2,8,2,NULL,2),(493,'BA 350','Tuesday','08:30:00','10:00:00','L. Issaoui','32','Ju. IT/BA','tutorial',16,3,6,7,7,NULL),(494,'BA 350','Thursday','10:00:00','11:30:00','A. Dridi','A5','Ju. BA/FIN','lecture',16,1,17,1,NULL,1),(495,'BA 350','Thursday','11:30:00','13:00:00','A. Dridi','A5','Ju. BA/FIN','lecture',16,2,18,1,NULL,1),(496,'BA 350','Friday','08:30:00','10:00:00','L. Issaoui','15','Ju. BA/FIN','tutorial',16,3,21,7,7,NULL),(497,'BA 350','Tuesday','10:00:00','11:30:00','R. Aloui','Lab 10','Ju. FIN/BA','lecture',16,1,7,3,NULL,2),(498,'BA 350','Tuesday','11:30:00','13:00:00','R. Aloui','Lab 10','Ju. FIN/BA','lecture',16,2,8,3,NULL,2),(499,'BA 350','Thursday','11:30:00','13:00:00','X','Y','Ju. FIN/BA','tutorial',16,3,18,3,2,NULL);
 /*!40000 ALTER TABLE `schedule` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_schedule_insert` AFTER INSERT ON `schedule` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_schedule_update` AFTER UPDATE ON `schedule` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_schedule_delete` AFTER DELETE ON `schedule` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `schedule_parameters`
@@ -868,6 +1349,12 @@ CREATE TABLE `schedule_parameters` (
   `time_limit` int DEFAULT NULL,
   `penalty_gap` int DEFAULT NULL,
   `schedule_validation` tinyint(1) DEFAULT '1',
+  `solver_engine` enum('auto','cbc','exact') NOT NULL DEFAULT 'auto',
+  `gap_formulation` enum('pairwise','span') NOT NULL DEFAULT 'pairwise',
+  `solution_tolerance` decimal(8,2) NOT NULL DEFAULT '0.00',
+  `solution_distance` int NOT NULL DEFAULT '1',
+  `solver_threads` int DEFAULT NULL,
+  `solver_processes` int NOT NULL DEFAULT '1',
   PRIMARY KEY (`id`)
 ) ENGINE=InnoDB AUTO_INCREMENT=2 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -878,10 +1365,61 @@ CREATE TABLE `schedule_parameters` (
 
 LOCK TABLES `schedule_parameters` WRITE;
 /*!40000 ALTER TABLE `schedule_parameters` DISABLE KEYS */;
-INSERT INTO `schedule_parameters` VALUES (1,10.00,1,10,20,100,0);
+INSERT INTO `schedule_parameters` VALUES (1,10.00,1,10,20,100,0,'auto','pairwise',0.00,1,NULL,1);
 /*!40000 ALTER TABLE `schedule_parameters` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `schedule_result_cache`
+--
+
+DROP TABLE IF EXISTS `schedule_result_cache`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `schedule_result_cache` (
+  `result_key` char(64) NOT NULL,
+  `timetable_version` int NOT NULL,
+  `result` mediumtext NOT NULL,
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`result_key`),
+  KEY `timetable_version` (`timetable_version`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `schedule_result_cache`
+--
+
+LOCK TABLES `schedule_result_cache` WRITE;
+/*!40000 ALTER TABLE `schedule_result_cache` DISABLE KEYS */;
+/*!40000 ALTER TABLE `schedule_result_cache` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `section_capacity`
+--
+
+DROP TABLE IF EXISTS `section_capacity`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `section_capacity` (
+  `course_code` varchar(20) NOT NULL,
+  `session_type` enum('lecture','tutorial') NOT NULL,
+  `group` varchar(50) NOT NULL,
+  `capacity` int NOT NULL,
+  PRIMARY KEY (`course_code`,`session_type`,`group`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `section_capacity`
+--
+
+LOCK TABLES `section_capacity` WRITE;
+/*!40000 ALTER TABLE `section_capacity` DISABLE KEYS */;
+/*!40000 ALTER TABLE `section_capacity` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `student`
 --
@@ -1118,6 +1656,90 @@ INSERT INTO `tbs_students` VALUES (1,'Ali','Ben Salah',12345678,'ali@tbs.u-tunis
 /*!40000 ALTER TABLE `tbs_students` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `time_grid`
+--
+
+DROP TABLE IF EXISTS `time_grid`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `time_grid` (
+  `time_slot` int NOT NULL,
+  `week_day` enum('Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday') NOT NULL,
+  `start_time` time NOT NULL,
+  `end_time` time NOT NULL,
+  PRIMARY KEY (`time_slot`),
+  UNIQUE KEY `week_day_start_time` (`week_day`,`start_time`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `time_grid`
+--
+
+LOCK TABLES `time_grid` WRITE;
+/*!40000 ALTER TABLE `time_grid` DISABLE KEYS */;
+INSERT INTO `time_grid` VALUES (1,'Monday','08:30:00','10:00:00'),(2,'Monday','10:00:00','11:30:00'),(3,'Monday','11:30:00','13:00:00'),(4,'Monday','13:30:00','15:00:00'),(5,'Monday','15:00:00','16:30:00'),(6,'Tuesday','08:30:00','10:00:00'),(7,'Tuesday','10:00:00','11:30:00'),(8,'Tuesday','11:30:00','13:00:00'),(9,'Tuesday','13:30:00','15:00:00'),(10,'Tuesday','15:00:00','16:30:00'),(11,'Wednesday','08:30:00','10:00:00'),(12,'Wednesday','10:00:00','11:30:00'),(13,'Wednesday','11:30:00','13:00:00'),(14,'Wednesday','13:30:00','15:00:00'),(15,'Wednesday','15:00:00','16:30:00'),(16,'Thursday','08:30:00','10:00:00'),(17,'Thursday','10:00:00','11:30:00'),(18,'Thursday','11:30:00','13:00:00'),(19,'Thursday','13:30:00','15:00:00'),(20,'Thursday','15:00:00','16:30:00'),(21,'Friday','08:30:00','10:00:00'),(22,'Friday','10:00:00','11:30:00'),(23,'Friday','11:30:00','13:00:00'),(24,'Friday','13:30:00','15:00:00'),(25,'Friday','15:00:00','16:30:00'),(26,'Saturday','08:30:00','10:00:00'),(27,'Saturday','10:00:00','11:30:00'),(28,'Saturday','11:30:00','13:00:00'),(29,'Saturday','13:30:00','15:00:00'),(30,'Saturday','15:00:00','16:30:00');
+/*!40000 ALTER TABLE `time_grid` ENABLE KEYS */;
+UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_time_grid_insert` AFTER INSERT ON `time_grid` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_time_grid_update` AFTER UPDATE ON `time_grid` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'ONLY_FULL_GROUP_BY,STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `after_time_grid_delete` AFTER DELETE ON `time_grid` FOR EACH ROW BEGIN
+    -- Make every worker reload its cached timetable snapshot
+    INSERT INTO cache_versions (name, version) VALUES ('timetable', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
 --
 -- Table structure for table `time_slot_preferences`
 --
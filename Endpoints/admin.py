@@ -3,6 +3,12 @@ from datetime import datetime, date
 import base64
 from werkzeug.security import check_password_hash, generate_password_hash
 from auth import admin_required
+from curriculum_catalog import invalidate_curriculum_catalog
+from prerequisite_graph import invalidate_prerequisite_graph
+from timetable_snapshot import invalidate_timetable_snapshot
+from schedule_optimizer import GAP_FORMULATIONS, SOLVER_ENGINES
+from solver_trace import get_solver_trace
+from system_parameters import invalidate_system_parameters, resolve_parameters
 from functools import wraps
 import re
 
@@ -274,18 +280,12 @@ def check_for_graduates(cursor):
     - List of student IDs who meet graduation requirements
     """
     # Get graduation requirements from system parameters
-    cursor.execute("""
-        SELECT minimum_grad_credit, minimum_grad_cgpa
-        FROM system_parameters
-        LIMIT 1
-    """)
-    
-    params = cursor.fetchone()
-    if not params:
+    params = resolve_parameters(current_app.mysql.connection)
+    if not params.configured:
         current_app.logger.error("Failed to retrieve system parameters for graduation check")
         return []
     
-    min_credits, min_cgpa = params
+    min_credits, min_cgpa = params.minimum_grad_credit, params.minimum_grad_cgpa
     
     # Find students who meet graduation requirements
     cursor.execute("""
@@ -619,6 +619,8 @@ def course_registration():
                         (academic_year, semester, start_date, is_current)
                         VALUES (%s, %s, CURDATE(), 1)
                     """, (next_year, next_semester))
+                    # A new semester means a new timetable: drop cached optimizer snapshots
+                    invalidate_timetable_snapshot(cursor)
                     current_app.mysql.connection.commit()
                     
                     # If transitioning from Spring to Fall, increment student years
@@ -655,10 +657,8 @@ def course_registration():
                     # Create new student_semester_summary entries for all students
                     current_app.logger.info("Creating new student_semester_summary entries for all students")
                     
-                    # First, get the min_cumulative_gpa value for logging
-                    cursor.execute("SELECT min_cumulative_gpa FROM system_parameters ORDER BY last_updated DESC LIMIT 1")
-                    min_gpa_result = cursor.fetchone()
-                    min_cumulative_gpa = min_gpa_result[0] if min_gpa_result else None
+                    # First, get the min_cumulative_gpa threshold the probation counters are set against
+                    min_cumulative_gpa = resolve_parameters(current_app.mysql.connection).min_cumulative_gpa
                     current_app.logger.info(f"Current min_cumulative_gpa threshold: {min_cumulative_gpa}")
                     
                     # Log academic years for some students
@@ -681,7 +681,7 @@ def course_registration():
                             prev.cumulative_gpa,
                             CASE
                                 WHEN prev.cumulative_gpa IS NULL THEN 0
-                                WHEN prev.cumulative_gpa < (SELECT min_cumulative_gpa FROM system_parameters ORDER BY last_updated DESC LIMIT 1)
+                                WHEN prev.cumulative_gpa < %s
                                     THEN COALESCE(prev.probation_counter, 0) + 1
                                 ELSE 0
                             END AS probation_counter,
@@ -723,7 +723,7 @@ def course_registration():
                             cumulative_gpa = VALUES(cumulative_gpa),
                             probation_counter = VALUES(probation_counter),
                             forgiveness_counter = COALESCE(student_semester_summary.forgiveness_counter, VALUES(forgiveness_counter))
-                    """, (next_semester,))
+                    """, (next_semester, min_cumulative_gpa))
                     
                     records_inserted = cursor.rowcount
                     current_app.mysql.connection.commit()
@@ -751,16 +751,14 @@ def course_registration():
                     # Check for students who reached max probation limit and need board review
                     # Note: This check also happens in student.py:is_awaiting_board_decision for real-time checks
                     current_app.logger.info("Checking for students who reached max probation limit...")
+                    max_probation_board = resolve_parameters(current_app.mysql.connection).max_probation_board
                     cursor.execute("""
                         WITH MaxProbationValues AS (
                             SELECT 
                                 s.student_id,
-                                COALESCE(spo.max_probation_board, sp.max_probation_board) AS max_probation_board
+                                COALESCE(spo.max_probation_board, %s) AS max_probation_board
                             FROM 
                                 student s
-                            CROSS JOIN (
-                                SELECT * FROM system_parameters ORDER BY last_updated DESC LIMIT 1
-                            ) sp
                             LEFT JOIN 
                                 student_parameters_overrides spo ON s.student_id = spo.student_id
                         )
@@ -781,7 +779,7 @@ def course_registration():
                                 WHERE bpe.student_id = sss.student_id
                                 AND bpe.status = 'pending'
                             )
-                    """, (next_year, next_semester))
+                    """, (max_probation_board, next_year, next_semester))
                     
                     students_at_max_probation = cursor.fetchall()
                     
@@ -2307,6 +2305,7 @@ def system_adjustments():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -2412,6 +2411,7 @@ def system_adjustments():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -2458,6 +2458,7 @@ def system_adjustments():
             
             # Delete overrides for this student
             cursor.execute("DELETE FROM student_parameters_overrides WHERE student_id = %s", (student_id,))
+            invalidate_system_parameters(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -2630,6 +2631,8 @@ def system_adjustments_courses():
                 data.get('in_curriculum', True), data.get('requires_french', False)
             ))
             
+            invalidate_prerequisite_graph(cursor)
+            invalidate_curriculum_catalog(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -2691,6 +2694,8 @@ def system_adjustments_courses():
                 data['course_code']
             ))
             
+            invalidate_prerequisite_graph(cursor)
+            invalidate_curriculum_catalog(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -2711,6 +2716,10 @@ def system_adjustments_courses():
             
             # Delete the course
             cursor.execute("DELETE FROM courses WHERE course_code = %s", (course_code,))
+            # Also cascades to the prerequisite, elective group and major requirement
+            # rows, whose triggers do not fire on cascades
+            invalidate_prerequisite_graph(cursor)
+            invalidate_curriculum_catalog(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -2985,6 +2994,7 @@ def system_adjustments_major():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -3095,6 +3105,7 @@ def system_adjustments_major():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -3141,6 +3152,7 @@ def system_adjustments_major():
             
             # Delete overrides for this student
             cursor.execute("DELETE FROM student_parameters_overrides WHERE student_id = %s", (student_id,))
+            invalidate_system_parameters(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -3400,6 +3412,7 @@ def system_adjustments_general():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -3511,6 +3524,7 @@ def system_adjustments_general():
                             str(new_value) if new_value is not None else None
                         ))
                 
+                invalidate_system_parameters(cursor)
                 current_app.mysql.connection.commit()
                 
                 return jsonify({
@@ -3581,6 +3595,7 @@ def system_adjustments_general():
                 AND min_credit_percentage_major IS NULL
             """, (student_id,))
             
+            invalidate_system_parameters(cursor)
             current_app.mysql.connection.commit()
             
             return jsonify({
@@ -3610,23 +3625,28 @@ def system_adjustments_schedule():
     try:
         cursor = current_app.mysql.connection.cursor()
         if request.method == 'GET':
-            cursor.execute("""
-                SELECT weight_mode_a, weight_mode_b, maximum_solutions, time_limit, penalty_gap, schedule_validation
-                FROM schedule_parameters
-                LIMIT 1
-            """)
-            params = cursor.fetchone()
-            if not params:
+            # SELECT * so a database without the optional columns still loads;
+            # missing ones report the optimizer's defaults
+            cursor.execute("SELECT * FROM schedule_parameters LIMIT 1")
+            row = cursor.fetchone()
+            if not row:
                 return jsonify({'success': False, 'message': 'Schedule parameters not found'}), 404
+            params = dict(zip([column[0] for column in cursor.description], row))
             return jsonify({
                 'success': True,
                 'parameters': {
-                    'weight_mode_a': float(params[0]) if params[0] is not None else None,
-                    'weight_mode_b': int(params[1]) if params[1] is not None else None,
-                    'maximum_solutions': int(params[2]) if params[2] is not None else None,
-                    'time_limit': int(params[3]) if params[3] is not None else None,
-                    'penalty_gap': int(params[4]) if params[4] is not None else None,
-                    'schedule_validation': int(params[5]) if params[5] is not None else 0
+                    'weight_mode_a': float(params['weight_mode_a']) if params['weight_mode_a'] is not None else None,
+                    'weight_mode_b': int(params['weight_mode_b']) if params['weight_mode_b'] is not None else None,
+                    'maximum_solutions': int(params['maximum_solutions']) if params['maximum_solutions'] is not None else None,
+                    'time_limit': int(params['time_limit']) if params['time_limit'] is not None else None,
+                    'penalty_gap': int(params['penalty_gap']) if params['penalty_gap'] is not None else None,
+                    'schedule_validation': int(params['schedule_validation']) if params['schedule_validation'] is not None else 0,
+                    'solver_engine': params.get('solver_engine') or 'auto',
+                    'gap_formulation': params.get('gap_formulation') or 'pairwise',
+                    'solution_tolerance': float(params['solution_tolerance']) if params.get('solution_tolerance') is not None else 0.0,
+                    'solution_distance': int(params['solution_distance']) if params.get('solution_distance') is not None else 1,
+                    'solver_threads': int(params['solver_threads']) if params.get('solver_threads') is not None else None,
+                    'solver_processes': int(params['solver_processes']) if params.get('solver_processes') is not None else 1
                 }
             })
         else:  # POST or PUT
@@ -3637,10 +3657,54 @@ def system_adjustments_schedule():
             time_limit = data.get('time_limit')
             penalty_gap = data.get('penalty_gap')
             schedule_validation = data.get('schedule_validation', 0)
+            # Optional; left unchanged when the client does not send them
+            solver_engine = data.get('solver_engine')
+            gap_formulation = data.get('gap_formulation')
+            solution_tolerance = data.get('solution_tolerance')
+            solution_distance = data.get('solution_distance')
+            solver_threads = data.get('solver_threads')
+            solver_processes = data.get('solver_processes')
 
             # Basic validation (ensure not None)
             if any(v is None for v in [weight_mode_a, weight_mode_b, penalty_gap, maximum_solutions, time_limit]):
                 return jsonify({'success': False, 'message': 'All parameters are required'}), 400
+            if solver_engine is not None and solver_engine not in SOLVER_ENGINES:
+                return jsonify({'success': False, 'message': f"solver_engine must be one of {', '.join(SOLVER_ENGINES)}"}), 400
+            if gap_formulation is not None and gap_formulation not in GAP_FORMULATIONS:
+                return jsonify({'success': False, 'message': f"gap_formulation must be one of {', '.join(GAP_FORMULATIONS)}"}), 400
+            if solution_tolerance is not None and (
+                    isinstance(solution_tolerance, bool) or not isinstance(solution_tolerance, (int, float)) or solution_tolerance < 0):
+                return jsonify({'success': False, 'message': 'solution_tolerance must be a number >= 0'}), 400
+            if solution_distance is not None and (
+                    isinstance(solution_distance, bool) or not isinstance(solution_distance, int) or solution_distance < 1):
+                return jsonify({'success': False, 'message': 'solution_distance must be an integer >= 1'}), 400
+            if solver_threads is not None and (isinstance(solver_threads, bool) or not isinstance(solver_threads, int) or solver_threads < 1):
+                return jsonify({'success': False, 'message': 'solver_threads must be an integer >= 1'}), 400
+            if solver_processes is not None and (isinstance(solver_processes, bool) or not isinstance(solver_processes, int) or solver_processes < 1):
+                return jsonify({'success': False, 'message': 'solver_processes must be an integer >= 1'}), 400
+
+            # Optional columns are only written when sent, and only if this
+            # database has them
+            optional_values = {
+                'solver_engine': solver_engine,
+                'gap_formulation': gap_formulation,
+                'solution_tolerance': solution_tolerance,
+                'solution_distance': solution_distance,
+                'solver_threads': solver_threads,
+                'solver_processes': solver_processes,
+            }
+            cursor.execute("SELECT * FROM schedule_parameters LIMIT 0")
+            existing_columns = {column[0] for column in cursor.description}
+            cursor.fetchall()
+            missing = [column for column, value in optional_values.items()
+                       if value is not None and column not in existing_columns]
+            if missing:
+                return jsonify({
+                    'success': False,
+                    'message': f"This database's schedule_parameters table has no {', '.join(missing)} column; "
+                               f"add it before setting it"
+                }), 400
+            optional_updates = [(column, value) for column, value in optional_values.items() if value is not None]
 
             # Update single row (assumes id=1)
             cursor.execute("""
@@ -3650,16 +3714,19 @@ def system_adjustments_schedule():
                     penalty_gap = %s,
                     maximum_solutions = %s,
                     time_limit = %s,
-                    schedule_validation = %s
+                    schedule_validation = %s{optional_set}
                 WHERE id = 1
-            """, (
+            """.format(optional_set=''.join(f",\n                    {column} = %s" for column, _ in optional_updates)), (
                 weight_mode_a,
                 weight_mode_b,
                 penalty_gap,
                 maximum_solutions,
                 time_limit,
-                schedule_validation
+                schedule_validation,
+                *[value for _, value in optional_updates]
             ))
+            # Optimizer workers read schedule_parameters from the timetable snapshot
+            invalidate_timetable_snapshot(cursor)
             current_app.mysql.connection.commit()
             return jsonify({'success': True, 'message': 'Schedule parameters updated successfully'})
 
@@ -3776,6 +3843,39 @@ def get_parameter_logs():
         if cursor:
             cursor.close()
 
+@admin_bp.route('/solver_trace', methods=['GET', 'DELETE'])
+@admin_required
+def solver_trace():
+    """Read (optionally per student) or clear this worker's schedule optimizer trace"""
+    trace = get_solver_trace()
+    if request.method == 'DELETE':
+        trace.clear()
+        return jsonify({'success': True, 'message': 'Solver trace cleared'})
+
+    student_id = request.args.get('student_id')
+    limit = request.args.get('limit', 200, type=int)
+    return jsonify({
+        'success': True,
+        'traced_students': trace.traced_students(),
+        'entries': trace.entries(student_id=student_id, limit=limit)
+    })
+
+@admin_bp.route('/solver_trace/students', methods=['PUT'])
+@admin_required
+def solver_trace_students():
+    """Turn optimizer tracing on or off for one student's solves"""
+    data = request.json or {}
+    student_id = data.get('student_id')
+    if student_id is None:
+        return jsonify({'success': False, 'message': 'student_id is required'}), 400
+
+    trace = get_solver_trace()
+    if data.get('enabled', True):
+        trace.enable_student(student_id)
+    else:
+        trace.disable_student(student_id)
+    return jsonify({'success': True, 'traced_students': trace.traced_students()})
+
 def get_major_minor_status(cursor):
     """Get the current status of major/minor selection period"""
     current_app.logger.info("Checking major/minor selection status")
@@ -5639,26 +5739,18 @@ def handle_probation_extension_request_ui(request_id):
             elif status == 'approved':
                 # Get the student's probation counter and max_probation_total
                 cursor.execute("""
-                    SELECT 
-                        sss.probation_counter,
-                        COALESCE(spo.max_probation_total, sp.max_probation_total) AS max_probation_total
-                    FROM 
-                        student_semester_summary sss
-                    JOIN 
-                        (SELECT max_probation_total FROM system_parameters ORDER BY last_updated DESC LIMIT 1) sp
-                    LEFT JOIN 
-                        student_parameters_overrides spo ON sss.student_id = spo.student_id
-                    WHERE 
-                        sss.student_id = %s
-                    ORDER BY 
-                        sss.year DESC, sss.semester DESC
+                    SELECT sss.probation_counter
+                    FROM student_semester_summary sss
+                    WHERE sss.student_id = %s
+                    ORDER BY sss.year DESC, sss.semester DESC
                     LIMIT 1
                 """, (student_id,))
                 
                 probation_data = cursor.fetchone()
-                if probation_data:
+                parameters = resolve_parameters(current_app.mysql.connection, student_id)
+                if probation_data and parameters.configured:
                     probation_counter = probation_data[0]
-                    max_probation_total = probation_data[1]
+                    max_probation_total = parameters.max_probation_total
                     
                     # If probation counter has reached or exceeded max_probation_total, dismiss the student
                     if probation_counter >= max_probation_total:
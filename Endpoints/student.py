@@ -6,12 +6,20 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from auth import login_required
 from flask import Blueprint, request, jsonify, current_app, g, session
 from course_select import get_course_registration_data, get_current_courses, get_notenrolled_courses
-from schedule_optimizer import optimize_student_schedule
+from curriculum_catalog import get_curriculum_catalog
+from prerequisite_graph import get_prerequisite_graph
+from schedule_optimizer import optimize_student_schedule, check_selection_feasibility
+from system_parameters import resolve_parameters
+from schedule_jobs import QueueFull, get_schedule_job_queue, job_handler
+from solver_trace import trace_requested
+from timetable_snapshot import get_timetable_snapshot
 from functools import wraps
 from datetime import datetime, date
 import base64
 from werkzeug.security import check_password_hash, generate_password_hash
 import math
+import hashlib
+import json
 
 # Database connection function
 def get_db_connection():
@@ -102,27 +110,11 @@ def check_and_update_dismissal_status(student_id):
             
         probation_counter = probation_result[0] if probation_result[0] is not None else 0
         
-        # Get max_probation_total from system parameters
-        cursor.execute("""
-            SELECT max_probation_total
-            FROM system_parameters
-            ORDER BY last_updated DESC
-            LIMIT 1
-        """)
-        system_param = cursor.fetchone()
-        max_probation_total = system_param[0] if system_param and system_param[0] is not None else 3  # Default to 3 if not set
-        
-        # Check for student override
-        cursor.execute("""
-            SELECT max_probation_total
-            FROM student_parameters_overrides
-            WHERE student_id = %s
-        """, (student_id,))
-        
-        override = cursor.fetchone()
-        if override and override[0] is not None:
-            max_probation_total = override[0]
-            
+        # Get max_probation_total from system parameters, a student override taking precedence
+        max_probation_total = resolve_parameters(current_app.mysql.connection, student_id).max_probation_total
+        if max_probation_total is None:
+            max_probation_total = 3  # Default to 3 if not set
+
         current_app.logger.info(f"Student {student_id} probation counter: {probation_counter}, max_probation_total: {max_probation_total}")
         
         # Check if student has an approved probation extension
@@ -178,27 +170,11 @@ def is_awaiting_board_decision(student_id):
         probation_counter = probation_result[0] if probation_result[0] is not None else 0
         current_app.logger.info(f"Student {student_id} probation counter: {probation_counter}")
         
-        # Get max_probation_board from system parameters
-        cursor.execute("""
-            SELECT max_probation_board
-            FROM system_parameters
-            ORDER BY last_updated DESC
-            LIMIT 1
-        """)
-        system_param = cursor.fetchone()
-        max_probation_board = system_param[0] if system_param and system_param[0] is not None else 2  # Default to 2 if not set
-        
-        # Check for student override
-        cursor.execute("""
-            SELECT max_probation_board
-            FROM student_parameters_overrides
-            WHERE student_id = %s
-        """, (student_id,))
-        
-        override = cursor.fetchone()
-        if override and override[0] is not None:
-            max_probation_board = override[0]
-            
+        # Get max_probation_board from system parameters, a student override taking precedence
+        max_probation_board = resolve_parameters(current_app.mysql.connection, student_id).max_probation_board
+        if max_probation_board is None:
+            max_probation_board = 2  # Default to 2 if not set
+
         current_app.logger.info(f"Max probation board threshold for student {student_id}: {max_probation_board}")
         
         # Check if there's an approved extension request
@@ -670,33 +646,13 @@ def course_registration():
             if probation_counter > 0:
                 data['probation_counter'] = probation_counter
                 
-                # Get max probation limits from system parameters
-                cursor.execute("""
-                    SELECT max_probation_board, max_probation_total, min_cumulative_gpa
-                    FROM system_parameters 
-                    ORDER BY last_updated DESC LIMIT 1
-                """)
-                probation_params = cursor.fetchone()
-                
-                if probation_params:
-                    data['max_probation_board'] = probation_params[0]
-                    data['max_probation_total'] = probation_params[1]
-                    data['min_cumulative_gpa'] = float(probation_params[2]) if probation_params[2] else None
-                
-                # Check if student has overrides
-                cursor.execute("""
-                    SELECT max_probation_board, max_probation_total
-                    FROM student_parameters_overrides
-                    WHERE student_id = %s
-                """, (student_id,))
-                
-                probation_override = cursor.fetchone()
-                if probation_override:
-                    if probation_override[0] is not None:
-                        data['max_probation_board'] = probation_override[0]
-                    if probation_override[1] is not None:
-                        data['max_probation_total'] = probation_override[1]
-                
+                # Get max probation limits from system parameters, with the student's overrides
+                probation_params = resolve_parameters(current_app.mysql.connection, student_id)
+                if probation_params.configured:
+                    data['max_probation_board'] = probation_params.max_probation_board
+                    data['max_probation_total'] = probation_params.max_probation_total
+                    data['min_cumulative_gpa'] = probation_params.min_cumulative_gpa or None
+
                 # Get student's current cumulative GPA
                 cursor.execute("""
                     SELECT cumulative_gpa
@@ -749,15 +705,10 @@ def course_registration():
 
 def get_max_courses():
     """Returns the current max courses allowed per semester"""
-    cursor = current_app.mysql.connection.cursor()
     try:
-        cursor.execute("SELECT max_courses_per_semester FROM system_parameters LIMIT 1")
-        result = cursor.fetchone()
-        return result[0]
+        return resolve_parameters(current_app.mysql.connection).max_courses_per_semester
     except Exception as e:
         current_app.logger.error(f"Error fetching max courses: {str(e)}")
-    finally:
-        cursor.close()
 
 
 @student_bp.route('/enrollment-history')
@@ -785,23 +736,7 @@ def enrollment_history():
             cursor = current_app.mysql.connection.cursor()
             try:
                 # 1) Determine the maximum forgiveness uses (override takes precedence over system default)
-                cursor.execute("""
-                    SELECT max_forgiveness_uses
-                    FROM student_parameters_overrides
-                    WHERE student_id = %s
-                """, (student_id,))
-                override_row = cursor.fetchone()
-                if override_row and override_row[0] is not None:
-                    max_forgiveness_uses = int(override_row[0])
-                else:
-                    cursor.execute("""
-                        SELECT max_forgiveness_uses
-                        FROM system_parameters
-                        ORDER BY last_updated DESC
-                        LIMIT 1
-                    """)
-                    system_row = cursor.fetchone()
-                    max_forgiveness_uses = int(system_row[0]) if system_row and system_row[0] is not None else None
+                max_forgiveness_uses = resolve_parameters(current_app.mysql.connection, student_id).max_forgiveness_uses
 
                 # 2) Count the number of forgiveness policies already used by the student
                 cursor.execute("""
@@ -1228,10 +1163,8 @@ def submit_courses():
             is_non_french = cursor.fetchone()[0] == 1
             
             # Get min_credit_percentage_major from system_parameters
-            cursor.execute("SELECT min_credit_percentage_major FROM system_parameters ORDER BY last_updated DESC LIMIT 1")
-            min_percentage_row = cursor.fetchone()
-            min_percentage = float(min_percentage_row[0]) if min_percentage_row and min_percentage_row[0] is not None else None
-            
+            min_percentage = resolve_parameters(current_app.mysql.connection).min_credit_percentage_major
+
             # Calculate total weights for year 1 and 2 courses
             total_weights_query = """
                 SELECT SUM(coefficient) as total_weights
@@ -1593,7 +1526,7 @@ def get_major_gpa():
         cumulative_gpa, is_non_french = get_student_basic_info(cursor, student_id)
         
         # 2. Get system parameters
-        min_percentage, min_cumulative_gpa = get_system_parameters(cursor)
+        min_percentage, min_cumulative_gpa = get_system_parameters()
         
         # 3. Calculate credit status
         credit_status = calculate_credit_status(cursor, student_id, is_non_french, min_percentage)
@@ -1602,17 +1535,17 @@ def get_major_gpa():
         meets_cumulative_gpa = check_cumulative_gpa_requirement(cumulative_gpa, min_cumulative_gpa)
         
         # 5. Get GPA requirements (system defaults + overrides)
-        min_gpa_map = get_gpa_requirements(cursor, student_id)
+        min_gpa_map = get_gpa_requirements(student_id)
         
         # 6. Get all majors data
-        majors, majors_order = get_majors_data(cursor)
+        majors, majors_order = get_majors_data()
         
         # 7. Get student grades
         student_grades = get_student_grades(cursor, student_id)
         
         # 8. Calculate major-specific data & update table student
         major_data, specialized_gpas = calculate_major_data(
-            cursor, majors, student_grades, min_gpa_map,
+            majors, student_grades, min_gpa_map,
             credit_status['meets_requirement'], meets_cumulative_gpa
         )
 
@@ -1742,17 +1675,9 @@ def get_student_basic_info(cursor, student_id):
     is_non_french = bool(result[1]) if result and result[1] is not None else False
     return cumulative_gpa, is_non_french
 
-def get_system_parameters(cursor):
-    cursor.execute("""
-        SELECT min_credit_percentage_major, min_cumulative_gpa
-        FROM system_parameters
-        ORDER BY last_updated DESC
-        LIMIT 1
-    """)
-    min_percentage_row = cursor.fetchone()
-    min_percentage = float(min_percentage_row[0]) if min_percentage_row else None
-    min_cumulative_gpa = float(min_percentage_row[1]) if min_percentage_row else None
-    return min_percentage, min_cumulative_gpa
+def get_system_parameters():
+    system_parameters = resolve_parameters(current_app.mysql.connection)
+    return system_parameters.min_credit_percentage_major, system_parameters.min_cumulative_gpa
 
 def calculate_credit_status(cursor, student_id, is_non_french, min_percentage):
     # Calculate total weights
@@ -1813,49 +1738,15 @@ def check_cumulative_gpa_requirement(cumulative_gpa, min_cumulative_gpa):
             min_cumulative_gpa is not None and 
             cumulative_gpa >= min_cumulative_gpa)
 
-def get_gpa_requirements(cursor, student_id):
-    # Get system defaults
-    cursor.execute("""
-        SELECT 
-            COALESCE(min_gpa_acct, 0) as min_gpa_acct,
-            COALESCE(min_gpa_ba, 0) as min_gpa_ba,
-            COALESCE(min_gpa_fin, 0) as min_gpa_fin,
-            COALESCE(min_gpa_it, 0) as min_gpa_it,
-            COALESCE(min_gpa_mrk, 0) as min_gpa_mrk
-        FROM system_parameters
-        ORDER BY last_updated DESC LIMIT 1
-    """)
-    system_defaults = cursor.fetchone()
-    
-    min_gpa_map = {
-        'ACCT': float(system_defaults[0]),
-        'BA': float(system_defaults[1]),
-        'FIN': float(system_defaults[2]),
-        'IT': float(system_defaults[3]),
-        'MRK': float(system_defaults[4])
-    }
+def get_gpa_requirements(student_id):
+    # System defaults with the student's overrides applied, unset minimums counting as 0
+    parameters = resolve_parameters(current_app.mysql.connection, student_id)
+    return {major: min_gpa if min_gpa is not None else 0.0
+            for major, min_gpa in parameters.min_gpa_map.items()}
 
-    # Check for overrides
-    cursor.execute("""
-        SELECT 
-            min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-        FROM student_parameters_overrides
-        WHERE student_id = %s
-    """, (student_id,))
-    override_row = cursor.fetchone()
-    
-    if override_row:
-        if override_row[0] is not None: min_gpa_map['ACCT'] = float(override_row[0])
-        if override_row[1] is not None: min_gpa_map['BA'] = float(override_row[1])
-        if override_row[2] is not None: min_gpa_map['FIN'] = float(override_row[2])
-        if override_row[3] is not None: min_gpa_map['IT'] = float(override_row[3])
-        if override_row[4] is not None: min_gpa_map['MRK'] = float(override_row[4])
-
-    return min_gpa_map
-
-def get_majors_data(cursor):
-    cursor.execute("SELECT id, major, full_name FROM majors")
-    majors = {row[0]: {'major': row[1], 'full_name': row[2]} for row in cursor.fetchall()}
+def get_majors_data():
+    catalog = get_curriculum_catalog(current_app.mysql.connection)
+    majors = {major.id: {'major': major.major, 'full_name': major.full_name} for major in catalog.majors}
     majors_order = [major_info['major'] for major_id, major_info in sorted(majors.items())]
     return majors, majors_order
 
@@ -1873,7 +1764,7 @@ def get_student_grades(cursor, student_id):
         for row in cursor.fetchall()
     }
 
-def calculate_major_data(cursor, majors, student_grades, min_gpa_map,
+def calculate_major_data(majors, student_grades, min_gpa_map,
                       meets_credit_req, meets_cumulative_gpa):
     """Calculate major data including specialized GPAs for each major"""
     major_data = {}
@@ -1886,12 +1777,9 @@ def calculate_major_data(cursor, majors, student_grades, min_gpa_map,
         'mrk_gpa': None
     }
 
+    catalog = get_curriculum_catalog(current_app.mysql.connection)
     for major_id, major_info in majors.items():
-        cursor.execute("""
-            SELECT course_code, course_name, weight, COALESCE(minimum_grade_point, 0)
-            FROM major_course_requirements
-            WHERE major_id = %s
-        """, (major_id,))
+        major_requirements = catalog.requirements_by_major.get(major_id, ())
 
         requirements = []
         total_weighted = 0.0
@@ -1902,24 +1790,15 @@ def calculate_major_data(cursor, majors, student_grades, min_gpa_map,
         has_minimum_requirements = False  # Flag to track if any course has minimum requirements
 
         # First, calculate the total weight of all requirements for this major
-        for row in cursor.fetchall():
-            course_code, course_name, weight, min_grade = row
+        for course_code, course_name, weight, min_grade in major_requirements:
             weight = float(weight)
             total_major_requirements_weight += weight
             if min_grade and float(min_grade) > 0:
                 has_minimum_requirements = True
         
-        # Reset cursor position to get requirements again
-        cursor.execute("""
-            SELECT course_code, course_name, weight, COALESCE(minimum_grade_point, 0)
-            FROM major_course_requirements
-            WHERE major_id = %s
-        """, (major_id,))
-
-        for row in cursor.fetchall():
-            course_code, course_name, weight, min_grade = row
+        for course_code, course_name, weight, min_grade in major_requirements:
             weight = float(weight)
-            min_grade = float(min_grade) if min_grade is not None else None
+            min_grade = float(min_grade) if min_grade is not None else 0.0
 
             # Check if this course has a minimum grade requirement
             if min_grade and min_grade > 0:
@@ -2054,8 +1933,8 @@ def select_major_minor():
                 'code': 'SELECTION_CLOSED'
             }), 403
 
-        all_majors = fetch_all_majors(cursor)
-        all_minors = fetch_all_minors(cursor)
+        all_majors = fetch_all_majors()
+        all_minors = fetch_all_minors()
         eligible_majors = fetch_eligible_majors()
 
         validation_error = validate_choices(choices, all_majors, all_minors, eligible_majors)
@@ -2154,13 +2033,13 @@ def invalid_data_response():
         'code': 'INVALID_DATA'
     }), 400
 
-def fetch_all_majors(cursor):
-    cursor.execute("SELECT major, full_name FROM majors")
-    return {row[0]: row[1] for row in cursor.fetchall()}
+def fetch_all_majors():
+    catalog = get_curriculum_catalog(current_app.mysql.connection)
+    return {major.major: major.full_name for major in catalog.majors}
 
-def fetch_all_minors(cursor):
-    cursor.execute("SELECT minor, full_name FROM minors")
-    return {row[0]: row[1] for row in cursor.fetchall()}
+def fetch_all_minors():
+    catalog = get_curriculum_catalog(current_app.mysql.connection)
+    return {minor.minor: minor.full_name for minor in catalog.minors}
 
 def fetch_eligible_majors():
     gpa_data = get_major_gpa().get_json()
@@ -2308,14 +2187,9 @@ def get_rejected_combinations():
 @login_required
 def get_major_minor_options():
     try:
-        cursor = current_app.mysql.connection.cursor()
-        
         # Get all majors and minors with their full names
-        cursor.execute("SELECT major, full_name FROM majors")
-        majors = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        cursor.execute("SELECT minor, full_name FROM minors")
-        minors = {row[0]: row[1] for row in cursor.fetchall()}
+        majors = fetch_all_majors()
+        minors = fetch_all_minors()
         
         return jsonify({
             'success': True,
@@ -2326,9 +2200,6 @@ def get_major_minor_options():
     except Exception as e:
         current_app.logger.error(f"Error fetching major/minor options: {str(e)}", exc_info=True)
         return error_response(str(e))
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
 
 
 @student_bp.route('/major_minor/selection_status')
@@ -2444,19 +2315,14 @@ def get_current_choices():
 @login_required
 def get_course_info(course_code):
     """Get course information including prerequisites and courses that have this course as prerequisite"""
-    cursor = current_app.mysql.connection.cursor()
     try:
         # Get student ID for logging
         student_id = session['student']['student_id']
         current_app.logger.info(f"Course info request for {course_code} by student {student_id}")
         
         # Get course details
-        cursor.execute("""
-            SELECT c.course_code, c.course_name, c.description, c.has_tutorial, c.has_lecture, c.coefficient
-            FROM courses c
-            WHERE c.course_code = %s
-        """, (course_code,))
-        course = cursor.fetchone()
+        catalog = get_curriculum_catalog(current_app.mysql.connection)
+        course = catalog.course_by_code.get(course_code)
         
         if not course:
             return jsonify({
@@ -2464,34 +2330,16 @@ def get_course_info(course_code):
                 'message': 'Course not found'
             }), 404
         
-        # Get prerequisites for this course
-        cursor.execute("""
-            SELECT c.course_code, c.course_name
-            FROM courses c
-            JOIN course_prerequisites cp ON c.id = cp.prerequisite_id
-            JOIN courses c2 ON cp.course_id = c2.id
-            WHERE c2.course_code = %s
-        """, (course_code,))
-        prerequisites = [{'code': row[0], 'name': row[1]} for row in cursor.fetchall()]
-        
-        # Get courses that have this course as a prerequisite
-        cursor.execute("""
-            SELECT c.course_code, c.course_name
-            FROM courses c
-            JOIN course_prerequisites cp ON c.id = cp.course_id
-            JOIN courses c2 ON cp.prerequisite_id = c2.id
-            WHERE c2.course_code = %s
-        """, (course_code,))
-        is_prerequisite_for = [{'code': row[0], 'name': row[1]} for row in cursor.fetchall()]
+        prerequisites, is_prerequisite_for = get_prerequisite_links(catalog, course_code)
         
         return jsonify({
             'success': True,
-            'course_code': course[0],
-            'course_name': course[1],
-            'description': course[2],
-            'has_tutorial': bool(course[3]),
-            'has_lecture': bool(course[4]),
-            'coefficient': course[5],
+            'course_code': course.course_code,
+            'course_name': course.course_name,
+            'description': course.description,
+            'has_tutorial': bool(course.has_tutorial),
+            'has_lecture': bool(course.has_lecture),
+            'coefficient': course.coefficient,
             'prerequisites': prerequisites,
             'is_prerequisite_for': is_prerequisite_for
         })
@@ -2502,14 +2350,11 @@ def get_course_info(course_code):
             'success': False,
             'message': f'Error fetching course information: {str(e)}'
         }), 500
-    finally:
-        cursor.close()
 
 @student_bp.route('/course-registration/courses_info', methods=['POST'])
 @login_required
 def get_multiple_courses_info():
     """Get information for multiple courses in a single request"""
-    cursor = current_app.mysql.connection.cursor()
     try:
         # Get student ID for logging
         student_id = session['student']['student_id']
@@ -2533,74 +2378,19 @@ def get_multiple_courses_info():
         
         # Create result dictionary
         courses_info = {}
-        
-        # Use a parameterized query with IN clause
-        if course_codes:
-            # Create placeholders for SQL query
-            placeholders = ', '.join(['%s'] * len(course_codes))
-            
-            # Get basic course info for all requested courses
-            cursor.execute(f"""
-                SELECT c.course_code, c.course_name, c.description, c.has_tutorial, c.has_lecture, c.coefficient
-                FROM courses c
-                WHERE c.course_code IN ({placeholders})
-            """, course_codes)
-            
-            # Store basic course info
-            for row in cursor.fetchall():
-                course_code = row[0]
-                courses_info[course_code] = {
-                    'course_code': course_code,
-                    'course_name': row[1],
-                    'description': row[2],
-                    'has_tutorial': bool(row[3]),
-                    'has_lecture': bool(row[4]),
-                    'coefficient': row[5],
-                    'prerequisites': [],
-                    'is_prerequisite_for': []
-                }
-            
-            # Get prerequisites for all courses
-            cursor.execute(f"""
-                SELECT c2.course_code, c.course_code as prereq_code, c.course_name as prereq_name
-                FROM courses c2
-                JOIN course_prerequisites cp ON cp.course_id = c2.id
-                JOIN courses c ON c.id = cp.prerequisite_id
-                WHERE c2.course_code IN ({placeholders})
-            """, course_codes)
-            
-            # Add prerequisites to the corresponding courses
-            for row in cursor.fetchall():
-                course_code = row[0]
-                prereq_code = row[1]
-                prereq_name = row[2]
-                
-                if course_code in courses_info:
-                    courses_info[course_code]['prerequisites'].append({
-                        'code': prereq_code,
-                        'name': prereq_name
-                    })
-            
-            # Get "is prerequisite for" info
-            cursor.execute(f"""
-                SELECT c2.course_code, c.course_code as required_code, c.course_name as required_name
-                FROM courses c2
-                JOIN course_prerequisites cp ON cp.prerequisite_id = c2.id
-                JOIN courses c ON c.id = cp.course_id
-                WHERE c2.course_code IN ({placeholders})
-            """, course_codes)
-            
-            # Add "is prerequisite for" to the corresponding courses
-            for row in cursor.fetchall():
-                course_code = row[0]
-                required_code = row[1]
-                required_name = row[2]
-                
-                if course_code in courses_info:
-                    courses_info[course_code]['is_prerequisite_for'].append({
-                        'code': required_code,
-                        'name': required_name
-                    })
+        catalog = get_curriculum_catalog(current_app.mysql.connection)
+        for course in catalog.courses_for(course_codes):
+            prerequisites, is_prerequisite_for = get_prerequisite_links(catalog, course.course_code)
+            courses_info[course.course_code] = {
+                'course_code': course.course_code,
+                'course_name': course.course_name,
+                'description': course.description,
+                'has_tutorial': bool(course.has_tutorial),
+                'has_lecture': bool(course.has_lecture),
+                'coefficient': course.coefficient,
+                'prerequisites': prerequisites,
+                'is_prerequisite_for': is_prerequisite_for
+            }
         
         return jsonify({
             'success': True,
@@ -2613,8 +2403,14 @@ def get_multiple_courses_info():
             'success': False,
             'message': f'Error fetching course information: {str(e)}'
         }), 500
-    finally:
-        cursor.close()
+
+def get_prerequisite_links(catalog, course_code):
+    """The {'code', 'name'} lists of a course's prerequisites and of the courses requiring it"""
+    graph = get_prerequisite_graph(current_app.mysql.connection)
+    prerequisites = sorted(catalog.courses_for(graph.prerequisites.get(course_code, ())), key=lambda course: course.id)
+    dependents = catalog.courses_for(graph.dependents.get(course_code, ()))
+    return ([{'code': course.course_code, 'name': course.course_name} for course in prerequisites],
+            [{'code': course.course_code, 'name': course.course_name} for course in dependents])
 
 @student_bp.route('/schedule', methods=['GET'])
 @login_required
@@ -2717,7 +2513,6 @@ def get_student_schedule():
             
             # Add saved schedule to response if it exists
             if saved_schedule:
-                import json
                 schedule_data = json.loads(saved_schedule[0])
                 created_at = saved_schedule[1].strftime('%Y-%m-%d %H:%M:%S') if saved_schedule[1] else None
                 
@@ -2906,7 +2701,6 @@ def regenerate_schedule():
                 # Save the schedule to the database
                 try:
                     # Prepare data to save
-                    import json
                     # Remove course_details before saving (we'll add them back when retrieving)
                     save_result = {k: v for k, v in result.items() if k != 'course_details'}
                     schedule_data = json.dumps(save_result)
@@ -4542,10 +4336,10 @@ def handle_time_slot_preferences():
                 (student_id,)
             )
             
-            # Then insert new preferences for all 30 slots
+            # Then insert new preferences for every slot of the time grid
             current_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            for slot_number in range(1, 31):
+            for slot_number in get_timetable_snapshot(current_app.mysql.connection).grid.slots:
                 is_preferred = 1 if slot_number in preferred_slots else 0
                 
                 cursor.execute(
@@ -4572,6 +4366,198 @@ def handle_time_slot_preferences():
                 'message': 'Failed to save time slot preferences'
             }), 500
 
+def _load_generation_preferences(cursor, student_id, request_data=None):
+    """Preferences generate_optimized_schedule hands to the optimizer: stored ones merged with the request's"""
+    preferences = {}
+
+    # Load professor preferences
+    cursor.execute("""
+        SELECT course_code, session_type, professor_index, ranked
+        FROM professor_preferences
+        WHERE student_id = %s
+    """, (student_id,))
+
+    professor_preferences = {}
+    for row in cursor.fetchall():
+        course_code, session_type, professor_index, rank = row
+        if course_code not in professor_preferences:
+            professor_preferences[course_code] = {}
+        if session_type not in professor_preferences[course_code]:
+            professor_preferences[course_code][session_type] = {}
+        professor_preferences[course_code][session_type][professor_index] = rank
+
+    if professor_preferences:
+        preferences['professor_preferences'] = professor_preferences
+
+    # Load timeslot preferences
+    cursor.execute("""
+        SELECT time_slot_number, is_preferred
+        FROM time_slot_preferences
+        WHERE student_id = %s
+    """, (student_id,))
+
+    timeslot_preferences = {}
+    for row in cursor.fetchall():
+        time_slot_number, is_preferred = row
+        timeslot_preferences[time_slot_number] = bool(is_preferred)
+
+    if timeslot_preferences:
+        preferences['timeslot_preferences'] = timeslot_preferences
+
+    current_app.logger.info(f"Generating optimized schedule for student {student_id} with preferences: {preferences}")
+
+    # Check if there are any additional preferences from the request
+    try:
+        data = request_data
+        if data and 'preferences' in data:
+            req_preferences = data['preferences']
+        
+            # Check if priority_mode is specified
+            if 'priority_mode' in req_preferences:
+                priority_mode = req_preferences['priority_mode']
+                current_app.logger.info(f"Using priority mode for schedule generation: {priority_mode}")
+            
+                # Add priority_mode to preferences - the optimizer will load the appropriate weight
+                preferences['priority_mode'] = priority_mode
+            else:
+                # If no priority_mode specified, check the database for the current mode
+                cursor.execute(
+                    "SELECT priority FROM priority_preferences WHERE student_id = %s",
+                    (student_id,)
+                )
+                mode_result = cursor.fetchone()
+                if mode_result and mode_result[0]:
+                    stored_mode = mode_result[0]
+                    # Convert 'a'/'b' to 'timeslots'/'professors'
+                    stored_priority_mode = (
+                        'timeslots' if stored_mode == 'a' else 'professors'
+                    )
+                    preferences['priority_mode'] = stored_priority_mode
+                    current_app.logger.info(
+                        f"Using stored priority mode from DB: {stored_priority_mode}"
+                    )
+                else:
+                    # Default to timeslots priority if nothing is stored
+                    preferences['priority_mode'] = 'timeslots'
+                    current_app.logger.info(
+                        "No stored priority found – defaulting to 'timeslots'"
+                    )
+        
+            # Merge any other preferences
+            for key, value in req_preferences.items():
+                if key != 'priority_mode':  # We've already handled this
+                    preferences[key] = value
+    except Exception as e:
+        current_app.logger.error(f"Error parsing request preferences: {str(e)}")
+        # Continue with existing preferences
+    
+    return preferences
+
+def _attach_course_details(cursor, result):
+    """Add course names and course_details to a generated schedule; False if it had nothing to look up"""
+    if 'schedule' in result:
+        # Check for course_name in schedule items
+        for item in result['schedule']:
+            if 'course_name' not in item or not item['course_name'] or item['course_name'] == 'Unknown Course':
+                # Need to populate course names
+                break
+        else:
+            # All items have course names, skip database query
+            current_app.logger.debug("Schedule items already have course names, skipping query")
+            result['course_details'] = {}
+            return False
+    
+        # Need to query course details
+        course_details = {}
+        for item in result['schedule']:
+            course_code = item['course_code']
+            if course_code not in course_details:
+                cursor.execute("""
+                    SELECT course_name, coefficient
+                    FROM courses
+                    WHERE course_code = %s
+                """, (course_code,))
+                course_info = cursor.fetchone()
+                if course_info:
+                    course_details[course_code] = {
+                        'course_name': course_info[0],
+                        'coefficient': course_info[1]
+                    }
+                    # Update item directly for better display
+                    item['course_name'] = course_info[0]
+                else:
+                    # Create default if no info found
+                    course_details[course_code] = {
+                        'course_name': f"{course_code} Course",
+                        'coefficient': 3  # Default credits
+                    }
+                    item['course_name'] = f"{course_code} Course"
+    
+        result['course_details'] = course_details
+    
+    return True
+
+def _save_generated_schedule(connection, cursor, student_id, enrolled_courses, result):
+    """Replace the saved student_schedules row for the student's current courses with result"""
+    try:
+        # Get semester and year
+        cursor.execute("""
+            SELECT semester, year
+            FROM academic_calendar
+            WHERE is_current = 1
+            LIMIT 1
+        """)
+        calendar_info = cursor.fetchone()
+        if calendar_info:
+            result['semester'] = calendar_info[0]
+            result['year'] = calendar_info[1]
+    
+        # Prepare data to save
+        enrolled_courses_key = ','.join(sorted(enrolled_courses))
+        save_result = {k: v for k, v in result.items() if k != 'course_details'}
+        schedule_data = json.dumps(save_result)
+    
+        # First delete any existing schedules
+        cursor.execute("""
+            DELETE FROM student_schedules
+            WHERE student_id = %s AND enrolled_courses_key = %s
+        """, (student_id, enrolled_courses_key))
+    
+        # Check if the student_schedules table has semester and year columns
+        try:
+            # First check table structure
+            cursor.execute("SHOW COLUMNS FROM student_schedules")
+            columns = [column[0] for column in cursor.fetchall()]
+        
+            if 'semester' in columns and 'year' in columns:
+                # If columns exist, use them
+                cursor.execute("""
+                    INSERT INTO student_schedules 
+                    (student_id, enrolled_courses_key, schedule_data, semester, year)
+                    VALUES (%s, %s, %s, %s, %s)
+                """, (student_id, enrolled_courses_key, schedule_data, result['semester'], result['year']))
+            else:
+                # If columns don't exist, don't include them
+                cursor.execute("""
+                    INSERT INTO student_schedules 
+                    (student_id, enrolled_courses_key, schedule_data)
+                    VALUES (%s, %s, %s)
+                """, (student_id, enrolled_courses_key, schedule_data))
+        except Exception as e:
+            current_app.logger.error(f"Error checking table structure: {str(e)}")
+            # Fallback to simpler query
+            cursor.execute("""
+                INSERT INTO student_schedules 
+                (student_id, enrolled_courses_key, schedule_data)
+                VALUES (%s, %s, %s)
+            """, (student_id, enrolled_courses_key, schedule_data))
+        connection.commit()
+    
+        current_app.logger.info(f"Saved optimized schedule for student {student_id}")
+    except Exception as e:
+        current_app.logger.error(f"Error saving optimized schedule: {str(e)}")
+        # Continue anyway, just don't save the schedule
+
 @student_bp.route('/schedule/generate', methods=['POST'])
 @login_required
 def generate_optimized_schedule():
@@ -4605,89 +4591,8 @@ def generate_optimized_schedule():
                     'code': 'NO_COURSES'
                 }), 404
             
-            # Load preferences from database
-            preferences = {}
-            
-            # Load professor preferences
-            cursor.execute("""
-                SELECT course_code, session_type, professor_index, ranked
-                FROM professor_preferences
-                WHERE student_id = %s
-            """, (student_id,))
-            
-            professor_preferences = {}
-            for row in cursor.fetchall():
-                course_code, session_type, professor_index, rank = row
-                if course_code not in professor_preferences:
-                    professor_preferences[course_code] = {}
-                if session_type not in professor_preferences[course_code]:
-                    professor_preferences[course_code][session_type] = {}
-                professor_preferences[course_code][session_type][professor_index] = rank
-            
-            if professor_preferences:
-                preferences['professor_preferences'] = professor_preferences
-            
-            # Load timeslot preferences
-            cursor.execute("""
-                SELECT time_slot_number, is_preferred
-                FROM time_slot_preferences
-                WHERE student_id = %s
-            """, (student_id,))
-            
-            timeslot_preferences = {}
-            for row in cursor.fetchall():
-                time_slot_number, is_preferred = row
-                timeslot_preferences[time_slot_number] = bool(is_preferred)
-            
-            if timeslot_preferences:
-                preferences['timeslot_preferences'] = timeslot_preferences
-            
-            current_app.logger.info(f"Generating optimized schedule for student {student_id} with preferences: {preferences}")
-            
-            # Check if there are any additional preferences from the request
-            try:
-                data = request.get_json()
-                if data and 'preferences' in data:
-                    req_preferences = data['preferences']
-                    
-                    # Check if priority_mode is specified
-                    if 'priority_mode' in req_preferences:
-                        priority_mode = req_preferences['priority_mode']
-                        current_app.logger.info(f"Using priority mode for schedule generation: {priority_mode}")
-                        
-                        # Add priority_mode to preferences - the optimizer will load the appropriate weight
-                        preferences['priority_mode'] = priority_mode
-                    else:
-                        # If no priority_mode specified, check the database for the current mode
-                        cursor.execute(
-                            "SELECT priority FROM priority_preferences WHERE student_id = %s",
-                            (student_id,)
-                        )
-                        mode_result = cursor.fetchone()
-                        if mode_result and mode_result[0]:
-                            stored_mode = mode_result[0]
-                            # Convert 'a'/'b' to 'timeslots'/'professors'
-                            stored_priority_mode = (
-                                'timeslots' if stored_mode == 'a' else 'professors'
-                            )
-                            preferences['priority_mode'] = stored_priority_mode
-                            current_app.logger.info(
-                                f"Using stored priority mode from DB: {stored_priority_mode}"
-                            )
-                        else:
-                            # Default to timeslots priority if nothing is stored
-                            preferences['priority_mode'] = 'timeslots'
-                            current_app.logger.info(
-                                "No stored priority found – defaulting to 'timeslots'"
-                            )
-                    
-                    # Merge any other preferences
-                    for key, value in req_preferences.items():
-                        if key != 'priority_mode':  # We've already handled this
-                            preferences[key] = value
-            except Exception as e:
-                current_app.logger.error(f"Error parsing request preferences: {str(e)}")
-                # Continue with existing preferences
+            # Stored preferences merged with any sent in the request
+            preferences = _load_generation_preferences(cursor, student_id, request.get_json(silent=True))
             
             # Import the optimize_student_schedule function
             from schedule_optimizer import optimize_student_schedule
@@ -4713,106 +4618,11 @@ def generate_optimized_schedule():
                 }), 500
             
             # Add course details to the result
-            if 'schedule' in result:
-                # Check for course_name in schedule items
-                for item in result['schedule']:
-                    if 'course_name' not in item or not item['course_name'] or item['course_name'] == 'Unknown Course':
-                        # Need to populate course names
-                        break
-                else:
-                    # All items have course names, skip database query
-                    current_app.logger.debug("Schedule items already have course names, skipping query")
-                    result['course_details'] = {}
-                    return jsonify(result)
-                
-                # Need to query course details
-                course_details = {}
-                for item in result['schedule']:
-                    course_code = item['course_code']
-                    if course_code not in course_details:
-                        cursor.execute("""
-                            SELECT course_name, coefficient
-                            FROM courses
-                            WHERE course_code = %s
-                        """, (course_code,))
-                        course_info = cursor.fetchone()
-                        if course_info:
-                            course_details[course_code] = {
-                                'course_name': course_info[0],
-                                'coefficient': course_info[1]
-                            }
-                            # Update item directly for better display
-                            item['course_name'] = course_info[0]
-                        else:
-                            # Create default if no info found
-                            course_details[course_code] = {
-                                'course_name': f"{course_code} Course",
-                                'coefficient': 3  # Default credits
-                            }
-                            item['course_name'] = f"{course_code} Course"
-                
-                result['course_details'] = course_details
+            if not _attach_course_details(cursor, result):
+                return jsonify(result)
             
             # Save the schedule to the database
-            try:
-                # Get semester and year
-                cursor.execute("""
-                    SELECT semester, year
-                    FROM academic_calendar
-                    WHERE is_current = 1
-                    LIMIT 1
-                """)
-                calendar_info = cursor.fetchone()
-                if calendar_info:
-                    result['semester'] = calendar_info[0]
-                    result['year'] = calendar_info[1]
-                
-                # Prepare data to save
-                import json
-                enrolled_courses_key = ','.join(sorted(enrolled_courses))
-                save_result = {k: v for k, v in result.items() if k != 'course_details'}
-                schedule_data = json.dumps(save_result)
-                
-                # First delete any existing schedules
-                cursor.execute("""
-                    DELETE FROM student_schedules
-                    WHERE student_id = %s AND enrolled_courses_key = %s
-                """, (student_id, enrolled_courses_key))
-                
-                # Check if the student_schedules table has semester and year columns
-                try:
-                    # First check table structure
-                    cursor.execute("SHOW COLUMNS FROM student_schedules")
-                    columns = [column[0] for column in cursor.fetchall()]
-                    
-                    if 'semester' in columns and 'year' in columns:
-                        # If columns exist, use them
-                        cursor.execute("""
-                            INSERT INTO student_schedules 
-                            (student_id, enrolled_courses_key, schedule_data, semester, year)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (student_id, enrolled_courses_key, schedule_data, result['semester'], result['year']))
-                    else:
-                        # If columns don't exist, don't include them
-                        cursor.execute("""
-                            INSERT INTO student_schedules 
-                            (student_id, enrolled_courses_key, schedule_data)
-                            VALUES (%s, %s, %s)
-                        """, (student_id, enrolled_courses_key, schedule_data))
-                except Exception as e:
-                    current_app.logger.error(f"Error checking table structure: {str(e)}")
-                    # Fallback to simpler query
-                    cursor.execute("""
-                        INSERT INTO student_schedules 
-                        (student_id, enrolled_courses_key, schedule_data)
-                        VALUES (%s, %s, %s)
-                    """, (student_id, enrolled_courses_key, schedule_data))
-                current_app.mysql.connection.commit()
-                
-                current_app.logger.info(f"Saved optimized schedule for student {student_id}")
-            except Exception as e:
-                current_app.logger.error(f"Error saving optimized schedule: {str(e)}")
-                # Continue anyway, just don't save the schedule
+            _save_generated_schedule(current_app.mysql.connection, cursor, student_id, enrolled_courses, result)
             
             return jsonify(result)
         
@@ -5265,6 +5075,39 @@ def check_forgiveness_status():
             'error': str(e)
         }), 500
 
+def _attach_solutions_course_details(cursor, result):
+    """Add the shared course_details to every solution of a find-all result"""
+    if result['success'] and 'solutions' in result and result['solutions']:
+        try:
+            # Get all unique course codes from all solutions
+            all_course_codes = set()
+            for solution in result['solutions']:
+                if 'schedule' in solution:
+                    for item in solution['schedule']:
+                        all_course_codes.add(item['course_code'])
+
+            # Get course details for all courses
+            course_details = {}
+            for course_code in all_course_codes:
+                cursor.execute("""
+                    SELECT course_name, coefficient
+                    FROM courses
+                    WHERE course_code = %s
+                """, (course_code,))
+                course_info = cursor.fetchone()
+                if course_info:
+                    course_details[course_code] = {
+                        'course_name': course_info[0],
+                        'coefficient': course_info[1]
+                    }
+
+            # Add course details to each solution
+            for solution in result['solutions']:
+                solution['course_details'] = course_details
+        except Exception as e:
+            current_app.logger.error(f"Error processing solutions: {str(e)}")
+            # Continue anyway, we'll return what we have
+
 @student_bp.route('/schedule/all-optimal', methods=['POST'])
 @login_required
 def find_all_optimal_schedules():
@@ -5320,36 +5163,7 @@ def find_all_optimal_schedules():
             )
             
             # Add course details to each solution
-            if result['success'] and 'solutions' in result and result['solutions']:
-                try:
-                    # Get all unique course codes from all solutions
-                    all_course_codes = set()
-                    for solution in result['solutions']:
-                        if 'schedule' in solution:
-                            for item in solution['schedule']:
-                                all_course_codes.add(item['course_code'])
-                    
-                    # Get course details for all courses
-                    course_details = {}
-                    for course_code in all_course_codes:
-                        cursor.execute("""
-                            SELECT course_name, coefficient
-                            FROM courses
-                            WHERE course_code = %s
-                        """, (course_code,))
-                        course_info = cursor.fetchone()
-                        if course_info:
-                            course_details[course_code] = {
-                                'course_name': course_info[0],
-                                'coefficient': course_info[1]
-                            }
-                    
-                    # Add course details to each solution
-                    for solution in result['solutions']:
-                        solution['course_details'] = course_details
-                except Exception as e:
-                    current_app.logger.error(f"Error processing solutions: {str(e)}")
-                    # Continue anyway, we'll return what we have
+            _attach_solutions_course_details(cursor, result)
             
             return jsonify(result)
         
@@ -5364,6 +5178,179 @@ def find_all_optimal_schedules():
             'code': 'SCHEDULE_ERROR'
         }), 500
 
+def _job_db_connection():
+    """Own MySQL connection for a job worker thread, outside any request"""
+    import mysql.connector
+    return mysql.connector.connect(
+        host=current_app.config['MYSQL_HOST'],
+        user=current_app.config['MYSQL_USER'],
+        password=current_app.config['MYSQL_PASSWORD'],
+        database=current_app.config['MYSQL_DB']
+    )
+
+@job_handler('generate')
+def _run_generate_job(payload):
+    """Background counterpart of generate_optimized_schedule"""
+    student_id = payload['student_id']
+    connection = _job_db_connection()
+    cursor = connection.cursor()
+    try:
+        preferences = _load_generation_preferences(cursor, student_id, payload.get('request_data'))
+        result = optimize_student_schedule(
+            student_id=student_id,
+            db_connection=connection,
+            random_seed=None,
+            preferences=preferences
+        )
+        if not result['success']:
+            return {
+                'success': False,
+                'message': result.get('message', 'Failed to generate schedule'),
+                'code': 'OPTIMIZATION_FAILED'
+            }
+        if _attach_course_details(cursor, result):
+            _save_generated_schedule(connection, cursor, student_id, payload['enrolled_courses'], result)
+        return result
+    finally:
+        cursor.close()
+        connection.close()
+
+@job_handler('all_optimal')
+def _run_all_optimal_job(payload):
+    """Background counterpart of find_all_optimal_schedules"""
+    student_id = payload['student_id']
+    connection = _job_db_connection()
+    cursor = connection.cursor()
+    try:
+        result = optimize_student_schedule(
+            student_id=student_id,
+            db_connection=connection,
+            preferences=payload.get('preferences'),
+            find_all=True
+        )
+        _attach_solutions_course_details(cursor, result)
+        return result
+    finally:
+        cursor.close()
+        connection.close()
+
+@student_bp.route('/schedule/jobs', methods=['POST'])
+@login_required
+def submit_schedule_job():
+    """Queue a schedule generation ('generate') or all-optimal search ('all_optimal') and return its job id"""
+    try:
+        student = session.get('student')
+        if not student:
+            return jsonify({
+                'success': False,
+                'message': 'User not logged in',
+                'code': 'UNAUTHORIZED'
+            }), 401
+
+        student_id = student['student_id']
+        data = request.get_json(silent=True) or {}
+        job_type = data.get('type', 'generate')
+        if job_type not in ('generate', 'all_optimal'):
+            return jsonify({
+                'success': False,
+                'message': "type must be 'generate' or 'all_optimal'",
+                'code': 'INVALID_JOB_TYPE'
+            }), 400
+
+        cursor = current_app.mysql.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT course_code FROM add_course 
+                WHERE student_id = %s AND status = 'enrolled'
+                ORDER BY course_code
+            """, (student_id,))
+            enrolled_courses = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        if not enrolled_courses:
+            return jsonify({
+                'success': False,
+                'message': 'You have no enrolled courses. Please enroll in courses before generating a schedule.',
+                'code': 'NO_COURSES'
+            }), 404
+
+        # One active job per student, course set and preferences: repeated clicks
+        # poll the same job, changed preferences get a job of their own
+        enrolled_courses_key = ','.join(sorted(enrolled_courses))
+        payload = {'student_id': student_id, 'enrolled_courses': enrolled_courses}
+        if job_type == 'generate':
+            payload['request_data'] = data
+            preferences = data
+        else:
+            payload['preferences'] = data.get('preferences')
+            preferences = payload['preferences']
+        preferences_key = hashlib.sha256(
+            json.dumps(preferences, sort_keys=True, default=str).encode()).hexdigest()
+        if trace_requested():
+            # The job runs outside this request, so carry ?trace=1 along
+            payload['trace'] = True
+
+        try:
+            job, created = get_schedule_job_queue().submit(
+                job_type, student_id, f"{student_id}:{enrolled_courses_key}:{preferences_key}", payload)
+        except QueueFull as e:
+            current_app.logger.warning(f"Schedule job refused for student {student_id}: {str(e)}")
+            return jsonify({
+                'success': False,
+                'message': 'The schedule generator is busy, please try again in a moment.',
+                'code': 'QUEUE_FULL'
+            }), 503
+
+        current_app.logger.info(
+            f"{'Queued' if created else 'Reusing'} {job_type} job {job['job_id']} for student {student_id}")
+        return jsonify({
+            'success': True,
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'deduplicated': not created
+        }), 202
+
+    except Exception as e:
+        current_app.logger.error(f"Error submitting schedule job: {str(e)}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'message': f'Error submitting schedule job: {str(e)}',
+            'code': 'SCHEDULE_ERROR'
+        }), 500
+
+@student_bp.route('/schedule/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_schedule_job(job_id):
+    """Status of a schedule job, with its result once finished"""
+    try:
+        student = session.get('student')
+        if not student:
+            return jsonify({
+                'success': False,
+                'message': 'User not logged in',
+                'code': 'UNAUTHORIZED'
+            }), 401
+
+        job = get_schedule_job_queue().get(job_id)
+        # Other students' jobs look exactly like missing ones
+        if not job or job['student_id'] != student['student_id']:
+            return jsonify({
+                'success': False,
+                'message': 'Schedule job not found',
+                'code': 'JOB_NOT_FOUND'
+            }), 404
+
+        return jsonify({'success': True, 'job': job})
+
+    except Exception as e:
+        current_app.logger.error(f"Error reading schedule job {job_id}: {str(e)}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'message': f'Error reading schedule job: {str(e)}',
+            'code': 'SCHEDULE_ERROR'
+        }), 500
+
 @student_bp.route('/schedule/confirm_choice', methods=['POST'])
 @login_required
 def confirm_schedule_choice():
@@ -5479,7 +5466,6 @@ def confirm_schedule_choice():
         enrolled_courses_key = ",".join(enrolled_courses)
         
         # Convert schedule data to JSON string
-        import json
         schedule_data = json.dumps(schedule)
         
         # Check if student already has a saved schedule for this semester
@@ -5698,97 +5684,6 @@ def update_priority_mode_in_db():
             'code': 'MODE_ERROR'
         }), 500
 
-def build_prerequisite_chains(cursor, course_code, visited=None, depth=0):
-    """
-    Recursively build prerequisite chains for a given course.
-    
-    Args:
-        cursor: Database cursor
-        course_code: The course code to check prerequisites for
-        visited: Set of already visited course codes (to prevent cycles)
-        depth: Current recursion depth
-        
-    Returns:
-        List of chains, where each chain is a list of dictionaries with course info
-    """
-    if visited is None:
-        visited = set()
-    
-    # Prevent cycles in prerequisite graph
-    if course_code in visited or depth > 10:  # Limit recursion depth
-        return []
-    
-    visited.add(course_code)
-    
-    # Get course info
-    cursor.execute("""
-        SELECT c.course_code, c.course_name, c.year, c.semester, c.id
-        FROM courses c
-        WHERE c.course_code = %s
-    """, (course_code,))
-    
-    course_info = cursor.fetchone()
-    if not course_info:
-        current_app.logger.warning(f"Course {course_code} not found in database")
-        return []
-    
-    course_code, course_name, year, semester, course_id = course_info
-    
-    # Create current course node
-    current_course = {
-        "code": course_code,
-        "name": course_name,
-        "year": year,
-        "semester": semester
-    }
-    
-    # Find courses that have this course as a prerequisite
-    cursor.execute("""
-        SELECT c.course_code, c.course_name, c.year, c.semester, c.id
-        FROM course_prerequisites cp
-        JOIN courses c ON cp.course_id = c.id
-        WHERE cp.prerequisite_id = %s
-    """, (course_id,))
-    
-    dependent_courses = cursor.fetchall()
-    current_app.logger.info(f"Course {course_code} is a prerequisite for {len(dependent_courses)} courses")
-    
-    # If this course is not a prerequisite for any other course, return empty list
-    if not dependent_courses:
-        return []
-    
-    # Build chains for each dependent course
-    chains = []
-    for dep_course in dependent_courses:
-        dep_code, dep_name, dep_year, dep_semester, dep_id = dep_course
-        current_app.logger.info(f"Course {course_code} is a prerequisite for {dep_code}")
-        
-        # Create dependent course node
-        dependent_course = {
-            "code": dep_code,
-            "name": dep_name,
-            "year": dep_year,
-            "semester": dep_semester
-        }
-        
-        # Create a chain with this course and the dependent one
-        current_chain = [current_course, dependent_course]
-        
-        # Recursively get chains for the dependent course
-        next_chains = build_prerequisite_chains(cursor, dep_code, visited.copy(), depth + 1)
-        
-        if next_chains:
-            # If there are further dependencies, extend each chain
-            for next_chain in next_chains:
-                # Skip the first element in next_chain as it's already included as dependent_course
-                extended_chain = current_chain + next_chain[1:]
-                chains.append(extended_chain)
-        else:
-            # If no further dependencies, use the current chain
-            chains.append(current_chain)
-    
-    return chains
-
 @student_bp.route('/course-registration/check', methods=['POST'])
 @login_required
 def check_course_selection():
@@ -5902,75 +5797,51 @@ def check_course_selection():
         current_app.logger.info(f"Available courses (current semester): {available_courses}")
         current_app.logger.info(f"Calculated unselected courses (current semester): {unselected_courses}")
         
-        # TEMPORARY ENROLLMENT FOR SCHEDULE VALIDATION
-        # Create a new database connection for transaction
-        db_connection = current_app.mysql.connection
-        cursor = db_connection.cursor()
-        
+        # SCHEDULE VALIDATION
+        # The selection is checked in memory: the optimizer reads it in place of
+        # this term's enrolled/notenrolled add_course rows, so nothing is written
+        # (and no add_course triggers fire), and answers are memoized per timetable
+        cursor = current_app.mysql.connection.cursor()
         try:
-            # Begin transaction
-            cursor.execute("START TRANSACTION")
-            
-            # First delete all existing enrollments for this semester
-            cursor.execute("""
-                DELETE FROM add_course 
-                WHERE student_id = %s 
-                AND year = %s 
-                AND semester = %s
-                AND status IN ('enrolled', 'notenrolled')
-            """, (student_id, current_year, current_semester))
-            
-            # Add selected courses as 'enrolled'
-            for course_code in selected_courses:
-                cursor.execute("""
-                    INSERT INTO add_course (student_id, course_code, year, semester, status)
-                    VALUES (%s, %s, %s, %s, 'enrolled')
-                """, (student_id, course_code, current_year, current_semester))
-            
-            # Add unselected courses as 'notenrolled'
-            for course_code in unselected_courses:
-                cursor.execute("""
-                    INSERT INTO add_course (student_id, course_code, year, semester, status)
-                    VALUES (%s, %s, %s, %s, 'notenrolled')
-                """, (student_id, course_code, current_year, current_semester))
-            
             # Check if schedule validation is enabled in the system parameters
             cursor.execute("SELECT schedule_validation FROM schedule_parameters LIMIT 1")
             validation_result = cursor.fetchone()
             schedule_validation_enabled = validation_result and validation_result[0] == 1
-            
-            if schedule_validation_enabled:
-                # Check if a feasible schedule can be created
-                schedule_result = optimize_student_schedule(student_id, db_connection)
-                
-                # Check if schedule optimization was successful
-                if not schedule_result['success']:
-                    # Always rollback the temporary enrollments
-                    cursor.execute("ROLLBACK")
-                    return jsonify({
-                        'success': False,
-                        'message': 'There is a scheduling conflict between the courses you selected. Please adjust your selection.',
-                        'code': 'SCHEDULE_CONFLICT'
-                    }), 400
-            else:
-                # Skip schedule validation, assume it's successful
-                schedule_result = {'success': True}
-            
-            # Always rollback the temporary enrollments
-            cursor.execute("ROLLBACK")
-            
-        except Exception as e:
-            # Ensure rollback on any error
-            cursor.execute("ROLLBACK")
-            current_app.logger.error(f"Error during temporary enrollment: {str(e)}", exc_info=True)
-            return jsonify({
-                'success': False,
-                'message': f'Error checking schedule feasibility: {str(e)}',
-                'code': 'SCHEDULE_CHECK_ERROR'
-            }), 500
         finally:
             cursor.close()
         
+        if schedule_validation_enabled:
+            course_selection = {
+                'year': current_year,
+                'semester': current_semester,
+                'enrolled': list(selected_courses),
+                'notenrolled': unselected_courses
+            }
+            # Check if a feasible schedule can be created
+            schedule_result = check_selection_feasibility(student_id, current_app.mysql.connection, course_selection)
+            
+            # Check if schedule optimization was successful
+            if not schedule_result['success']:
+                # Name the smallest set of courses that clash, so the student
+                # knows which ones to change instead of retrying blindly
+                conflicts = schedule_result.get('conflicts', [])
+                if len(conflicts) > 1:
+                    message = f"There is a scheduling conflict between {', '.join(conflicts)}. Please adjust your selection."
+                elif conflicts:
+                    message = f"{conflicts[0]} cannot be placed in any of its available time slots. Please adjust your selection."
+                else:
+                    message = 'There is a scheduling conflict between the courses you selected. Please adjust your selection.'
+                return jsonify({
+                    'success': False,
+                    'message': message,
+                    'code': 'SCHEDULE_CONFLICT',
+                    'conflicts': conflicts,
+                    'clashes': schedule_result.get('clashes', [])
+                }), 400
+        else:
+            # Skip schedule validation, assume it's successful
+            schedule_result = {'success': True}
+        
         # Generate warnings
         warnings = []
         prerequisite_chains = []
@@ -5980,9 +5851,12 @@ def check_course_selection():
             # Create a new database connection for warnings analysis
             cursor = current_app.mysql.connection.cursor()
             
+            # Prerequisite chains are precomputed per curriculum version
+            prerequisite_graph = get_prerequisite_graph(current_app.mysql.connection)
+            
             # Build prerequisite chains for unselected courses
             for course_code in unselected_courses:
-                chains = build_prerequisite_chains(cursor, course_code)
+                chains = prerequisite_graph.chains.get(course_code, [])
                 if chains:
                     for chain in chains:
                         formatted_chain = []
@@ -6027,7 +5901,7 @@ def check_course_selection():
             
             # Build chains for selected courses
             for course_code in selected_course_codes:
-                chains = build_prerequisite_chains(cursor, course_code)
+                chains = prerequisite_graph.chains.get(course_code, [])
                 if chains:
                     for chain in chains:
                         formatted_chain = []
@@ -6056,14 +5930,9 @@ def check_course_selection():
             specialized_gpas = cursor.fetchone()
             current_app.logger.info(f"Specialized GPAs for student {student_id}: {specialized_gpas}")
             
-            # Get system parameters for minimum GPA requirements
-            cursor.execute("""
-                SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                FROM system_parameters
-                LIMIT 1
-            """)
-            
-            min_gpa_requirements = cursor.fetchone()
+            # Get system parameters for minimum GPA requirements, in ACCT, BA, FIN, IT, MRK order
+            system_parameters = resolve_parameters(current_app.mysql.connection)
+            min_gpa_requirements = tuple(system_parameters.min_gpa_map.values()) if system_parameters.configured else None
             current_app.logger.info(f"Minimum GPA requirements: {min_gpa_requirements}")
             
             # If we have both specialized GPAs and minimum requirements
@@ -6552,16 +6421,10 @@ def check_course_selection():
             specialized_gpas = cursor.fetchone()
             
             # Get minimum GPA requirements
-            cursor.execute("""
-                SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                FROM system_parameters
-                ORDER BY last_updated DESC
-                LIMIT 1
-            """)
-            
-            min_gpas = cursor.fetchone()
+            system_parameters = resolve_parameters(current_app.mysql.connection)
             
-            if specialized_gpas and min_gpas:
+            if specialized_gpas and system_parameters.configured:
+                min_gpa_map = system_parameters.min_gpa_map
                 # Map of major codes to indices
                 major_indices = {
                     'ACCT': 0,
@@ -6574,7 +6437,7 @@ def check_course_selection():
                 # For each major, check if the selected courses are the last required courses
                 for major_code, idx in major_indices.items():
                     current_gpa = specialized_gpas[idx] if specialized_gpas[idx] is not None else 0
-                    min_required_gpa = min_gpas[idx] if min_gpas[idx] is not None else 2.0
+                    min_required_gpa = min_gpa_map[major_code] if min_gpa_map[major_code] is not None else 2.0
                     
                     # Skip if already meeting requirements
                     if current_gpa >= min_required_gpa:
@@ -6834,14 +6697,8 @@ def check_probation_impact(student_id, selected_courses):
             }
         
         # Get minimum required GPA to get out of probation
-        cursor.execute("""
-            SELECT min_cumulative_gpa
-            FROM system_parameters
-            LIMIT 1
-        """)
-        
-        min_gpa_result = cursor.fetchone()
-        if not min_gpa_result:
+        system_parameters = resolve_parameters(current_app.mysql.connection)
+        if not system_parameters.configured:
             # No system parameters found
             return {
                 'on_probation': True,
@@ -6849,7 +6706,7 @@ def check_probation_impact(student_id, selected_courses):
                 'error': 'Could not determine minimum GPA requirement.'
             }
             
-        min_required_gpa = float(min_gpa_result[0])
+        min_required_gpa = system_parameters.min_cumulative_gpa
         
         # Get weights for selected courses
         if not selected_courses:
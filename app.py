@@ -45,6 +45,9 @@ app.config['MYSQL_USER'] = os.environ.get('MYSQL_USER', 'root')
 app.config['MYSQL_PASSWORD'] = os.environ.get('MYSQL_PASSWORD', 'YOUR_MYSQL_PASSWORD')
 app.config['MYSQL_DB'] = os.environ.get('MYSQL_DB', 'pfe')
 
+# Schedule optimizer: CBC writes its log to stdout only when SOLVER_MSG=1
+app.config['SOLVER_MSG'] = os.environ.get('SOLVER_MSG') == '1'
+
 # Initialize MySQL and Smorest API
 mysql = MySQL(app)
 app.mysql = mysql
@@ -0,0 +1,218 @@
+"""
+Batch schedule pre-computation for every student with enrolled courses.
+
+Solves each student's schedule with optimize_student_schedule in a process
+pool (one worker per core by default) and bulk-writes the results into
+student_schedules under the same enrolled_courses_key the student endpoints
+use, so /student/schedule/generate and the schedule views find them ready.
+
+Progress is checkpointed to a JSON file after every committed batch. A rerun
+skips students whose saved result still matches their enrolled courses and
+retries the ones that failed; --restart ignores the checkpoint.
+
+Usage:
+    python batch_schedules.py [--workers N] [--batch-size N] [--checkpoint PATH] [--limit N] [--restart]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+
+import mysql.connector
+from dotenv import load_dotenv
+from flask import Flask
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from schedule_optimizer import optimize_student_schedule
+
+DEFAULT_CHECKPOINT = 'batch_schedules.checkpoint.json'
+REPORT_EVERY = 10  # seconds between progress lines
+
+# Per-worker state, set up once by _init_worker
+_worker_app = None
+_worker_connection = None
+
+
+def create_app():
+    """Flask app carrying the MySQL settings of app.py, for the optimizer's logging and config"""
+    load_dotenv(override=True)
+    app = Flask('batch_schedules')
+    app.config['MYSQL_HOST'] = os.environ.get('MYSQL_HOST', 'localhost')
+    app.config['MYSQL_USER'] = os.environ.get('MYSQL_USER', 'root')
+    app.config['MYSQL_PASSWORD'] = os.environ.get('MYSQL_PASSWORD', 'YOUR_MYSQL_PASSWORD')
+    app.config['MYSQL_DB'] = os.environ.get('MYSQL_DB', 'pfe')
+    return app
+
+
+def connect(app):
+    return mysql.connector.connect(
+        host=app.config['MYSQL_HOST'],
+        user=app.config['MYSQL_USER'],
+        password=app.config['MYSQL_PASSWORD'],
+        database=app.config['MYSQL_DB']
+    )
+
+
+def _init_worker():
+    # One connection per worker process; the timetable snapshot is then
+    # loaded once per worker and shared by all the students it solves
+    global _worker_app, _worker_connection
+    _worker_app = create_app()
+    _worker_connection = connect(_worker_app)
+
+
+def _solve_student(student_id, find_all=False):
+    """Worker task: returns (student_id, result) with the result ready for student_schedules"""
+    with _worker_app.app_context():
+        try:
+            result = optimize_student_schedule(student_id, db_connection=_worker_connection, find_all=find_all)
+        except Exception as e:
+            _worker_app.logger.error(f"Batch solve failed for student {student_id}: {str(e)}")
+            result = {'success': False, 'message': f'Error optimizing schedule: {str(e)}'}
+        finally:
+            # End the read transaction so the next student sees current data
+            _worker_connection.rollback()
+    return student_id, result
+
+
+def load_enrolled_students(connection):
+    """student_id -> enrolled_courses_key for every student with enrolled courses"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT student_id, course_code FROM add_course
+            WHERE status = 'enrolled'
+            ORDER BY student_id, course_code
+        """)
+        courses = defaultdict(list)
+        for student_id, course_code in cursor.fetchall():
+            courses[student_id].append(course_code)
+    finally:
+        cursor.close()
+    return {student_id: ','.join(sorted(codes)) for student_id, codes in courses.items()}
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return {'completed': {}, 'failed': {}}
+    with open(path) as f:
+        checkpoint = json.load(f)
+    checkpoint.setdefault('completed', {})
+    checkpoint.setdefault('failed', {})
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    # Write then rename, so an interrupted run never leaves a truncated file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def write_schedules(connection, rows):
+    """Replace the saved schedules of a batch of students in one transaction.
+
+    rows are (student_id, enrolled_courses_key, result) tuples.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.executemany("""
+            DELETE FROM student_schedules
+            WHERE student_id = %s AND enrolled_courses_key = %s
+        """, [(student_id, key) for student_id, key, _ in rows])
+        cursor.executemany("""
+            INSERT INTO student_schedules
+            (student_id, enrolled_courses_key, schedule_data, semester, year)
+            VALUES (%s, %s, %s, %s, %s)
+        """, [
+            (student_id, key, json.dumps(result), result.get('semester'), result.get('year'))
+            for student_id, key, result in rows
+        ])
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def run(workers, batch_size, checkpoint_path, limit=None, restart=False):
+    app = create_app()
+    connection = connect(app)
+    try:
+        students = load_enrolled_students(connection)
+        checkpoint = {'completed': {}, 'failed': {}} if restart else load_checkpoint(checkpoint_path)
+
+        # Checkpoint keys are strings (JSON); a changed enrollment is solved again
+        pending = [student_id for student_id, key in students.items()
+                   if checkpoint['completed'].get(str(student_id)) != key]
+        if limit is not None:
+            pending = pending[:limit]
+        print(f"{len(students)} enrolled students, {len(students) - len(pending)} already done, "
+              f"{len(pending)} to solve with {workers} workers")
+        if not pending:
+            return checkpoint
+
+        solved = failed = 0
+        batch = []
+        start = last_report = time.perf_counter()
+
+        def flush():
+            if not batch:
+                return
+            write_schedules(connection, batch)
+            for student_id, key, _ in batch:
+                checkpoint['completed'][str(student_id)] = key
+                checkpoint['failed'].pop(str(student_id), None)
+            save_checkpoint(checkpoint_path, checkpoint)
+            batch.clear()
+
+        with Pool(processes=workers, initializer=_init_worker) as pool:
+            for student_id, result in pool.imap_unordered(_solve_student, pending):
+                if result.get('success') and result.get('schedule'):
+                    batch.append((student_id, students[student_id], result))
+                    solved += 1
+                else:
+                    checkpoint['failed'][str(student_id)] = result.get('message', 'No schedule found')
+                    failed += 1
+                if len(batch) >= batch_size:
+                    flush()
+
+                now = time.perf_counter()
+                if now - last_report >= REPORT_EVERY:
+                    done = solved + failed
+                    print(f"{done}/{len(pending)} students, {done / (now - start):.2f} students/sec, "
+                          f"{failed} failed")
+                    last_report = now
+            flush()
+        save_checkpoint(checkpoint_path, checkpoint)
+
+        elapsed = time.perf_counter() - start
+        print(f"Solved {solved} and failed {failed} of {len(pending)} students in {elapsed:.1f}s "
+              f"({len(pending) / elapsed:.2f} students/sec)")
+        return checkpoint
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--batch-size', type=int, default=50,
+                        help='students written to student_schedules per transaction')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT)
+    parser.add_argument('--limit', type=int, help='solve at most this many pending students')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and solve everyone')
+    args = parser.parse_args()
+
+    checkpoint = run(args.workers, args.batch_size, args.checkpoint, args.limit, args.restart)
+    sys.exit(1 if checkpoint['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Cohort assignment benchmark: assign_cohort against the exact assignment MILP.
+
+Generates cohorts whose students each have a few ranked schedules over the
+sections of a shared timetable, with popular sections over-subscribed, and
+solves the capacitated assignment with cohort_assignment.assign_cohort and,
+up to --exact-max students, with the equivalent MILP in CBC. Reports times,
+the value reached against the Lagrangian bound and against the MILP optimum,
+and fails (exit status 1) if an assignment exceeds a capacity.
+
+Usage:
+    python benchmarks/bench_cohort.py [--seeds N] [--exact-max N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from cohort_assignment import PLACEMENT_VALUE, CohortChoice, assign_cohort
+
+SIZES = [
+    # (students, courses, groups per course)
+    (100, 6, 3),
+    (500, 6, 3),
+    (2000, 8, 4),
+    (5000, 6, 3),
+    (20000, 10, 5),
+]
+
+
+def generate_cohort(students, courses, groups, seed=0):
+    """Ranked choices per student and capacities that leave the popular groups short"""
+    rng = random.Random(seed)
+    # Earlier groups are more popular; capacities cover the cohort only overall
+    weights = [1.0 / (g + 1) for g in range(groups)]
+    capacities = {}
+    for course in range(courses):
+        for session_type in ('lecture', 'tutorial'):
+            for g in range(groups):
+                capacities[(f"C{course}", session_type, f"G{g}")] = int(students * 1.1 / groups) + 1
+
+    choices = {}
+    for student in range(students):
+        taken = rng.sample(range(courses), rng.randint(3, min(6, courses)))
+        student_choices = []
+        for rank in range(rng.randint(1, 6)):
+            sections = set()
+            for course in taken:
+                for session_type in ('lecture', 'tutorial'):
+                    g = rng.choices(range(groups), weights)[0]
+                    sections.add((f"C{course}", session_type, f"G{g}"))
+            student_choices.append(CohortChoice(sections, PLACEMENT_VALUE - rank * rng.randint(0, 3)))
+        choices[student] = student_choices
+    return choices, capacities
+
+
+def solve_exact(choices, capacities):
+    model = pulp.LpProblem("Cohort_Assignment", pulp.LpMaximize)
+    z = {(s, c): pulp.LpVariable(f"z_{s}_{c}", cat=pulp.LpBinary)
+         for s, student_choices in choices.items() for c in range(len(student_choices))}
+    model += pulp.lpSum(choices[s][c].value * var for (s, c), var in z.items())
+    for s, student_choices in choices.items():
+        model += pulp.lpSum(z[(s, c)] for c in range(len(student_choices))) <= 1
+    using = {}
+    for (s, c), var in z.items():
+        for section in choices[s][c].sections:
+            using.setdefault(section, []).append(var)
+    for section, capacity in capacities.items():
+        if section in using:
+            model += pulp.lpSum(using[section]) <= capacity
+    model.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=120))
+    return pulp.value(model.objective)
+
+
+def within_capacity(choices, capacities, assignment):
+    loads = {}
+    for s, index in assignment.chosen.items():
+        if index is not None:
+            for section in choices[s][index].sections:
+                loads[section] = loads.get(section, 0) + 1
+    return all(loads.get(section, 0) <= capacity for section, capacity in capacities.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--exact-max', type=int, default=500)
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'students':>9} {'seed':>5} {'assign s':>9} {'placed':>7} {'of bound':>9} {'exact s':>8} {'of exact':>9}")
+    for students, courses, groups in SIZES:
+        for seed in range(args.seeds):
+            choices, capacities = generate_cohort(students, courses, groups, seed)
+            start = time.perf_counter()
+            assignment = assign_cohort(choices, capacities)
+            elapsed = time.perf_counter() - start
+            if not within_capacity(choices, capacities, assignment):
+                failures += 1
+                print(f"CAPACITY EXCEEDED students={students} seed={seed}")
+
+            exact_time = exact = None
+            if students <= args.exact_max:
+                start = time.perf_counter()
+                exact = solve_exact(choices, capacities)
+                exact_time = time.perf_counter() - start
+            placed = students - len(assignment.unassigned)
+            print(f"{students:>9} {seed:>5} {elapsed:>9.2f} {placed:>7} "
+                  f"{assignment.value / assignment.bound:>9.4f} "
+                  f"{exact_time if exact_time is not None else float('nan'):>8.2f} "
+                  f"{assignment.value / exact if exact else float('nan'):>9.4f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Engine benchmark: CBC against the in-process exact engine on generated instances.
+
+Every instance is built once per engine and solved for its optimum. The run
+fails (exit status 1) if the exact engine's objective differs from CBC's, if
+one engine finds the model infeasible and the other does not, or if the PuLP
+objective evaluated on the exact engine's variable values disagrees with the
+objective the engine reports.
+
+Usage:
+    python benchmarks/bench_engines.py [--seeds N] [--max-courses N]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.synthetic import generate_student, generate_timetable, load_optimizer, make_app
+from exact_solver import ExactScheduleSolver
+from schedule_optimizer import ExactSolutionEnumerator, OptimalSolutionEnumerator
+
+SCENARIOS = ['good_standing', 'failed', 'skipped']
+TOLERANCE = 1e-6
+
+
+def solve_instance(optimizer, engine):
+    model, x, y, I = optimizer.build_model()
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=optimizer.model_time_limit)
+    if engine == 'cbc':
+        enumerator = OptimalSolutionEnumerator(model, x, solver)
+    else:
+        exact_solver = ExactScheduleSolver(optimizer.model_sets, optimizer.FixSlot, optimizer.FixProf)
+        enumerator = ExactSolutionEnumerator(model, x, y, exact_solver, solver)
+
+    start = time.perf_counter()
+    status = enumerator.solve_optimum()
+    elapsed = time.perf_counter() - start
+
+    objective = enumerator.optimal_value if status == pulp.LpStatusOptimal else None
+    model_objective = pulp.value(model.objective) if status == pulp.LpStatusOptimal else None
+    return status, objective, model_objective, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=10)
+    parser.add_argument('--max-courses', type=int, default=8)
+    args = parser.parse_args()
+
+    mismatches = 0
+    timings = defaultdict(lambda: {'cbc': [], 'exact': []})
+    with make_app().app_context():
+        for seed in range(args.seeds):
+            for courses in range(2, args.max_courses + 1):
+                sections = 2 + (seed + courses) % 6
+                professors = 2 + seed % 3
+                timetable = generate_timetable(courses, sections, professors,
+                                               tutorial_ratio=0.3 + 0.1 * (seed % 5), seed=seed * 100 + courses)
+                for scenario in SCENARIOS:
+                    student = generate_student(timetable, scenario=scenario,
+                                               preferred_slot_ratio=0.1 * (seed % 5), seed=seed)
+                    optimizer = load_optimizer(timetable, student)
+                    optimizer.load_weight_from_db()
+
+                    results = {engine: solve_instance(optimizer, engine) for engine in ('cbc', 'exact')}
+                    cbc_status, cbc_objective, _, cbc_time = results['cbc']
+                    exact_status, exact_objective, exact_model_objective, exact_time = results['exact']
+                    timings[courses]['cbc'].append(cbc_time)
+                    timings[courses]['exact'].append(exact_time)
+
+                    same_status = (cbc_status == pulp.LpStatusOptimal) == (exact_status == pulp.LpStatusOptimal)
+                    same_objective = (cbc_objective is None or exact_objective is None or
+                                      abs(cbc_objective - exact_objective) <= TOLERANCE)
+                    consistent = (exact_objective is None or
+                                  abs(exact_objective - exact_model_objective) <= TOLERANCE)
+                    if not (same_status and same_objective and consistent):
+                        mismatches += 1
+                        print(f"MISMATCH seed={seed} courses={courses} scenario={scenario}: "
+                              f"cbc={pulp.LpStatus[cbc_status]} {cbc_objective} "
+                              f"exact={pulp.LpStatus[exact_status]} {exact_objective} "
+                              f"(model objective {exact_model_objective})")
+
+    print(f"{'courses':>8} {'instances':>10} {'cbc ms':>9} {'exact ms':>9} {'speedup':>8}")
+    for courses in sorted(timings):
+        cbc = sum(timings[courses]['cbc']) / len(timings[courses]['cbc']) * 1000
+        exact = sum(timings[courses]['exact']) / len(timings[courses]['exact']) * 1000
+        print(f"{courses:>8} {len(timings[courses]['cbc']):>10} {cbc:>9.1f} {exact:>9.1f} {cbc / exact:>7.1f}x")
+    print(f"objective mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
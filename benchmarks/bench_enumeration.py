@@ -0,0 +1,122 @@
+"""
+Enumeration benchmark: wall time to collect 1, 10 and 50 optimal solutions.
+
+Compares the legacy loop of find_all_optimal_solutions (a fresh
+`objective >= optimum` row and a model.variables() scan per iteration, plus
+one solve past the last requested solution) with OptimalSolutionEnumerator.
+Both sides use the same model and CBC settings, so the numbers measure the
+enumeration strategy rather than extraction or logging.
+
+Usage:
+    python benchmarks/bench_enumeration.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable,
+                                  load_optimizer, make_app)
+from schedule_optimizer import OptimalSolutionEnumerator
+
+SIZES = [
+    # (courses, sections per course, professors per course)
+    (4, 6, 3),
+    (6, 8, 3),
+    (8, 10, 4),
+]
+SOLUTION_COUNTS = [1, 10, 50]
+
+
+def legacy_enumeration(model, solver, max_solutions):
+    """The loop find_all_optimal_solutions ran before OptimalSolutionEnumerator"""
+    solves = 1
+    result = model.solve(solver)
+    if result != pulp.LpStatusOptimal:
+        return [], solves
+    optimal_objective_value = pulp.value(model.objective)
+
+    solutions = []
+    while len(solutions) < max_solutions:
+        active_x_vars = [var for var in model.variables()
+                         if var.name.startswith('x_') and var.varValue is not None and var.varValue > 0.5]
+        if not active_x_vars:
+            break
+        solutions.append(frozenset(var.name for var in active_x_vars))
+
+        model += pulp.lpSum(active_x_vars) <= len(active_x_vars) - 1, f"exclude_solution_{len(solutions)}"
+        model += model.objective >= optimal_objective_value, f"maintain_optimality_{len(solutions)}"
+        solves += 1
+        result = model.solve(solver)
+        if result != pulp.LpStatusOptimal:
+            break
+        new_obj_value = pulp.value(model.objective)
+        if new_obj_value is None or new_obj_value < optimal_objective_value - 0.001:
+            break
+    return solutions, solves
+
+
+def enumerator_enumeration(model, x, solver, max_solutions):
+    enumerator = OptimalSolutionEnumerator(model, x, solver)
+    solves = 1
+    if enumerator.solve_optimum() != pulp.LpStatusOptimal:
+        return [], solves
+
+    solutions = []
+    while True:
+        solutions.append(frozenset(var.name for var in enumerator.active_x_vars()))
+        if len(solutions) >= max_solutions:
+            break
+        solves += 1
+        if not enumerator.next_solution():
+            break
+    return solutions, solves
+
+
+def bench_enumeration(courses, sections, professors, max_solutions, repeat):
+    timetable = generate_timetable(courses, sections, professors, seed=courses)
+    # No time-slot preferences leaves many ties, so there are plenty of optimal solutions
+    student = generate_student(timetable, scenario='skipped', preferred_slot_ratio=0.0, seed=courses)
+    optimizer = load_optimizer(timetable, student, DEFAULT_SCHEDULE_PARAMETERS)
+    optimizer.load_weight_from_db()
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=optimizer.model_time_limit)
+
+    result = {'courses': courses, 'options': len(optimizer.schedule_options), 'requested': max_solutions}
+    for name in ('legacy', 'enumerator'):
+        timings = []
+        for _ in range(repeat):
+            model, x, y, I = optimizer.build_model()
+            start = time.perf_counter()
+            if name == 'legacy':
+                solutions, solves = legacy_enumeration(model, solver, max_solutions)
+            else:
+                solutions, solves = enumerator_enumeration(model, x, solver, max_solutions)
+            timings.append(time.perf_counter() - start)
+        result[name] = {'found': len(solutions), 'solves': solves, 'seconds': min(timings)}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    with make_app().app_context():
+        print(f"{'courses':>8} {'options':>8} {'wanted':>7} {'found':>6} "
+              f"{'legacy s':>9} {'solves':>7} {'enum s':>9} {'solves':>7} {'speedup':>8}")
+        for courses, sections, professors in SIZES:
+            for max_solutions in SOLUTION_COUNTS:
+                result = bench_enumeration(courses, sections, professors, max_solutions, args.repeat)
+                legacy, enumerator = result['legacy'], result['enumerator']
+                print(f"{result['courses']:>8} {result['options']:>8} {result['requested']:>7} "
+                      f"{enumerator['found']:>6} {legacy['seconds']:>9.2f} {legacy['solves']:>7} "
+                      f"{enumerator['seconds']:>9.2f} {enumerator['solves']:>7} "
+                      f"{legacy['seconds'] / enumerator['seconds']:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Extraction benchmark: cost of reading 50 enumerated solutions out of a solved model.
+
+For each enumerated solution, compares the legacy extraction (model.variables()
+scans that split names like x_i_k_l to recover indices: the x and y passes of
+_extract_solution, the y pass of _calculate_professor_preference and the
+active-variable listing of find_all_optimal_solutions) with
+ScheduleOptimizer._read_solution, which reads the x and y dicts build_model
+returns and scores the solution in the same pass. The full _extract_solution
+(schedule rows included) is timed on top for reference. Solutions come from
+the exact engine so enumeration itself stays cheap.
+
+Usage:
+    python benchmarks/bench_extraction.py [--solutions N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable,
+                                  load_optimizer, make_app)
+from exact_solver import ExactScheduleSolver
+from schedule_optimizer import ExactSolutionEnumerator
+
+SIZES = [
+    # (courses, sections per course, professors per course)
+    (4, 6, 3),
+    (6, 8, 3),
+    (8, 10, 4),
+]
+
+
+def _active_indices(model, prefixes):
+    indices = []
+    for var in model.variables():
+        value = pulp.value(var)
+        if var.name[:2] in prefixes and value is not None and value > 0.5:
+            parts = var.name.split('_')
+            indices.append((int(parts[1]), int(parts[2]), int(parts[3])))
+    return indices
+
+
+def legacy_read(model):
+    """The name-parsing passes the optimizer made over model.variables() per solution"""
+    x = _active_indices(model, ('x_',))         # _extract_solution, x pass
+    y = _active_indices(model, ('y_',))         # _extract_solution, y pass
+    _active_indices(model, ('y_',))             # _calculate_professor_preference
+    _active_indices(model, ('x_', 'y_'))        # find_all_optimal_solutions listing
+    return x, y
+
+
+def bench_extraction(courses, sections, professors, max_solutions):
+    timetable = generate_timetable(courses, sections, professors, seed=courses)
+    # No time-slot preferences leaves many ties, so there are plenty of optimal solutions
+    student = generate_student(timetable, scenario='skipped', preferred_slot_ratio=0.0, seed=courses)
+    optimizer = load_optimizer(timetable, student, DEFAULT_SCHEDULE_PARAMETERS)
+    optimizer.load_weight_from_db()
+    model, x, y, I = optimizer.build_model()
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=optimizer.model_time_limit)
+    exact_solver = ExactScheduleSolver(optimizer.model_sets, optimizer.FixSlot, optimizer.FixProf)
+    enumerator = ExactSolutionEnumerator(model, x, y, exact_solver, solver)
+
+    timings = {'legacy': 0.0, 'read': 0.0, 'extract': 0.0}
+    found = 0
+    if enumerator.solve_optimum() == pulp.LpStatusOptimal:
+        while found < max_solutions:
+            start = time.perf_counter()
+            legacy_read(model)
+            timings['legacy'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution = optimizer._read_solution(x, y)
+            timings['read'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            optimizer._extract_solution(solution)
+            timings['extract'] += time.perf_counter() - start
+
+            found += 1
+            if not enumerator.next_solution():
+                break
+    return {'courses': courses, 'variables': model.numVariables(), 'found': found, **timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--solutions', type=int, default=50)
+    args = parser.parse_args()
+
+    with make_app().app_context():
+        print(f"{'courses':>8} {'vars':>6} {'found':>6} {'legacy ms':>10} {'read ms':>8} {'speedup':>8} "
+              f"{'extract ms':>11}")
+        for courses, sections, professors in SIZES:
+            result = bench_extraction(courses, sections, professors, args.solutions)
+            print(f"{result['courses']:>8} {result['variables']:>6} {result['found']:>6} "
+                  f"{result['legacy'] * 1000:>10.1f} {result['read'] * 1000:>8.1f} "
+                  f"{result['legacy'] / result['read']:>7.1f}x {result['extract'] * 1000:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
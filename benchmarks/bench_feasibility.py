@@ -0,0 +1,92 @@
+"""
+Feasibility benchmark: ScheduleOptimizer.check_feasibility against a full solve.
+
+Every generated instance is answered by check_feasibility, by the constraint-only
+CBC model it falls back to, and by the full CBC solve of build_model. Reports
+the average time of each per course count. The run fails (exit status 1) if the
+in-process search and the CBC feasibility model disagree; instances the full
+model rejects only because of professor pairing are counted, not failed.
+
+Usage:
+    python benchmarks/bench_feasibility.py [--seeds N] [--max-courses N]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.bench_engines import solve_instance
+from benchmarks.synthetic import generate_student, generate_timetable, load_optimizer, make_app
+from exact_solver import FeasibilitySearch
+
+SCENARIOS = ['good_standing', 'failed', 'skipped']
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=10)
+    parser.add_argument('--max-courses', type=int, default=10)
+    args = parser.parse_args()
+
+    mismatches = infeasible = professor_only = 0
+    timings = defaultdict(lambda: defaultdict(list))
+    with make_app().app_context():
+        for seed in range(args.seeds):
+            for courses in range(2, args.max_courses + 1):
+                sections = 1 + (seed + courses) % 3
+                professors = 2 + seed % 3
+                timetable = generate_timetable(courses, sections, professors,
+                                               tutorial_ratio=0.3 + 0.1 * (seed % 5), seed=seed * 100 + courses)
+                for scenario in SCENARIOS:
+                    student = generate_student(timetable, scenario=scenario, seed=seed)
+                    # Fixing sessions to another group's sections leaves some
+                    # selections without a conflict-free schedule
+                    if seed % 2:
+                        student['group'] = timetable['groups'][courses % len(timetable['groups'])]
+                    optimizer = load_optimizer(timetable, student)
+                    optimizer.load_weight_from_db()
+
+                    check, check_time = timed(optimizer.check_feasibility)
+                    sets = optimizer._build_sets()
+                    search = FeasibilitySearch(sets, optimizer.FixSlot, optimizer.FixProf)
+                    cbc_feasible, cbc_time = timed(optimizer._solve_feasibility_model, sets, search)
+                    full, full_time = timed(solve_instance, optimizer, 'cbc')
+                    full_feasible = full[0] == pulp.LpStatusOptimal
+
+                    timings[courses]['check'].append(check_time)
+                    timings[courses]['cbc'].append(cbc_time)
+                    timings[courses]['full'].append(full_time)
+                    if not check['feasible']:
+                        infeasible += 1
+                    elif not full_feasible:
+                        professor_only += 1
+                    if check['feasible'] != cbc_feasible:
+                        mismatches += 1
+                        print(f"MISMATCH seed={seed} courses={courses} scenario={scenario}: "
+                              f"search={check['feasible']} cbc={cbc_feasible}")
+
+    print(f"{'courses':>8} {'instances':>10} {'check ms':>9} {'cbc ms':>9} {'full ms':>9}")
+    for courses in sorted(timings):
+        row = [f"{courses:>8} {len(timings[courses]['check']):>10}"]
+        for name in ('check', 'cbc', 'full'):
+            runs = timings[courses][name]
+            row.append(f"{sum(runs) / len(runs) * 1000:>9.2f}")
+        print(' '.join(row))
+    print(f"infeasible selections: {infeasible}, rejected only by professor pairing: {professor_only}")
+    print(f"search/CBC mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
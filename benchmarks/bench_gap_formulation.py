@@ -0,0 +1,96 @@
+"""
+Gap formulation benchmark: model size and CBC solve time, pairwise against span.
+
+For every generated instance the model is built with each
+schedule_parameters.gap_formulation and solved with CBC. Reports the average
+variable and constraint counts and solve time per course count, and fails
+(exit status 1) if the two formulations reach different optimal objectives.
+
+Usage:
+    python benchmarks/bench_gap_formulation.py [--seeds N] [--max-courses N]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable,
+                                  load_optimizer, make_app, with_new_version)
+from schedule_optimizer import GAP_FORMULATIONS
+
+SCENARIOS = ['good_standing', 'failed', 'skipped']
+TOLERANCE = 1e-6
+
+
+def solve_instance(timetable, student, gap_formulation):
+    # schedule_parameters lives in the timetable snapshot, so a changed
+    # parameter needs a new cache version just like an admin edit
+    parameters = dict(DEFAULT_SCHEDULE_PARAMETERS, gap_formulation=gap_formulation)
+    optimizer = load_optimizer(with_new_version(timetable), student, parameters)
+    optimizer.load_weight_from_db()
+    model, x, y, I = optimizer.build_model()
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=optimizer.model_time_limit)
+
+    start = time.perf_counter()
+    status = model.solve(solver)
+    elapsed = time.perf_counter() - start
+
+    objective = pulp.value(model.objective) if status == pulp.LpStatusOptimal else None
+    return {'variables': model.numVariables(), 'constraints': model.numConstraints(),
+            'status': status, 'objective': objective, 'seconds': elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--max-courses', type=int, default=8)
+    args = parser.parse_args()
+
+    mismatches = 0
+    results = defaultdict(lambda: defaultdict(list))
+    with make_app().app_context():
+        for seed in range(args.seeds):
+            for courses in range(2, args.max_courses + 1):
+                sections = 2 + (seed + courses) % 6
+                professors = 2 + seed % 3
+                timetable = generate_timetable(courses, sections, professors,
+                                               tutorial_ratio=0.3 + 0.1 * (seed % 5), seed=seed * 100 + courses)
+                for scenario in SCENARIOS:
+                    student = generate_student(timetable, scenario=scenario,
+                                               preferred_slot_ratio=0.1 * (seed % 5), seed=seed)
+                    instance = {name: solve_instance(timetable, student, name) for name in GAP_FORMULATIONS}
+                    for name, result in instance.items():
+                        results[courses][name].append(result)
+
+                    pairwise, span = instance['pairwise'], instance['span']
+                    same_status = (pairwise['status'] == pulp.LpStatusOptimal) == (span['status'] == pulp.LpStatusOptimal)
+                    same_objective = (pairwise['objective'] is None or span['objective'] is None or
+                                      abs(pairwise['objective'] - span['objective']) <= TOLERANCE)
+                    if not (same_status and same_objective):
+                        mismatches += 1
+                        print(f"MISMATCH seed={seed} courses={courses} scenario={scenario}: "
+                              f"pairwise={pulp.LpStatus[pairwise['status']]} {pairwise['objective']} "
+                              f"span={pulp.LpStatus[span['status']]} {span['objective']}")
+
+    print(f"{'courses':>8} {'instances':>10} "
+          f"{'pw vars':>8} {'pw rows':>8} {'pw ms':>8} {'sp vars':>8} {'sp rows':>8} {'sp ms':>8}")
+    for courses in sorted(results):
+        row = [f"{courses:>8} {len(results[courses]['pairwise']):>10}"]
+        for name in GAP_FORMULATIONS:
+            runs = results[courses][name]
+            variables = sum(r['variables'] for r in runs) / len(runs)
+            constraints = sum(r['constraints'] for r in runs) / len(runs)
+            seconds = sum(r['seconds'] for r in runs) / len(runs)
+            row.append(f"{variables:>8.0f} {constraints:>8.0f} {seconds * 1000:>8.1f}")
+        print(' '.join(row))
+    print(f"objective mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
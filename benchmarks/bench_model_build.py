@@ -0,0 +1,61 @@
+"""
+Model-build benchmark: ScheduleOptimizer.build_model time against the option count.
+
+Usage:
+    python benchmarks/bench_model_build.py [--repeat N] [--scenario skipped|good_standing|failed]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_timetable, generate_student, load_optimizer, make_app
+
+SIZES = [
+    # (courses, sections per course, professors per course)
+    (3, 4, 3),
+    (5, 8, 4),
+    (7, 12, 5),
+    (9, 16, 6),
+    (10, 24, 8),
+]
+
+
+def bench_build(courses, sections, professors, scenario, repeat):
+    timetable = generate_timetable(courses, sections, professors, seed=courses)
+    student = generate_student(timetable, scenario=scenario, seed=courses)
+    optimizer = load_optimizer(timetable, student)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model, x, y, I = optimizer.build_model()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'courses': courses,
+        'options': len(optimizer.schedule_options),
+        'x_vars': len(x),
+        'constraints': len(model.constraints),
+        'build_ms': min(timings) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scenario', default='skipped', choices=['skipped', 'good_standing', 'failed'])
+    args = parser.parse_args()
+
+    with make_app().app_context():
+        print(f"{'courses':>8} {'options':>8} {'x vars':>8} {'rows':>8} {'build ms':>10}")
+        for courses, sections, professors in SIZES:
+            result = bench_build(courses, sections, professors, args.scenario, args.repeat)
+            print(f"{result['courses']:>8} {result['options']:>8} {result['x_vars']:>8} "
+                  f"{result['constraints']:>8} {result['build_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Model cache benchmark: re-solving after a preference change, with and without the cached model.
+
+Each student is solved once to fill the model cache, then re-solved after
+each of a series of preference changes (new preferred time slots, the other
+priority mode). Every re-solve is timed twice: from the cached model, which
+only gets a new objective and warm-starts CBC, and from an empty cache, which
+rebuilds the model. The result cache is cleared before every solve, so
+both really solve. The run fails (exit status 1) if the two disagree on the
+optimal objective value.
+
+Usage:
+    python benchmarks/bench_model_cache.py [--changes N] [--engine cbc|exact|auto]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, TOTAL_SLOTS, generate_student, generate_timetable,
+                                  load_optimizer, make_app)
+from model_cache import get_model_cache
+from result_cache import get_result_cache
+from schedule_optimizer import _optimize_loaded
+
+SIZES = [
+    # (courses, sections per course, professors per course)
+    (4, 4, 3),
+    (6, 6, 3),
+    (8, 8, 4),
+]
+TOLERANCE = 1e-6
+
+
+def timed_solve(timetable, student, parameters):
+    # Result cache keys leave out the student, so the rebuild solve would be
+    # served the cached solve's result; every timed solve has to really solve
+    get_result_cache().clear()
+    optimizer = load_optimizer(timetable, student, parameters)
+    start = time.perf_counter()
+    result = _optimize_loaded(optimizer, optimizer.db, student['student_id'])
+    return result, time.perf_counter() - start, optimizer.model_reused
+
+
+def change_preferences(student, rng, change):
+    if change % 2:
+        student['priority'] = 'b' if student['priority'] == 'a' else 'a'
+    else:
+        student['timeslot_preferences'] = [(slot, 1) for slot in range(1, TOTAL_SLOTS + 1) if rng.random() < 0.3]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--changes', type=int, default=6)
+    parser.add_argument('--engine', default='cbc', choices=['cbc', 'exact', 'auto'])
+    args = parser.parse_args()
+
+    parameters = dict(DEFAULT_SCHEDULE_PARAMETERS, solver_engine=args.engine)
+    cache = get_model_cache()
+    mismatches = 0
+    with make_app().app_context():
+        print(f"{'courses':>8} {'changes':>8} {'rebuild ms':>11} {'cached ms':>10} {'speedup':>8}")
+        for courses, sections, professors in SIZES:
+            timetable = generate_timetable(courses, sections, professors, seed=courses)
+            student = generate_student(timetable, scenario='skipped', seed=courses)
+            uncached = {'student_id': f"{student['student_id']}-rebuild"}
+            rng = random.Random(courses)
+            cache.clear()
+            timed_solve(timetable, student, parameters)
+
+            rebuild_time = cached_time = 0.0
+            for change in range(args.changes):
+                change_preferences(student, rng, change)
+                cached, elapsed, reused = timed_solve(timetable, student, parameters)
+                cached_time += elapsed
+                # The same student under an id with nothing cached
+                cache.discard(uncached['student_id'])
+                rebuilt, elapsed, _ = timed_solve(timetable, dict(student, **uncached), parameters)
+                rebuild_time += elapsed
+
+                if not reused or cached['success'] != rebuilt['success'] or (
+                        cached['success'] and
+                        abs(cached['model_objective_value'] - rebuilt['model_objective_value']) > TOLERANCE):
+                    mismatches += 1
+                    print(f"MISMATCH courses={courses} change={change}: reused={reused} "
+                          f"cached={cached.get('model_objective_value')} rebuilt={rebuilt.get('model_objective_value')}")
+
+            print(f"{courses:>8} {args.changes:>8} {rebuild_time * 1000:>11.1f} {cached_time * 1000:>10.1f} "
+                  f"{rebuild_time / cached_time:>7.1f}x")
+    print(f"mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Parallel enumeration benchmark: find_all_optimal_solutions in one process and split over a pool.
+
+Solves synthetic students with solver_processes 1 and --processes, CBC on
+one thread each, and reports the wall time of each. By default the split
+only happens when the first solve takes PARALLEL_MIN_SOLVE_TIME or longer,
+as in production; --always-split lowers that to 0 to time the pool on
+instances that are quick to solve. The run fails (exit status 1) if the two
+disagree on the optimal objective value or, for tied optima, on the
+solutions found.
+
+Usage:
+    python benchmarks/bench_parallel.py [--processes N] [--always-split]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import schedule_optimizer
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable, load_optimizer,
+                                  make_app, with_new_version)
+
+SIZES = [
+    # (courses, sections per course, professors per course)
+    (6, 6, 3),
+    (8, 8, 4),
+    (10, 10, 4),
+    (12, 12, 5),
+]
+
+
+def schedule_pattern(solution):
+    return frozenset((row['course_code'], row['session_number'], row['time_slot']) for row in solution['schedule'])
+
+
+def timed_find_all(timetable, student, parameters):
+    optimizer = load_optimizer(with_new_version(timetable), student, parameters)
+    start = time.perf_counter()
+    result = optimizer.find_all_optimal_solutions()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--always-split', action='store_true')
+    args = parser.parse_args()
+    if args.always_split:
+        schedule_optimizer.PARALLEL_MIN_SOLVE_TIME = 0
+
+    mismatches = 0
+    with make_app().app_context():
+        print(f"{'courses':>8} {'solutions':>10} {'1 proc s':>9} {f'{args.processes} proc s':>10} {'speedup':>8}")
+        for courses, sections, professors in SIZES:
+            timetable = generate_timetable(courses, sections, professors, tutorial_ratio=0.3, seed=courses)
+            student = generate_student(timetable, scenario='skipped', preferred_slot_ratio=0.2, seed=courses)
+            runs = []
+            for processes in (1, args.processes):
+                parameters = dict(DEFAULT_SCHEDULE_PARAMETERS, solver_engine='cbc', solver_threads=1,
+                                  solver_processes=processes, time_limit=60)
+                runs.append(timed_find_all(timetable, student, parameters))
+            (sequential, sequential_time), (parallel, parallel_time) = runs
+
+            patterns = [{schedule_pattern(solution) for solution in result.get('solutions', [])}
+                        for result in (sequential, parallel)]
+            if sequential['success'] != parallel['success'] or (
+                    sequential['success'] and (
+                        sequential['objective_value'] != parallel['objective_value'] or
+                        len(patterns[0]) != len(patterns[1]) or
+                        (len(patterns[0]) < DEFAULT_SCHEDULE_PARAMETERS['maximum_solutions'] and
+                         patterns[0] != patterns[1]))):
+                mismatches += 1
+                print(f"MISMATCH courses={courses}: sequential={sequential.get('objective_value')} "
+                      f"parallel={parallel.get('objective_value')}")
+
+            print(f"{courses:>8} {len(patterns[1]):>10} {sequential_time:>9.2f} {parallel_time:>10.2f} "
+                  f"{sequential_time / parallel_time:>7.1f}x")
+    print(f"mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
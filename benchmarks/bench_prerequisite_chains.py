@@ -0,0 +1,182 @@
+"""
+Prerequisite chain benchmark: precomputed PrerequisiteGraph chains against the recursive builder.
+
+Generates curricula of eight terms (four years, two semesters) whose courses
+require up to --max-prerequisites courses of the two previous terms, and
+builds the dependency chains of every course the way the course selection
+check does: with the recursive builder it replaced (two queries per visited
+course, answered from memory here, so the numbers understate the database
+round trips) and by loading a PrerequisiteGraph once and reading its chains.
+Reports both times and the legacy query count, and fails (exit status 1) if
+the chains differ.
+
+Usage:
+    python benchmarks/bench_prerequisite_chains.py [--seeds N] [--max-prerequisites N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_app
+from prerequisite_graph import PrerequisiteGraph
+
+COURSES_PER_TERM = [4, 8, 12, 16]
+TERMS = [(year, semester) for year in range(1, 5) for semester in (1, 2)]
+
+
+def generate_curriculum(courses_per_term, max_prerequisites, seed=0):
+    """Course rows (id, code, name, year, semester) and prerequisite rows (id, course_id, prerequisite_id)"""
+    rng = random.Random(seed)
+    courses = []
+    edges = []
+    terms = []
+    for year, semester in TERMS:
+        term = []
+        for _ in range(courses_per_term):
+            course_id = len(courses) + 1
+            courses.append((course_id, f"Y{year}S{semester}C{len(term) + 1}", f"Course {course_id}", year, semester))
+            earlier = [prerequisite for previous in terms[-2:] for prerequisite in previous]
+            for prerequisite_id in rng.sample(earlier, min(len(earlier), rng.randint(0, max_prerequisites))):
+                edges.append((len(edges) + 1, course_id, prerequisite_id))
+            term.append(course_id)
+        terms.append(term)
+    rng.shuffle(edges)
+    return courses, edges
+
+
+class CurriculumCursor:
+    """Answers the chain builder's and the graph loader's queries from a generated curriculum"""
+
+    def __init__(self, courses, edges):
+        self.courses = courses
+        self.edges = edges
+        self.by_code = {row[1]: row for row in courses}
+        self.by_id = {row[0]: row for row in courses}
+        self.queries = 0
+        self._rows = []
+
+    def execute(self, query, params=None):
+        sql = ' '.join(query.split())
+        self.queries += 1
+        if sql.startswith('SELECT id, course_code, course_name, year, semester FROM courses'):
+            rows = list(self.courses)
+        elif 'ORDER BY prerequisite_id, id' in sql:
+            rows = [(course_id, prerequisite_id) for _, course_id, prerequisite_id in sorted(
+                self.edges, key=lambda edge: (edge[2], edge[0]))]
+        elif 'WHERE c.course_code = %s' in sql:
+            row = self.by_code.get(params[0])
+            rows = [(row[1], row[2], row[3], row[4], row[0])] if row else []
+        elif 'WHERE cp.prerequisite_id = %s' in sql:
+            # MySQL reads these through the prerequisite_id index, in id order
+            rows = []
+            for _, course_id, prerequisite_id in sorted(self.edges):
+                if prerequisite_id == params[0]:
+                    row = self.by_id[course_id]
+                    rows.append((row[1], row[2], row[3], row[4], row[0]))
+        else:
+            raise NotImplementedError(f"CurriculumCursor does not handle query: {sql}")
+        self._rows = rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+def legacy_chains(cursor, course_code, visited=None, depth=0):
+    """build_prerequisite_chains as the course selection check ran it before PrerequisiteGraph"""
+    if visited is None:
+        visited = set()
+    if course_code in visited or depth > 10:
+        return []
+    visited.add(course_code)
+
+    cursor.execute("""
+        SELECT c.course_code, c.course_name, c.year, c.semester, c.id
+        FROM courses c
+        WHERE c.course_code = %s
+    """, (course_code,))
+    course_info = cursor.fetchone()
+    if not course_info:
+        return []
+    course_code, course_name, year, semester, course_id = course_info
+    current_course = {"code": course_code, "name": course_name, "year": year, "semester": semester}
+
+    cursor.execute("""
+        SELECT c.course_code, c.course_name, c.year, c.semester, c.id
+        FROM course_prerequisites cp
+        JOIN courses c ON cp.course_id = c.id
+        WHERE cp.prerequisite_id = %s
+    """, (course_id,))
+    dependent_courses = cursor.fetchall()
+    if not dependent_courses:
+        return []
+
+    chains = []
+    for dep_code, dep_name, dep_year, dep_semester, dep_id in dependent_courses:
+        current_chain = [current_course, {"code": dep_code, "name": dep_name, "year": dep_year, "semester": dep_semester}]
+        next_chains = legacy_chains(cursor, dep_code, visited.copy(), depth + 1)
+        if next_chains:
+            for next_chain in next_chains:
+                chains.append(current_chain + next_chain[1:])
+        else:
+            chains.append(current_chain)
+    return chains
+
+
+def timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--max-prerequisites', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    mismatches = 0
+    with make_app().app_context():
+        print(f"{'courses':>8} {'seed':>5} {'edges':>6} {'chains':>7} {'queries':>8} "
+              f"{'legacy ms':>10} {'load ms':>8} {'lookup ms':>10} {'speedup':>8}")
+        for courses_per_term in COURSES_PER_TERM:
+            for seed in range(args.seeds):
+                courses, edges = generate_curriculum(courses_per_term, args.max_prerequisites, seed=seed)
+                codes = [row[1] for row in courses]
+
+                cursor = CurriculumCursor(courses, edges)
+                legacy, legacy_seconds = timed(lambda: [legacy_chains(cursor, code) for code in codes], args.repeat)
+                queries = cursor.queries // args.repeat
+
+                def load():
+                    cursor.execute("SELECT id, course_code, course_name, year, semester FROM courses")
+                    course_rows = cursor.fetchall()
+                    cursor.execute("SELECT course_id, prerequisite_id FROM course_prerequisites ORDER BY prerequisite_id, id")
+                    return PrerequisiteGraph(seed, course_rows, cursor.fetchall())
+
+                graph, load_seconds = timed(load, args.repeat)
+                precomputed, lookup_seconds = timed(lambda: [graph.chains.get(code, []) for code in codes], args.repeat)
+
+                if precomputed != legacy:
+                    mismatches += 1
+                    print(f"MISMATCH courses={len(courses)} seed={seed}")
+                chain_count = sum(len(chains) for chains in legacy)
+                print(f"{len(courses):>8} {seed:>5} {len(edges):>6} {chain_count:>7} {queries:>8} "
+                      f"{legacy_seconds * 1000:>10.2f} {load_seconds * 1000:>8.2f} {lookup_seconds * 1000:>10.3f} "
+                      f"{legacy_seconds / lookup_seconds:>7.0f}x")
+    print(f"chain mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
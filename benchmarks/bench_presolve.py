@@ -0,0 +1,90 @@
+"""
+Presolve benchmark: model size and CBC solve time with and without the presolve stage.
+
+For every generated instance the model is built with PRESOLVE off and on and
+solved with CBC. Reports the average variable and constraint counts and solve
+time per scenario and course count, and fails (exit status 1) if the two
+reach different optimal objectives.
+
+Usage:
+    python benchmarks/bench_presolve.py [--seeds N] [--max-courses N]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+import schedule_optimizer
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable,
+                                  load_optimizer, make_app, with_new_version)
+
+SCENARIOS = ['good_standing', 'failed', 'skipped']
+TOLERANCE = 1e-6
+
+
+def solve_instance(timetable, student, presolve):
+    schedule_optimizer.PRESOLVE = presolve
+    optimizer = load_optimizer(with_new_version(timetable), student, DEFAULT_SCHEDULE_PARAMETERS)
+    optimizer.load_weight_from_db()
+    model, x, y, I = optimizer.build_model()
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=optimizer.model_time_limit)
+
+    start = time.perf_counter()
+    status = model.solve(solver)
+    elapsed = time.perf_counter() - start
+
+    objective = pulp.value(model.objective) if status == pulp.LpStatusOptimal else None
+    return {'variables': model.numVariables(), 'constraints': model.numConstraints(),
+            'status': status, 'objective': objective, 'seconds': elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--max-courses', type=int, default=8)
+    args = parser.parse_args()
+
+    mismatches = 0
+    results = defaultdict(lambda: defaultdict(list))
+    with make_app().app_context():
+        for seed in range(args.seeds):
+            for courses in range(2, args.max_courses + 1):
+                sections = 2 + (seed + courses) % 6
+                professors = 2 + seed % 3
+                timetable = generate_timetable(courses, sections, professors,
+                                               tutorial_ratio=0.3 + 0.1 * (seed % 5), seed=seed * 100 + courses)
+                for scenario in SCENARIOS:
+                    student = generate_student(timetable, scenario=scenario,
+                                               preferred_slot_ratio=0.1 * (seed % 5), seed=seed)
+                    runs = {presolve: solve_instance(timetable, student, presolve) for presolve in (False, True)}
+                    for presolve, run in runs.items():
+                        results[(scenario, courses)][presolve].append(run)
+
+                    off, on = runs[False], runs[True]
+                    if off['status'] != on['status'] or (
+                            off['objective'] is not None and abs(off['objective'] - on['objective']) > TOLERANCE):
+                        mismatches += 1
+                        print(f"MISMATCH seed={seed} courses={courses} scenario={scenario}: "
+                              f"off={off['objective']} on={on['objective']}")
+    schedule_optimizer.PRESOLVE = True
+
+    print(f"{'scenario':>14} {'courses':>8} {'vars off':>9} {'vars on':>8} {'rows off':>9} {'rows on':>8} "
+          f"{'off s':>7} {'on s':>7}")
+    for (scenario, courses), runs in sorted(results.items()):
+        average = {presolve: {field: sum(run[field] for run in runs[presolve]) / len(runs[presolve])
+                              for field in ('variables', 'constraints', 'seconds')}
+                   for presolve in (False, True)}
+        off, on = average[False], average[True]
+        print(f"{scenario:>14} {courses:>8} {off['variables']:>9.0f} {on['variables']:>8.0f} "
+              f"{off['constraints']:>9.0f} {on['constraints']:>8.0f} {off['seconds']:>7.3f} {on['seconds']:>7.3f}")
+    print(f"objective mismatches: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
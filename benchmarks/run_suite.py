@@ -0,0 +1,146 @@
+"""
+Optimizer benchmark suite: build, solve and enumeration time and peak memory as JSON.
+
+Runs ScheduleOptimizer end to end on generated timetables (see synthetic.py)
+for every combination of course count, sections per course, professors per
+course and FixSlot scenario, and prints one JSON document: per case the model
+size, the results (objective, solution count) and
+
+    build_ms       build_model on a loaded optimizer
+    solve_ms       solve(): build, solve and solution extraction
+    enumerate_ms   find_all_optimal_solutions()
+    peak_kib       peak Python heap over solve() and find_all_optimal_solutions()
+
+Times are the best of --repeat runs, each on a fresh cache version so no run
+is served by the model or result cache. Memory is measured in a separate run
+under tracemalloc, which slows Python down too much to time; it does not see
+the CBC process. Generation is seeded, so everything but the timings is the
+same from run to run: save the output of two versions and diff them, or pass
+the older file as --compare for the time ratios of every case.
+
+Usage:
+    python benchmarks/run_suite.py [--courses 4 6 8] [--sections 4 8] [--professors 3]
+                                   [--scenarios good_standing failed skipped] [--seeds N]
+                                   [--engine cbc|exact|auto] [--repeat N]
+                                   [--output FILE] [--compare FILE]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulp
+
+from benchmarks.synthetic import (DEFAULT_SCHEDULE_PARAMETERS, generate_student, generate_timetable,
+                                  load_optimizer, make_app, with_new_version)
+
+SCENARIOS = ['good_standing', 'failed', 'skipped']
+TIMINGS = ('build_ms', 'solve_ms', 'enumerate_ms')
+
+
+def case_name(courses, sections, professors, scenario, seed):
+    return f"c{courses}-s{sections}-p{professors}-{scenario}-{seed}"
+
+
+def run_case(timetable, student, parameters, repeat):
+    timings = {name: [] for name in TIMINGS}
+    for _ in range(repeat):
+        optimizer = load_optimizer(with_new_version(timetable), student, parameters)
+        optimizer.load_weight_from_db()
+        start = time.perf_counter()
+        model, x, y, I = optimizer.build_model()
+        timings['build_ms'].append(time.perf_counter() - start)
+        variables, constraints = model.numVariables(), model.numConstraints()
+
+        optimizer = load_optimizer(with_new_version(timetable), student, parameters)
+        start = time.perf_counter()
+        solved = optimizer.solve()
+        timings['solve_ms'].append(time.perf_counter() - start)
+
+        optimizer = load_optimizer(with_new_version(timetable), student, parameters)
+        start = time.perf_counter()
+        enumerated = optimizer.find_all_optimal_solutions()
+        timings['enumerate_ms'].append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    load_optimizer(with_new_version(timetable), student, parameters).solve()
+    load_optimizer(with_new_version(timetable), student, parameters).find_all_optimal_solutions()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {
+        'options': len(timetable['schedule']),
+        'variables': variables,
+        'constraints': constraints,
+        'success': solved['success'],
+        'objective_value': solved.get('model_objective_value'),
+        'solutions': len(enumerated.get('solutions', [])),
+        'peak_kib': round(peak / 1024),
+    }
+    result.update({name: round(min(values) * 1000, 1) for name, values in timings.items()})
+    return result
+
+
+def compare(previous, current):
+    """Print the time ratio (current / previous) of every case both runs have"""
+    print(f"{'case':>32} " + ' '.join(f"{name:>13}" for name in TIMINGS + ('peak_kib',)), file=sys.stderr)
+    for name, case in current['cases'].items():
+        before = previous['cases'].get(name)
+        if before is None:
+            continue
+        ratios = [case[field] / before[field] if before[field] else float('nan') for field in TIMINGS + ('peak_kib',)]
+        flag = '' if case['objective_value'] == before['objective_value'] else '  objective changed'
+        print(f"{name:>32} " + ' '.join(f"{ratio:>12.2f}x" for ratio in ratios) + flag, file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, nargs='+', default=[4, 6, 8])
+    parser.add_argument('--sections', type=int, nargs='+', default=[4, 8])
+    parser.add_argument('--professors', type=int, nargs='+', default=[3])
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument('--seeds', type=int, default=1)
+    parser.add_argument('--engine', default='cbc', choices=['cbc', 'exact', 'auto'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    args = parser.parse_args()
+
+    parameters = dict(DEFAULT_SCHEDULE_PARAMETERS, solver_engine=args.engine, solver_threads=1)
+    suite = {
+        'environment': {'python': platform.python_version(), 'pulp': pulp.__version__,
+                        'machine': platform.machine()},
+        'parameters': dict(vars(args), output=None, compare=None),
+        'cases': {},
+    }
+    with make_app().app_context():
+        for courses, sections, professors, seed in itertools.product(
+                args.courses, args.sections, args.professors, range(args.seeds)):
+            timetable = generate_timetable(courses, sections, professors, seed=seed * 100 + courses)
+            for scenario in args.scenarios:
+                student = generate_student(timetable, scenario=scenario, seed=seed)
+                name = case_name(courses, sections, professors, scenario, seed)
+                suite['cases'][name] = dict(run_case(timetable, student, parameters, args.repeat),
+                                            courses=courses, sections=sections, professors=professors,
+                                            scenario=scenario, seed=seed)
+                print(f"{name}: {suite['cases'][name]['solve_ms']} ms", file=sys.stderr)
+
+    output = json.dumps(suite, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), suite)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+"""
+Synthetic timetable data and a stub database connection for optimizer benchmarks.
+
+The generated rows follow the shape of the real `schedule` and `course_sessions`
+tables (groups F.1, F.2, ..., lectures on consecutive slots, one tutorial per
+group) so ScheduleOptimizer can be driven end to end without MySQL.
+"""
+import itertools
+import os
+import random
+import sys
+from datetime import timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+SLOT_TIMES = [
+    (timedelta(hours=8, minutes=30), timedelta(hours=10)),
+    (timedelta(hours=10), timedelta(hours=11, minutes=30)),
+    (timedelta(hours=11, minutes=30), timedelta(hours=13)),
+    (timedelta(hours=13, minutes=30), timedelta(hours=15)),
+    (timedelta(hours=15), timedelta(hours=16, minutes=30)),
+]
+SLOTS_PER_DAY = len(SLOT_TIMES)
+TOTAL_SLOTS = len(DAYS) * SLOTS_PER_DAY
+
+# Each generated timetable gets its own 'timetable' cache version, so the
+# optimizer's process-wide snapshot is reloaded when a benchmark switches data
+_timetable_versions = itertools.count(1)
+
+SCHEDULE_COLUMNS = [
+    'id', 'course_code', 'week_day', 'start_time', 'end_time',
+    'professor', 'classroom', 'group', 'session_type',
+    'course_index', 'session_number_index', 'time_slot_index',
+    'professor_index', 'Tutprof_index', 'lect_prof_index',
+]
+
+
+def generate_timetable(num_courses=6, sections_per_course=4, professors_per_course=3,
+                       tutorial_ratio=0.6, seed=0):
+    """Generate schedule rows where every group (section) has a clash-free week"""
+    rng = random.Random(seed)
+    groups = [f"F.{n}" for n in range(1, sections_per_course + 1)]
+    free_slots = {group: set(range(1, TOTAL_SLOTS + 1)) for group in groups}
+
+    rows = []
+    course_sessions = {}
+    for c in range(num_courses):
+        course_code = f"SYN {100 + c}"
+        lecture_sessions = 2 if rng.random() < 0.85 else 1
+        tutorial_sessions = 1 if rng.random() < tutorial_ratio else 0
+        course_sessions[course_code] = {
+            'lecture_sessions': lecture_sessions,
+            'tutorial_sessions': tutorial_sessions,
+            'total_sessions': lecture_sessions + tutorial_sessions,
+        }
+        lecture_profs = list(range(1, professors_per_course + 1))
+        tutorial_profs = list(range(1, max(1, professors_per_course - 1) + 1))
+
+        for group in groups:
+            lecture_prof = rng.choice(lecture_profs)
+            lecture_slots = _pick_consecutive(rng, free_slots[group], lecture_sessions)
+            if lecture_slots is None:
+                continue
+            for k, slot in enumerate(lecture_slots, start=1):
+                rows.append(_row(len(rows) + 1, course_code, c + 1, k, slot, group,
+                                 'lecture', lecture_prof, None, lecture_prof))
+            for k in range(lecture_sessions + 1, lecture_sessions + tutorial_sessions + 1):
+                candidates = sorted(free_slots[group])
+                if not candidates:
+                    break
+                slot = rng.choice(candidates)
+                free_slots[group].discard(slot)
+                tutorial_prof = rng.choice(tutorial_profs)
+                rows.append(_row(len(rows) + 1, course_code, c + 1, k, slot, group,
+                                 'tutorial', tutorial_prof, rng.randint(1, 50), None))
+
+    return {'schedule': rows, 'course_sessions': course_sessions, 'groups': groups,
+            'version': next(_timetable_versions)}
+
+
+def with_new_version(timetable):
+    """The same timetable under a fresh cache version, as after an admin edit"""
+    return dict(timetable, version=next(_timetable_versions))
+
+
+def _pick_consecutive(rng, free, count):
+    """Pick `count` consecutive free slots on the same day, removing them from `free`"""
+    starts = []
+    for day in range(len(DAYS)):
+        for pos in range(SLOTS_PER_DAY - count + 1):
+            slots = [day * SLOTS_PER_DAY + pos + n + 1 for n in range(count)]
+            if all(s in free for s in slots):
+                starts.append(slots)
+    if not starts:
+        return None
+    slots = rng.choice(starts)
+    free.difference_update(slots)
+    return slots
+
+
+def _row(row_id, course_code, course_index, session, slot, group, session_type,
+         professor_index, tutprof_index, lect_prof_index):
+    day, pos = divmod(slot - 1, SLOTS_PER_DAY)
+    start_time, end_time = SLOT_TIMES[pos]
+    return {
+        'id': row_id,
+        'course_code': course_code,
+        'week_day': DAYS[day],
+        'start_time': start_time,
+        'end_time': end_time,
+        'professor': f"Prof {course_code} #{professor_index}",
+        'classroom': f"S{slot}",
+        'group': group,
+        'session_type': session_type,
+        'course_index': course_index,
+        'session_number_index': session,
+        'time_slot_index': slot,
+        'professor_index': professor_index,
+        'Tutprof_index': tutprof_index,
+        'lect_prof_index': lect_prof_index,
+    }
+
+
+def generate_student(timetable, group='F.1', level='Sophomore', scenario='good_standing',
+                     preferred_slot_ratio=0.3, seed=0):
+    """Build a student's state for the stub connection.
+
+    scenario is one of 'good_standing' (FixSlot/FixProf on the main group),
+    'failed' (Junior with one failed course fixed to the group) or 'skipped'
+    (no fixing at all, the whole option space is open).
+    """
+    rng = random.Random(seed)
+    courses = sorted(timetable['course_sessions'])
+    history = [(code, 'enrolled', None) for code in courses]
+    if scenario == 'failed' and courses:
+        level = 'Junior'
+        history.append((courses[0], 'failed', '2024-01-15'))
+    elif scenario == 'skipped' and courses:
+        history.append((courses[-1], 'notenrolled', '2024-01-15'))
+
+    professor_preferences = []
+    for code in courses:
+        profs = sorted({row['professor_index'] for row in timetable['schedule']
+                        if row['course_code'] == code})
+        rng.shuffle(profs)
+        for rank, prof in enumerate(profs, start=1):
+            professor_preferences.append((code, prof, rank))
+
+    timeslot_preferences = [(slot, 1) for slot in range(1, TOTAL_SLOTS + 1)
+                            if rng.random() < preferred_slot_ratio]
+
+    return {
+        'student_id': 1,
+        'group': group,
+        'level': level,
+        'enrolled_courses': courses,
+        'history': history,
+        'professor_preferences': professor_preferences,
+        'timeslot_preferences': timeslot_preferences,
+        'priority': 'a',
+    }
+
+
+DEFAULT_SCHEDULE_PARAMETERS = {
+    'id': 1,
+    'weight_mode_a': 10.0,
+    'weight_mode_b': 1,
+    'maximum_solutions': 10,
+    'time_limit': 20,
+    'penalty_gap': 100,
+    'schedule_validation': 1,
+}
+
+
+class StubCursor:
+    """Answers the queries ScheduleOptimizer issues from in-memory data"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, params=None):
+        sql = ' '.join(query.split())
+        params = list(params or [])
+        data = self.connection.timetable
+        student = self.connection.student
+        self.connection.queries += 1
+        self.description = None
+
+        if 'FROM cache_versions' in sql:
+            rows = [(data['version'],)]
+        elif 'FROM student WHERE' in sql:
+            rows = [(student['group'], student['level'])]
+        elif 'lecture_study_group, tutorial_study_group FROM add_course' in sql:
+            rows = [(code, None, None) for code in student['enrolled_courses']]
+        elif 'course_code, status, date FROM add_course' in sql:
+            # ORDER BY course_code, date DESC (MySQL sorts NULL dates last)
+            rows = sorted(student['history'], key=lambda r: r[2] or '', reverse=True)
+            rows = sorted(rows, key=lambda r: r[0])
+        elif 'SELECT ac.course_code FROM add_course ac' in sql:
+            rows = [(code,) for code in student['enrolled_courses']]
+        elif 'FROM course_sessions' in sql:
+            rows = [(code, s['lecture_sessions'], s['tutorial_sessions'], s['total_sessions'])
+                    for code, s in data['course_sessions'].items()]
+        elif 'FROM schedule ORDER BY id' in sql:
+            columns = self._select_columns(sql)
+            rows = [tuple(r[c] for c in columns) for r in data['schedule']]
+            self.description = [(c,) for c in columns]
+        elif 'FROM time_grid' in sql:
+            rows = [(day * SLOTS_PER_DAY + pos + 1, week_day, start_time, end_time)
+                    for day, week_day in enumerate(DAYS) for pos, (start_time, end_time) in enumerate(SLOT_TIMES)]
+        elif 'FROM professor_preferences' in sql:
+            rows = list(student['professor_preferences'])
+        elif 'FROM time_slot_preferences' in sql:
+            rows = list(student['timeslot_preferences'])
+        elif 'FROM schedule_parameters' in sql:
+            params_row = self.connection.schedule_parameters
+            columns = self._select_columns(sql)
+            if columns == ['*']:
+                columns = list(params_row)
+            rows = [tuple(params_row.get(c) for c in columns)]
+            self.description = [(c,) for c in columns]
+        elif 'FROM priority_preferences' in sql:
+            rows = [(student['priority'],)]
+        elif 'DISTINCT ac.semester, ac.year' in sql:
+            rows = [(1, 2025)]
+        else:
+            raise NotImplementedError(f"StubCursor does not handle query: {sql}")
+
+        self._rows = list(rows)
+
+    @staticmethod
+    def _select_columns(sql):
+        select = sql[len('SELECT '):sql.index(' FROM ')]
+        return [c.strip().strip('`') for c in select.split(',')]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+
+class StubConnection:
+    """Minimal DB-API connection serving one synthetic student and timetable"""
+
+    def __init__(self, timetable, student, schedule_parameters=None):
+        self.timetable = timetable
+        self.student = student
+        self.schedule_parameters = dict(schedule_parameters or DEFAULT_SCHEDULE_PARAMETERS)
+        self.queries = 0
+
+    def cursor(self):
+        return StubCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_app():
+    """Flask app providing the application context the optimizer logs through"""
+    app = Flask('benchmarks')
+    app.logger.setLevel('ERROR')
+    return app
+
+
+def load_optimizer(timetable, student, schedule_parameters=None):
+    """Create a ScheduleOptimizer with its data loaded from the stub connection"""
+    from schedule_optimizer import ScheduleOptimizer
+
+    connection = StubConnection(timetable, student, schedule_parameters)
+    optimizer = ScheduleOptimizer(connection, student['student_id'])
+    optimizer.load_data()
+    return optimizer
@@ -0,0 +1,31 @@
+from flask import current_app
+
+# Names of the version stamps stored in the cache_versions table.
+# Every admin write that changes the data behind a process-wide cache bumps
+# the matching stamp, so each worker process notices the change on its next
+# read and reloads, without any cross-process messaging.
+CATALOG = 'catalog'
+CURRICULUM = 'curriculum'
+PARAMETERS = 'parameters'
+TIMETABLE = 'timetable'
+
+
+def get_cache_version(cursor, name):
+    """Return the current version stamp for a cache, or None if it cannot be read"""
+    try:
+        cursor.execute("SELECT version FROM cache_versions WHERE name = %s", (name,))
+        row = cursor.fetchone()
+    except Exception as e:
+        current_app.logger.warning(f"Could not read cache version '{name}': {str(e)}")
+        return None
+    return int(row[0]) if row else None
+
+
+def bump_cache_version(cursor, name):
+    """Increment a cache version stamp; the caller commits with its own transaction"""
+    cursor.execute("""
+        INSERT INTO cache_versions (name, version)
+        VALUES (%s, 1)
+        ON DUPLICATE KEY UPDATE version = version + 1
+    """, (name,))
+    current_app.logger.info(f"Bumped cache version '{name}'")
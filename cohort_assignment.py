@@ -0,0 +1,355 @@
+"""
+Cohort-wide section assignment under section capacities.
+
+Every student brings the ranked schedules the optimizer found for them
+(find_all_optimal_solutions; a solution_tolerance gives near-optimal
+alternatives too). Every schedule uses a set of sections, a section being one
+(course_code, session_type, group) of the timetable, and the section_capacity
+table caps how many students a section takes. The engine picks at most one
+schedule per student so that no section is over capacity, placing as many
+students as possible and, among those placements, losing as little of each
+student's own objective as possible:
+
+    maximise   sum over students of (PLACEMENT_VALUE - objective gap of the chosen schedule)
+    subject to  students choosing a schedule with section s <= capacity[s]
+
+Capacities are relaxed with one price per section (Lagrangian decomposition):
+given the prices, each student independently takes the schedule with the best
+value minus the prices of its sections, and the prices of overloaded sections
+rise by a diminishing subgradient step. The relaxation also gives an upper
+bound on the optimum. The last prices then order a greedy repair that places
+students by regret, each into their best schedule that still fits, so the
+result always respects every capacity. Sections without a capacity row are
+unlimited. Each iteration is linear in the number of schedules, so a whole
+school is assigned in seconds.
+
+Usage:
+    python cohort_assignment.py [--workers N] [--iterations N] [--limit N] [--apply]
+
+Without --apply the run only reports; with it, every placed student's study
+groups are written to add_course (as confirm_schedule_choice does) and the
+chosen schedule to student_schedules.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+from functools import partial
+from multiprocessing import Pool
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Value of placing a student at all; larger than any objective gap, so the
+# engine never leaves a student out to improve someone else's schedule
+PLACEMENT_VALUE = 1000.0
+DEFAULT_ITERATIONS = 100
+MAX_IMPROVEMENT_PASSES = 5
+# Relative distance to the Lagrangian bound at which the search stops
+OPTIMALITY_GAP = 0.005
+
+
+class CohortChoice:
+    """One schedule a student could be given: its sections and its value"""
+
+    __slots__ = ('sections', 'value', 'schedule')
+
+    def __init__(self, sections, value, schedule=None):
+        self.sections = frozenset(sections)
+        self.value = value
+        self.schedule = schedule
+
+
+class CohortAssignment:
+    """The chosen schedule of every student (an index into their choices, or None).
+
+    value is the objective of the assignment and bound the Lagrangian upper
+    bound on it, so value / bound is a guaranteed quality ratio.
+    """
+
+    def __init__(self, chosen, loads, value, bound, iterations):
+        self.chosen = chosen
+        self.loads = loads
+        self.value = value
+        self.bound = bound
+        self.iterations = iterations
+
+    @property
+    def unassigned(self):
+        return [student_id for student_id, index in self.chosen.items() if index is None]
+
+
+def schedule_sections(schedule):
+    """The (course_code, session_type, group) sections a schedule's sessions belong to"""
+    return {(session['course_code'], session['session_type'], session['group'])
+            for session in schedule if session.get('group')}
+
+
+def solution_choices(solutions):
+    """CohortChoices of a student's find_all_optimal_solutions solutions, best first"""
+    return [CohortChoice(schedule_sections(solution['schedule']),
+                         PLACEMENT_VALUE - solution.get('objective_gap', 0), solution)
+            for solution in solutions if solution.get('schedule')]
+
+
+def _reduced_values(values, capped, prices):
+    """Per student, (value minus section prices, index) of every choice, best first and earlier on ties"""
+    reduced = {}
+    for student_id, student_values in values.items():
+        options = [(value - sum(prices[s] for s in sections), index)
+                   for index, (value, sections) in enumerate(zip(student_values, capped[student_id]))]
+        reduced[student_id] = sorted(options, key=lambda option: (-option[0], option[1]))
+    return reduced
+
+
+def _repair(values, capped, capacities, reduced):
+    """A capacity-feasible assignment: students by regret, each into their best choice that fits"""
+    def regret(student_id):
+        options = reduced[student_id]
+        return options[0][0] - (options[1][0] if len(options) > 1 else 0)
+
+    remaining = dict(capacities)
+    chosen = {}
+    value = 0.0
+    for student_id in sorted(reduced, key=regret, reverse=True):
+        chosen[student_id] = None
+        for _, index in reduced[student_id]:
+            sections = capped[student_id][index]
+            if all(remaining[s] > 0 for s in sections):
+                for s in sections:
+                    remaining[s] -= 1
+                chosen[student_id] = index
+                value += values[student_id][index]
+                break
+    return chosen, value
+
+
+def _improve(values, capped, capacities, chosen, value, passes=MAX_IMPROVEMENT_PASSES):
+    """Place unassigned students by moving one placed student to another of their choices.
+
+    For each choice of an unassigned student, a student holding a seat in
+    every full section of it is moved to another of their choices that still
+    fits once the first student is in; the first such move is kept.
+    """
+    remaining = dict(capacities)
+    members = defaultdict(set)
+
+    def take(student_id, index, amount):
+        for s in capped[student_id][index]:
+            remaining[s] -= amount
+            if amount > 0:
+                members[s].add(student_id)
+            else:
+                members[s].discard(student_id)
+
+    def fits(student_id, index):
+        return all(remaining[s] > 0 for s in capped[student_id][index])
+
+    def move_one_holder(student_id, index, full):
+        for other in set.intersection(*(members[s] for s in full)):
+            current = chosen[other]
+            take(other, current, -1)
+            if fits(student_id, index):
+                take(student_id, index, 1)
+                for alternative in range(len(capped[other])):
+                    if alternative != current and fits(other, alternative):
+                        take(other, alternative, 1)
+                        chosen[student_id], chosen[other] = index, alternative
+                        return values[student_id][index] + values[other][alternative] - values[other][current]
+                take(student_id, index, -1)
+            take(other, current, 1)
+        return None
+
+    for student_id, index in chosen.items():
+        if index is not None:
+            take(student_id, index, 1)
+
+    for _ in range(passes):
+        improved = False
+        for student_id in [s for s, index in chosen.items() if index is None]:
+            for index in range(len(capped[student_id])):
+                if fits(student_id, index):
+                    take(student_id, index, 1)
+                    chosen[student_id] = index
+                    value += values[student_id][index]
+                    improved = True
+                    break
+                full = [s for s in capped[student_id][index] if remaining[s] <= 0]
+                gain = move_one_holder(student_id, index, full) if full else None
+                if gain is not None:
+                    value += gain
+                    improved = True
+                    break
+        if not improved:
+            break
+    return chosen, value
+
+
+def assign_cohort(choices, capacities, iterations=DEFAULT_ITERATIONS):
+    """Assign at most one choice per student without exceeding any section capacity.
+
+    choices maps each student to their CohortChoices, best first; capacities
+    maps sections to the number of students they take. The price updates
+    stop once the best repair is within OPTIMALITY_GAP of the Lagrangian
+    bound; students it leaves out then get a local search. Returns a
+    CohortAssignment.
+    """
+    capacities = {s: max(int(c), 0) for s, c in capacities.items()}
+    students = list(choices)
+    choices = {student_id: student_choices for student_id, student_choices in choices.items() if student_choices}
+    values = {student_id: [c.value for c in student_choices] for student_id, student_choices in choices.items()}
+    # Only the sections with a capacity matter to the assignment
+    capped = {student_id: [tuple(s for s in c.sections if s in capacities) for c in student_choices]
+              for student_id, student_choices in choices.items()}
+    largest = max((v for student_values in values.values() for v in student_values), default=0.0)
+
+    prices = defaultdict(float)
+    bound = math.inf
+    chosen, value = {}, -math.inf
+    iteration = 0
+    for iteration in range(1, max(iterations, 1) + 1):
+        reduced = _reduced_values(values, capped, prices)
+        loads = defaultdict(int)
+        dual = sum(prices[s] * c for s, c in capacities.items())
+        for student_id, options in reduced.items():
+            best_value, best_index = options[0]
+            if best_value > 0:
+                dual += best_value
+                for s in capped[student_id][best_index]:
+                    loads[s] += 1
+        bound = min(bound, dual)
+
+        # Every price vector gives its own greedy repair; keep the best one
+        candidate, candidate_value = _repair(values, capped, capacities, reduced)
+        if candidate_value > value:
+            chosen, value = candidate, candidate_value
+        if value >= bound * (1 - OPTIMALITY_GAP):
+            break
+
+        # Subgradient of the dual: load minus capacity, prices kept non-negative
+        step = largest / (2 * math.sqrt(iteration))
+        moved = False
+        for s, capacity in capacities.items():
+            excess = loads.get(s, 0) - capacity
+            if excess > 0 or prices[s] > 0:
+                new_price = max(0.0, prices[s] + step * excess / max(capacity, 1))
+                moved = moved or new_price != prices[s]
+                prices[s] = new_price
+        if not moved:
+            # No section overloaded and no price to lower: the relaxation is optimal
+            break
+
+    if value < bound * (1 - OPTIMALITY_GAP) or None in chosen.values():
+        chosen, value = _improve(values, capped, capacities, chosen, value)
+    for student_id in students:
+        chosen.setdefault(student_id, None)
+
+    loads = defaultdict(int)
+    for student_id, index in chosen.items():
+        if index is not None:
+            for s in choices[student_id][index].sections:
+                loads[s] += 1
+    return CohortAssignment(chosen, dict(loads), value, bound, iteration)
+
+
+def load_capacities(connection):
+    """(course_code, session_type, group) -> capacity, from the section_capacity table"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT course_code, session_type, `group`, capacity FROM section_capacity")
+        return {(course_code, session_type, group): capacity
+                for course_code, session_type, group, capacity in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def write_assignment(connection, students, choices, assignment):
+    """Save every placed student's study groups and chosen schedule in one transaction"""
+    from batch_schedules import write_schedules
+
+    rows = []
+    cursor = connection.cursor()
+    try:
+        for student_id, index in assignment.chosen.items():
+            if index is None:
+                continue
+            solution = choices[student_id][index].schedule
+            groups = defaultdict(dict)
+            for course_code, session_type, group in sorted(choices[student_id][index].sections):
+                groups[course_code].setdefault(session_type, group)
+            for course_code, course_groups in groups.items():
+                cursor.execute("""
+                    UPDATE add_course
+                    SET lecture_study_group = %s,
+                        tutorial_study_group = %s
+                    WHERE student_id = %s
+                    AND course_code = %s
+                    AND year = %s
+                    AND semester = %s
+                    AND status = 'enrolled'
+                """, (course_groups.get('lecture'), course_groups.get('tutorial'), student_id, course_code,
+                      solution.get('year'), solution.get('semester')))
+            rows.append((student_id, students[student_id], dict(solution, success=True)))
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    write_schedules(connection, rows)
+
+
+def run(workers, iterations, limit=None, apply=False):
+    from batch_schedules import _init_worker, _solve_student, connect, create_app, load_enrolled_students
+
+    app = create_app()
+    connection = connect(app)
+    try:
+        students = load_enrolled_students(connection)
+        capacities = load_capacities(connection)
+        pending = list(students)[:limit] if limit is not None else list(students)
+        print(f"{len(pending)} students, {len(capacities)} sections with a capacity, {workers} workers")
+
+        start = time.perf_counter()
+        choices = {}
+        with Pool(processes=workers, initializer=_init_worker) as pool:
+            for student_id, result in pool.imap_unordered(partial(_solve_student, find_all=True), pending):
+                student_choices = solution_choices(result.get('solutions') or []) if result.get('success') else []
+                if student_choices:
+                    choices[student_id] = student_choices
+        solved = time.perf_counter()
+        print(f"Found schedules for {len(choices)} of {len(pending)} students in {solved - start:.1f}s")
+
+        assignment = assign_cohort(choices, capacities, iterations)
+        assigned = time.perf_counter()
+        print(f"Assigned {len(choices) - len(assignment.unassigned)} students, "
+              f"{len(assignment.unassigned)} left without a schedule that fits, in {assigned - solved:.2f}s "
+              f"({assignment.iterations} iterations, value {assignment.value:.1f} of at most {assignment.bound:.1f})")
+        full = sorted(s for s, c in capacities.items() if assignment.loads.get(s, 0) >= c)
+        if full:
+            print(f"Sections at capacity: {', '.join('/'.join(map(str, s)) for s in full)}")
+
+        if apply:
+            write_assignment(connection, students, choices, assignment)
+            print("Study groups and schedules written")
+        return assignment
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help='price updates of the Lagrangian relaxation')
+    parser.add_argument('--limit', type=int, help='assign at most this many students')
+    parser.add_argument('--apply', action='store_true',
+                        help='write study groups and schedules instead of only reporting')
+    args = parser.parse_args()
+
+    assignment = run(args.workers, args.iterations, args.limit, args.apply)
+    sys.exit(1 if assignment.unassigned else 0)
+
+
+if __name__ == '__main__':
+    main()
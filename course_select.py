@@ -1,4 +1,63 @@
+from collections import defaultdict
+
 from flask import current_app, jsonify
+from curriculum_catalog import course_dicts, find_in_set, get_curriculum_catalog
+from prerequisite_graph import get_prerequisite_graph
+from system_parameters import resolve_parameters
+
+class StudentHistory:
+    """A student's add_course rows joined with courses, from one query.
+
+    The registration helpers below derive their lists from it instead of
+    aggregating add_course again. rows holds every attempt in id order and
+    attempts the same rows per course; latest is the most recent attempt of
+    each course (the MAX(id) row), and passed, failed and notenrolled the
+    courses whose latest attempt has that status. best_grades is the best
+    passing grade_point of each course. Rows whose course_code is not in
+    courses have course_id None.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.attempts = defaultdict(list)
+        self.latest = {}
+        self.best_grades = {}
+        for row in rows:
+            code = row['course_code']
+            self.attempts[code].append(row)
+            self.latest[code] = row
+            if row['status'] == 'passed' and row['grade_point'] is not None:
+                if code not in self.best_grades or row['grade_point'] > self.best_grades[code]:
+                    self.best_grades[code] = row['grade_point']
+        self.latest_by_course_id = {row['course_id']: row for row in self.latest.values() if row['course_id'] is not None}
+        self.passed = {code for code, row in self.latest.items() if row['status'] == 'passed'}
+        self.failed = {code for code, row in self.latest.items() if row['status'] == 'failed'}
+        self.notenrolled = {code for code, row in self.latest.items() if row['status'] == 'notenrolled'}
+
+    def __contains__(self, course_code):
+        return course_code in self.latest
+
+def load_student_history(student_id):
+    """Load the student's full add_course history joined with courses"""
+    cursor = current_app.mysql.connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT ac.id, ac.course_code, ac.status, ac.semester, ac.year,
+                   ac.grade_point, ac.letter_grade, ac.forgiveness,
+                   c.id AS course_id, c.course_name, c.coefficient,
+                   c.semester AS course_semester, c.year AS course_year, c.requires_french
+            FROM add_course ac
+            LEFT JOIN courses c ON ac.course_code = c.course_code
+            WHERE ac.student_id = %s
+            ORDER BY ac.id
+        """, (student_id,))
+        columns = [col[0] for col in cursor.description]
+        return StudentHistory([dict(zip(columns, row)) for row in cursor.fetchall()])
+    except Exception as e:
+        current_app.logger.error(f"Error in load_student_history: {str(e)}")
+        return StudentHistory([])
+    finally:
+        cursor.close()
 
 def get_course_registration_data(student_id):
     """Get all course registration data for a student"""
@@ -48,15 +107,16 @@ def get_course_registration_data(student_id):
                 'filtered_majors': []
             }
         
+        # The student's whole add_course history, which every list below is derived from
+        history = load_student_history(student_id)
+        
         # Check credit requirements for year 3+ students
         credit_requirement_met = True
         credit_status = None
         
         if student_year >= 3:
             # Get min_credit_percentage_major from system_parameters
-            cursor.execute("SELECT min_credit_percentage_major FROM system_parameters ORDER BY last_updated DESC LIMIT 1")
-            min_percentage_row = cursor.fetchone()
-            min_percentage = float(min_percentage_row[0]) if min_percentage_row and min_percentage_row[0] is not None else None
+            min_percentage = resolve_parameters(current_app.mysql.connection).min_credit_percentage_major
             
             # Calculate total weights for year 1 and 2 courses
             total_weights_query = """
@@ -71,30 +131,16 @@ def get_course_registration_data(student_id):
             total_weights_row = cursor.fetchone()
             total_weights = float(total_weights_row[0]) if total_weights_row and total_weights_row[0] is not None else 0.0
             
-            # Calculate earned credits for year 1 and 2 courses - use DISTINCT to count each course only once
-            earned_credits_query = """
-                SELECT SUM(c.coefficient) as earned_credits
-                FROM (
-                    SELECT DISTINCT ac.course_code
-                    FROM add_course ac
-                    JOIN courses c ON ac.course_code = c.course_code
-                    WHERE ac.student_id = %s 
-                    AND ac.status = 'passed'
-                    AND c.year IN (1, 2)
-                    {french_clause}
-                ) as distinct_courses
-                JOIN courses c ON distinct_courses.course_code = c.course_code
-            """.format(
-                french_clause="AND (c.requires_french = 0 OR c.requires_french IS NULL)" if is_non_french else ""
-            )
-            cursor.execute(earned_credits_query, (student_id,))
-            earned_credits_row = cursor.fetchone()
-            earned_credits = 0.0  # Default value
-            if earned_credits_row and earned_credits_row[0] is not None:
-                try:
-                    earned_credits = float(earned_credits_row[0])
-                except (TypeError, ValueError):
-                    earned_credits = 0.0
+            # Calculate earned credits for year 1 and 2 courses - count each passed course only once
+            earned_credits = 0.0
+            for code, attempts in history.attempts.items():
+                row = attempts[0]
+                if row['course_id'] is None or row['course_year'] not in (1, 2):
+                    continue
+                if is_non_french and row['requires_french']:
+                    continue
+                if any(attempt['status'] == 'passed' for attempt in attempts):
+                    earned_credits += float(row['coefficient'])
             
             # Calculate required credits based on min_percentage
             required_credits = None
@@ -114,35 +160,35 @@ def get_course_registration_data(student_id):
             }
         
         # Get student's course history flags
-        has_failed = has_failed_courses(student_id)
-        has_notenrolled = has_notenrolled_courses(student_id)
+        has_failed = has_failed_courses(student_id, history)
+        has_notenrolled = has_notenrolled_courses(student_id, history)
         
         # Get course lists
-        failed_courses = get_failed_courses(student_id, current_semester, current_year)
-        notenrolled_courses = get_notenrolled_courses(student_id, current_semester, current_year)
-        retake_courses = get_retake_courses(student_id, current_semester, current_year)
+        failed_courses = get_failed_courses(student_id, current_semester, current_year, history)
+        notenrolled_courses = get_notenrolled_courses(student_id, current_semester, current_year, history)
+        retake_courses = get_retake_courses(student_id, current_semester, current_year, history)
         
         # Get eligible current courses
         current_courses_data = get_current_courses(current_semester, current_year, student_id)
-        eligible_current, not_met_current = get_eligible_courses(student_id, current_courses_data['courses'])
+        eligible_current, not_met_current = get_eligible_courses(student_id, current_courses_data['courses'], history)
         filtered_majors = current_courses_data['filtered_majors']
         
         # Get other course lists
-        eligible_notenrolled, not_met_notenrolled = get_eligible_courses(student_id, notenrolled_courses)
+        eligible_notenrolled, not_met_notenrolled = get_eligible_courses(student_id, notenrolled_courses, history)
         
         # Combine not met requirements from all sources
         not_met_requirements = not_met_current + not_met_notenrolled
         
         # Get currently enrolled courses
-        enrolled_courses = get_enrolled_courses(student_id, current_semester, current_year)
+        enrolled_courses = get_enrolled_courses(student_id, current_semester, current_year, history)
         
         # Get extra courses (for 3rd year and above)
         extra_courses = []
         if student_year >= 3:
-            extra_courses = get_extra_courses(current_semester, student_id)
+            extra_courses = get_extra_courses(current_semester, student_id, history)
             
         # Get elective courses
-        elective_courses = get_elective_courses(current_semester, current_year, student_id)
+        elective_courses = get_elective_courses(current_semester, current_year, student_id, history)
         
         # Check if student is eligible to choose a major
         cursor.execute("""
@@ -175,20 +221,16 @@ def get_course_registration_data(student_id):
         """, (student_id,))
         specialized_gpas = cursor.fetchone()
         
-        cursor.execute("""
-            SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-            FROM system_parameters
-            ORDER BY last_updated DESC
-            LIMIT 1
-        """)
-        min_gpas = cursor.fetchone()
+        system_parameters = resolve_parameters(current_app.mysql.connection)
         
         eligible_major_count = 0
         eligible_majors = []
-        if specialized_gpas and min_gpas:
+        if specialized_gpas and system_parameters.configured:
+            min_gpa_map = system_parameters.min_gpa_map
             major_codes = ['ACCT', 'BA', 'FIN', 'IT', 'MRK']
             for i in range(5):  # Check all 5 majors
-                if specialized_gpas[i] is not None and min_gpas[i] is not None and specialized_gpas[i] >= min_gpas[i]:
+                min_gpa = min_gpa_map[major_codes[i]]
+                if specialized_gpas[i] is not None and min_gpa is not None and specialized_gpas[i] >= min_gpa:
                     eligible_major_count += 1
                     eligible_majors.append(major_codes[i])
         
@@ -227,7 +269,7 @@ def get_course_registration_data(student_id):
         if use_max_year_filter:
             max_year = 2  # Limit to Freshman and Sophomore courses
             current_courses_data = get_current_courses(current_semester, current_year, student_id, max_year=max_year)
-            eligible_current, not_met_current = get_eligible_courses(student_id, current_courses_data['courses'])
+            eligible_current, not_met_current = get_eligible_courses(student_id, current_courses_data['courses'], history)
             filtered_majors = current_courses_data['filtered_majors']
         
         return {
@@ -290,204 +332,115 @@ def get_current_year(student_id):
     finally:
         cursor.close()
 
-def has_failed_courses(student_id):
+def has_failed_courses(student_id, history=None):
     """Check if student has any currently failed courses"""
-    cursor = current_app.mysql.connection.cursor()
-    try:
-        cursor.execute("""
-            SELECT COUNT(*) FROM (
-                SELECT ac1.course_code, ac1.status
-                FROM add_course ac1
-                INNER JOIN (
-                    SELECT course_code, MAX(id) as latest_id
-                    FROM add_course
-                    WHERE student_id = %s
-                    GROUP BY course_code
-                ) latest ON ac1.id = latest.latest_id
-                WHERE ac1.student_id = %s AND ac1.status = 'failed'
-            ) as current_failed_courses
-        """, (student_id, student_id))
-        count = cursor.fetchone()[0]
-        return count > 0
-    except Exception as e:
-        current_app.logger.error(f"Error in has_failed_courses: {str(e)}")
-        return False
-    finally:
-        cursor.close()
+    if history is None:
+        history = load_student_history(student_id)
+    return len(history.failed) > 0
 
-def has_notenrolled_courses(student_id):
+def has_notenrolled_courses(student_id, history=None):
     """Check if student has any currently notenrolled courses"""
-    cursor = current_app.mysql.connection.cursor()
-    try:
-        cursor.execute("""
-            SELECT COUNT(*) FROM (
-                SELECT ac1.course_code, ac1.status
-                FROM add_course ac1
-                INNER JOIN (
-                    SELECT course_code, MAX(id) as latest_id
-                    FROM add_course
-                    WHERE student_id = %s
-                    GROUP BY course_code
-                ) latest ON ac1.id = latest.latest_id
-                WHERE ac1.student_id = %s AND ac1.status = 'notenrolled'
-            ) as current_notenrolled_courses
-        """, (student_id, student_id))
-        count = cursor.fetchone()[0]
-        return count > 0
-    except Exception as e:
-        current_app.logger.error(f"Error in has_notenrolled_courses: {str(e)}")
-        return False
-    finally:
-        cursor.close()
+    if history is None:
+        history = load_student_history(student_id)
+    return len(history.notenrolled) > 0
 
-def get_enrolled_courses(student_id, semester, year):
+def get_enrolled_courses(student_id, semester, year, history=None):
     """Get currently enrolled courses for the current semester"""
-    cursor = current_app.mysql.connection.cursor()
-    try:
-        cursor.execute("""
-            SELECT ac.course_code, c.course_name, c.coefficient, ac.forgiveness
-            FROM add_course ac
-            JOIN courses c ON ac.course_code = c.course_code
-            WHERE ac.student_id = %s 
-            AND ac.semester = %s
-            AND ac.year = %s
-            AND ac.status = 'enrolled'
-            ORDER BY ac.id DESC
-        """, (student_id, semester, year))
-        
-        return [dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()]
-    except Exception as e:
-        current_app.logger.error(f"Error in get_enrolled_courses: {str(e)}")
-        return []
-    finally:
-        cursor.close()
+    if history is None:
+        history = load_student_history(student_id)
+    return [
+        {'course_code': row['course_code'], 'course_name': row['course_name'],
+         'coefficient': row['coefficient'], 'forgiveness': row['forgiveness']}
+        for row in reversed(history.rows)
+        if row['course_id'] is not None and row['semester'] == semester and row['year'] == year
+        and row['status'] == 'enrolled'
+    ]
 
-def get_failed_courses(student_id, current_semester, current_year):
+def get_failed_courses(student_id, current_semester, current_year, history=None):
     """Get the last failed attempt for each course from previous years"""
-    cursor = current_app.mysql.connection.cursor()
+    if history is None:
+        history = load_student_history(student_id)
     try:
-        cursor.execute("""
-        SELECT c.course_code, c.course_name, c.coefficient, 
-               ac.year AS failed_year, ac.grade_point
-        FROM (
-            SELECT course_code, MAX(id) AS latest_id
-            FROM add_course
-            WHERE student_id = %s
-            AND status = 'failed'
-            AND year < %s
-            GROUP BY course_code
-        ) AS latest_failed
-        JOIN add_course ac ON ac.id = latest_failed.latest_id
-        JOIN courses c ON ac.course_code = c.course_code
-        WHERE c.semester = %s
-        AND NOT EXISTS (
-            SELECT 1 FROM add_course ac2
-            WHERE ac2.student_id = %s
-            AND ac2.course_code = ac.course_code
-            AND ac2.status = 'passed'
-            AND ac2.year >= ac.year  # Passed in same or later year
-        )
-        """, (student_id, current_year, current_semester, student_id))
-
-        return [dict(zip([col[0] for col in cursor.description], row))
-                for row in cursor.fetchall()]
+        courses = []
+        for code, attempts in sorted(history.attempts.items()):
+            failed = [row for row in attempts if row['status'] == 'failed' and row['year'] < current_year]
+            if not failed:
+                continue
+            row = failed[-1]
+            if row['course_id'] is None or row['course_semester'] != current_semester:
+                continue
+            # Passed in same or later year
+            if any(other['status'] == 'passed' and other['year'] >= row['year'] for other in attempts):
+                continue
+            courses.append({'course_code': code, 'course_name': row['course_name'], 'coefficient': row['coefficient'],
+                            'failed_year': row['year'], 'grade_point': row['grade_point']})
+        return courses
     except Exception as e:
         current_app.logger.error(f"Error in get_failed_courses: {str(e)}")
         return []
-    finally:
-        cursor.close()
 
-def get_notenrolled_courses(student_id, current_semester, current_year):
+def get_notenrolled_courses(student_id, current_semester, current_year, history=None):
     """Get notenrolled courses from previous years (same semester)"""
-    cursor = current_app.mysql.connection.cursor()
+    if history is None:
+        history = load_student_history(student_id)
     try:
-        cursor.execute("""
-            SELECT c.course_code, c.course_name, c.coefficient,
-                   ac.year AS notenrolled_year
-            FROM (
-                SELECT course_code, MAX(year) AS max_year
-                FROM add_course
-                WHERE student_id = %s
-                AND semester = %s
-                AND status = 'notenrolled'
-                AND year < %s
-                GROUP BY course_code
-            ) AS latest_notenrolled
-            JOIN add_course ac ON ac.course_code = latest_notenrolled.course_code 
-                              AND ac.year = latest_notenrolled.max_year
-                              AND ac.status = 'notenrolled'
-                              AND ac.student_id = %s
-            JOIN courses c ON ac.course_code = c.course_code
-            WHERE c.semester = %s
-            AND NOT EXISTS (
-                SELECT 1 FROM add_course ac2
-                WHERE ac2.student_id = %s
-                AND ac2.course_code = ac.course_code
-                AND ac2.status = 'passed'
-                AND ac2.year >= ac.year
-            )
-            AND NOT EXISTS (
-                -- Exclude courses that have been registered for makeup (semester 3)
-                SELECT 1 FROM add_course ac3
-                WHERE ac3.student_id = %s
-                AND ac3.course_code = ac.course_code
-                AND ac3.semester = 3
-            )
-            ORDER BY c.course_code
-        """, (student_id, current_semester, current_year, 
-              student_id, current_semester, student_id, student_id))
-        
-        return [dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()]
+        courses = []
+        for code, attempts in sorted(history.attempts.items()):
+            years = [row['year'] for row in attempts
+                     if row['status'] == 'notenrolled' and row['semester'] == current_semester
+                     and row['year'] < current_year]
+            if not years:
+                continue
+            latest_year = max(years)
+            # Exclude courses that have been registered for makeup (semester 3)
+            if any(row['semester'] == 3 for row in attempts):
+                continue
+            for row in attempts:
+                if row['status'] != 'notenrolled' or row['year'] != latest_year:
+                    continue
+                if row['course_id'] is None or row['course_semester'] != current_semester:
+                    continue
+                if any(other['status'] == 'passed' and other['year'] >= row['year'] for other in attempts):
+                    continue
+                courses.append({'course_code': code, 'course_name': row['course_name'],
+                                'coefficient': row['coefficient'], 'notenrolled_year': row['year']})
+        return courses
     except Exception as e:
         current_app.logger.error(f"Error in get_notenrolled_courses: {str(e)}")
         return []
-    finally:
-        cursor.close()
 
-def get_retake_courses(student_id, current_semester, current_year):
+def get_retake_courses(student_id, current_semester, current_year, history=None):
     """Get the last passed attempt (with grade_point <= maximum_forgive_grade) for each course from previous years"""
-    cursor = current_app.mysql.connection.cursor()
+    if history is None:
+        history = load_student_history(student_id)
     try:
         # Get maximum_forgive_grade from system_parameters
-        cursor.execute("SELECT maximum_forgive_grade FROM system_parameters ORDER BY last_updated DESC LIMIT 1")
-        min_grade_row = cursor.fetchone()
-        maximum_forgive_grade = float(min_grade_row[0]) if min_grade_row and min_grade_row[0] is not None else 2.0
+        maximum_forgive_grade = resolve_parameters(current_app.mysql.connection).maximum_forgive_grade
+        if maximum_forgive_grade is None:
+            maximum_forgive_grade = 2.0
 
-        cursor.execute("""
-        SELECT c.course_code, c.course_name, c.coefficient, 
-               ac.year AS passed_year, ac.grade_point, ac.letter_grade
-        FROM (
-            SELECT course_code, MAX(id) AS latest_id
-            FROM add_course
-            WHERE student_id = %s
-            AND status = 'passed'
-            AND grade_point <= %s
-            AND year < %s
-            GROUP BY course_code
-        ) AS latest_passed
-        JOIN add_course ac ON ac.id = latest_passed.latest_id
-        JOIN courses c ON ac.course_code = c.course_code
-        WHERE c.semester = %s
-        AND NOT EXISTS (
-            SELECT 1 FROM add_course ac2
-            WHERE ac2.student_id = %s
-            AND ac2.course_code = ac.course_code
-            AND (
-                (ac2.status = 'passed' AND ac2.grade_point > %s) OR  # Better passing grade
-                (ac2.status = 'passed' AND ac2.year > ac.year)        # Or later passing attempt
-            )
-        )
-        """, (student_id, maximum_forgive_grade, current_year, current_semester, student_id, maximum_forgive_grade))
-
-        return [dict(zip([col[0] for col in cursor.description], row))
-                for row in cursor.fetchall()]
+        courses = []
+        for code, attempts in sorted(history.attempts.items()):
+            passed = [row for row in attempts
+                      if row['status'] == 'passed' and row['grade_point'] is not None
+                      and row['grade_point'] <= maximum_forgive_grade and row['year'] < current_year]
+            if not passed:
+                continue
+            row = passed[-1]
+            if row['course_id'] is None or row['course_semester'] != current_semester:
+                continue
+            # Better passing grade or later passing attempt
+            if any(other['status'] == 'passed' and (
+                    (other['grade_point'] is not None and other['grade_point'] > maximum_forgive_grade) or
+                    other['year'] > row['year']) for other in attempts):
+                continue
+            courses.append({'course_code': code, 'course_name': row['course_name'], 'coefficient': row['coefficient'],
+                            'passed_year': row['year'], 'grade_point': row['grade_point'],
+                            'letter_grade': row['letter_grade']})
+        return courses
     except Exception as e:
         current_app.logger.error(f"Error in get_retake_courses: {str(e)}")
         return []
-    finally:
-        cursor.close()
 
 def get_current_courses(current_semester, current_year, student_id, max_year=None):
     """Get courses offered in current semester/year, considering French requirements and major/minor selections"""
@@ -521,37 +474,13 @@ def get_current_courses(current_semester, current_year, student_id, max_year=Non
         filtered_majors = []  # Track majors that don't meet GPA requirements
         
         if year_of_study >= 3:
-            # First check for student-specific parameter overrides
-            cursor.execute("""
-                SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                FROM student_parameters_overrides
-                WHERE student_id = %s
-            """, (student_id,))
-            
-            min_gpas_override = cursor.fetchone()
-            
-            # If no overrides, get system parameters
-            if not min_gpas_override:
-                cursor.execute("""
-                    SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                    FROM system_parameters
-                    ORDER BY last_updated DESC
-                    LIMIT 1
-                """)
-                min_gpas = cursor.fetchone()
-            else:
-                min_gpas = min_gpas_override
-                current_app.logger.info(f"Using parameter overrides for student {student_id}: {min_gpas}")
+            # System minimum GPAs with any student-specific overrides applied
+            parameters = resolve_parameters(current_app.mysql.connection, student_id)
             
-            if min_gpas:
-                min_gpa_map = {
-                    'ACCT': float(min_gpas[0]) if min_gpas[0] is not None else 0,
-                    'BA': float(min_gpas[1]) if min_gpas[1] is not None else 0,
-                    'FIN': float(min_gpas[2]) if min_gpas[2] is not None else 0,
-                    'IT': float(min_gpas[3]) if min_gpas[3] is not None else 0,
-                    'MRK': float(min_gpas[4]) if min_gpas[4] is not None else 0
-                }
-                
+            if parameters.configured:
+                min_gpa_map = {major: min_gpa if min_gpa is not None else 0
+                               for major, min_gpa in parameters.min_gpa_map.items()}
+
                 # Get student's specialized GPAs
                 cursor.execute("""
                     SELECT acct_gpa, ba_gpa, fin_gpa, it_gpa, mrk_gpa
@@ -590,85 +519,43 @@ def get_current_courses(current_semester, current_year, student_id, max_year=Non
                 current_app.logger.warning("No minimum GPA requirements found in system_parameters")
                 eligible_majors = all_majors.copy()
 
-        # Base query - note we don't filter by year here as it will be handled in the conditions
-        query = """
-            SELECT course_code, course_name, coefficient, requires_french, for_major
-            FROM courses
-            WHERE semester = %s
-            AND in_curriculum = 1
-            AND NOT EXISTS (
-                SELECT 1 FROM course_elective_groups ceg
-                WHERE ceg.course_id = courses.id
-            )
-        """
-        params = [current_semester]
-
-        # If student is non-French, exclude courses that require French
-        if non_french:
-            query += " AND (requires_french = 0 OR requires_french IS NULL)"
+        # Filter the catalog - the year is handled by the major/minor conditions below
+        catalog = get_curriculum_catalog(current_app.mysql.connection)
+        major_minor_selection = year_of_study >= 3 and len(selected_majors) + len(selected_minors) >= 2
 
-        # If student is in 3rd year and has at least 2 selections
-        if year_of_study >= 3 and len(selected_majors) + len(selected_minors) >= 2:
-            major_minor_conditions = []
-            
-            # Add conditions for majors - these use the default year
-            if selected_majors:
-                major_conditions = []
-                for major in selected_majors:
-                    major_conditions.append(f"(FIND_IN_SET(%s, for_major) > 0 AND year = %s)")
-                    params.append(major)
-                    params.append(current_year)
-                major_minor_conditions.append("(" + " OR ".join(major_conditions) + ")")
-            
-            # Add conditions for minors with major restriction and proper year handling
-            if selected_minors:
-                minor_conditions = []
-                for minor in selected_minors:
-                    # For each minor, create a condition that checks:
-                    # 1. If the course is for this minor AND
-                    # 2. Either:
-                    #    a. for_minor_if_major_is is NULL (no major restriction) OR
-                    #    b. Student's major is in for_minor_if_major_is AND
-                    # 3. The year matches either:
-                    #    a. minor_study_year if it's set OR
-                    #    b. the default year if minor_study_year is NULL
-                    minor_condition = f"""(
-                        FIND_IN_SET(%s, for_minor) > 0 AND 
-                        (
-                            for_minor_if_major_is IS NULL OR 
-                            {' OR '.join(['FIND_IN_SET(%s, for_minor_if_major_is) > 0' for _ in selected_majors])}
-                        ) AND
-                        (
-                            (minor_study_year IS NOT NULL AND minor_study_year = %s) OR
-                            (minor_study_year IS NULL AND year = %s)
-                        )
-                    )"""
-                    minor_conditions.append(minor_condition)
-                    params.append(minor)
-                    # Add each major to params for the FIND_IN_SET checks
-                    params.extend(selected_majors)
-                    # Add current year twice - once for minor_study_year check, once for default year check
-                    params.append(current_year)
-                    params.append(current_year)
-                
-                major_minor_conditions.append("(" + " OR ".join(minor_conditions) + ")")
-            
-            # Combine all conditions
-            if major_minor_conditions:
-                query += " AND (" + " OR ".join(major_minor_conditions) + ")"
-        else:
-            # For non-major/minor specific courses, use the default year
-            query += " AND year = %s"
-            params.append(current_year)
+        def offered(course):
+            if course.semester != current_semester or course.in_curriculum != 1:
+                return False
+            if course.id in catalog.elective_groups_by_course:
+                return False
+            # If student is non-French, exclude courses that require French
+            if non_french and course.requires_french:
+                return False
+            if max_year and course.year > max_year:
+                return False
+            if not major_minor_selection:
+                # For non-major/minor specific courses, use the default year
+                return course.year == current_year
 
-        if max_year:
-            query += " AND year <= %s"
-            params.append(max_year)
+            # If student is in 3rd year and has at least 2 selections:
+            # courses for a selected major use the default year
+            if any(find_in_set(major, course.for_major) for major in selected_majors) and course.year == current_year:
+                return True
+            # Courses for a selected minor, if the minor is not restricted to
+            # other majors, in minor_study_year when set or the default year
+            for minor in selected_minors:
+                if not find_in_set(minor, course.for_minor):
+                    continue
+                if course.for_minor_if_major_is is not None and not any(
+                        find_in_set(major, course.for_minor_if_major_is) for major in selected_majors):
+                    continue
+                study_year = course.minor_study_year if course.minor_study_year is not None else course.year
+                if study_year == current_year:
+                    return True
+            return False
 
-        cursor.execute(query, tuple(params))
-        
-        courses = [dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()]
+        courses = course_dicts(filter(offered, catalog.courses),
+                               ('course_code', 'course_name', 'coefficient', 'requires_french', 'for_major'))
         
         # Filter courses based on specialized GPA requirements for year 3+ students
         # who don't have enough selections but meet the credit percentage requirement
@@ -700,7 +587,7 @@ def get_current_courses(current_semester, current_year, student_id, max_year=Non
     finally:
         cursor.close()
 
-def get_extra_courses(current_semester, student_id):
+def get_extra_courses(current_semester, student_id, history=None):
     """Get extra courses available for 3rd year and above students"""
     cursor = current_app.mysql.connection.cursor()
     try:
@@ -720,37 +607,13 @@ def get_extra_courses(current_semester, student_id):
         # Get specialized GPAs and minimum required GPAs for each major
         eligible_majors = []
         
-        # First check for student-specific parameter overrides
-        cursor.execute("""
-            SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-            FROM student_parameters_overrides
-            WHERE student_id = %s
-        """, (student_id,))
-        
-        min_gpas_override = cursor.fetchone()
+        # System minimum GPAs with any student-specific overrides applied
+        parameters = resolve_parameters(current_app.mysql.connection, student_id)
         
-        # If no overrides, get system parameters
-        if not min_gpas_override:
-            cursor.execute("""
-                SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                FROM system_parameters
-                ORDER BY last_updated DESC
-                LIMIT 1
-            """)
-            min_gpas = cursor.fetchone()
-        else:
-            min_gpas = min_gpas_override
-            current_app.logger.info(f"Using parameter overrides for student {student_id} in extra courses: {min_gpas}")
-        
-        if min_gpas:
-            min_gpa_map = {
-                'ACCT': float(min_gpas[0]) if min_gpas[0] is not None else 0,
-                'BA': float(min_gpas[1]) if min_gpas[1] is not None else 0,
-                'FIN': float(min_gpas[2]) if min_gpas[2] is not None else 0,
-                'IT': float(min_gpas[3]) if min_gpas[3] is not None else 0,
-                'MRK': float(min_gpas[4]) if min_gpas[4] is not None else 0
-            }
-            
+        if parameters.configured:
+            min_gpa_map = {major: min_gpa if min_gpa is not None else 0
+                           for major, min_gpa in parameters.min_gpa_map.items()}
+
             # Get student's specialized GPAs
             cursor.execute("""
                 SELECT acct_gpa, ba_gpa, fin_gpa, it_gpa, mrk_gpa
@@ -790,44 +653,32 @@ def get_extra_courses(current_semester, student_id):
         current_courses = get_current_courses(current_semester, current_year, student_id)
         current_course_codes = {course['course_code'] for course in current_courses['courses']} if current_courses['courses'] else set()
         
-        # Build query to get all eligible courses
-        query = """
-            SELECT DISTINCT c.course_code, c.course_name, c.coefficient, 
-                   c.year, c.for_major, c.for_minor, c.description
-            FROM courses c
-            WHERE c.semester = %s
-            AND c.in_curriculum = 1
-            AND (c.as_extra = 1 OR c.as_extra IS NULL)
-            AND (
-                (c.year <= %s) -- Allow courses up to current academic year
-                OR (%s >= 4)   -- If student is in year 4 or above, show all courses
-            )
-            AND NOT EXISTS (
-                -- Exclude ALL courses from add_course regardless of status
-                SELECT 1 FROM add_course ac
-                WHERE ac.student_id = %s
-                AND ac.course_code = c.course_code
-            )
-        """
-        params = [current_semester, year_of_study, year_of_study, student_id]
-
-        # Add French requirement filter if needed
-        if non_french:
-            query += " AND (c.requires_french = 0 OR c.requires_french IS NULL)"
-
-        cursor.execute(query, tuple(params))
-        
-        # Fetch all potential courses
-        courses = [dict(zip([col[0] for col in cursor.description], row)) 
-                  for row in cursor.fetchall()]
+        # All in-curriculum courses of the semester that may be taken as extra,
+        # up to the student's year (every year from year 4 on)
+        catalog = get_curriculum_catalog(current_app.mysql.connection)
+        courses = course_dicts(
+            [course for course in catalog.courses
+             if course.semester == current_semester and course.in_curriculum == 1
+             and course.as_extra in (1, None)
+             and (course.year <= year_of_study or year_of_study >= 4)
+             # Exclude courses that require French for non-French students
+             and not (non_french and course.requires_french)],
+            ('course_code', 'course_name', 'coefficient', 'year', 'for_major', 'for_minor', 'description'))
+        
+        if history is None:
+            history = load_student_history(student_id)
         
         # Filter courses based on prerequisites, exclude current courses, and filter by eligible majors
-        eligible_courses = []
+        candidate_courses = []
         for course in courses:
             # Skip courses that are already in current_courses
             if course['course_code'] in current_course_codes:
                 continue
             
+            # Exclude ALL courses from add_course regardless of status
+            if course['course_code'] in history:
+                continue
+            
             # Check if course is for a major that meets specialized GPA requirements
             course_major = course.get('for_major')
             if course_major and course_major != '':
@@ -842,10 +693,10 @@ def get_extra_courses(current_semester, student_id):
                     current_app.logger.info(f"Filtering out extra course {course['course_code']} for major {course_major} due to insufficient specialized GPA")
                     continue
             
-            # Only add courses that meet prerequisites
-            if check_prerequisites(student_id, course['course_code']):
-                eligible_courses.append(course)
+            candidate_courses.append(course)
         
+        # Only keep courses that meet prerequisites
+        eligible_courses, _ = get_eligible_courses(student_id, candidate_courses, history)
         return eligible_courses
 
     except Exception as e:
@@ -854,7 +705,7 @@ def get_extra_courses(current_semester, student_id):
     finally:
         cursor.close()
 
-def get_elective_courses(current_semester, current_year, student_id):
+def get_elective_courses(current_semester, current_year, student_id, history=None):
     """Get elective courses grouped by elective_group_number with their requirements"""
     cursor = current_app.mysql.connection.cursor()
     try:
@@ -873,37 +724,13 @@ def get_elective_courses(current_semester, current_year, student_id):
         # Get specialized GPAs and minimum required GPAs for each major if student is year 3+
         eligible_majors = []
         if year_of_study >= 3:
-            # First check for student-specific parameter overrides
-            cursor.execute("""
-                SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                FROM student_parameters_overrides
-                WHERE student_id = %s
-            """, (student_id,))
-            
-            min_gpas_override = cursor.fetchone()
-            
-            # If no overrides, get system parameters
-            if not min_gpas_override:
-                cursor.execute("""
-                    SELECT min_gpa_acct, min_gpa_ba, min_gpa_fin, min_gpa_it, min_gpa_mrk
-                    FROM system_parameters
-                    ORDER BY last_updated DESC
-                    LIMIT 1
-                """)
-                min_gpas = cursor.fetchone()
-            else:
-                min_gpas = min_gpas_override
-                current_app.logger.info(f"Using parameter overrides for student {student_id} in elective courses: {min_gpas}")
+            # System minimum GPAs with any student-specific overrides applied
+            parameters = resolve_parameters(current_app.mysql.connection, student_id)
             
-            if min_gpas:
-                min_gpa_map = {
-                    'ACCT': float(min_gpas[0]) if min_gpas[0] is not None else 0,
-                    'BA': float(min_gpas[1]) if min_gpas[1] is not None else 0,
-                    'FIN': float(min_gpas[2]) if min_gpas[2] is not None else 0,
-                    'IT': float(min_gpas[3]) if min_gpas[3] is not None else 0,
-                    'MRK': float(min_gpas[4]) if min_gpas[4] is not None else 0
-                }
-                
+            if parameters.configured:
+                min_gpa_map = {major: min_gpa if min_gpa is not None else 0
+                               for major, min_gpa in parameters.min_gpa_map.items()}
+
                 # Get student's specialized GPAs
                 cursor.execute("""
                     SELECT acct_gpa, ba_gpa, fin_gpa, it_gpa, mrk_gpa
@@ -941,32 +768,32 @@ def get_elective_courses(current_semester, current_year, student_id):
             # For students in years 1-2, all majors are eligible
             eligible_majors = ['ACCT', 'BA', 'FIN', 'IT', 'MRK']
         
-        # Get elective courses for the current semester
-        query = """
-            SELECT c.course_code, c.course_name, c.coefficient,
-                   ceg.elective_group_number, c.for_major, egr.follows_major_pick,
-                   egr.related_to_course, egr.maximum_picks
-            FROM courses c
-            JOIN course_elective_groups ceg ON c.id = ceg.course_id
-            JOIN elective_group_requirements egr ON ceg.elective_group_number = egr.elective_group_number
-            WHERE c.semester = %s
-            AND c.year = %s
-            AND c.in_curriculum = 1
-        """
-        params = [current_semester, current_year]
+        # Get elective courses for the current semester, one row per elective group a course is in
+        catalog = get_curriculum_catalog(current_app.mysql.connection)
+        all_courses = []
+        for course in catalog.courses:
+            if course.semester != current_semester or course.year != current_year or course.in_curriculum != 1:
+                continue
+            # Skip courses that require French if needed
+            if is_non_french and course.requires_french:
+                continue
+            for group_number in catalog.elective_groups_by_course.get(course.id, ()):
+                group = catalog.elective_group_requirements.get(group_number)
+                if group is None:
+                    continue
+                all_courses.append({
+                    'course_code': course.course_code,
+                    'course_name': course.course_name,
+                    'coefficient': course.coefficient,
+                    'elective_group_number': group_number,
+                    'for_major': course.for_major,
+                    'follows_major_pick': group.follows_major_pick,
+                    'related_to_course': group.related_to_course,
+                    'maximum_picks': group.maximum_picks
+                })
         
-        # Add French requirement filter if needed
-        if is_non_french:
-            query += " AND (c.requires_french = 0 OR c.requires_french IS NULL)"
-            
         # Order by elective group and course code
-        query += " ORDER BY ceg.elective_group_number, c.course_code"
-        
-        cursor.execute(query, tuple(params))
-        
-        # Fetch all elective courses
-        all_courses = [dict(zip([col[0] for col in cursor.description], row)) 
-                      for row in cursor.fetchall()]
+        all_courses.sort(key=lambda course: (course['elective_group_number'], course['course_code']))
         
         # Filter courses based on follows_major_pick, student's majors, and specialized GPA requirements
         filtered_courses = []
@@ -996,16 +823,11 @@ def get_elective_courses(current_semester, current_year, student_id):
                 # No major restriction or doesn't follow major pick
                 filtered_courses.append(course)
         
-        # Get requirements for each elective group
-        cursor.execute("""
-            SELECT elective_group_number, required_picks, maximum_picks, related_to_course
-            FROM elective_group_requirements
-        """)
-        
         # Create a dictionary of requirements by group number
         requirements = {}
-        for row in cursor.fetchall():
-            group_num, req_picks, max_picks, related_ids = row
+        for group in catalog.elective_group_requirements.values():
+            group_num, req_picks, max_picks, related_ids = (
+                group.elective_group_number, group.required_picks, group.maximum_picks, group.related_to_course)
             # Parse related_ids (comma-separated list of course IDs) -> list[int]
             related_id_list = []
             if related_ids:
@@ -1014,14 +836,9 @@ def get_elective_courses(current_semester, current_year, student_id):
                 except ValueError:
                     current_app.logger.warning(f"Invalid related_to_course format for elective group {group_num}: {related_ids}")
             # Translate IDs to course codes offered this semester/year
-            related_course_codes = []
-            if related_id_list:
-                format_strings = ','.join(['%s'] * len(related_id_list))
-                cursor.execute(f"""
-                    SELECT course_code FROM courses
-                    WHERE id IN ({format_strings}) AND semester = %s AND year = %s
-                """, tuple(related_id_list + [current_semester, current_year]))
-                related_course_codes = [row[0] for row in cursor.fetchall()]
+            related_courses = [catalog.course_by_id.get(course_id) for course_id in sorted(set(related_id_list))]
+            related_course_codes = [course.course_code for course in related_courses
+                                    if course and course.semester == current_semester and course.year == current_year]
             requirements[group_num] = {
                 'required_picks': req_picks,
                 'maximum_picks': max_picks,
@@ -1052,23 +869,16 @@ def get_elective_courses(current_semester, current_year, student_id):
             grouped_courses[group_number]['courses'].append(course)
         
         # Check if student has already enrolled in any of these courses
+        if history is None:
+            history = load_student_history(student_id)
+        graph = get_prerequisite_graph(current_app.mysql.connection)
         for group_number, group_data in grouped_courses.items():
             for course in group_data['courses']:
-                cursor.execute("""
-                    SELECT status
-                    FROM add_course
-                    WHERE student_id = %s
-                    AND course_code = %s
-                    AND status IN ('enrolled', 'passed')
-                    ORDER BY id DESC
-                    LIMIT 1
-                """, (student_id, course['course_code']))
-                
-                result = cursor.fetchone()
-                course['enrolled'] = result is not None and result[0] in ('enrolled', 'passed')
+                course['enrolled'] = any(row['status'] in ('enrolled', 'passed')
+                                         for row in history.attempts.get(course['course_code'], []))
                 
                 # Check prerequisites
-                course['eligible'] = check_prerequisites(student_id, course['course_code'])
+                course['eligible'] = not graph.missing_prerequisites(course['course_code'], history.passed)
         
         return grouped_courses
         
@@ -1078,55 +888,43 @@ def get_elective_courses(current_semester, current_year, student_id):
     finally:
         cursor.close()
 
-def get_eligible_courses(student_id, courses):
-    """Filter courses to only those where prerequisites are met"""
+def get_eligible_courses(student_id, courses, history=None):
+    """Filter courses to only those where prerequisites are met.
+
+    Not-met courses get a missing_prerequisites list of the course codes the
+    student still has to pass.
+    """
+    try:
+        if history is None:
+            history = load_student_history(student_id)
+        graph = get_prerequisite_graph(current_app.mysql.connection)
+        _, missing = graph.classify([course['course_code'] for course in courses], history.passed)
+    except Exception as e:
+        current_app.logger.error(f"Error in get_eligible_courses: {str(e)}")
+        return [], list(courses)
+    
     eligible = []
     not_met = []
-    
     for course in courses:
-        if check_prerequisites(student_id, course['course_code']):
-            eligible.append(course)
-        else:
+        if course['course_code'] in missing:
+            course['missing_prerequisites'] = missing[course['course_code']]
             not_met.append(course)
+        else:
+            eligible.append(course)
     
     return eligible, not_met
 
-def check_prerequisites(student_id, course_code):
-    """Check if student has passed all prerequisites for a course"""
-    cursor = current_app.mysql.connection.cursor()
+def check_prerequisites(student_id, course_code, history=None):
+    """Check if student has passed all prerequisites for a course (latest attempt passed)"""
     try:
-        # Get all prerequisites for the course
-        cursor.execute("""
-            SELECT cp.prerequisite_id 
-            FROM course_prerequisites cp
-            JOIN courses c ON cp.course_id = c.id
-            WHERE c.course_code = %s
-        """, (course_code,))
-        prerequisites = [row[0] for row in cursor.fetchall()]
-        
-        if not prerequisites:
+        graph = get_prerequisite_graph(current_app.mysql.connection)
+        if course_code not in graph.prerequisites:
             return True  # No prerequisites
         
-        # Check if student has passed all prerequisites
-        cursor.execute("""
-            SELECT COUNT(DISTINCT c.id) 
-            FROM courses c
-            JOIN add_course ac ON c.course_code = ac.course_code
-            WHERE ac.student_id = %s 
-            AND c.id IN %s
-            AND ac.status = 'passed'
-            AND ac.id = (
-                SELECT MAX(id) FROM add_course 
-                WHERE student_id = ac.student_id 
-                AND course_code = ac.course_code
-            )
-        """, (student_id, tuple(prerequisites)))
-        
-        passed_count = cursor.fetchone()[0]
-        return passed_count == len(prerequisites)
+        if history is None:
+            history = load_student_history(student_id)
+        return not graph.missing_prerequisites(course_code, history.passed)
         
     except Exception as e:
         current_app.logger.error(f"Error in check_prerequisites: {str(e)}")
-        return False
-    finally:
-        cursor.close()
\ No newline at end of file
+        return False
\ No newline at end of file
@@ -0,0 +1,142 @@
+import threading
+from collections import defaultdict, namedtuple
+from flask import current_app
+from cache_versions import get_cache_version, bump_cache_version, CATALOG
+
+# Columns loaded from the courses table, in table order
+COURSE_COLUMNS = (
+    "id", "course_code", "course_name", "coefficient", "semester", "year",
+    "for_major", "for_minor", "for_minor_if_major_is", "minor_study_year",
+    "description", "has_lecture", "has_tutorial", "in_curriculum",
+    "requires_french", "eligible_for_makeup", "as_extra",
+)
+
+Course = namedtuple('Course', COURSE_COLUMNS)
+Major = namedtuple('Major', ('id', 'major', 'full_name'))
+Minor = namedtuple('Minor', ('id', 'minor', 'full_name'))
+MajorRequirement = namedtuple('MajorRequirement', ('course_code', 'course_name', 'weight', 'minimum_grade_point'))
+ElectiveGroupRequirement = namedtuple('ElectiveGroupRequirement', (
+    'elective_group_number', 'required_picks', 'follows_major_pick', 'related_to_course', 'maximum_picks'))
+
+
+class CurriculumCatalog:
+    """Read-only, in-memory copy of the curriculum reference tables.
+
+    Holds courses, majors, minors, major_course_requirements,
+    course_elective_groups and elective_group_requirements as namedtuples,
+    shared by every request in the process and replaced only when the
+    'catalog' version stamp in cache_versions changes. Rows keep their table
+    (id) order: courses, majors and minors are tuples, requirements_by_major
+    maps a major id to its requirements and elective_groups_by_course a
+    course id to its elective group numbers. The lookup dicts are shared:
+    callers must not mutate them.
+    """
+
+    def __init__(self, version, courses, majors, minors, major_requirements,
+                 course_elective_groups, elective_group_requirements):
+        self.version = version
+        self.courses = tuple(Course(*row) for row in courses)
+        self.course_by_code = {course.course_code: course for course in self.courses}
+        self.course_by_id = {course.id: course for course in self.courses}
+        self.majors = tuple(Major(*row) for row in majors)
+        self.minors = tuple(Minor(*row) for row in minors)
+
+        requirements_by_major = defaultdict(list)
+        for major_id, *requirement in major_requirements:
+            requirements_by_major[major_id].append(MajorRequirement(*requirement))
+        self.requirements_by_major = {major_id: tuple(rows) for major_id, rows in requirements_by_major.items()}
+
+        elective_groups_by_course = defaultdict(list)
+        for course_id, elective_group_number in course_elective_groups:
+            elective_groups_by_course[course_id].append(elective_group_number)
+        self.elective_groups_by_course = {course_id: tuple(groups) for course_id, groups in elective_groups_by_course.items()}
+        self.elective_group_requirements = {
+            row[0]: ElectiveGroupRequirement(*row) for row in elective_group_requirements}
+
+    def courses_for(self, course_codes):
+        """The catalog rows of the given course codes that exist, in the given order"""
+        return [self.course_by_code[code] for code in course_codes if code in self.course_by_code]
+
+
+def course_dicts(courses, columns):
+    """Fresh dicts of the given columns of catalog course rows, for callers that annotate them"""
+    return [{column: getattr(course, column) for column in columns} for course in courses]
+
+
+def find_in_set(value, csv):
+    """MySQL FIND_IN_SET(value, csv) > 0 for the comma-separated for_* columns.
+
+    Case-insensitive like the columns' utf8mb4_0900_ai_ci collation, and
+    blanks around the items are ignored.
+    """
+    if value is None or csv is None:
+        return False
+    value = value.strip().casefold()
+    return any(item.strip().casefold() == value for item in csv.split(','))
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_curriculum_catalog(db_connection):
+    """Return the process-wide curriculum catalog, reloading it if the version stamp moved.
+
+    Costs one primary-key lookup on cache_versions when the catalog is current.
+    If the version cannot be read a fresh, uncached catalog is loaded.
+    """
+    global _catalog
+    cursor = db_connection.cursor()
+    try:
+        version = get_cache_version(cursor, CATALOG)
+        catalog = _catalog
+        if version is not None and catalog is not None and catalog.version == version:
+            return catalog
+
+        with _catalog_lock:
+            catalog = _catalog
+            if version is not None and catalog is not None and catalog.version == version:
+                return catalog
+            catalog = _load_catalog(cursor, version)
+            if version is not None:
+                _catalog = catalog
+            return catalog
+    finally:
+        cursor.close()
+
+
+def invalidate_curriculum_catalog(cursor):
+    """Bump the catalog version so every worker reloads its catalog on next use"""
+    bump_cache_version(cursor, CATALOG)
+
+
+def _load_catalog(cursor, version):
+    columns = ", ".join(f"`{column}`" for column in COURSE_COLUMNS)
+    cursor.execute(f"SELECT {columns} FROM courses ORDER BY id")
+    courses = cursor.fetchall()
+    cursor.execute("SELECT id, major, full_name FROM majors ORDER BY id")
+    majors = cursor.fetchall()
+    cursor.execute("SELECT id, minor, full_name FROM minors ORDER BY id")
+    minors = cursor.fetchall()
+    cursor.execute("""
+        SELECT major_id, course_code, course_name, weight, minimum_grade_point
+        FROM major_course_requirements
+        ORDER BY major_id, id
+    """)
+    major_requirements = cursor.fetchall()
+    cursor.execute("SELECT course_id, elective_group_number FROM course_elective_groups ORDER BY id")
+    course_elective_groups = cursor.fetchall()
+    cursor.execute("""
+        SELECT elective_group_number, required_picks, follows_major_pick, related_to_course, maximum_picks
+        FROM elective_group_requirements
+        ORDER BY id
+    """)
+    elective_group_requirements = cursor.fetchall()
+
+    current_app.logger.info(
+        f"Loaded curriculum catalog version {version}: {len(courses)} courses, {len(majors)} majors, "
+        f"{len(minors)} minors, {len(major_requirements)} major requirements, "
+        f"{len(elective_group_requirements)} elective groups")
+
+    return CurriculumCatalog(version, courses, majors, minors, major_requirements,
+                             course_elective_groups, elective_group_requirements)
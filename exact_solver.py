@@ -0,0 +1,734 @@
+"""
+In-process exact solver for the student schedule model.
+
+Searches the same model ScheduleOptimizer.build_model hands to CBC, using the
+sets and weights it records in `model_sets`:
+
+    maximise   sum alpha[i][p] * y[i,k,p] + sum beta[l] * x[i,k,l] - lambda * gaps
+    subject to C1-C7b as built in build_model
+
+Every course is expanded into its feasible session-to-slot patterns (C1, no
+overlap inside the course, C3 chronology, FixSlot), each scored with the best
+professor assignment the pattern allows (C4a, C4b, C5, C6, FixProf). Courses
+only interact through slot occupancy (C2) and the gap penalty, so a
+branch-and-bound over courses with bitmask occupancy finds the optimum without
+an LP file or a solver process.
+
+The gap penalty mirrors the MILP exactly: it only models the slots that carry
+x variables (model_sets['day_slots']), so a day's penalty is the number of
+those slots between its first and last occupied slot that are not occupied.
+Occupancy is a bitmask with one block of bits per day of the time grid.
+
+FeasibilitySearch answers the yes/no question of registration with the
+timing constraints alone (C1, C2, C3, FixSlot, FixProf) and stops at the
+first conflict-free schedule.
+"""
+import time
+from functools import lru_cache
+
+
+# Widest day (slots per day) whose between masks are tabulated: 2**16
+# entries. Wider grids compute them per day mask instead of building a table
+# that grows exponentially with the grid.
+MAX_TABLE_WIDTH = 16
+
+
+def _between(bits):
+    """The bits strictly between the first and last set bit of a day mask"""
+    if bits & (bits - 1):
+        low = bits & -bits
+        high = 1 << (bits.bit_length() - 1)
+        return (high - 1) & ~((low << 1) - 1)
+    return 0
+
+
+@lru_cache(maxsize=None)
+def _between_table(width):
+    """_between of every day mask of `width` bits, for width <= MAX_TABLE_WIDTH"""
+    return [_between(bits) for bits in range(1 << width)]
+
+
+def slot_bits(sets):
+    """Bit of each grid slot in an occupancy mask: a block of slots_per_day bits per day"""
+    grid = sets['grid']
+    return {l: grid.day_of[l] * grid.slots_per_day + grid.position[l] for l in grid.slots}
+
+
+def chronology_pairs(sets, course_code, i):
+    """Sessions (k, k+1) tied by C3, with the same ranges build_model uses"""
+    lecture_sessions = sets['lecture_sessions'][i]
+    L = sets['L'][i]
+    if lecture_sessions <= 1:
+        return set()
+    last = lecture_sessions - 1 if course_code in sets['I_1'] else lecture_sessions
+    return {k for k in range(1, last) if L.get(k) and L.get(k + 1)}
+
+
+class ExactSearchLimit(Exception):
+    """Raised when a search would exceed its pattern, node or time budget"""
+
+
+class CoursePattern:
+    """One feasible way to schedule a course: its slots, professors and objective value"""
+
+    __slots__ = ('course_index', 'slots', 'professors', 'mask', 'value')
+
+    def __init__(self, course_index, slots, professors, mask, value):
+        self.course_index = course_index
+        self.slots = slots              # ((k, l), ...)
+        self.professors = professors    # ((k, p), ...)
+        self.mask = mask
+        self.value = value
+
+
+class ExactSolution:
+    """A complete schedule found by the exact search"""
+
+    def __init__(self, patterns, objective, used_slots, gaps, spans):
+        self.patterns = patterns
+        self.objective = objective
+        self.used_slots = used_slots    # slots whose used_slot variable is 1
+        self.gaps = gaps                # (day, start_idx, end_idx) of active gap variables
+        self.spans = spans              # day -> (first, last, holes) of the span variables
+
+    @property
+    def x(self):
+        return [(pattern.course_index, k, l) for pattern in self.patterns for k, l in pattern.slots]
+
+    @property
+    def y(self):
+        return [(pattern.course_index, k, p) for pattern in self.patterns for k, p in pattern.professors]
+
+
+class ExactScheduleSolver:
+    """Branch-and-bound over per-course patterns with bitmask slot occupancy.
+
+    pattern_limit caps the number of slot assignments expanded per course,
+    node_limit the number of search nodes and deadline (a time.perf_counter()
+    value) the wall time; exceeding any of them raises ExactSearchLimit so the
+    caller can fall back to CBC.
+    """
+
+    def __init__(self, model_sets, fix_slot, fix_prof, pattern_limit=None, node_limit=None,
+                 deadline=None, tolerance=0.001):
+        self.sets = model_sets
+        self.fix_slot = set(fix_slot)
+        self.fix_prof = set(fix_prof)
+        self.pattern_limit = pattern_limit
+        self.node_limit = node_limit
+        self.deadline = deadline
+        self.tolerance = tolerance
+        self.lambda_weight = model_sets['lambda_weight']
+        self.nodes = 0
+
+        grid = model_sets['grid']
+        self.bit = slot_bits(model_sets)
+        self.order = grid.order
+        self.days = len(grid.days)
+        self.width = grid.slots_per_day
+        self.day_bits = (1 << self.width) - 1
+        self.between = _between_table(self.width) if self.width <= MAX_TABLE_WIDTH else None
+
+        # Slots that carry at least one x variable; only these can be gaps
+        self.x_mask = 0
+        for slots in model_sets['day_slots']:
+            for l in slots:
+                self.x_mask |= 1 << self.bit[l]
+
+        self.courses = None
+        self.feasible = None
+        self.optimum = None
+
+    # ------------------------------------------------------------------
+    # Pattern generation
+    # ------------------------------------------------------------------
+    def estimate_patterns(self):
+        """Upper bound on the slot assignments that would be expanded, summed over courses"""
+        total = 0
+        for course_code, i in self.sets['I'].items():
+            count = 1
+            for k, slots in self._session_candidates(i):
+                count *= max(len(slots), 1)
+            total += count
+        return total
+
+    def _session_candidates(self, i):
+        candidates = []
+        for k in range(1, self.sets['K'][i] + 1):
+            slots = self.sets['L'][i].get(k, [])
+            fixed = [l for l in slots if (i, k, l) in self.fix_slot]
+            candidates.append((k, fixed if fixed else list(slots)))
+        return candidates
+
+    def _chronology_pairs(self, course_code, i):
+        return chronology_pairs(self.sets, course_code, i)
+
+    def _build_course(self, course_code, i):
+        """All feasible patterns of one course, grouped by slot mask"""
+        candidates = self._session_candidates(i)
+        for k, slots in candidates:
+            if len({l for l in slots if (i, k, l) in self.fix_slot}) > 1:
+                return []  # two fixed slots for one session violate C1
+
+        chronology = self._chronology_pairs(course_code, i)
+        professors = _CourseProfessors(self, course_code, i)
+        beta = self.sets['beta']
+
+        by_mask = {}
+        expanded = 0
+        assignment = []
+
+        def expand(position, mask, previous_slot):
+            nonlocal expanded
+            if position == len(candidates):
+                expanded += 1
+                if self.pattern_limit is not None and expanded > self.pattern_limit:
+                    raise ExactSearchLimit(f"course {course_code} has more than {self.pattern_limit} patterns")
+                chosen = professors.best(assignment)
+                if chosen is None:
+                    return
+                professor_value, professor_choice = chosen
+                value = professor_value + sum(beta[l] for _, l in assignment if l is not None)
+                pattern = CoursePattern(i, tuple((k, l) for k, l in assignment if l is not None),
+                                        professor_choice, mask, value)
+                by_mask.setdefault(mask, []).append(pattern)
+                return
+
+            k, slots = candidates[position]
+            if not slots:
+                assignment.append((k, None))
+                expand(position + 1, mask, None)
+                assignment.pop()
+                return
+            for l in slots:
+                bit = 1 << self.bit[l]
+                if mask & bit:
+                    continue  # C2 within the course
+                if (k - 1) in chronology and previous_slot is not None and not self.order[previous_slot] < self.order[l]:
+                    continue  # C3
+                assignment.append((k, l))
+                expand(position + 1, mask | bit, l)
+                assignment.pop()
+
+        expand(0, 0, None)
+
+        groups = []
+        for mask, patterns in by_mask.items():
+            patterns.sort(key=lambda pattern: -pattern.value)
+            groups.append((mask, patterns[0].value, patterns))
+        # Best value first; among equal values, patterns that leave fewer gaps of their own
+        groups.sort(key=lambda group: (-group[1], self._holes(group[0])))
+        return groups
+
+    def prepare(self):
+        """Expand every course; returns False if some course has no feasible pattern"""
+        courses = []
+        for course_code, i in self.sets['I'].items():
+            groups = self._build_course(course_code, i)
+            if not groups:
+                self.courses = []
+                self.feasible = False
+                return False
+            courses.append(groups)
+
+        # Courses with a single slot layout go first since they only fix
+        # occupancy; then the ones whose choice moves the objective most, so
+        # the value bounds bite early, ties going to fewer patterns
+        courses.sort(key=lambda groups: (len(groups) > 1, groups[-1][1] - groups[0][1], len(groups)))
+        self.courses = courses
+
+        self.suffix_best = [0] * (len(courses) + 1)
+        self.suffix_open = [0] * (len(courses) + 1)
+        for depth in range(len(courses) - 1, -1, -1):
+            open_mask = 0
+            for mask, _, _ in courses[depth]:
+                open_mask |= mask
+            self.suffix_best[depth] = self.suffix_best[depth + 1] + courses[depth][0][1]
+            self.suffix_open[depth] = self.suffix_open[depth + 1] | open_mask
+        self.feasible = True
+        return True
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def _holes(self, occupied, open_mask=0):
+        """Unoccupied x-bearing slots inside each day's occupied span that open_mask cannot fill"""
+        holes = 0
+        blocked = self.x_mask & ~occupied & ~open_mask
+        for day in range(self.days):
+            shift = day * self.width
+            day_mask = (occupied >> shift) & self.day_bits
+            between = self.between[day_mask] if self.between is not None else _between(day_mask)
+            if between:
+                holes += (between & (blocked >> shift)).bit_count()
+        return holes
+
+    def _compatible_bound(self, depth, occupied):
+        """Sum of each remaining course's best value among patterns that still fit, or None.
+
+        None means some remaining course has no pattern left that avoids the
+        occupied slots, so the branch is infeasible.
+        """
+        total = 0
+        for groups in self.courses[depth:]:
+            for mask, group_value, _ in groups:
+                if not mask & occupied:
+                    total += group_value
+                    break
+            else:
+                return None
+        return total
+
+    def _tick(self):
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise ExactSearchLimit(f"search exceeded {self.node_limit} nodes")
+        if self.deadline is not None and self.nodes % 1024 == 0 and time.perf_counter() > self.deadline:
+            raise ExactSearchLimit("search exceeded its time limit")
+
+    def solve(self):
+        """Return the optimal ExactSolution, or None if the model is infeasible"""
+        if self.feasible is None:
+            self.prepare()
+        if not self.feasible:
+            return None
+
+        best = [None, None]  # objective, chosen groups
+        chosen = []
+
+        def search(depth, occupied, value):
+            self._tick()
+            if depth == len(self.courses):
+                objective = value - self.lambda_weight * self._holes(occupied)
+                if best[0] is None or objective > best[0] + 1e-9:
+                    best[0] = objective
+                    best[1] = list(chosen)
+                return
+            remaining = self._compatible_bound(depth, occupied)
+            if remaining is None or (best[0] is not None and value + remaining <= best[0] + 1e-9):
+                return
+            for group in self.courses[depth]:
+                mask, group_value, _ = group
+                bound = value + group_value + self.suffix_best[depth + 1]
+                if best[0] is not None and bound <= best[0] + 1e-9:
+                    break  # groups are sorted by value, none of the rest can do better
+                if mask & occupied:
+                    continue
+                next_occupied = occupied | mask
+                bound -= self.lambda_weight * self._holes(next_occupied, self.suffix_open[depth + 1])
+                if best[0] is not None and bound <= best[0] + 1e-9:
+                    continue
+                chosen.append(group)
+                search(depth + 1, next_occupied, value + group_value)
+                chosen.pop()
+
+        search(0, 0, 0)
+        if best[0] is None:
+            return None
+        self.optimum = best[0]
+        return self._solution([group[2][0] for group in best[1]], best[0])
+
+    def enumerate_optimal(self):
+        """Yield every optimal solution (distinct x assignments), best-first per course"""
+        if self.optimum is None:
+            first = self.solve()
+            if first is None:
+                return
+        threshold = self.optimum - self.tolerance
+        chosen = []
+
+        def search(depth, occupied, value):
+            self._tick()
+            if depth == len(self.courses):
+                objective = value - self.lambda_weight * self._holes(occupied)
+                if objective >= threshold:
+                    yield from self._expand_ties(list(chosen), objective - threshold, occupied)
+                return
+            remaining = self._compatible_bound(depth, occupied)
+            if remaining is None or value + remaining < threshold:
+                return
+            for group in self.courses[depth]:
+                mask, group_value, _ = group
+                bound = value + group_value + self.suffix_best[depth + 1]
+                if bound < threshold:
+                    break
+                if mask & occupied:
+                    continue
+                next_occupied = occupied | mask
+                bound -= self.lambda_weight * self._holes(next_occupied, self.suffix_open[depth + 1])
+                if bound < threshold:
+                    continue
+                chosen.append(group)
+                yield from search(depth + 1, next_occupied, value + group_value)
+                chosen.pop()
+
+        yield from search(0, 0, 0)
+
+    def _expand_ties(self, groups, slack, occupied):
+        """Every combination of same-mask patterns whose combined shortfall fits in slack"""
+        penalty = self.lambda_weight * self._holes(occupied)
+        picked = []
+
+        def expand(position, remaining):
+            if position == len(groups):
+                value = sum(pattern.value for pattern in picked)
+                yield self._solution(list(picked), value - penalty)
+                return
+            _, group_value, patterns = groups[position]
+            for pattern in patterns:
+                shortfall = group_value - pattern.value
+                if shortfall > remaining + 1e-9:
+                    break
+                picked.append(pattern)
+                yield from expand(position + 1, remaining - shortfall)
+                picked.pop()
+
+        yield from expand(0, slack)
+
+    def _solution(self, patterns, objective):
+        occupied = 0
+        for pattern in patterns:
+            occupied |= pattern.mask
+
+        # Gap and span variables count positions within each day's day_slots
+        used_slots = []
+        gaps = []
+        spans = {}
+        for day, slots in enumerate(self.sets['day_slots']):
+            positions = [pos for pos, l in enumerate(slots) if occupied >> self.bit[l] & 1]
+            if not positions:
+                # An empty day's span is reversed, so its holes row holds at 0
+                spans[day] = (max(len(slots) - 1, 0), 0, 0)
+                continue
+            used_slots.extend(slots[pos] for pos in positions)
+            for start, end in zip(positions, positions[1:]):
+                if end - start >= 2:
+                    gaps.append((day, start, end))
+            spans[day] = (positions[0], positions[-1], positions[-1] - positions[0] + 1 - len(positions))
+        return ExactSolution(patterns, objective, used_slots, gaps, spans)
+
+
+class FeasibilitySearch:
+    """First-solution search over the timing constraints of the model only.
+
+    Models C1 (one slot per session), C2 (no overlap), C3 (chronology),
+    FixSlot, and FixProf as the restriction of a session to the slots its
+    fixed professor teaches (what C6 makes of y = 1). Professor pairing and
+    the objective are left out, so every course reduces to the distinct slot
+    masks it can occupy and the search stops at the first choice of pairwise
+    disjoint masks. model_sets needs no weights: ScheduleOptimizer._build_sets
+    is enough.
+    """
+
+    def __init__(self, model_sets, fix_slot, fix_prof, pattern_limit=None, node_limit=None):
+        self.sets = model_sets
+        self.fix_slot = set(fix_slot)
+        self.fix_prof = set(fix_prof)
+        self.pattern_limit = pattern_limit
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.bit = slot_bits(model_sets)
+        self.order = model_sets['grid'].order
+        self.masks = None       # course code -> feasible slot masks
+        self.solution = None    # course code -> chosen mask, from the last successful solve
+
+    def session_candidates(self, i):
+        """(k, slots) for every session of course i that C1 constrains, after the fixings.
+
+        A session left with no slot makes the course infeasible; sessions
+        without any slot option (no C1 row) and no fixed professor are skipped.
+        """
+        L = self.sets['L'][i]
+        L_p = self.sets['L_p'][i]
+        prof = self.sets['Prof'][i]
+        candidates = []
+        for k in range(1, self.sets['K'][i] + 1):
+            slots = list(L.get(k, []))
+            fixed_professors = [p for fi, fk, p in self.fix_prof if fi == i and fk == k and p in prof]
+            if not slots and not (fixed_professors and k in L):
+                continue
+            fixed = {l for l in slots if (i, k, l) in self.fix_slot}
+            if fixed:
+                slots = [l for l in slots if l in fixed]
+            for p in fixed_professors:
+                teaching = set(L_p[k].get(p, ()))
+                slots = [l for l in slots if l in teaching]
+            if len(fixed) > 1:
+                slots = []  # two fixed slots for one session violate C1
+            candidates.append((k, slots))
+        return candidates
+
+    def _course_masks(self, course_code, i):
+        candidates = self.session_candidates(i)
+        if any(not slots for _, slots in candidates):
+            return []
+        chronology = chronology_pairs(self.sets, course_code, i)
+
+        masks = set()
+        expanded = 0
+
+        def expand(position, mask, previous):
+            nonlocal expanded
+            if position == len(candidates):
+                expanded += 1
+                if self.pattern_limit is not None and expanded > self.pattern_limit:
+                    raise ExactSearchLimit(f"course {course_code} has more than {self.pattern_limit} patterns")
+                masks.add(mask)
+                return
+            k, slots = candidates[position]
+            for l in slots:
+                bit = 1 << self.bit[l]
+                if mask & bit:
+                    continue  # C2 within the course
+                if (k - 1) in chronology and previous is not None and previous[0] == k - 1 and \
+                        not self.order[previous[1]] < self.order[l]:
+                    continue  # C3
+                expand(position + 1, mask | bit, (k, l))
+
+        expand(0, 0, None)
+        return sorted(masks)
+
+    def prepare(self):
+        self.masks = {course_code: self._course_masks(course_code, i) for course_code, i in self.sets['I'].items()}
+
+    def solve(self, courses=None):
+        """True as soon as one conflict-free choice of masks is found, False if none exists.
+
+        courses limits the search to a subset of the course codes.
+        """
+        if self.masks is None:
+            self.prepare()
+        courses = list(self.masks) if courses is None else list(courses)
+        if any(not self.masks[course_code] for course_code in courses):
+            return False
+
+        # Fewest layouts first; each node checks every remaining course still fits
+        order = sorted(courses, key=lambda course_code: len(self.masks[course_code]))
+        chosen = {}
+
+        def search(depth, occupied):
+            self.nodes += 1
+            if self.node_limit is not None and self.nodes > self.node_limit:
+                raise ExactSearchLimit(f"search exceeded {self.node_limit} nodes")
+            if depth == len(order):
+                return True
+            for course_code in order[depth + 1:]:
+                if all(mask & occupied for mask in self.masks[course_code]):
+                    return False
+            course_code = order[depth]
+            for mask in self.masks[course_code]:
+                if mask & occupied:
+                    continue
+                chosen[course_code] = mask
+                if search(depth + 1, occupied | mask):
+                    return True
+            chosen.pop(course_code, None)
+            return False
+
+        if search(0, 0):
+            self.solution = dict(chosen)
+            return True
+        return False
+
+    def conflicts(self):
+        """A minimal set of course codes with no conflict-free schedule, by deletion filtering.
+
+        Call after solve() returned False. Each course is dropped in turn and
+        stays dropped if the rest is still infeasible, so every course left is
+        needed for the clash. The searches share one node_limit budget; if it
+        runs out, the infeasible (but maybe not minimal) set found so far is
+        returned.
+        """
+        if self.masks is None:
+            self.prepare()
+        alone = [course_code for course_code, masks in self.masks.items() if not masks]
+        if alone:
+            return alone[:1]
+
+        conflict = list(self.masks)
+        self.nodes = 0
+        try:
+            for course_code in list(conflict):
+                rest = [other for other in conflict if other != course_code]
+                if not self.solve(rest):
+                    conflict = rest
+        except ExactSearchLimit:
+            pass
+        return conflict
+
+    def clashing_slots(self, conflict):
+        """course code -> sorted slots it could use that another conflict course could also use.
+
+        A course that cannot be laid out on its own gets all its candidate slots.
+        """
+        reachable = {}
+        for course_code in conflict:
+            i = self.sets['I'][course_code]
+            reachable[course_code] = {l for _, slots in self.session_candidates(i) for l in slots}
+        if len(conflict) == 1:
+            return {course_code: sorted(slots) for course_code, slots in reachable.items()}
+
+        clashes = {}
+        for course_code, slots in reachable.items():
+            shared = set()
+            for other, other_slots in reachable.items():
+                if other != course_code:
+                    shared |= slots & other_slots
+            clashes[course_code] = sorted(shared)
+        return clashes
+
+
+class _CourseProfessors:
+    """Best professor assignment (y) for a course given the slots of its sessions.
+
+    Lectures take one professor for every lecture session (C4a, C4b). A
+    tutorial's professors depend only on its own slot, because C5 asks for
+    exactly one professor of TutProf[i][q] for every lecture professor q.
+    """
+
+    def __init__(self, solver, course_code, i):
+        sets = solver.sets
+        self.i = i
+        self.K = sets['K'][i]
+        self.lecture_sessions = sets['lecture_sessions'][i]
+        self.tutorial_sessions = sets['tutorial_sessions'][i]
+        self.has_tutorials = course_code in sets['I_1']
+        self.alpha = sets['alpha'][i]
+        prof = sets['Prof'][i]
+        self.lecture_candidates = sorted(sets['LectProf'][i] if self.has_tutorials else prof)
+
+        # Professors that teach session k in slot l (C6)
+        self.slot_professors = {}
+        for k, by_prof in sets['L_p'][i].items():
+            for p, slots in by_prof.items():
+                for l in slots:
+                    self.slot_professors.setdefault((k, l), set()).add(p)
+
+        self.fixed = {}
+        for fi, k, p in solver.fix_prof:
+            if fi == i and 1 <= k <= self.K and p in prof:
+                self.fixed.setdefault(k, set()).add(p)
+
+        # C5 rows: one exactly-one set per lecture professor with tutorial partners
+        self.tutorial_sets = []
+        if self.has_tutorials and self.lecture_sessions >= 1 and self.K >= 1:
+            for q in sorted(sets['LectProf'][i]):
+                partners = frozenset(p for p in sets['TutProf'][i].get(q, ()) if p in prof)
+                if partners and partners not in self.tutorial_sets:
+                    self.tutorial_sets.append(partners)
+
+        self.lecture_cache = {}
+        self.session_cache = {}
+
+    def allowed(self, k, l):
+        if l is None:
+            return set()
+        return self.slot_professors.get((k, l), set())
+
+    def best(self, assignment):
+        """(value, ((k, p), ...)) for the slot assignment, or None if no y is feasible"""
+        slot_of = dict(assignment)
+        lecture_count = min(self.lecture_sessions, self.K)
+
+        lecture_key = tuple(slot_of.get(k) for k in range(1, lecture_count + 1))
+        if lecture_key not in self.lecture_cache:
+            self.lecture_cache[lecture_key] = self._best_lecture(lecture_key)
+        lecture = self.lecture_cache[lecture_key]
+        if lecture is None:
+            return None
+        value, choice = lecture[0], list(lecture[1])
+
+        for k in range(lecture_count + 1, self.K + 1):
+            key = (k, slot_of.get(k))
+            if key not in self.session_cache:
+                self.session_cache[key] = self._best_session(k, slot_of.get(k))
+            session = self.session_cache[key]
+            if session is None:
+                return None
+            value += session[0]
+            choice.extend(session[1])
+        return value, tuple(choice)
+
+    def _best_lecture(self, lecture_slots):
+        lecture_ks = range(1, len(lecture_slots) + 1)
+        allowed = {k: self.allowed(k, lecture_slots[k - 1]) for k in lecture_ks}
+        for k in lecture_ks:
+            if not self.fixed.get(k, set()) <= allowed[k]:
+                return None
+        if not lecture_ks or not self.lecture_candidates:
+            return 0, ()
+
+        fixed = set()
+        for k in lecture_ks:
+            fixed |= self.fixed.get(k, set())
+        if len(fixed) > 1:
+            return None
+
+        best = None
+        for p in self.lecture_candidates:
+            if fixed and p not in fixed:
+                continue
+            if all(p in allowed[k] for k in lecture_ks):
+                value = self.alpha[p] * len(lecture_ks)
+                if best is None or value > best[0]:
+                    best = (value, tuple((k, p) for k in lecture_ks))
+        return best
+
+    def _best_session(self, k, l):
+        allowed = self.allowed(k, l)
+        fixed = self.fixed.get(k, set())
+        if not fixed <= allowed:
+            return None
+
+        if not self.has_tutorials:
+            # I_2: every session takes exactly one professor (C4a)
+            if not self.alpha:
+                return 0, ()
+            candidates = sorted(fixed if fixed else allowed)
+            if len(fixed) > 1 or not candidates:
+                return None
+            p = max(candidates, key=lambda p: self.alpha[p])
+            return self.alpha[p], ((k, p),)
+
+        in_c5 = k <= self.lecture_sessions + self.tutorial_sessions
+        sets = self.tutorial_sets if in_c5 else []
+        constrained = set().union(*sets) if sets else set()
+
+        value = 0
+        choice = []
+        for p in sorted(allowed - constrained):
+            if p in fixed or self.alpha[p] > 0:
+                value += self.alpha[p]
+                choice.append((k, p))
+
+        best = self._best_exact_one(sorted(constrained & allowed), sets, fixed)
+        if best is None:
+            return None
+        value += best[0]
+        choice.extend((k, p) for p in best[1])
+        return value, tuple(choice)
+
+    def _best_exact_one(self, candidates, sets, fixed):
+        """Max-alpha subset of candidates meeting every set exactly once (C5) and keeping fixed"""
+        best = [None, None]
+        picked = []
+
+        def search(position, counts, value):
+            if position == len(candidates):
+                if all(count == 1 for count in counts) and (best[0] is None or value > best[0]):
+                    best[0], best[1] = value, list(picked)
+                return
+            p = candidates[position]
+            member = [p in s for s in sets]
+            new_counts = [count + hit for count, hit in zip(counts, member)]
+            if all(count <= 1 for count in new_counts):
+                picked.append(p)
+                search(position + 1, new_counts, value + self.alpha[p])
+                picked.pop()
+            if p not in fixed:
+                search(position + 1, counts, value)
+
+        search(0, [0] * len(sets), 0)
+        if best[0] is None:
+            return None
+        return best[0], best[1]
@@ -0,0 +1,67 @@
+import threading
+from collections import OrderedDict
+
+# Entries kept per process; each is a small dict, so this is a few hundred KB
+FEASIBILITY_CACHE_SIZE = 4096
+
+
+class FeasibilityCache:
+    """LRU memo of schedule feasibility answers for one timetable version.
+
+    Keys are ScheduleOptimizer.feasibility_key() tuples. The cache belongs to
+    the timetable version it was filled under: a lookup or store with another
+    version empties it first, so an admin edit to the timetable (which bumps
+    the 'timetable' cache version) invalidates every answer in every process.
+    Answers under an unknown version (None) are never cached.
+    """
+
+    def __init__(self, maxsize=FEASIBILITY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self, version):
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+    def get(self, version, key):
+        if version is None:
+            return None
+        with self._lock:
+            self._check_version(version)
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(value)
+
+    def put(self, version, key, value):
+        if version is None:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = dict(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = FeasibilityCache()
+
+
+def get_feasibility_cache():
+    """Return the process-wide feasibility cache"""
+    return _cache
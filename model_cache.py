@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Students whose last built model is kept per process, and for how long.
+# A model holds a few thousand PuLP objects, so this stays in the tens of MB.
+MODEL_CACHE_SIZE = 64
+MODEL_CACHE_TTL = 900  # seconds
+
+
+class ModelCache:
+    """LRU of each student's last built optimization model, with a time to live.
+
+    Values are stored under ScheduleOptimizer.model_cache_key(): everything
+    the constraints depend on, the timetable version included. A model is
+    taken out for a solve and put back afterwards, so two requests never
+    share one; taking it with another key (new enrolled courses, an admin
+    timetable edit) or after MODEL_CACHE_TTL drops it instead. Keys of None
+    are never cached.
+    """
+
+    def __init__(self, maxsize=MODEL_CACHE_SIZE, ttl=MODEL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def take(self, student_id, key):
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.pop(str(student_id), None)
+            if entry is None or entry[0] != key or time.monotonic() - entry[1] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2]
+
+    def put(self, student_id, key, value):
+        if key is None:
+            return
+        with self._lock:
+            self._entries[str(student_id)] = (key, time.monotonic(), value)
+            self._entries.move_to_end(str(student_id))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, student_id):
+        with self._lock:
+            self._entries.pop(str(student_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = ModelCache()
+
+
+def get_model_cache():
+    """Return the process-wide model cache"""
+    return _cache
@@ -0,0 +1,158 @@
+import threading
+from collections import defaultdict
+from flask import current_app
+from cache_versions import get_cache_version, bump_cache_version, CURRICULUM
+
+# Longest chain followed from a course, as the recursive chain builder did
+MAX_CHAIN_DEPTH = 10
+
+
+class PrerequisiteGraph:
+    """Read-only, in-memory copy of courses and course_prerequisites keyed by course code.
+
+    One graph is shared by every request in the process and is replaced only
+    when the 'curriculum' version stamp in cache_versions changes.
+    prerequisites maps a course to the codes of the courses it requires and
+    dependents a course to the courses requiring it, in course_prerequisites
+    order; requires and required_by are their transitive closures. chains
+    maps a course to every maximal dependency chain starting at it, each a
+    list of course nodes (code, name, year, semester); courses no other
+    course requires have no chains. Everything is computed on load, so
+    lookups are dictionary reads. The nodes are shared: callers must not
+    mutate them.
+    """
+
+    def __init__(self, version, courses, edges):
+        self.version = version
+        self.courses = {}
+        code_of = {}
+        for course_id, course_code, course_name, year, semester in courses:
+            code_of[course_id] = course_code
+            self.courses[course_code] = {
+                "code": course_code,
+                "name": course_name,
+                "year": year,
+                "semester": semester
+            }
+
+        self.prerequisites = defaultdict(set)
+        self.dependents = defaultdict(list)
+        for course_id, prerequisite_id in edges:
+            course_code, prerequisite_code = code_of[course_id], code_of[prerequisite_id]
+            self.prerequisites[course_code].add(prerequisite_code)
+            self.dependents[prerequisite_code].append(course_code)
+
+        self.requires = {code: self._closure(code, self.prerequisites) for code in self.prerequisites}
+        self.required_by = {code: self._closure(code, self.dependents) for code in self.dependents}
+        self.chains = {}
+        for course_code in self.dependents:
+            self.chains[course_code] = [[self.courses[code] for code in chain]
+                                        for chain in self._chains_from(course_code, frozenset(), 0)]
+
+    def missing_prerequisites(self, course_code, passed):
+        """The prerequisites of a course not in passed, sorted by code"""
+        return sorted(self.prerequisites.get(course_code, set()) - passed)
+
+    def classify(self, course_codes, passed):
+        """Split course codes into (eligible, missing) in one pass.
+
+        passed is the set of course codes the student has passed. eligible
+        lists the codes whose prerequisites are all in it, in input order, and
+        missing maps every other code to its missing prerequisites.
+        """
+        eligible = []
+        missing = {}
+        for course_code in course_codes:
+            lacking = self.missing_prerequisites(course_code, passed)
+            if lacking:
+                missing[course_code] = lacking
+            else:
+                eligible.append(course_code)
+        return eligible, missing
+
+    @staticmethod
+    def _closure(course_code, adjacency):
+        """Every course reachable from course_code through adjacency, excluding itself unless on a cycle"""
+        reached = set()
+        stack = list(adjacency.get(course_code, ()))
+        while stack:
+            code = stack.pop()
+            if code not in reached:
+                reached.add(code)
+                stack.extend(adjacency.get(code, ()))
+        return frozenset(reached)
+
+    def _chains_from(self, course_code, path, depth):
+        """Maximal chains of course codes from course_code, not revisiting path.
+
+        A dependent already on the path (a cycle) or past MAX_CHAIN_DEPTH ends
+        the chain, which still includes it.
+        """
+        if course_code in path or depth > MAX_CHAIN_DEPTH:
+            return []
+        path = path | {course_code}
+        chains = []
+        for dependent in self.dependents.get(course_code, ()):
+            next_chains = self._chains_from(dependent, path, depth + 1)
+            if next_chains:
+                chains.extend([course_code] + chain for chain in next_chains)
+            else:
+                chains.append([course_code, dependent])
+        return chains
+
+    @property
+    def edge_count(self):
+        return sum(len(prerequisites) for prerequisites in self.prerequisites.values())
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def get_prerequisite_graph(db_connection):
+    """Return the process-wide prerequisite graph, reloading it if the version stamp moved.
+
+    Costs one primary-key lookup on cache_versions when the graph is current.
+    If the version cannot be read a fresh, uncached graph is loaded.
+    """
+    global _graph
+    cursor = db_connection.cursor()
+    try:
+        version = get_cache_version(cursor, CURRICULUM)
+        graph = _graph
+        if version is not None and graph is not None and graph.version == version:
+            return graph
+
+        with _graph_lock:
+            graph = _graph
+            if version is not None and graph is not None and graph.version == version:
+                return graph
+            graph = _load_graph(cursor, version)
+            if version is not None:
+                _graph = graph
+            return graph
+    finally:
+        cursor.close()
+
+
+def invalidate_prerequisite_graph(cursor):
+    """Bump the curriculum version so every worker reloads its graph on next use"""
+    bump_cache_version(cursor, CURRICULUM)
+
+
+def _load_graph(cursor, version):
+    cursor.execute("SELECT id, course_code, course_name, year, semester FROM courses")
+    courses = cursor.fetchall()
+    # Dependents in the order the chain builder used to read them per course
+    cursor.execute("""
+        SELECT course_id, prerequisite_id
+        FROM course_prerequisites
+        ORDER BY prerequisite_id, id
+    """)
+    graph = PrerequisiteGraph(version, courses, cursor.fetchall())
+
+    current_app.logger.info(
+        f"Loaded prerequisite graph version {version}: {len(graph.courses)} courses, "
+        f"{graph.edge_count} prerequisites, {sum(len(chains) for chains in graph.chains.values())} chains")
+
+    return graph
@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import mysql.connector
+from flask import current_app
+
+# Results kept per process in front of the schedule_result_cache table.
+# A find-all result is a few tens of KB, so this stays in the tens of MB.
+RESULT_CACHE_SIZE = 512
+# Seconds before trying the table again after the connection failed
+RESULT_CACHE_RETRY = 60
+
+
+class ResultCache:
+    """Solve results shared by every student whose model is the same.
+
+    Keys are ScheduleOptimizer.result_cache_key() digests: a hash of the
+    model's inputs (courses, FixSlot, FixProf, objective weights, timetable
+    version), so students of one group with the same courses and preferences
+    share one solve. Results are kept in an in-process LRU and in the
+    schedule_result_cache table, which every process reads and writes
+    through a connection of its own in autocommit mode: a request's
+    transaction is never committed or rolled back by the cache. Rows of
+    older timetable versions are deleted when a newer one is first stored.
+    Without MySQL settings in the app config only the LRU is used.
+    """
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # The connection is not thread-safe; it is only used under this lock
+        self._connection_lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        self._retry_at = 0
+        self._pruned_version = None
+        self.hits = 0
+        self.misses = 0
+
+    def _cursor(self):
+        """Cursor on this process's cache connection, or None when the table is unavailable"""
+        if 'MYSQL_HOST' not in current_app.config or time.monotonic() < self._retry_at:
+            return None
+        # A forked worker must not share its parent's socket. A connection the
+        # server dropped is only noticed when a query fails (see _query), so a
+        # lookup costs no extra ping round trip.
+        if self._connection is None or self._connection_pid != os.getpid():
+            try:
+                self._connection = mysql.connector.connect(
+                    host=current_app.config['MYSQL_HOST'],
+                    user=current_app.config['MYSQL_USER'],
+                    password=current_app.config['MYSQL_PASSWORD'],
+                    database=current_app.config['MYSQL_DB'],
+                    autocommit=True
+                )
+                self._connection_pid = os.getpid()
+            except Exception as e:
+                current_app.logger.warning(f"Result cache table unavailable: {str(e)}")
+                self._connection = None
+                self._retry_at = time.monotonic() + RESULT_CACHE_RETRY
+                return None
+        return self._connection.cursor()
+
+    def _query(self, work):
+        """Run work(cursor) on the cache connection, reconnecting once if the connection was lost.
+
+        Returns work's result, or None when the table is unavailable.
+        """
+        for attempt in range(2):
+            cursor = self._cursor()
+            if cursor is None:
+                return None
+            try:
+                return work(cursor)
+            except (mysql.connector.OperationalError, mysql.connector.InterfaceError):
+                if attempt:
+                    raise
+                self._connection = None
+            finally:
+                cursor.close()
+
+    def _remember(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """A copy of the result stored under key, or None"""
+        if key is None:
+            return None
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+        if result is None:
+            result = self._load(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self._remember(key, result)
+            self.hits += 1
+        # Callers add semester/year to the result in place
+        return json.loads(result)
+
+    def put(self, key, version, result):
+        if key is None:
+            return
+        encoded = json.dumps(result, default=str)
+        with self._lock:
+            self._remember(key, encoded)
+        self._store(key, version, encoded)
+
+    def _load(self, key):
+        def select(cursor):
+            cursor.execute("SELECT result FROM schedule_result_cache WHERE result_key = %s", (key,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+        with self._connection_lock:
+            try:
+                return self._query(select)
+            except Exception as e:
+                current_app.logger.warning(f"Could not read the result cache: {str(e)}")
+                return None
+
+    def _store(self, key, version, encoded):
+        def insert(cursor):
+            if version != self._pruned_version:
+                cursor.execute("DELETE FROM schedule_result_cache WHERE timetable_version < %s", (version,))
+                self._pruned_version = version
+            cursor.execute("""
+                INSERT INTO schedule_result_cache (result_key, timetable_version, result)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE result = VALUES(result), created_at = CURRENT_TIMESTAMP
+            """, (key, version, encoded))
+
+        with self._connection_lock:
+            try:
+                self._query(insert)
+            except Exception as e:
+                current_app.logger.warning(f"Could not write the result cache: {str(e)}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = ResultCache()
+
+
+def get_result_cache():
+    """Return the process-wide result cache"""
+    return _cache
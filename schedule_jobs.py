@@ -0,0 +1,297 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from flask import current_app, g
+
+# Jobs allowed to run at once per queue, across every process sharing the
+# job database; each process starts this many worker threads per queue
+QUEUE_LIMITS = {
+    'generate': 2,
+    'all_optimal': 1,
+}
+# Queued (not yet running) jobs a queue accepts before submit is refused
+MAX_PENDING = 200
+# Finished jobs are kept this long for polling, then purged
+RESULT_TTL = 3600
+# A running job's worker refreshes its heartbeat this often while the job runs
+HEARTBEAT_INTERVAL = 30
+# A running job whose heartbeat is older than this is assumed lost with its process
+STALE_AFTER = 4 * HEARTBEAT_INTERVAL
+POLL_INTERVAL = 0.5
+
+# queue name -> handler(payload) returning a JSON-serialisable result
+_handlers = {}
+
+
+class QueueFull(Exception):
+    """Raised when a queue already holds MAX_PENDING queued jobs"""
+
+
+def job_handler(queue):
+    """Register the function that runs the jobs of a queue"""
+    def register(handler):
+        if queue not in QUEUE_LIMITS:
+            raise ValueError(f"Unknown job queue '{queue}'")
+        _handlers[queue] = handler
+        return handler
+    return register
+
+
+class ScheduleJobQueue:
+    """Schedule-generation jobs in a local SQLite file, run by worker threads.
+
+    The SQLite file is the only shared state, so every process of the app
+    (gunicorn workers included) sees the same jobs: submit deduplicates on
+    (queue, dedup_key) among active jobs, and a job is only claimed while its
+    queue is under its QUEUE_LIMITS concurrency. No external broker is needed.
+    """
+
+    def __init__(self, app, path):
+        self.app = app
+        self.path = path
+        self._wake = threading.Event()
+        self._started_pid = None
+        self._start_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        # Autocommit mode; writes take the lock explicitly with BEGIN IMMEDIATE
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _init_db(self):
+        connection = self._connect()
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS schedule_jobs (
+                    id TEXT PRIMARY KEY,
+                    queue TEXT NOT NULL,
+                    dedup_key TEXT NOT NULL,
+                    student_id INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    heartbeat_at REAL,
+                    finished_at REAL
+                )
+            """)
+            columns = [row['name'] for row in connection.execute("PRAGMA table_info(schedule_jobs)")]
+            if 'heartbeat_at' not in columns:
+                connection.execute("ALTER TABLE schedule_jobs ADD COLUMN heartbeat_at REAL")
+            connection.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS schedule_jobs_active
+                ON schedule_jobs (queue, dedup_key) WHERE status IN ('queued', 'running')
+            """)
+            connection.execute("""
+                CREATE INDEX IF NOT EXISTS schedule_jobs_claim
+                ON schedule_jobs (queue, status, created_at)
+            """)
+        finally:
+            connection.close()
+
+    def submit(self, queue, student_id, dedup_key, payload):
+        """Queue a job, or return the active one with the same key. Returns (job, created)"""
+        if queue not in _handlers:
+            raise ValueError(f"No handler registered for job queue '{queue}'")
+
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute("""
+                SELECT * FROM schedule_jobs
+                WHERE queue = ? AND dedup_key = ? AND status IN ('queued', 'running')
+            """, (queue, dedup_key)).fetchone()
+            if row:
+                connection.execute("COMMIT")
+                return self._job_dict(row), False
+
+            pending = connection.execute(
+                "SELECT COUNT(*) FROM schedule_jobs WHERE queue = ? AND status = 'queued'", (queue,)
+            ).fetchone()[0]
+            if pending >= MAX_PENDING:
+                connection.execute("ROLLBACK")
+                raise QueueFull(f"The {queue} queue already has {pending} jobs waiting")
+
+            job_id = uuid.uuid4().hex
+            connection.execute("""
+                INSERT INTO schedule_jobs (id, queue, dedup_key, student_id, payload, status, created_at)
+                VALUES (?, ?, ?, ?, ?, 'queued', ?)
+            """, (job_id, queue, dedup_key, student_id, json.dumps(payload), time.time()))
+            connection.execute("COMMIT")
+            row = connection.execute("SELECT * FROM schedule_jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            connection.close()
+
+        self._start_workers()
+        self._wake.set()
+        return self._job_dict(row), True
+
+    def get(self, job_id):
+        # Polling also revives the workers of a process that has not submitted
+        self._start_workers()
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT * FROM schedule_jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            connection.close()
+        return self._job_dict(row) if row else None
+
+    @staticmethod
+    def _job_dict(row):
+        return {
+            'job_id': row['id'],
+            'type': row['queue'],
+            'student_id': row['student_id'],
+            'status': row['status'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'created_at': row['created_at'],
+            'started_at': row['started_at'],
+            'finished_at': row['finished_at'],
+        }
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+    def _start_workers(self):
+        # Threads do not survive a fork, so a forked worker process starts its own
+        with self._start_lock:
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+            for queue in _handlers:
+                for n in range(QUEUE_LIMITS[queue]):
+                    thread = threading.Thread(target=self._work, args=(queue,),
+                                              name=f"schedule-job-{queue}-{n}", daemon=True)
+                    thread.start()
+
+    def _work(self, queue):
+        while True:
+            try:
+                job = self._claim(queue)
+            except sqlite3.Error as e:
+                with self.app.app_context():
+                    current_app.logger.error(f"Error claiming {queue} job: {str(e)}")
+                job = None
+            if job is None:
+                self._wake.wait(POLL_INTERVAL)
+                self._wake.clear()
+                continue
+            try:
+                self._run(job)
+            except Exception as e:
+                # Most likely recording the outcome failed; keep the worker alive,
+                # the job is failed as lost once it goes stale
+                with self.app.app_context():
+                    current_app.logger.error(f"Error running schedule job {job['id']}: {str(e)}", exc_info=True)
+
+    def _claim(self, queue):
+        """Mark the oldest queued job running, if the queue is under its limit"""
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("""
+                UPDATE schedule_jobs SET status = 'failed', error = 'Job was lost by its worker', finished_at = ?
+                WHERE queue = ? AND status = 'running' AND COALESCE(heartbeat_at, started_at) < ?
+            """, (now, queue, now - STALE_AFTER))
+            connection.execute("""
+                DELETE FROM schedule_jobs
+                WHERE status IN ('finished', 'failed') AND finished_at < ?
+            """, (now - RESULT_TTL,))
+
+            running = connection.execute(
+                "SELECT COUNT(*) FROM schedule_jobs WHERE queue = ? AND status = 'running'", (queue,)
+            ).fetchone()[0]
+            row = None
+            if running < QUEUE_LIMITS[queue]:
+                row = connection.execute("""
+                    SELECT id, payload FROM schedule_jobs
+                    WHERE queue = ? AND status = 'queued'
+                    ORDER BY created_at
+                    LIMIT 1
+                """, (queue,)).fetchone()
+                if row:
+                    connection.execute(
+                        "UPDATE schedule_jobs SET status = 'running', started_at = ?, heartbeat_at = ? WHERE id = ?",
+                        (now, now, row['id'])
+                    )
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        return {'id': row['id'], 'queue': queue, 'payload': json.loads(row['payload'])}
+
+    def _run(self, job):
+        # However long the solve takes, the job is not stale while its worker lives
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job['id'], stop),
+                                     name=f"schedule-job-heartbeat-{job['id']}", daemon=True)
+        heartbeat.start()
+        try:
+            self._run_handler(job)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job_id, stop):
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                connection = self._connect()
+                try:
+                    connection.execute(
+                        "UPDATE schedule_jobs SET heartbeat_at = ? WHERE id = ? AND status = 'running'",
+                        (time.time(), job_id))
+                finally:
+                    connection.close()
+            except sqlite3.Error as e:
+                with self.app.app_context():
+                    current_app.logger.warning(f"Error refreshing heartbeat of schedule job {job_id}: {str(e)}")
+
+    def _run_handler(self, job):
+        with self.app.app_context():
+            # A job submitted with ?trace=1 is traced like the request would have been
+            g.solver_trace = bool(job['payload'].get('trace'))
+            try:
+                result = _handlers[job['queue']](job['payload'])
+                # The app's JSON provider, so results serialise as in jsonify
+                self._finish(job['id'], 'finished', result=current_app.json.dumps(result))
+            except Exception as e:
+                current_app.logger.error(f"Schedule job {job['id']} failed: {str(e)}", exc_info=True)
+                self._finish(job['id'], 'failed', error=str(e))
+
+    def _finish(self, job_id, status, result=None, error=None):
+        """Record a job's outcome, unless the stale sweep has already failed it"""
+        connection = self._connect()
+        try:
+            connection.execute("""
+                UPDATE schedule_jobs SET status = ?, result = ?, error = ?, finished_at = ?
+                WHERE id = ? AND status = 'running'
+            """, (status, result, error, time.time(), job_id))
+        finally:
+            connection.close()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_schedule_job_queue():
+    """Return the process-wide job queue for the current app"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            app = current_app._get_current_object()
+            path = app.config.get('SCHEDULE_JOBS_DB') or os.environ.get(
+                'SCHEDULE_JOBS_DB', os.path.join(app.root_path, 'schedule_jobs.sqlite3'))
+            _queue = ScheduleJobQueue(app, path)
+        return _queue
@@ -1,22 +1,588 @@
+import hashlib
+import json
+import multiprocessing
+import threading
 import pulp
 import mysql.connector
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 from datetime import datetime, time, timedelta
 from flask import current_app
 from collections import defaultdict
+from timetable_snapshot import get_timetable_snapshot
+from feasibility_cache import get_feasibility_cache
+from model_cache import get_model_cache
+from result_cache import get_result_cache
+from solver_trace import get_solver_trace
+from exact_solver import ExactScheduleSolver, ExactSearchLimit, FeasibilitySearch, chronology_pairs
+
+# Values of schedule_parameters.solver_engine
+SOLVER_ENGINES = ('auto', 'cbc', 'exact')
+
+# Values of schedule_parameters.gap_formulation
+GAP_FORMULATIONS = ('pairwise', 'span')
+
+# 'auto' uses the exact engine only while the search stays this small,
+# otherwise (or when a budget is hit mid-search) the model goes to CBC
+EXACT_AUTO_PATTERN_LIMIT = 20000
+EXACT_AUTO_NODE_LIMIT = 20000
+
+# find_all only splits its CBC enumeration over processes when the first
+# solve took at least this long (seconds); smaller models enumerate faster
+# than the branches can be handed out
+PARALLEL_MIN_SOLVE_TIME = 0.5
+
+# build_model removes the x and y variables presolve proves are 0 in every
+# feasible schedule before the model is built
+PRESOLVE = True
+
+
+class ScheduleOptionIndex:
+    """Multi-key index over the loaded schedule options.
+
+    Built once in a single pass when the options are loaded, so the set builders
+    in build_model (L, Prof, LectProf, T, L_p, TutProf, FixSlot, FixProf) become
+    dictionary lookups instead of full rescans of the option list.
+    """
+
+    def __init__(self, schedule_options):
+        # course_code -> professors teaching any session of the course (Prof_i)
+        self.course_professors = defaultdict(set)
+        # course_code -> session number -> professors teaching that session
+        self.session_professors = defaultdict(lambda: defaultdict(set))
+        # (course_code, session) -> time slots offered for the session (L_i_k)
+        self.session_slots = defaultdict(set)
+        # (course_code, professor) -> time slots taught by the professor (T_i_p)
+        self.professor_slots = defaultdict(set)
+        # (course_code, session, professor) -> time slots (L_i_k_p)
+        self.session_professor_slots = defaultdict(set)
+        # course_code -> session number -> lecture professor -> paired professors (TutProf_i_q)
+        self.paired_professors = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+        # (course_code, session, group) -> time slots in option order (FixSlot)
+        self.group_slots = defaultdict(list)
+        # (course_code, group) -> {(session, professor)} (FixProf)
+        self.group_professors = defaultdict(set)
+
+        for option in schedule_options:
+            course_code = option.get('course_code')
+            session = option.get('session_number_index')
+            slot = option.get('time_slot_index')
+            professor = option.get('professor_index')
+            group = option.get('group')
+
+            if professor is not None:
+                self.course_professors[course_code].add(professor)
+                self.group_professors[(course_code, group)].add((session, professor))
+                if session is not None:
+                    self.session_professors[course_code][session].add(professor)
+                    lect_prof = option.get('lect_prof_index')
+                    if lect_prof is not None:
+                        self.paired_professors[course_code][session][lect_prof].add(professor)
+
+            if slot is None or session is None:
+                continue
+
+            self.session_slots[(course_code, session)].add(slot)
+            self.session_professor_slots[(course_code, session, professor)].add(slot)
+            if professor is not None:
+                self.professor_slots[(course_code, professor)].add(slot)
+            group_slots = self.group_slots[(course_code, session, group)]
+            if slot not in group_slots:
+                group_slots.append(slot)
+
+    def slots_for_session(self, course_code, session):
+        return sorted(self.session_slots.get((course_code, session), ()))
+
+    def professors_for_course(self, course_code):
+        return sorted(self.course_professors.get(course_code, ()))
+
+    def professors_for_sessions(self, course_code, predicate):
+        """Professors teaching any session number of the course accepted by predicate"""
+        professors = set()
+        for session, profs in self.session_professors.get(course_code, {}).items():
+            if predicate(session):
+                professors |= profs
+        return sorted(professors)
+
+    def slots_for_professor(self, course_code, professor):
+        return sorted(self.professor_slots.get((course_code, professor), ()))
+
+    def slots_for_session_professor(self, course_code, session, professor):
+        return sorted(self.session_professor_slots.get((course_code, session, professor), ()))
+
+    def paired_professors_for(self, course_code, lect_prof, predicate):
+        """Professors of sessions accepted by predicate that are paired with lecture professor lect_prof"""
+        professors = set()
+        for session, by_lect_prof in self.paired_professors.get(course_code, {}).items():
+            if predicate(session) and lect_prof in by_lect_prof:
+                professors |= by_lect_prof[lect_prof]
+        return sorted(professors)
+
+    def slots_for_group(self, course_code, session, group):
+        return list(self.group_slots.get((course_code, session, group), ()))
+
+    def professors_for_group(self, course_code, group):
+        return self.group_professors.get((course_code, group), set())
+
+
+class OptimalSolutionEnumerator:
+    """Enumerates the optimal solutions of one model, reusing it across iterations.
+
+    The first solve finds the optimum, which is then pinned by a single
+    `objective >= optimum - objective_tolerance` row. Each further solution is
+    found by adding one cut on the x variables to the same model and solving
+    again, so solutions come best first; the enumerator never solves past the
+    last solution the caller asked for.
+
+    With the defaults the cut is a no-good cut and only exact optima are
+    returned. objective_tolerance widens this to the top solutions within
+    that objective distance, and min_distance asks every new solution to be
+    at least that Hamming distance away (on x) from each earlier one. Every
+    solution sets one x per session, so moving one session is distance 2.
+    """
+
+    def __init__(self, model, x, solver, tolerance=0.001, objective_tolerance=0, min_distance=1):
+        self.model = model
+        self.x_vars = list(x.values())
+        self.solver = solver
+        self.tolerance = tolerance
+        self.objective_tolerance = objective_tolerance
+        # x variables of a new solution that must differ from an earlier one's
+        self.min_changed = max(1, -(-min_distance // 2))
+        self.objective = model.objective
+        self.optimal_value = None
+        self.status = None
+        self.cuts = 0
+
+    def solve_optimum(self):
+        """Solve the model with its real objective; returns the PuLP status"""
+        self.status = self.model.solve(self.solver)
+        if self.status == pulp.LpStatusOptimal:
+            self.optimal_value = pulp.value(self.objective)
+        return self.status
+
+    def active_x_vars(self):
+        return [var for var in self.x_vars if var.varValue is not None and var.varValue > 0.5]
+
+    def next_solution(self):
+        """Exclude the current solution and look for another optimal one.
+
+        Returns True when the model holds a new solution with the optimal
+        objective value, False when the optimal solutions are exhausted.
+        """
+        active_x_vars = self.active_x_vars()
+        if not active_x_vars:
+            current_app.logger.warning("No active x decision variables in solution, stopping iteration")
+            return False
+
+        self.exclude(active_x_vars)
+        return self.search()
+
+    def exclude(self, active_x_vars):
+        """Cut off the solution whose active x variables are active_x_vars"""
+        if self.cuts == 0:
+            self.model += self.objective >= self._floor(), "maintain_optimality"
+
+        self.cuts += 1
+        self.model += (pulp.lpSum(active_x_vars) <= len(active_x_vars) - self.min_changed,
+                       f"exclude_solution_{self.cuts}")
+
+    def search(self):
+        """Solve the model under its cuts; True if it holds a new solution with the optimal objective value"""
+        floor = self._floor()
+        self.status = self.model.solve(self.solver)
+        if self.status != pulp.LpStatusOptimal:
+            current_app.logger.info(f"No more optimal solutions found. Status: {pulp.LpStatus[self.status]}")
+            return False
+
+        value = pulp.value(self.objective)
+        if value is None or value < floor:
+            current_app.logger.info(f"Next solution has lower objective value ({value}), stopping search")
+            return False
+        return True
+
+    def _floor(self):
+        return self.optimal_value - self.objective_tolerance - self.tolerance
+
+
+class ExactSolutionEnumerator:
+    """OptimalSolutionEnumerator counterpart backed by the in-process exact engine.
+
+    Solutions are written into the PuLP variables of the built model, so
+    _extract_solution and the objective read them exactly as after a CBC solve.
+    If the exact search runs over its budget, finding the optimum or
+    enumerating, the enumerator hands the model to CBC, with every solution
+    returned so far cut off, and delegates to an OptimalSolutionEnumerator
+    from then on. The exact
+    engine only enumerates tied optima, so a top-K enumeration (a positive
+    objective_tolerance or a min_distance above 2) also goes to CBC after the
+    first solution.
+    """
+
+    def __init__(self, model, x, y, exact_solver, fallback_solver, objective_tolerance=0, min_distance=1):
+        self.model = model
+        self.x = x
+        self.y = y
+        self.exact_solver = exact_solver
+        self.fallback_solver = fallback_solver
+        self.objective_tolerance = objective_tolerance
+        self.min_distance = min_distance
+        self.fallback = None
+        self.solutions = None
+        self.seen = set()
+        self.optimal_value = None
+        self.status = None
+        self.variables = {var.name: var for var in model.variables()}
+
+    def solve_optimum(self):
+        try:
+            solution = self.exact_solver.solve()
+        except ExactSearchLimit as e:
+            current_app.logger.info(f"Exact engine gave up ({str(e)}), solving with CBC")
+            self.fallback = self._cbc_enumerator()
+            self.status = self.fallback.solve_optimum()
+            self.optimal_value = self.fallback.optimal_value
+            return self.status
+
+        if solution is None:
+            self.status = pulp.LpStatusInfeasible
+        else:
+            self.status = pulp.LpStatusOptimal
+            self.optimal_value = solution.objective
+            self._apply(solution)
+        self.model.status = self.status
+        current_app.logger.info(
+            f"Exact engine finished in {self.exact_solver.nodes} nodes, status {pulp.LpStatus[self.status]}")
+        return self.status
+
+    def active_x_vars(self):
+        if self.fallback is not None:
+            return self.fallback.active_x_vars()
+        return [var for var in self.x.values() if var.varValue is not None and var.varValue > 0.5]
+
+    def _cbc_enumerator(self):
+        return OptimalSolutionEnumerator(self.model, self.x, self.fallback_solver,
+                                         objective_tolerance=self.objective_tolerance,
+                                         min_distance=self.min_distance)
+
+    def next_solution(self):
+        if self.fallback is None and (self.objective_tolerance > 0 or self.min_distance > 2):
+            # Continue from the applied optimum: CBC cuts it off and searches on
+            self.fallback = self._cbc_enumerator()
+            self.fallback.optimal_value = self.optimal_value
+            self.fallback.status = self.status
+        if self.fallback is not None:
+            return self.fallback.next_solution()
+        if self.solutions is None:
+            self.solutions = self.exact_solver.enumerate_optimal()
+        try:
+            for solution in self.solutions:
+                if frozenset(solution.x) not in self.seen:
+                    self._apply(solution)
+                    return True
+        except ExactSearchLimit as e:
+            # Continue with CBC from the solutions returned so far, cutting all of them off
+            current_app.logger.info(f"Exact enumeration stopped early ({str(e)}), continuing with CBC")
+            self.fallback = self._cbc_enumerator()
+            self.fallback.optimal_value = self.optimal_value
+            self.fallback.status = self.status
+            for pattern in self.seen:
+                self.fallback.exclude([self.x[key] for key in pattern])
+            return self.fallback.search()
+        return False
+
+    def _apply(self, solution):
+        for var in self.variables.values():
+            var.varValue = 0
+        for key in solution.x:
+            self.x[key].varValue = 1
+        for key in solution.y:
+            self.y[key].varValue = 1
+        # Only the variables of the model's gap formulation exist
+        for l in solution.used_slots:
+            if f"used_slot_{l}" in self.variables:
+                self.variables[f"used_slot_{l}"].varValue = 1
+        for day, start_idx, end_idx in solution.gaps:
+            if f"gap_{day}_{start_idx}_{end_idx}" in self.variables:
+                self.variables[f"gap_{day}_{start_idx}_{end_idx}"].varValue = 1
+        for day, (first, last, holes) in solution.spans.items():
+            if f"span_holes_{day}" in self.variables:
+                self.variables[f"span_first_{day}"].varValue = first
+                self.variables[f"span_last_{day}"].varValue = last
+                self.variables[f"span_holes_{day}"].varValue = holes
+        self.seen.add(frozenset(solution.x))
+
+
+def _enumerate_branch(model_dict, branch, floor, min_changed, limit, time_limit, threads):
+    """Process pool task: up to `limit` solutions of one branch of a serialized model.
+
+    The branch fixes the x variable named `branch` to 1. Solutions are found
+    as OptimalSolutionEnumerator finds them (a floor on the objective and a
+    cut per solution) and returned best first as (objective value, {variable
+    name: value}) pairs, with whether the branch ran out of solutions before
+    `limit`. Runs without an app context, so it does not log.
+    """
+    _, model = pulp.LpProblem.from_dict(model_dict)
+    variables = model.variablesDict()
+    x_vars = [var for name, var in variables.items() if name.startswith('x_')]
+    model += variables[branch] == 1, "branch"
+    model += model.objective >= floor, "maintain_optimality"
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit, threads=threads)
+
+    solutions = []
+    while len(solutions) < limit:
+        if model.solve(solver) != pulp.LpStatusOptimal:
+            return solutions, True
+        value = pulp.value(model.objective)
+        if value is None or value < floor:
+            return solutions, True
+        solutions.append((value, {var.name: var.varValue for var in model.variables()}))
+        active_x_vars = [var for var in x_vars if var.varValue is not None and var.varValue > 0.5]
+        model += (pulp.lpSum(active_x_vars) <= len(active_x_vars) - min_changed,
+                  f"exclude_solution_{len(solutions)}")
+    return solutions, False
+
+
+_branch_pool = None
+_branch_pool_processes = None
+_branch_pool_lock = threading.Lock()
+
+
+def _submit_branches(processes, tasks):
+    """Submit (function, *args) tasks to the process-wide branch pool; returns their futures.
+
+    The pool is started once and replaced when the number of processes
+    changes. Both happen under one lock with the submissions, so another
+    thread can only shut a pool down once this thread's tasks are queued on
+    it, and shutdown() still runs queued tasks.
+    """
+    global _branch_pool, _branch_pool_processes
+    with _branch_pool_lock:
+        if _branch_pool is None or _branch_pool_processes != processes:
+            if _branch_pool is not None:
+                _branch_pool.shutdown(wait=False)
+            # spawn: the app may run threads, which fork does not carry over safely
+            _branch_pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+            _branch_pool_processes = processes
+        return [_branch_pool.submit(*task) for task in tasks]
+
+
+class ParallelSolutionEnumerator:
+    """OptimalSolutionEnumerator counterpart that enumerates branches in a process pool.
+
+    After the optimum is found, the model is split on the session with the
+    most slot choices: one branch per slot, with that session's x fixed to 1.
+    The branches are enumerated in separate processes, and their solutions
+    are merged best first and deduplicated by x pattern, keeping the first
+    `limit` that respect min_distance. next_solution then applies the merged
+    solutions to the model's variables one after the other. When the first
+    solve is quicker than PARALLEL_MIN_SOLVE_TIME the enumeration stays in
+    this process, through an OptimalSolutionEnumerator.
+
+    With objective_tolerance 0 every solution has the optimal value, so each
+    branch only looks for its share of `limit`. If the merge comes up short
+    while a branch stopped at its share, the enumeration goes on in this
+    process with every merged solution cut off. Top-K branches look for the
+    full `limit`, so the merge keeps the K best.
+
+    solver_processes defaults to 1, which never builds this enumerator: on
+    the synthetic benchmark instances (about 0.1 s per CBC solve) a split is
+    0.6-0.9x as fast as the sequential enumerator, since each branch pays
+    for a model rebuild and its own first solve. Raise it only for timetables
+    whose single solve is much slower than PARALLEL_MIN_SOLVE_TIME, after
+    checking with benchmarks/bench_parallel.py.
+    """
+
+    def __init__(self, model, x, solver, processes, limit, time_limit, threads=None,
+                 tolerance=0.001, objective_tolerance=0, min_distance=1):
+        self.model = model
+        self.x = x
+        self.solver = solver
+        self.processes = processes
+        self.limit = limit
+        self.time_limit = time_limit
+        self.threads = threads
+        self.tolerance = tolerance
+        self.objective_tolerance = objective_tolerance
+        self.min_distance = min_distance
+        self.min_changed = max(1, -(-min_distance // 2))
+        self.optimal_value = None
+        self.status = None
+        self.solutions = []
+        self.position = 0
+        self.complete = True
+        self.sequential = None
+
+    def _branches(self):
+        """x variable names of the session with the most slot choices"""
+        slots = defaultdict(list)
+        for (i, k, l), var in self.x.items():
+            slots[(i, k)].append(var.name)
+        return max(slots.values(), key=len) if slots else []
+
+    def _merge(self, branch_results):
+        x_names = {var.name for var in self.x.values()}
+        branch_results = list(branch_results)
+        self.complete = all(exhausted for _, exhausted in branch_results)
+        found = sorted((solution for solutions, _ in branch_results for solution in solutions),
+                       key=lambda solution: -solution[0])
+        merged, patterns = [], []
+        for value, values in found:
+            pattern = frozenset(name for name in x_names if values.get(name) is not None and values[name] > 0.5)
+            if any(len(pattern ^ other) < max(self.min_distance, 1) for other in patterns):
+                continue
+            merged.append(values)
+            patterns.append(pattern)
+            if len(merged) >= self.limit:
+                break
+        return merged
+
+    def _apply(self, values):
+        for var in self.model.variables():
+            var.varValue = values.get(var.name)
+
+    def _sequential_enumerator(self):
+        enumerator = OptimalSolutionEnumerator(
+            self.model, self.x, self.solver, tolerance=self.tolerance,
+            objective_tolerance=self.objective_tolerance, min_distance=self.min_distance)
+        enumerator.optimal_value = self.optimal_value
+        enumerator.status = self.status
+        return enumerator
+
+    def _continue_sequentially(self):
+        """Cut off the merged solutions and go on with an OptimalSolutionEnumerator"""
+        self.sequential = self._sequential_enumerator()
+        # The last merged solution is applied, so the enumerator cuts it off
+        # itself; before its first cut it also adds the objective floor
+        if len(self.solutions) > 1:
+            floor = self.optimal_value - self.objective_tolerance - self.tolerance
+            self.model += self.model.objective >= floor, "maintain_optimality"
+        for values in self.solutions[:-1]:
+            active_x_vars = [var for var in self.x.values()
+                             if values.get(var.name) is not None and values[var.name] > 0.5]
+            self.sequential.cuts += 1
+            self.model += (pulp.lpSum(active_x_vars) <= len(active_x_vars) - self.min_changed,
+                           f"exclude_solution_{self.sequential.cuts}")
+        current_app.logger.info(f"Branches stopped at their share, continuing after "
+                                f"{len(self.solutions)} solutions in this process")
+        return self.sequential.next_solution()
+
+    def solve_optimum(self):
+        start = perf_counter()
+        self.status = self.model.solve(self.solver)
+        if self.status != pulp.LpStatusOptimal:
+            return self.status
+        self.optimal_value = pulp.value(self.model.objective)
+
+        branches = self._branches()
+        if perf_counter() - start < PARALLEL_MIN_SOLVE_TIME or len(branches) < 2:
+            self.sequential = self._sequential_enumerator()
+            return self.status
+
+        floor = self.optimal_value - self.objective_tolerance - self.tolerance
+        branch_limit = self.limit if self.objective_tolerance > 0 else -(-self.limit // len(branches))
+        model_dict = self.model.to_dict()
+        current_app.logger.info(f"Enumerating {len(branches)} branches in {self.processes} processes")
+        futures = _submit_branches(self.processes, [
+            (_enumerate_branch, model_dict, branch, floor, self.min_changed, branch_limit, self.time_limit, self.threads)
+            for branch in branches])
+        self.solutions = self._merge(future.result() for future in futures)
+
+        # The optimum found above is in one of the branches; start from the merged best
+        if self.solutions:
+            self._apply(self.solutions[0])
+        return self.status
+
+    def next_solution(self):
+        if self.sequential is not None:
+            return self.sequential.next_solution()
+        self.position += 1
+        if self.position >= len(self.solutions):
+            if not self.complete and self.solutions:
+                return self._continue_sequentially()
+            current_app.logger.info("No more optimal solutions found in the branches")
+            return False
+        self._apply(self.solutions[self.position])
+        return True
+
+
+class BuiltModel:
+    """A model build_model returned, with what is needed to give it a new objective.
+
+    rows is the number of constraints the model was built with; the
+    enumerators' optimality pin and cuts come after them. FixSlot and FixProf
+    are the fixings it was built with, which _build_sets is not rerun for.
+    """
+
+    __slots__ = ('key', 'model', 'x', 'y', 'I', 'sets', 'lambda_weight', 'total_gaps', 'rows', 'FixSlot', 'FixProf')
+
+    def __init__(self, key, model, x, y, I, sets, lambda_weight, total_gaps, FixSlot, FixProf):
+        self.key = key
+        self.model = model
+        self.x = x
+        self.y = y
+        self.I = I
+        self.sets = sets
+        self.lambda_weight = lambda_weight
+        self.total_gaps = total_gaps
+        self.rows = len(model.constraints)
+        self.FixSlot = FixSlot
+        self.FixProf = FixProf
+
+
+class ModelSolution:
+    """One solution of a built model, read from the x and y dicts build_model returns.
+
+    x and y hold the active (i, k, l) and (i, k, p) keys. The objective
+    components are the ones reported to students (rank weights of the
+    assigned professors, preferred slots used, gaps times lambda) and are
+    computed in the same pass; nothing is parsed back out of variable names.
+    """
+
+    __slots__ = ('x', 'y', 'professor_preference_value', 'timeslot_preference_value', 'gap_penalty')
+
+    def __init__(self, x, y, professor_preference_value, timeslot_preference_value, gap_penalty):
+        self.x = x
+        self.y = y
+        self.professor_preference_value = professor_preference_value
+        self.timeslot_preference_value = timeslot_preference_value
+        self.gap_penalty = gap_penalty
+
+    @property
+    def total_objective_value(self):
+        return self.professor_preference_value + self.timeslot_preference_value - self.gap_penalty
+
+    def objective_components(self):
+        return {
+            'professor_preference_value': self.professor_preference_value,
+            'timeslot_preference_value': self.timeslot_preference_value,
+            'gap_penalty': self.gap_penalty
+        }
+
 
 class ScheduleOptimizer:
 
-    def __init__(self, db_connection, student_id):
+    def __init__(self, db_connection, student_id, course_selection=None):
 
         self.db = db_connection
         self.student_id = student_id
         self.cursor = self.db.cursor()
         
+        # Optional in-memory add_course rows for one term:
+        # {'year', 'semester', 'enrolled': [codes], 'notenrolled': [codes]}.
+        # They replace that term's enrolled/notenrolled rows in the database, so
+        # a course selection can be checked without writing it to add_course.
+        self.course_selection = course_selection
+        
         self.enrolled_courses = []
         self.schedule_options = []
+        self.option_index = ScheduleOptionIndex([])
         self.course_sessions = {}
         self.groups = {}
         
+        # Shared, versioned copy of the schedule/course_sessions/schedule_parameters tables
+        self.timetable = None
+        
         # Initialize student group and level information
         self.student_group = None
         self.student_level = None
@@ -34,7 +600,25 @@ class ScheduleOptimizer:
         self.preferences = None
         self.timeslot_weights = {}
         
+        # Set per solve: whether it records into the solver trace
+        self.tracing = False
+        
+        # The last model build_model returned (BuiltModel) and whether it came
+        # from the model cache; cache_model() hands it back to the cache
+        self.built_model = None
+        self.model_reused = False
+        
+    def _course_selection_filter(self):
+        """SQL condition and params leaving out the add_course rows course_selection replaces"""
+        if not self.course_selection:
+            return "", ()
+        return (
+            " AND NOT (year = %s AND semester = %s AND status IN ('enrolled', 'notenrolled'))",
+            (self.course_selection['year'], self.course_selection['semester'])
+        )
+        
     def load_data(self):
+        self.timetable = get_timetable_snapshot(self.db)
         self._load_student_info()
         self._load_enrolled_courses()
         self._load_course_sessions()
@@ -43,6 +627,22 @@ class ScheduleOptimizer:
         self._load_timeslot_preferences()
         self._check_failed_skipped_courses()
         
+    def feasibility_key(self):
+        """Everything besides the timetable version that decides whether a schedule exists.
+
+        The enrolled courses and the inputs of FixSlot/FixProf; weights and
+        preferences only move the objective. Call after load_data.
+        """
+        return (
+            tuple(sorted(self.enrolled_courses)),
+            self.student_group,
+            self.student_level,
+            tuple(sorted(self.current_failed_courses)),
+            self.has_skipped_courses,
+            tuple(sorted(self.lecture_groups.items())),
+            tuple(sorted(self.tutorial_groups.items())),
+        )
+        
     def _load_student_info(self):
         """Load student group information from the database"""
         # Try to fetch both main group and academic level (if the column exists)
@@ -70,13 +670,15 @@ class ScheduleOptimizer:
         self.tutorial_groups = {}
         
         # Load course-specific groups from add_course table
+        # (in-memory selection rows carry no groups)
+        selection_sql, selection_params = self._course_selection_filter()
         query = """
             SELECT course_code, lecture_study_group, tutorial_study_group
             FROM add_course
             WHERE student_id = %s
             AND status = 'enrolled'
-        """
-        self.cursor.execute(query, (self.student_id,))
+        """ + selection_sql
+        self.cursor.execute(query, (self.student_id,) + selection_params)
         for course_code, lecture_group, tutorial_group in self.cursor.fetchall():
             if lecture_group and lecture_group.strip():
                 self.lecture_groups[course_code] = lecture_group
@@ -89,17 +691,28 @@ class ScheduleOptimizer:
     def _check_failed_skipped_courses(self):
         """Check if student has failed or skipped courses by looking at add_course table"""
         # First get all course history for the student, ordered by course and date
+        selection_sql, selection_params = self._course_selection_filter()
         query = """
             SELECT course_code, status, date
                     FROM add_course
                     WHERE student_id = %s
+        """ + selection_sql + """
             ORDER BY course_code, date DESC
         """
-        self.cursor.execute(query, (self.student_id,))
+        self.cursor.execute(query, (self.student_id,) + selection_params)
+        history = self.cursor.fetchall()
+        
+        if self.course_selection:
+            # Selection rows are undated, and MySQL sorts NULL dates last in DESC order
+            history = list(history)
+            history += [(code, 'enrolled', None) for code in self.course_selection['enrolled']]
+            history += [(code, 'notenrolled', None) for code in self.course_selection['notenrolled']]
+            history.sort(key=lambda row: row[2] is None)
+            history.sort(key=lambda row: row[0])
         
         # Build a mapping of course -> list of statuses (descending by date)
         status_map = defaultdict(list)
-        for course_code, status, _ in self.cursor.fetchall():
+        for course_code, status, _ in history:
             status_map[course_code].append(status)
 
         self.current_failed_courses = []
@@ -126,28 +739,23 @@ class ScheduleOptimizer:
             f"Student {self.student_id} failed courses: {self.current_failed_courses}, skipped_any: {self.has_skipped_courses}")
         
     def _load_enrolled_courses(self):
+        selection_sql, selection_params = self._course_selection_filter()
         query = """
             SELECT ac.course_code
             FROM add_course ac
             WHERE ac.student_id = %s 
             AND ac.status = 'enrolled'
-        """
-        self.cursor.execute(query, (self.student_id,))
+        """ + selection_sql
+        self.cursor.execute(query, (self.student_id,) + selection_params)
         self.enrolled_courses = [row[0] for row in self.cursor.fetchall()]
+        if self.course_selection:
+            self.enrolled_courses += list(self.course_selection['enrolled'])
         current_app.logger.debug(f"Loaded {len(self.enrolled_courses)} enrolled courses for student {self.student_id}")
         
-        # Load course indices for enrolled courses
+        # Load course indices for enrolled courses from the timetable snapshot
         self.course_indices = {}
         if self.enrolled_courses:
-            placeholders = ', '.join(['%s'] * len(self.enrolled_courses))
-            query = f"""
-                SELECT DISTINCT course_code, course_index 
-                FROM schedule 
-                WHERE course_code IN ({placeholders})
-            """
-            self.cursor.execute(query, self.enrolled_courses)
-            for row in self.cursor.fetchall():
-                self.course_indices[row[0]] = row[1]
+            self.course_indices = self.timetable.indices_for(self.enrolled_courses)
             current_app.logger.debug(f"Loaded course indices: {self.course_indices}")
             
     def _load_course_sessions(self):
@@ -156,20 +764,7 @@ class ScheduleOptimizer:
             current_app.logger.warning("No enrolled courses found, skipping course sessions loading")
             return
             
-        placeholders = ', '.join(['%s'] * len(self.enrolled_courses))
-        query = f"""
-            SELECT course_code, lecture_sessions, tutorial_sessions, total_sessions
-            FROM course_sessions
-            WHERE course_code IN ({placeholders})
-        """
-        self.cursor.execute(query, self.enrolled_courses)
-        
-        for row in self.cursor.fetchall():
-            self.course_sessions[row[0]] = {
-                'lecture_sessions': row[1],
-                'tutorial_sessions': row[2],
-                'total_sessions': row[3]
-            }
+        self.course_sessions = self.timetable.sessions_for(self.enrolled_courses)
         current_app.logger.debug(f"Loaded session info for {len(self.course_sessions)} courses")
     
     def _load_schedule_options(self):
@@ -180,31 +775,12 @@ class ScheduleOptimizer:
         # Log the enrolled courses
         current_app.logger.debug(f"Loading schedule options for courses: {self.enrolled_courses}")
             
-        placeholders = ', '.join(['%s'] * len(self.enrolled_courses))
-        query = f"""
-            SELECT id, course_code, week_day, start_time, end_time, 
-                   professor, classroom, `group`,
-                   course_index, session_number_index,
-                   time_slot_index, professor_index,
-                   Tutprof_index, lect_prof_index
-            FROM schedule
-            WHERE course_code IN ({placeholders})
-        """
-        self.cursor.execute(query, self.enrolled_courses)
+        # Options come from the shared timetable snapshot (time_slot_index already
+        # normalised to int there); the dicts are shared and must not be mutated
+        self.schedule_options = self.timetable.options_for(self.enrolled_courses)
         
-        # Convert to list of dictionaries
-        columns = [col[0] for col in self.cursor.description]
-        self.schedule_options = []
-        
-        for row in self.cursor.fetchall():
-            option = dict(zip(columns, row))
-            # Make sure time_slot_index is an integer
-            if 'time_slot_index' in option and option['time_slot_index'] is not None:
-                try:
-                    option['time_slot_index'] = int(option['time_slot_index'])
-                except (ValueError, TypeError):
-                    current_app.logger.warning(f"Invalid time_slot_index value: {option['time_slot_index']} for course {option.get('course_code')}")
-            self.schedule_options.append(option)
+        # Index the options once so build_model does not rescan them per set
+        self.option_index = ScheduleOptionIndex(self.schedule_options)
             
         # Log results
         if not self.schedule_options:
@@ -290,14 +866,12 @@ class ScheduleOptimizer:
     def load_weight_from_db(self, priority_mode=None):
         
         # Fetch all schedule-wide parameters (weights, max solutions, time limit)
-        weight_query = (
-            "SELECT weight_mode_a, weight_mode_b, maximum_solutions, time_limit "
-            "FROM schedule_parameters LIMIT 1"
-        )
-        self.cursor.execute(weight_query)
-        weight_row = self.cursor.fetchone()
+        # from the timetable snapshot instead of querying schedule_parameters
+        if self.timetable is None:
+            self.timetable = get_timetable_snapshot(self.db)
+        parameters = self.timetable.schedule_parameters
 
-        if not weight_row:
+        if not parameters:
             error_msg = (
                 "No schedule parameters found in database. "
                 "Please add a row to the schedule_parameters table."
@@ -305,13 +879,31 @@ class ScheduleOptimizer:
             current_app.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        weight_mode_a = float(weight_row[0])
-        weight_mode_b = float(weight_row[1])
+        weight_mode_a = float(parameters['weight_mode_a'])
+        weight_mode_b = float(parameters['weight_mode_b'])
+
+        # Optional column: deployments without it use the automatic engine choice
+        self.solver_engine = parameters.get('solver_engine') or 'auto'
+        if self.solver_engine not in SOLVER_ENGINES:
+            current_app.logger.warning(f"Unknown solver_engine '{self.solver_engine}', using 'auto'")
+            self.solver_engine = 'auto'
+        self.gap_formulation = parameters.get('gap_formulation') or 'pairwise'
+        if self.gap_formulation not in GAP_FORMULATIONS:
+            current_app.logger.warning(f"Unknown gap_formulation '{self.gap_formulation}', using 'pairwise'")
+            self.gap_formulation = 'pairwise'
+        # Optional columns shaping find_all: by default exact optima that differ at all
+        self.solution_tolerance = float(parameters.get('solution_tolerance') or 0)
+        self.solution_distance = max(int(parameters.get('solution_distance') or 1), 1)
+        # Optional columns: CBC threads (CBC's default when unset) and the
+        # processes find_all may split its enumeration over (1 by default, which
+        # keeps it in this process; see ParallelSolutionEnumerator)
+        self.solver_threads = int(parameters['solver_threads']) if parameters.get('solver_threads') else None
+        self.solver_processes = max(int(parameters.get('solver_processes') or 1), 1)
 
         # Read additional global parameters -----------------------------------------
         try:
-            self.maximum_solutions = int(weight_row[2])
-            self.model_time_limit = int(weight_row[3])
+            self.maximum_solutions = int(parameters['maximum_solutions'])
+            self.model_time_limit = int(parameters['time_limit'])
         except (TypeError, ValueError):
             error_msg = "Invalid maximum_solutions or time_limit value in schedule_parameters table."
             current_app.logger.error(error_msg)
@@ -357,22 +949,11 @@ class ScheduleOptimizer:
         # This is now just a wrapper around the public method for backward compatibility
         return self.load_weight_from_db(priority_mode)
         
-    def build_model(self):
-        """Build the integer linear programming model based on the mathematical formulation"""
-        # Create the model - maximize objective function
-        model = pulp.LpProblem(name="Student_Schedule_Optimization", sense=pulp.LpMaximize)
-        
-        # If no enrolled courses or schedule options, return empty model
-        if not self.enrolled_courses or not self.schedule_options:
-            current_app.logger.warning(f"Cannot build model: enrolled_courses={len(self.enrolled_courses)}, schedule_options={len(self.schedule_options)}")
-            return model, {}, {}
-            
-        # Always load the weight from the database
-        # This will use the stored mode if no explicit priority_mode is provided
-        self.load_weight_from_db(
-            priority_mode=self.preferences.get('priority_mode') if self.preferences else None
-        )
-        
+    def _build_sets(self):
+        """Sets of the model and the FixSlot/FixProf fixings, without any PuLP objects.
+
+        Returns the dict build_model keeps as model_sets, minus the weights.
+        """
         # Define sets as in the mathematical formulation
         # Set I: indexes for the courses the student is enrolled in
         I = {}
@@ -406,20 +987,15 @@ class ScheduleOptimizer:
         
         current_app.logger.debug(f"Parameter K (total sessions per course): {K}")
         
+        # All set builders below query the option index built in _load_schedule_options
+        index = self.option_index
+        
         # Set L_i_k: time slots for session number k for course i
         L = {}
         for course_code, i in I.items():
             L[i] = {}
             for k in range(1, K[i] + 1):
-                L[i][k] = set()
-                for option in self.schedule_options:
-                    if (option['course_code'] == course_code and 
-                        option['session_number_index'] == k and
-                        'time_slot_index' in option and 
-                        option['time_slot_index'] is not None):
-                        L[i][k].add(option['time_slot_index'])
-                
-                L[i][k] = sorted(list(L[i][k]))
+                L[i][k] = index.slots_for_session(course_code, k)
                 
                 # If no time slots found, log a warning
                 if not L[i][k]:
@@ -430,27 +1006,14 @@ class ScheduleOptimizer:
         # Set Prof_i: professors who teach course i
         Prof = {}
         for course_code, i in I.items():
-            Prof[i] = set()
-            for option in self.schedule_options:
-                if (option['course_code'] == course_code and 
-                    'professor_index' in option and 
-                    option['professor_index'] is not None):
-                    Prof[i].add(option['professor_index'])
-            
-            Prof[i] = sorted(list(Prof[i]))
+            Prof[i] = index.professors_for_course(course_code)
         
         current_app.logger.debug(f"Set Prof (professors per course): {Prof}")
         
         LectProf = {}
         for course_code, i in I.items():
-            LectProf[i] = set()
             lecture_sessions = self.course_sessions.get(course_code, {}).get('lecture_sessions', 0)
-            for option in self.schedule_options:
-                if (option['course_code'] == course_code and 
-                    option['session_number_index'] <= lecture_sessions and  # lecture session
-                    option.get('professor_index') is not None):
-                    LectProf[i].add(option['professor_index'])
-            LectProf[i] = sorted(list(LectProf[i]))
+            LectProf[i] = index.professors_for_sessions(course_code, lambda k: k <= lecture_sessions)
 
         current_app.logger.debug(f"Set LectProf (lecture professors per course): {LectProf}")
         # Set T_i_p: time slots where professor p is available to teach course i
@@ -458,15 +1021,7 @@ class ScheduleOptimizer:
         for course_code, i in I.items():
             T[i] = {}
             for p in Prof[i]:
-                T[i][p] = set()
-                for option in self.schedule_options:
-                    if (option['course_code'] == course_code and
-                        option['professor_index'] == p and
-                        'time_slot_index' in option and 
-                        option['time_slot_index'] is not None):
-                        T[i][p].add(option['time_slot_index'])
-                
-                T[i][p] = sorted(list(T[i][p]))
+                T[i][p] = index.slots_for_professor(course_code, p)
         
         current_app.logger.debug(f"Set T (time slots per course and professor): {T}")
         
@@ -477,16 +1032,7 @@ class ScheduleOptimizer:
             for k in range(1, K.get(i, 0) + 1):
                 L_p[i][k] = {}
                 for p in Prof[i]:
-                    L_p[i][k][p] = set()
-                    for option in self.schedule_options:
-                        if (option['course_code'] == course_code and 
-                            option['session_number_index'] == k and
-                            option['professor_index'] == p and
-                            'time_slot_index' in option and 
-                            option['time_slot_index'] is not None):
-                            L_p[i][k][p].add(option['time_slot_index'])
-                    
-                    L_p[i][k][p] = sorted(list(L_p[i][k][p]))
+                    L_p[i][k][p] = index.slots_for_session_professor(course_code, k, p)
         
         current_app.logger.debug(f"Set L_p (time slots per course, session, and professor) created")
         
@@ -495,32 +1041,14 @@ class ScheduleOptimizer:
         for course_code, i in I_1.items():  # Only for courses with tutorials
             TutProf[i] = {}
             lecture_sessions = self.course_sessions.get(course_code, {}).get('lecture_sessions', 0)
+            is_tutorial = lambda k: k > lecture_sessions
             
             for q in Prof[i]:  # For each professor
-                TutProf[i][q] = set()
-                for option in self.schedule_options:
-                    if (option['course_code'] == course_code and 
-                        option['session_number_index'] > lecture_sessions and
-                        'lect_prof_index' in option and 
-                        option['lect_prof_index'] == q and
-                        'professor_index' in option and 
-                        option['professor_index'] is not None):
-                        TutProf[i][q].add(option['professor_index'])
-                
-                TutProf[i][q] = sorted(list(TutProf[i][q]))
+                TutProf[i][q] = index.paired_professors_for(course_code, q, is_tutorial)
                 
                 # If no specific tutorial professors found, use all tutorial professors
                 if not TutProf[i][q]:
-                    # Find all professors who teach tutorials for this course
-                    tut_profs = set()
-                    for opt in self.schedule_options:
-                        if (opt['course_code'] == course_code and
-                            opt['session_number_index'] > lecture_sessions and
-                            'professor_index' in opt and 
-                            opt['professor_index'] is not None):
-                            tut_profs.add(opt['professor_index'])
-                    
-                    TutProf[i][q] = sorted(list(tut_profs))
+                    TutProf[i][q] = index.professors_for_sessions(course_code, is_tutorial)
         
         current_app.logger.debug(f"Set TutProf (tutorial professors per lecture professor): {TutProf}")
         
@@ -548,49 +1076,31 @@ class ScheduleOptimizer:
                 if course_code in self.lecture_groups:
                     group = self.lecture_groups[course_code]
                     for k in range(1, lecture_sessions + 1):
-                        for option in self.schedule_options:
-                            if (option['course_code'] == course_code and 
-                                option['session_number_index'] == k and
-                                option['group'] == group and
-                                'time_slot_index' in option and 
-                                option['time_slot_index'] is not None):
-                                
-                                # Add this (i,k,l) to self.FixSlot
-                                self.FixSlot.append((i, k, option['time_slot_index']))
-                                fixed_courses.add(course_code)
-                                current_app.logger.debug(f"Added fixed lecture session: Course {course_code}, Session {k}, Group {group}, Time slot {option['time_slot_index']}")
+                        for l in index.slots_for_group(course_code, k, group):
+                            # Add this (i,k,l) to self.FixSlot
+                            self.FixSlot.append((i, k, l))
+                            fixed_courses.add(course_code)
+                            current_app.logger.debug(f"Added fixed lecture session: Course {course_code}, Session {k}, Group {group}, Time slot {l}")
                 
                 # Handle tutorial sessions
                 if course_code in self.tutorial_groups:
                     group = self.tutorial_groups[course_code]
                     for k in range(lecture_sessions + 1, lecture_sessions + tutorial_sessions + 1):
-                        for option in self.schedule_options:
-                            if (option['course_code'] == course_code and 
-                                option['session_number_index'] == k and
-                                option['group'] == group and
-                                'time_slot_index' in option and 
-                                option['time_slot_index'] is not None):
-                                
-                                # Add this (i,k,l) to self.FixSlot
-                                self.FixSlot.append((i, k, option['time_slot_index']))
-                                fixed_courses.add(course_code)
-                                current_app.logger.debug(f"Added fixed tutorial session: Course {course_code}, Session {k}, Group {group}, Time slot {option['time_slot_index']}")
+                        for l in index.slots_for_group(course_code, k, group):
+                            # Add this (i,k,l) to self.FixSlot
+                            self.FixSlot.append((i, k, l))
+                            fixed_courses.add(course_code)
+                            current_app.logger.debug(f"Added fixed tutorial session: Course {course_code}, Session {k}, Group {group}, Time slot {l}")
             
             # For any courses not fixed with course-specific groups, try using the main group
             if self.student_group:
                 for course_code, i in I.items():
                     if course_code not in fixed_courses:
                         for k in range(1, K[i] + 1):
-                            for option in self.schedule_options:
-                                if (option['course_code'] == course_code and 
-                                    option['session_number_index'] == k and
-                                    option['group'] == self.student_group and
-                                    'time_slot_index' in option and 
-                                    option['time_slot_index'] is not None):
-                                    
-                                    # Add this (i,k,l) to self.FixSlot
-                                    self.FixSlot.append((i, k, option['time_slot_index']))
-                                    current_app.logger.debug(f"Added fixed session using main group: Course {course_code}, Session {k}, Group {self.student_group}, Time slot {option['time_slot_index']}")
+                            for l in index.slots_for_group(course_code, k, self.student_group):
+                                # Add this (i,k,l) to self.FixSlot
+                                self.FixSlot.append((i, k, l))
+                                current_app.logger.debug(f"Added fixed session using main group: Course {course_code}, Session {k}, Group {self.student_group}, Time slot {l}")
             
             current_app.logger.info(f"Defined {len(self.FixSlot)} fixed sessions for student's groups")
         # ------------------------------------------------------------------
@@ -607,14 +1117,8 @@ class ScheduleOptimizer:
                 total_sessions = self.course_sessions.get(course_code, {}).get('total_sessions', 0)
 
                 for k in range(1, total_sessions + 1):
-                    for option in self.schedule_options:
-                        if (
-                            option['course_code'] == course_code and
-                            option['session_number_index'] == k and
-                            option.get('group') == self.student_group and
-                            option.get('time_slot_index') is not None
-                        ):
-                            self.FixSlot.append((i, k, option['time_slot_index']))
+                    for l in index.slots_for_group(course_code, k, self.student_group):
+                        self.FixSlot.append((i, k, l))
 
             current_app.logger.info(
                 f"Defined {len(self.FixSlot)} fixed sessions for failed courses (group {self.student_group}).")
@@ -635,19 +1139,11 @@ class ScheduleOptimizer:
 
         if need_prof_fix_all or need_prof_fix_failed:
             fixed_prof_set = set()
-            for option in self.schedule_options:
-                if (
-                    option.get('group') == self.student_group and
-                    option.get('professor_index') is not None and
-                    option.get('course_code') in I
-                ):
-                    course_code = option['course_code']
-                    # If we're in failed-courses case, skip other courses
-                    if need_prof_fix_failed and not need_prof_fix_all and course_code not in self.current_failed_courses:
-                        continue
-                    i = I[course_code]
-                    k = option['session_number_index']
-                    p = option['professor_index']
+            for course_code, i in I.items():
+                # If we're in failed-courses case, skip other courses
+                if need_prof_fix_failed and not need_prof_fix_all and course_code not in self.current_failed_courses:
+                    continue
+                for k, p in index.professors_for_group(course_code, self.student_group):
                     fixed_prof_set.add((i, k, p))
 
             self.FixProf = sorted(list(fixed_prof_set))
@@ -659,6 +1155,199 @@ class ScheduleOptimizer:
             current_app.logger.debug(
                 "Conditions for FixProf not met for current scenario."
             )
+
+        # Each day's slots that carry x variables, in grid order: the gap
+        # penalty and the exact engine only look at these
+        grid = self.timetable.grid
+        option_slots = {l for sessions in L.values() for slots in sessions.values() for l in slots}
+        day_slots = [[l for l in day if l in option_slots] for day in grid.days]
+
+        return {
+            'I': I, 'I_1': I_1, 'I_2': I_2, 'K': K, 'L': L, 'Prof': Prof, 'LectProf': LectProf,
+            'L_p': L_p, 'TutProf': TutProf, 'idx_to_code': idx_to_code, 'grid': grid, 'day_slots': day_slots,
+            'lecture_sessions': {i: self.course_sessions.get(code, {}).get('lecture_sessions', 0) for code, i in I.items()},
+            'tutorial_sessions': {i: self.course_sessions.get(code, {}).get('tutorial_sessions', 0) for code, i in I.items()},
+        }
+
+    def _presolve(self, sets):
+        """Shrink the sets build_model creates variables from to what a feasible schedule can use.
+
+        Only x and y variables every feasible schedule sets to 0 are removed,
+        so the model keeps its solutions and its optimum:
+
+        - a session pinned by FixSlot, or by a FixProf professor (C7b, C6),
+          keeps only the pinned slots;
+        - a session left with one slot always takes it, so the other sessions
+          lose that slot (C2);
+        - lecture k comes before lecture k+1 (C3), which trims the late end of
+          one domain and the early end of the other;
+        - a professor with no slot left in a session is never assigned to it
+          (C6), a lecture professor missing from one lecture session to none
+          of them (C4b), and a slot no remaining professor teaches is never
+          used (C4a).
+
+        The rules are applied until nothing changes. A session never loses its
+        last slot, nor a FixSlot its slot or FixProf its y: when the rules get
+        there the model is infeasible, and it is left for the solver to say
+        so. Professors are only removed where every C4a and C5 row keeps a y,
+        and lecture y of courses with tutorials are kept since they switch
+        the C5 rows on. Updates L and L_p in place and adds the removed y
+        keys (dropped_y), the slots some session always uses (busy_slots) and
+        those no session can use any more (idle_slots), and returns the
+        shrink statistics. day_slots is left as it is: a gap counts every
+        slot some option uses, so an idle slot between two used ones still
+        is one.
+        """
+        I, I_1, K, L, L_p = sets['I'], sets['I_1'], sets['K'], sets['L'], sets['L_p']
+        Prof, LectProf, TutProf = sets['Prof'], sets['LectProf'], sets['TutProf']
+        order = sets['grid'].order
+
+        domain = {(i, k): set(L[i].get(k, [])) for i in I.values() for k in range(1, K[i] + 1)}
+        x_before = sum(len(slots) for slots in domain.values())
+        kept_slots = defaultdict(set)
+        for i, k, l in self.FixSlot:
+            if l in domain.get((i, k), ()):
+                kept_slots[(i, k)].add(l)
+        kept_y = {(i, k, p) for i, k, p in self.FixProf if (i, k) in domain and p in Prof[i]}
+
+        # Per course: the C4a sessions and professors (C4b ties the lecture
+        # sessions among them) and the C3 pairs, from the sets as built
+        courses = []
+        for course_code, i in I.items():
+            lectures = sets['lecture_sessions'][i]
+            if course_code in I_1:
+                assigned, candidates = range(1, lectures + 1), LectProf[i]
+            else:
+                assigned, candidates = range(1, K[i] + 1), Prof[i]
+            tied = [k for k in range(1, lectures + 1) if (i, k) in domain] if lectures > 1 else []
+            courses.append((course_code, i, [k for k in assigned if (i, k) in domain], candidates, tied,
+                            chronology_pairs(sets, course_code, i)))
+
+        changed = True
+
+        def narrow(key, slots):
+            nonlocal changed
+            slots = (domain[key] & slots) | kept_slots[key]
+            if slots and slots != domain[key]:
+                domain[key] = slots
+                changed = True
+
+        dead = set()
+        while changed:
+            changed = False
+            for key, slots in kept_slots.items():
+                if len(slots) == 1:
+                    narrow(key, slots)
+            for i, k, p in kept_y:
+                narrow((i, k), set(L_p[i][k][p]))
+
+            # C2: a session with one slot left owns it
+            owner = {}
+            for key, slots in domain.items():
+                if len(slots) == 1:
+                    owner.setdefault(next(iter(slots)), key)
+            for key, slots in domain.items():
+                narrow(key, {l for l in slots if owner.get(l, key) == key})
+
+            for course_code, i, assigned, candidates, tied, chronology in courses:
+                # C3: session k's earliest slot bounds k+1 from below, and back
+                for k in sorted(chronology):
+                    earliest = min(order[l] for l in domain[(i, k)])
+                    narrow((i, k + 1), {l for l in domain[(i, k + 1)] if order[l] > earliest})
+                    latest = max(order[l] for l in domain[(i, k + 1)])
+                    narrow((i, k), {l for l in domain[(i, k)] if order[l] < latest})
+
+                # y at 0: no slot left (C6), another professor fixed (C4a),
+                # or at 0 in another lecture session (C4b)
+                for k in range(1, K[i] + 1):
+                    for p in Prof[i]:
+                        if not domain[(i, k)] & set(L_p[i][k][p]):
+                            dead.add((i, k, p))
+                for k in assigned:
+                    fixed = [p for p in candidates if (i, k, p) in kept_y]
+                    if len(fixed) == 1:
+                        dead.update((i, k, p) for p in candidates if p != fixed[0])
+                for p in candidates:
+                    if any((i, k, p) in dead for k in tied):
+                        dead.update((i, k, p) for k in tied)
+                dead -= kept_y
+
+                for k in assigned:
+                    taught = set()
+                    for p in candidates:
+                        if (i, k, p) not in dead:
+                            taught.update(L_p[i][k][p])
+                    narrow((i, k), taught)
+
+        # Remove dead y only where no C4a or C5 row loses all of its y
+        dropped_y = set()
+        for course_code, i, assigned, candidates, tied, chronology in courses:
+            rows = [[(i, k, p) for p in candidates] for k in assigned]
+            if course_code in I_1:
+                lectures = sets['lecture_sessions'][i]
+                tutorials = range(lectures + 1, lectures + sets['tutorial_sessions'][i] + 1)
+                rows += [[(i, k, p) for p in TutProf[i][q] if p in Prof[i]]
+                         for q in LectProf[i] for k in tutorials if (i, k) in domain]
+            if any(row and all(key in dead for key in row) for row in rows):
+                continue
+            for key in dead:
+                if key[0] == i and key not in kept_y and (course_code not in I_1 or key[1] > sets['lecture_sessions'][i]):
+                    dropped_y.add(key)
+
+        for (i, k), slots in domain.items():
+            if k in L[i]:
+                L[i][k] = [l for l in L[i][k] if l in slots]
+                for p in L_p[i][k]:
+                    L_p[i][k][p] = [l for l in L_p[i][k][p] if l in slots]
+        option_slots = set().union(*domain.values())
+        busy_slots = frozenset(next(iter(slots)) for slots in domain.values() if len(slots) == 1)
+        idle_slots = frozenset(l for slots in sets['day_slots'] for l in slots if l not in option_slots)
+
+        stats = {
+            'x_removed': x_before - sum(len(slots) for slots in domain.values()),
+            'y_removed': len(dropped_y),
+            'fixed_sessions': sum(1 for slots in domain.values() if len(slots) == 1),
+            'idle_slots': len(idle_slots),
+        }
+        if self.gap_formulation == 'pairwise':
+            stats['gap_patterns_removed'] = (len(self._gap_patterns(sets['day_slots'])) -
+                                             len(self._gap_patterns(sets['day_slots'], busy_slots, idle_slots)))
+        sets.update(dropped_y=frozenset(dropped_y), busy_slots=busy_slots, idle_slots=idle_slots)
+        return stats
+
+    def build_model(self):
+        """Build the integer linear programming model based on the mathematical formulation
+
+        The constraints only depend on model_cache_key(). When this student's
+        last model was cached under the same key it is taken back and only
+        gets a new objective; the caller hands it back with cache_model().
+        """
+        # Create the model - maximize objective function
+        model = pulp.LpProblem(name="Student_Schedule_Optimization", sense=pulp.LpMaximize)
+        
+        # If no enrolled courses or schedule options, return empty model
+        if not self.enrolled_courses or not self.schedule_options:
+            current_app.logger.warning(f"Cannot build model: enrolled_courses={len(self.enrolled_courses)}, schedule_options={len(self.schedule_options)}")
+            return model, {}, {}
+            
+        # Always load the weight from the database
+        # This will use the stored mode if no explicit priority_mode is provided
+        self.load_weight_from_db(
+            priority_mode=self.preferences.get('priority_mode') if self.preferences else None
+        )
+        
+        key = self.model_cache_key()
+        cached = get_model_cache().take(self.student_id, key)
+        if cached is not None:
+            return self._reuse_model(cached)
+        
+        sets = self._build_sets()
+        if PRESOLVE:
+            sets['presolve'] = self._presolve(sets)
+            current_app.logger.info(f"Presolve for student {self.student_id}: {sets['presolve']}")
+        I, I_1, I_2, K, L = sets['I'], sets['I_1'], sets['I_2'], sets['K'], sets['L']
+        Prof, LectProf, L_p, TutProf = sets['Prof'], sets['LectProf'], sets['L_p'], sets['TutProf']
+        idx_to_code = sets['idx_to_code']
         
         # Decision variables
         # x_i_k_l: 1 if session k for course i is scheduled in time slot l
@@ -673,161 +1362,35 @@ class ScheduleOptimizer:
                         )
         
         # y_i_k_p: 1 if professor p is assigned to session k for course i
+        # (presolve drops those it proved are 0)
+        dropped_y = sets.get('dropped_y', frozenset())
         y = {}
         for i in I.values():
             for k in range(1, K[i] + 1):
                 if k in L[i]:
                     for p in Prof[i]:
-                        y[(i, k, p)] = pulp.LpVariable(
-                            f"y_{i}_{k}_{p}", 
-                            cat=pulp.LpBinary
-                        )
+                        if (i, k, p) not in dropped_y:
+                            y[(i, k, p)] = pulp.LpVariable(
+                                f"y_{i}_{k}_{p}", 
+                                cat=pulp.LpBinary
+                            )
         
-        # Preference weights calculation
-        # Alpha: professor preference weights based on student rankings
-        alpha = {}
-        for i in I.values():
-            course_code = idx_to_code[i]
-            alpha[i] = {}
-            for p in Prof[i]:
-                # Default weight is 1 (no preference)
-                alpha[i][p] = 1
-                
-                # Check if we have preference data for this course and professor
-                if course_code in self.professor_preferences:
-                    # Get all professor preferences for this course
-                    profs_ranked = 0
-                    rank_of_p = None
-                    
-                    # Count ranked professors and find rank of p
-                    for prof_idx, rank in self.professor_preferences[course_code].items():
-                        if rank > 0:
-                            profs_ranked += 1
-                        if prof_idx == p:
-                            rank_of_p = rank
-                    
-                    # Calculate weight if professor p was ranked
-                    if rank_of_p is not None and rank_of_p > 0 and profs_ranked > 0:
-                        alpha[i][p] = profs_ranked - rank_of_p + 1
-        
-        # Beta: time slot preference weights
-        beta = {}
-        
-        # Determine the weight to use for preferred time slots
-        # Check if timeslot weights are available
-        if 'active_weight' not in self.timeslot_weights:
-            error_msg = "Timeslot weights not loaded from database. Please check the schedule_parameters table."
-            current_app.logger.error(error_msg)
-            raise ValueError(error_msg)
-            
-        timeslot_weight = self.timeslot_weights['active_weight']
-        
-        # Check if there's a weight override in the preferences
-        if self.preferences and 'timeslot_weight_override' in self.preferences:
-            timeslot_weight = float(self.preferences['timeslot_weight_override'])
-            current_app.logger.debug(f"Using override timeslot weight: {timeslot_weight}")
-        
-        current_app.logger.debug(f"Using timeslot weight: {timeslot_weight}")
-        
-        for l in range(1, 31):  # Assuming 30 time slots
-            beta[l] = 0
-            if l in self.timeslot_preferences and self.timeslot_preferences[l]:
-                beta[l] = timeslot_weight
-        
-        current_app.logger.debug(f"Beta weights for preferred timeslots: {timeslot_weight}")
+        alpha, beta = self._objective_weights(sets)
         
         # Lambda: gap penalty weight
         lambda_weight = 100  # Large number for gap penalty
         
-        # Create variables to track used time slots
-        used_slot = {}
-        for l in range(1, 31):  # Assuming 30 time slots
-            used_slot[l] = pulp.LpVariable(f"used_slot_{l}", cat=pulp.LpBinary)
-        
-        # Link used_slot variables to x variables
-        for l in range(1, 31):
-            # Collect all x variables for time slot l
-            x_vars_for_slot = []
-            for i in I.values():
-                for k in range(1, K[i] + 1):
-                    if k in L[i] and l in L[i][k]:
-                        if (i, k, l) in x:
-                            x_vars_for_slot.append(x[(i, k, l)])
-            
-            if x_vars_for_slot:
-                # If any session is scheduled in this slot, the slot is used
-                model += used_slot[l] <= pulp.lpSum(x_vars_for_slot), f"used_slot_upper_{l}"
-                model += used_slot[l] * len(x_vars_for_slot) >= pulp.lpSum(x_vars_for_slot), f"used_slot_lower_{l}"
-        
-        # Gap penalty calculation
-        gap_vars = []
-        total_gaps = 0
-        
-        # For each day (6 days, 5 slots per day)
-        for day in range(6):
-            day_slots = [day*5 + slot + 1 for slot in range(5)]  # slots for this day
-            
-            # For each possible gap pattern
-            for start_idx in range(4):  # First 4 slots
-                for end_idx in range(start_idx + 2, 5):  # At least 2 slots later
-                    # The slots at the ends that must be used
-                    first_slot = day_slots[start_idx]
-                    last_slot = day_slots[end_idx]
-                    
-                    # The slots in between (the gap)
-                    middle_slots = [day_slots[i] for i in range(start_idx + 1, end_idx)]
-                    
-                    # Create a binary variable for this gap pattern
-                    gap_var = pulp.LpVariable(f"gap_{day}_{start_idx}_{end_idx}", cat=pulp.LpBinary)
-                    gap_vars.append(gap_var)
-                    
-                    # This variable will be 1 if and only if:
-                    # 1. The first slot is used
-                    # 2. The last slot is used
-                    # 3. All middle slots are unused
-                    
-                    # Constraint: gap_var <= first_slot_used
-                    model += gap_var <= used_slot[first_slot], f"gap_first_{day}_{start_idx}_{end_idx}"
-                    
-                    # Constraint: gap_var <= last_slot_used
-                    model += gap_var <= used_slot[last_slot], f"gap_last_{day}_{start_idx}_{end_idx}"
-                    
-                    # Constraints: gap_var <= 1 - middle_slot_used (for each middle slot)
-                    for idx, mid_slot in enumerate(middle_slots):
-                        model += gap_var <= 1 - used_slot[mid_slot], f"gap_mid_{day}_{start_idx}_{end_idx}_{idx}"
-                    
-                    # Constraint: gap_var >= first_used + last_used - sum(middle_used) - 1
-                    middle_sum = pulp.lpSum([used_slot[mid] for mid in middle_slots])
-                    model += gap_var >= used_slot[first_slot] + used_slot[last_slot] - middle_sum - 1, f"gap_def_{day}_{start_idx}_{end_idx}"
-                    
-                    # Add to total gaps: gap_size * gap_var
-                    gap_size = len(middle_slots)
-                    total_gaps += gap_size * gap_var
-        
-        # Objective function
-        obj_terms = []
-        
-        # Professor preference terms
-        for i in I.values():
-            for k in range(1, K[i] + 1):
-                if k in L[i]:
-                    for p in Prof[i]:
-                        if (i, k, p) in y:
-                            obj_terms.append(alpha[i][p] * y[(i, k, p)])
-        
-        # Time slot preference terms
-        for i in I.values():
-            for k in range(1, K[i] + 1):
-                if k in L[i]:
-                    for l in L[i][k]:
-                        if (i, k, l) in x:
-                            obj_terms.append(beta[l] * x[(i, k, l)])
-        
-        # Gap penalty term
-        obj_terms.append(-lambda_weight * total_gaps)
+        # Gap penalty, in the formulation chosen by schedule_parameters.gap_formulation
+        if getattr(self, 'gap_formulation', 'pairwise') == 'span':
+            total_gaps = self._add_span_gap_penalty(model, x, sets['day_slots'],
+                                                    sets.get('idle_slots', frozenset()))
+        else:
+            total_gaps = self._add_pairwise_gap_penalty(model, x, sets['day_slots'],
+                                                        sets.get('busy_slots', frozenset()),
+                                                        sets.get('idle_slots', frozenset()))
         
         # Set objective function
-        model += pulp.lpSum(obj_terms), "Maximize_Preferences"
+        model += self._objective(sets, x, y, alpha, beta, lambda_weight, total_gaps), "Maximize_Preferences"
         
         # CONSTRAINTS
         
@@ -840,7 +1403,7 @@ class ScheduleOptimizer:
                         model += pulp.lpSum(session_vars) == 1, f"C1_one_session_{i}_{k}"
         
         # Constraint 2: No Overlapping Sessions
-        for l in range(1, 31):  # Assuming 30 time slots
+        for l in sets['grid'].slots:
             slot_vars = []
             for i in I.values():
                 for k in range(1, K[i] + 1):
@@ -851,6 +1414,8 @@ class ScheduleOptimizer:
                 model += pulp.lpSum(slot_vars) <= 1, f"C2_no_overlap_{l}"
         
         # Constraint 3: Chronological Ordering of Lecture Sessions
+        # Slots are compared by their place in the week, not their number
+        order = sets['grid'].order
         # For courses with tutorials (I_1)
         for course_code, i in I_1.items():
             lecture_sessions = self.course_sessions.get(course_code, {}).get('lecture_sessions', 0)
@@ -860,13 +1425,13 @@ class ScheduleOptimizer:
                     left_side = []
                     for l in L[i][k]:
                         if (i, k, l) in x:
-                            left_side.append(l * x[(i, k, l)])
+                            left_side.append(order[l] * x[(i, k, l)])
                     
                     # Right side: time slot for session k+1
                     right_side = []
                     for l in L[i][k+1]:
                         if (i, k+1, l) in x:
-                            right_side.append(l * x[(i, k+1, l)])
+                            right_side.append(order[l] * x[(i, k+1, l)])
                     
                     if left_side and right_side:
                         model += 1 + pulp.lpSum(left_side) <= pulp.lpSum(right_side), f"C3_chrono_I1_{i}_{k}"
@@ -880,13 +1445,13 @@ class ScheduleOptimizer:
                     left_side = []
                     for l in L[i][k]:
                         if (i, k, l) in x:
-                            left_side.append(l * x[(i, k, l)])
+                            left_side.append(order[l] * x[(i, k, l)])
                     
                     # Right side: time slot for session k+1
                     right_side = []
                     for l in L[i][k+1]:
                         if (i, k+1, l) in x:
-                            right_side.append(l * x[(i, k+1, l)])
+                            right_side.append(order[l] * x[(i, k+1, l)])
                     
                     if left_side and right_side:
                         model += 1 + pulp.lpSum(left_side) <= pulp.lpSum(right_side), f"C3_chrono_I2_{i}_{k}"
@@ -959,60 +1524,487 @@ class ScheduleOptimizer:
                                 # Exactly matching the mathematical model: sum_{p ∈ TutProf_i,q} y_i,k,p = 1
                                 model += pulp.lpSum(tut_prof_vars) == 1, f"C5_tut_prof_{i}_{k}_{q}"
         
-        # Constraint 6: Link Professor to his time slot (exactly as requested)
-        #   I₁  → p ∈ Prof_i
-        #   I₂  → p ∈ LectProf_i
+        # Constraint 6: Link Professor to his time slot (exactly as requested)
+        #   I₁  → p ∈ Prof_i
+        #   I₂  → p ∈ LectProf_i
+        
+        # Courses WITH tutorials  (i ∈ I_1)
+        for course_code, i in I_1.items():
+            for k in range(1, K[i] + 1):
+                if k in L[i]:
+                    for p in Prof[i]:
+                        if (i, k, p) in y:
+                            rhs_vars = [x[(i, k, l)] for l in L_p[i][k][p] if (i, k, l) in x]
+                            model += y[(i, k, p)] <= (pulp.lpSum(rhs_vars) if rhs_vars else 0), f"C6_I1_{i}_{k}_{p}"
+        
+        # Courses WITHOUT tutorials (i ∈ I_2)
+        for course_code, i in I_2.items():
+            for k in range(1, K[i] + 1):
+                if k in L[i]:
+                    for p in Prof[i]:
+                        if (i, k, p) in y:
+                            rhs_vars = [x[(i, k, l)] for l in L_p[i][k][p] if (i, k, l) in x]
+                            model += y[(i, k, p)] <= (pulp.lpSum(rhs_vars) if rhs_vars else 0), f"C6_I2_{i}_{k}_{p}"
+        
+        # Constraint 7: Fixed Group Sessions
+        # x_i,k,l = 1 for (i,k,l) in self.FixSlot
+        # Only apply this constraint if the student has no failed or skipped courses
+        if self.FixSlot:
+            current_app.logger.info(f"Adding Constraint 7: Fixed Group Sessions for student {self.student_id}")
+            for i, k, l in self.FixSlot:
+                if (i, k, l) in x:
+                    model += x[(i, k, l)] == 1, f"C7_FixSlot_session_{i}_{k}_{l}"
+                    current_app.logger.debug(f"Added constraint for fixed session: Course {idx_to_code.get(i, i)}, Session {k}, Time slot {l}")
+        
+        # ------------------------------------------------------------------
+        # Constraint 7 (extended): Fixed professor assignments
+        # y_{i,k,p} = 1  for all (i,k,p) in FixProf
+        # ------------------------------------------------------------------
+        if getattr(self, 'FixProf', None):
+            current_app.logger.info(
+                f"Adding Constraint 7b: Fixed professor assignments for student {self.student_id}"
+            )
+            for i, k, p in self.FixProf:
+                if (i, k, p) in y:
+                    model += y[(i, k, p)] == 1, f"C7b_fixed_professor_{i}_{k}_{p}"
+                    current_app.logger.debug(
+                        f"Added fixed professor: Course {idx_to_code.get(i, i)}, Session {k}, Prof {p}"
+                    )
+
+        # Keep the sets and weights so the exact engine can search the same model
+        self.model_sets = dict(sets, alpha=alpha, beta=beta, lambda_weight=lambda_weight)
+        self.built_model = BuiltModel(key, model, x, y, I, sets, lambda_weight, total_gaps,
+                                      list(self.FixSlot), list(self.FixProf))
+        self.model_reused = False
+        
+        return model, x, y, I
+
+    def _objective_weights(self, sets):
+        """Alpha (professor rank weights) and beta (preferred slot weights) of the objective"""
+        I, Prof, idx_to_code = sets['I'], sets['Prof'], sets['idx_to_code']
+        
+        # Preference weights calculation
+        # Alpha: professor preference weights based on student rankings
+        alpha = {}
+        for i in I.values():
+            course_code = idx_to_code[i]
+            alpha[i] = {}
+            for p in Prof[i]:
+                # Default weight is 1 (no preference)
+                alpha[i][p] = 1
+                
+                # Check if we have preference data for this course and professor
+                if course_code in self.professor_preferences:
+                    # Get all professor preferences for this course
+                    profs_ranked = 0
+                    rank_of_p = None
+                    
+                    # Count ranked professors and find rank of p
+                    for prof_idx, rank in self.professor_preferences[course_code].items():
+                        if rank > 0:
+                            profs_ranked += 1
+                        if prof_idx == p:
+                            rank_of_p = rank
+                    
+                    # Calculate weight if professor p was ranked
+                    if rank_of_p is not None and rank_of_p > 0 and profs_ranked > 0:
+                        alpha[i][p] = profs_ranked - rank_of_p + 1
+        
+        # Beta: time slot preference weights
+        beta = {}
+        
+        # Determine the weight to use for preferred time slots
+        # Check if timeslot weights are available
+        if 'active_weight' not in self.timeslot_weights:
+            error_msg = "Timeslot weights not loaded from database. Please check the schedule_parameters table."
+            current_app.logger.error(error_msg)
+            raise ValueError(error_msg)
+            
+        timeslot_weight = self.timeslot_weights['active_weight']
+        
+        # Check if there's a weight override in the preferences
+        if self.preferences and 'timeslot_weight_override' in self.preferences:
+            timeslot_weight = float(self.preferences['timeslot_weight_override'])
+            current_app.logger.debug(f"Using override timeslot weight: {timeslot_weight}")
+        
+        current_app.logger.debug(f"Using timeslot weight: {timeslot_weight}")
+        
+        for l in sets['grid'].slots:
+            beta[l] = 0
+            if l in self.timeslot_preferences and self.timeslot_preferences[l]:
+                beta[l] = timeslot_weight
+        
+        current_app.logger.debug(f"Beta weights for preferred timeslots: {timeslot_weight}")
+        
+        return alpha, beta
+
+    def _objective(self, sets, x, y, alpha, beta, lambda_weight, total_gaps):
+        """The objective expression over the model's x and y variables"""
+        I, K, L, Prof = sets['I'], sets['K'], sets['L'], sets['Prof']
+        
+        # Objective function
+        obj_terms = []
         
-        # Courses WITH tutorials  (i ∈ I_1)
-        for course_code, i in I_1.items():
+        # Professor preference terms
+        for i in I.values():
             for k in range(1, K[i] + 1):
                 if k in L[i]:
                     for p in Prof[i]:
                         if (i, k, p) in y:
-                            rhs_vars = [x[(i, k, l)] for l in L_p[i][k][p] if (i, k, l) in x]
-                            model += y[(i, k, p)] <= (pulp.lpSum(rhs_vars) if rhs_vars else 0), f"C6_I1_{i}_{k}_{p}"
+                            obj_terms.append(alpha[i][p] * y[(i, k, p)])
         
-        # Courses WITHOUT tutorials (i ∈ I_2)
-        for course_code, i in I_2.items():
+        # Time slot preference terms
+        for i in I.values():
             for k in range(1, K[i] + 1):
                 if k in L[i]:
-                    for p in Prof[i]:
-                        if (i, k, p) in y:
-                            rhs_vars = [x[(i, k, l)] for l in L_p[i][k][p] if (i, k, l) in x]
-                            model += y[(i, k, p)] <= (pulp.lpSum(rhs_vars) if rhs_vars else 0), f"C6_I2_{i}_{k}_{p}"
+                    for l in L[i][k]:
+                        if (i, k, l) in x:
+                            obj_terms.append(beta[l] * x[(i, k, l)])
         
-        # Constraint 7: Fixed Group Sessions
-        # x_i,k,l = 1 for (i,k,l) in self.FixSlot
-        # Only apply this constraint if the student has no failed or skipped courses
-        if self.FixSlot:
-            current_app.logger.info(f"Adding Constraint 7: Fixed Group Sessions for student {self.student_id}")
-            for i, k, l in self.FixSlot:
-                if (i, k, l) in x:
-                    model += x[(i, k, l)] == 1, f"C7_FixSlot_session_{i}_{k}_{l}"
-                    current_app.logger.debug(f"Added constraint for fixed session: Course {idx_to_code.get(i, i)}, Session {k}, Time slot {l}")
+        # Gap penalty term
+        obj_terms.append(-lambda_weight * total_gaps)
         
-        # ------------------------------------------------------------------
-        # Constraint 7 (extended): Fixed professor assignments
-        # y_{i,k,p} = 1  for all (i,k,p) in FixProf
-        # ------------------------------------------------------------------
-        if getattr(self, 'FixProf', None):
-            current_app.logger.info(
-                f"Adding Constraint 7b: Fixed professor assignments for student {self.student_id}"
-            )
-            for i, k, p in self.FixProf:
-                if (i, k, p) in y:
-                    model += y[(i, k, p)] == 1, f"C7b_fixed_professor_{i}_{k}_{p}"
-                    current_app.logger.debug(
-                        f"Added fixed professor: Course {idx_to_code.get(i, i)}, Session {k}, Prof {p}"
-                    )
+        return pulp.lpSum(obj_terms)
+
+    def model_cache_key(self):
+        """Everything the model's constraints depend on, or None when it must not be cached.
+
+        Preferences and weights only move the objective, so they are left out.
+        Call after load_weight_from_db.
+        """
+        version = self.timetable.version if self.timetable is not None else None
+        if version is None:
+            return None
+        return (version, self.feasibility_key(), self.gap_formulation)
+
+    def result_cache_key(self, find_all):
+        """Digest of everything a solve's result depends on, or None when it must not be shared.
+
+        The courses, FixSlot, FixProf and objective weights of the model
+        build_model returned, with the timetable version, which covers the
+        schedule parameters. Two students of one group with the same courses
+        and preferences get the same digest. Call after build_model.
+        """
+        version = self.timetable.version if self.timetable is not None else None
+        if version is None or not getattr(self, 'model_sets', None):
+            return None
+        sets = self.model_sets
+        code = sets['idx_to_code']
+        inputs = {
+            'version': version,
+            'find_all': find_all,
+            'courses': sorted(code.values()),
+            'FixSlot': sorted((code[i], k, l) for i, k, l in self.FixSlot),
+            'FixProf': sorted((code[i], k, p) for i, k, p in self.FixProf),
+            'alpha': sorted((code[i], p, weight) for i, weights in sets['alpha'].items() for p, weight in weights.items()),
+            'beta': sorted((l, weight) for l, weight in sets['beta'].items() if weight),
+            'lambda': sets['lambda_weight'],
+            'gap_formulation': self.gap_formulation,
+            # Echoed in the result and used to pick among equal options
+            'group': (self.student_group, sorted(self.lecture_groups.items()),
+                      sorted(self.tutorial_groups.items())) if self.FixSlot else None,
+        }
+        return hashlib.sha256(json.dumps(inputs, default=str).encode()).hexdigest()
+
+    def _reuse_model(self, built):
+        """Put the current preferences into a cached model's objective and use it again"""
+        alpha, beta = self._objective_weights(built.sets)
+        built.model.setObjective(
+            self._objective(built.sets, built.x, built.y, alpha, beta, built.lambda_weight, built.total_gaps))
+        built.model.objective.name = "Maximize_Preferences"
+        self.model_sets = dict(built.sets, alpha=alpha, beta=beta, lambda_weight=built.lambda_weight)
+        self.FixSlot = list(built.FixSlot)
+        self.FixProf = list(built.FixProf)
+        self.built_model = built
+        self.model_reused = True
+        current_app.logger.info(f"Reusing the cached model of student {self.student_id}")
+        return built.model, built.x, built.y, built.I
+
+    def cache_model(self):
+        """Keep the model build_model returned for this student's next solve.
+
+        Rows the enumerators added (the optimality pin and the cuts) are
+        removed first. The variables keep the last solution, which is still
+        feasible and serves as CBC's warm start when only preferences change.
+        """
+        built = self.built_model
+        self.built_model = None
+        if built is None:
+            return
+        for name in list(built.model.constraints)[built.rows:]:
+            del built.model.constraints[name]
+        # After an enumeration the variables may hold what CBC left from the
+        # last, failed solve; an invalid start would mislead the next solve
+        variables = built.model.variables()
+        if any(var.varValue is None or not var.valid(1e-6) for var in variables) or not built.model.valid():
+            for var in variables:
+                var.varValue = None
+        get_model_cache().put(self.student_id, built.key, built)
+
+    def _slot_x_vars(self, x):
+        """x variables of every time slot that has any, keyed by slot"""
+        slot_x_vars = defaultdict(list)
+        for (i, k, l), var in x.items():
+            slot_x_vars[l].append(var)
+        return slot_x_vars
+
+    def _gap_patterns(self, day_slots, busy_slots=frozenset(), idle_slots=frozenset()):
+        """(day, start_idx, end_idx) of every pairwise gap pattern, positions indexing day_slots.
+
+        A pattern is a used slot, one or more unused ones and a used slot, so
+        days with fewer than three slots have none. A slot in busy_slots is
+        always used and cannot be in between; one in idle_slots is never used
+        and cannot be at either end.
+        """
+        patterns = []
+        for day, slots in enumerate(day_slots):
+            for start_idx in range(len(slots) - 2):
+                if slots[start_idx] in idle_slots:
+                    continue
+                for end_idx in range(start_idx + 2, len(slots)):  # At least 2 slots later
+                    if slots[end_idx] not in idle_slots and busy_slots.isdisjoint(slots[start_idx + 1:end_idx]):
+                        patterns.append((day, start_idx, end_idx))
+        return patterns
+
+    def _add_pairwise_gap_penalty(self, model, x, day_slots, busy_slots=frozenset(), idle_slots=frozenset()):
+        """Gap penalty with one binary per (day, first, last) slot pair; returns the total gaps expression.
+
+        Only the slots in day_slots (those carrying x variables) take part: a
+        slot no session can use is never a gap. A day needs three of them for
+        a gap, so the other days get no variables at all. Presolve's
+        busy_slots (always used) and idle_slots (never used, and left out of
+        the sums below) rule out more pairs.
+        """
+        slot_x_vars = self._slot_x_vars(x)
+        patterns = self._gap_patterns(day_slots, busy_slots, idle_slots)
 
+        # Create variables to track the used time slots of the patterns
+        used_slot = {}
+        for day, start_idx, end_idx in patterns:
+            for l in day_slots[day][start_idx:end_idx + 1]:
+                if l not in used_slot and l not in idle_slots:
+                    used_slot[l] = pulp.LpVariable(f"used_slot_{l}", cat=pulp.LpBinary)
         
-        return model, x, y, I
+        # Link used_slot variables to x variables
+        for l, used in used_slot.items():
+            x_vars_for_slot = slot_x_vars[l]
+            # If any session is scheduled in this slot, the slot is used
+            model += used <= pulp.lpSum(x_vars_for_slot), f"used_slot_upper_{l}"
+            model += used * len(x_vars_for_slot) >= pulp.lpSum(x_vars_for_slot), f"used_slot_lower_{l}"
+        
+        # Gap penalty calculation
+        total_gaps = 0
+        
+        # For each possible gap pattern, over the day's positions in day_slots
+        for day, start_idx, end_idx in patterns:
+            slots = day_slots[day]
+            # The slots at the ends that must be used
+            first_slot = slots[start_idx]
+            last_slot = slots[end_idx]
+            
+            # The slots in between (the gap), of which only those not idle can be used
+            middle_slots = slots[start_idx + 1:end_idx]
+            usable_slots = [mid for mid in middle_slots if mid in used_slot]
+            
+            # Create a binary variable for this gap pattern
+            gap_var = pulp.LpVariable(f"gap_{day}_{start_idx}_{end_idx}", cat=pulp.LpBinary)
+            
+            # This variable will be 1 if and only if:
+            # 1. The first slot is used
+            # 2. The last slot is used
+            # 3. All middle slots are unused
+            
+            # Constraint: gap_var <= first_slot_used
+            model += gap_var <= used_slot[first_slot], f"gap_first_{day}_{start_idx}_{end_idx}"
+            
+            # Constraint: gap_var <= last_slot_used
+            model += gap_var <= used_slot[last_slot], f"gap_last_{day}_{start_idx}_{end_idx}"
+            
+            # Constraints: gap_var <= 1 - middle_slot_used (for each middle slot)
+            for idx, mid_slot in enumerate(usable_slots):
+                model += gap_var <= 1 - used_slot[mid_slot], f"gap_mid_{day}_{start_idx}_{end_idx}_{idx}"
+            
+            # Constraint: gap_var >= first_used + last_used - sum(middle_used) - 1
+            middle_sum = pulp.lpSum([used_slot[mid] for mid in usable_slots])
+            model += gap_var >= used_slot[first_slot] + used_slot[last_slot] - middle_sum - 1, f"gap_def_{day}_{start_idx}_{end_idx}"
+            
+            # Add to total gaps: gap_size * gap_var
+            gap_size = len(middle_slots)
+            total_gaps += gap_size * gap_var
+        
+        return total_gaps
+
+    def _add_span_gap_penalty(self, model, x, day_slots, idle_slots=frozenset()):
+        """Gap penalty from each day's first and last used slot; returns the total gaps expression.
+
+        Scores the same as the pairwise form: a day's gaps are its slots in
+        day_slots between the first and last used one that are not used.
+        Positions count within day_slots, so slots no session can use take no
+        part. Each day needs three variables and at most 2n - 1 rows for n
+        slots instead of n binaries and a row set per slot pair. Slots in
+        presolve's idle_slots are never used and get no rows, but still
+        count as holes.
+        """
+        slot_x_vars = self._slot_x_vars(x)
+        total_gaps = 0
+
+        for day, slots in enumerate(day_slots):
+            # A gap needs an unused slot between two used ones
+            if len(slots) < 3 or sum(1 for l in slots if l not in idle_slots) < 2:
+                continue
+            last_pos = len(slots) - 1
+
+            # used[pos]: slot usage, the x sum (at most 1 by C2)
+            used = {pos: pulp.lpSum(slot_x_vars[l]) for pos, l in enumerate(slots) if l not in idle_slots}
+
+            first = pulp.LpVariable(f"span_first_{day}", lowBound=0, upBound=last_pos)
+            last = pulp.LpVariable(f"span_last_{day}", lowBound=0, upBound=last_pos)
+            holes = pulp.LpVariable(f"span_holes_{day}", lowBound=0)
+            for pos, used_pos in used.items():
+                if pos < last_pos:
+                    model += first + last_pos * used_pos <= pos + last_pos, f"span_first_{day}_{pos}"
+                if pos > 0:
+                    model += last >= pos * used_pos, f"span_last_{day}_{pos}"
+            # An empty day leaves last - first + 1 <= 0, so holes stays at 0
+            model += holes >= last - first + 1 - pulp.lpSum(used.values()), f"span_holes_{day}"
+            total_gaps += holes
+
+        return total_gaps
+
+    def check_feasibility(self):
+        """Whether the enrolled courses have any conflict-free schedule.
+
+        Only C1, C2, C3 and the FixSlot/FixProf fixings are modelled: no
+        preference objective, gap variables or professor pairing. The
+        in-process search stops at its first solution; past the exact-engine
+        budgets the same constraints go to CBC as a pure feasibility model.
+        Returns {'feasible': bool, 'conflicts': [course codes], 'clashes':
+        [slots]}, plus a 'message' when the answer comes from missing data.
+        When infeasible, 'conflicts' is a minimal set of courses that cannot
+        be scheduled together (FeasibilitySearch.conflicts) and 'clashes' the
+        time slots those courses compete for.
+        """
+        if not self.enrolled_courses:
+            return {'feasible': False, 'conflicts': [], 'clashes': [], 'message': 'No enrolled courses found'}
+        if not self.schedule_options:
+            return {'feasible': False, 'conflicts': [], 'clashes': [],
+                    'message': 'No schedule options available for the enrolled courses'}
+        missing_sessions = [c for c in self.enrolled_courses if c not in self.course_sessions]
+        if missing_sessions:
+            return {'feasible': False, 'conflicts': missing_sessions, 'clashes': [],
+                    'message': f'Missing session information for courses: {", ".join(missing_sessions)}'}
+
+        sets = self._build_sets()
+        search = FeasibilitySearch(sets, self.FixSlot, self.FixProf,
+                                   pattern_limit=EXACT_AUTO_PATTERN_LIMIT, node_limit=EXACT_AUTO_NODE_LIMIT)
+        try:
+            feasible = search.solve()
+        except ExactSearchLimit as e:
+            current_app.logger.info(f"Feasibility search stopped ({e}), using CBC")
+            feasible = self._solve_feasibility_model(sets, search)
+
+        if feasible:
+            return {'feasible': True, 'conflicts': [], 'clashes': []}
+        try:
+            conflicts = search.conflicts()
+            clashes = self._describe_clashes(search.clashing_slots(conflicts))
+        except ExactSearchLimit:
+            # Too many patterns to expand: no smaller set can be shown
+            conflicts, clashes = list(sets['I']), []
+        current_app.logger.info(f"No conflict-free schedule for student {self.student_id}: {conflicts}")
+        return {'feasible': False, 'conflicts': conflicts, 'clashes': clashes}
+
+    def _describe_clashes(self, clashing_slots):
+        """Day and times of each course's clashing slots, from the loaded schedule options"""
+        slot_times = {}
+        for option in self.schedule_options:
+            slot_times.setdefault(option['time_slot_index'], option)
+
+        clashes = []
+        for course_code, slots in clashing_slots.items():
+            for l in slots:
+                option = slot_times.get(l)
+                clashes.append({
+                    'course_code': course_code,
+                    'time_slot': l,
+                    'day': option['week_day'] if option else None,
+                    'start_time': self._format_time(option['start_time']) if option else None,
+                    'end_time': self._format_time(option['end_time']) if option else None,
+                })
+        return clashes
+
+    def _solve_feasibility_model(self, sets, search):
+        """C1, C2 and C3 over the fixed-down slot candidates, with no objective, solved by CBC"""
+        model = pulp.LpProblem(name="Student_Schedule_Feasibility", sense=pulp.LpMinimize)
+        x = {}
+        for course_code, i in sets['I'].items():
+            candidates = search.session_candidates(i)
+            if any(not slots for _, slots in candidates):
+                return False
+            slot_of = {}
+            for k, slots in candidates:
+                for l in slots:
+                    x[(i, k, l)] = pulp.LpVariable(f"x_{i}_{k}_{l}", cat=pulp.LpBinary)
+                model += pulp.lpSum(x[(i, k, l)] for l in slots) == 1, f"C1_one_session_{i}_{k}"
+                slot_of[k] = pulp.lpSum(sets['grid'].order[l] * x[(i, k, l)] for l in slots)
+            for k in chronology_pairs(sets, course_code, i):
+                if k in slot_of and k + 1 in slot_of:
+                    model += 1 + slot_of[k] <= slot_of[k + 1], f"C3_chrono_{i}_{k}"
+
+        slot_x_vars = self._slot_x_vars(x)
+        for l, slot_vars in slot_x_vars.items():
+            model += pulp.lpSum(slot_vars) <= 1, f"C2_no_overlap_{l}"
+
+        # A constant objective, so CBC stops at its first integer solution
+        model += pulp.lpSum([]), "Feasibility"
+        self.load_weight_from_db()  # for model_time_limit
+        status = model.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=getattr(self, 'model_time_limit', None),
+                                               threads=self.solver_threads))
+        return status == pulp.LpStatusOptimal
+
+    def _cbc_enumerator(self, model, x, solver, spread, parallel):
+        """CBC enumeration, split over solver_processes processes for find_all when configured"""
+        processes = getattr(self, 'solver_processes', 1)
+        # Pool workers (batch_schedules, cohort_assignment) may not start processes
+        if parallel and processes > 1 and not multiprocessing.current_process().daemon:
+            return ParallelSolutionEnumerator(model, x, solver, processes, self.maximum_solutions,
+                                              self.model_time_limit, self.solver_threads, **spread)
+        return OptimalSolutionEnumerator(model, x, solver, **spread)
+
+    def _solution_enumerator(self, model, x, y, solver, parallel=False):
+        """Pick the solver engine for a built model, per schedule_parameters.solver_engine.
+
+        parallel allows the CBC enumeration to run in a process pool; only
+        find_all asks for it, a single solve has nothing to split.
+        """
+        engine = getattr(self, 'solver_engine', 'auto')
+        spread = {'objective_tolerance': getattr(self, 'solution_tolerance', 0),
+                  'min_distance': getattr(self, 'solution_distance', 1)}
+        if engine == 'cbc':
+            return self._cbc_enumerator(model, x, solver, spread, parallel)
+
+        if engine == 'exact':
+            # No size budget, only the configured time limit
+            exact_solver = ExactScheduleSolver(
+                self.model_sets, self.FixSlot, self.FixProf,
+                deadline=perf_counter() + self.model_time_limit)
+        else:
+            exact_solver = ExactScheduleSolver(
+                self.model_sets, self.FixSlot, self.FixProf,
+                pattern_limit=EXACT_AUTO_PATTERN_LIMIT, node_limit=EXACT_AUTO_NODE_LIMIT)
+            estimate = exact_solver.estimate_patterns()
+            if estimate > EXACT_AUTO_PATTERN_LIMIT:
+                current_app.logger.info(f"Model too large for the exact engine ({estimate} patterns), using CBC")
+                return self._cbc_enumerator(model, x, solver, spread, parallel)
+
+        current_app.logger.info(f"Solving with the exact engine (solver_engine={engine})")
+        return ExactSolutionEnumerator(model, x, y, exact_solver, solver, **spread)
             
     def solve(self, preferences=None):
         """Build and solve the optimization model"""
         # Set preferences if provided
         self.preferences = preferences
+        self.tracing = get_solver_trace().is_enabled(self.student_id)
         
         if self.preferences:
             current_app.logger.debug(f"Solving with preferences: {self.preferences}")
@@ -1025,8 +2017,12 @@ class ScheduleOptimizer:
                 'message': 'No schedule options available for the enrolled courses'
             }
         
-        # Create reverse mapping from course index to course code
-        idx_to_code = {idx: code for code, idx in I.items()}
+        # Students with the same model share one solve; a traced solve always runs
+        result_key = self.result_cache_key(find_all=False)
+        cached = None if self.tracing else get_result_cache().get(result_key)
+        if cached is not None:
+            current_app.logger.info("Using the cached result of an identical model")
+            return cached
         
         # Solve the model using the time limit specified in schedule_parameters
         solver_time = getattr(self, 'model_time_limit', None)
@@ -1035,15 +2031,20 @@ class ScheduleOptimizer:
             current_app.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        solver = pulp.PULP_CBC_CMD(msg=True, timeLimit=solver_time)
+        # A reused model still holds its last solution, which CBC starts from
+        solver = pulp.PULP_CBC_CMD(msg=current_app.config.get('SOLVER_MSG', False), timeLimit=solver_time,
+                                   warmStart=self.model_reused, threads=self.solver_threads)
         
         # Log that we're starting to solve
         current_app.logger.info("Starting to solve the optimization model...")
         
         # Check if the model has variables and constraints
-        num_vars = len(model.variables())
+        num_vars = model.numVariables()
         num_constraints = len(model.constraints)
         current_app.logger.debug(f"Model has {num_vars} variables and {num_constraints} constraints")
+        self._trace('model', variables=num_vars, constraints=num_constraints,
+                    solver_engine=self.solver_engine, gap_formulation=self.gap_formulation,
+                    reused=self.model_reused, presolve=self.model_sets.get('presolve'))
         
         # Log some of the constraints for debugging
         if num_constraints > 0:
@@ -1069,63 +2070,12 @@ class ScheduleOptimizer:
                 'has_issues': False
             }
         
-        result = model.solve(solver)
+        result = self._solution_enumerator(model, x, y, solver).solve_optimum()
         
         # Log the result status
         current_app.logger.info(f"Optimization result status: {pulp.LpStatus[result]}")
         current_app.logger.info(f"Objective value: {pulp.value(model.objective)}")
-        
-        # Print all active decision variables (x and y with value 1)
-        print("\n=== ACTIVE DECISION VARIABLES (VALUE=1) ===")
-        active_x_vars = []
-        active_y_vars = []
-        
-        for var in model.variables():
-            var_value = pulp.value(var)
-            if var_value is not None and var_value > 0.5:
-                if var.name.startswith('x_'):
-                    # Parse x_i_k_l
-                    parts = var.name.split('_')
-                    if len(parts) >= 4:
-                        i = parts[1]
-                        k = parts[2]
-                        l = parts[3]
-                        course_code = idx_to_code.get(int(i), i)
-                        active_x_vars.append(f"x({course_code},{k},{l})=1")
-                
-                elif var.name.startswith('y_'):
-                    # Parse y_i_k_p
-                    parts = var.name.split('_')
-                    if len(parts) >= 4:
-                        i = parts[1]
-                        k = parts[2]
-                        p = parts[3]
-                        course_code = idx_to_code.get(int(i), i)
-                        active_y_vars.append(f"y({course_code},{k},{p})=1")
-        
-        print("ACTIVE X VARIABLES (SCHEDULE ASSIGNMENTS):")
-        if active_x_vars:
-            for var in active_x_vars:
-                print(f"  {var}")
-        else:
-            print("  None")
-            
-        print("\nACTIVE Y VARIABLES (PROFESSOR ASSIGNMENTS):")
-        if active_y_vars:
-            for var in active_y_vars:
-                print(f"  {var}")
-        else:
-            print("  None")
-        print("="*50)
-        
-        # Log gap variables that are active in the solution
-        active_gap_vars = []
-        for var in model.variables():
-            var_value = pulp.value(var)
-            if var.name.startswith('gap_') and var_value is not None and var_value > 0.5:
-                active_gap_vars.append(f"{var.name}={var_value}")
-        
-        current_app.logger.info(f"Active gap variables: {', '.join(active_gap_vars) if active_gap_vars else 'None'}")
+        self._trace('status', status=pulp.LpStatus[result], objective_value=pulp.value(model.objective))
         
         if result != pulp.LpStatusOptimal:
             return {
@@ -1133,83 +2083,16 @@ class ScheduleOptimizer:
                 'message': f'No feasible schedule found. Status: {pulp.LpStatus[result]}'
             }
         
+        # Read the solution straight from the x and y variables
+        solution = self._read_solution(x, y)
+        current_app.logger.debug(f"Decision variables: {len(x)} x-variables, {len(y)} y-variables")
+        self._trace_solution(1, solution)
+        
         # Extract the solution using the helper method
-        solution_data = self._extract_solution(model, x, y, I, idx_to_code)
+        solution_data = self._extract_solution(solution)
         
         # Get the schedule from the solution data
-        schedule = solution_data.get('schedule', [])
-        
-        # Log how many decision variables were created
-        x_vars = [v for v in model.variables() if v.name.startswith('x_')]
-        y_vars = [v for v in model.variables() if v.name.startswith('y_')]
-        current_app.logger.debug(f"Decision variables: {len(x_vars)} x-variables, {len(y_vars)} y-variables")
-        
-        # Log the selected decision variables
-        print("\n=== DECISION VARIABLES WITH VALUE 1 ===")
-        selected_vars = []
-        x_selected = []
-        y_selected = []
-        for var in model.variables():
-            var_value = pulp.value(var)
-            if var_value is not None and var_value > 0.5:
-                selected_vars.append(var.name)
-                if var.name.startswith('x_'):
-                    x_selected.append(var.name)
-                elif var.name.startswith('y_'):
-                    y_selected.append(var.name)
-        
-        # Print x variables in a concise format
-        print("X VARIABLES (SCHEDULE ASSIGNMENTS):")
-        print(", ".join(x_selected))
-        
-        # Print y variables in a concise format
-        print("\nY VARIABLES (PROFESSOR ASSIGNMENTS):")
-        print(", ".join(y_selected))
-        
-        # Log gap variables for debugging
-        print("\n=== GAP VARIABLES ===")
-        gap_vars = []
-        for var in model.variables():
-            var_value = pulp.value(var)
-            if var.name.startswith('gap_') and var_value is not None and var_value > 0.5:
-                gap_vars.append(f"{var.name}={var_value}")
-        print(", ".join(gap_vars) if gap_vars else "No active gap variables")
-        
-        # Log used slots for debugging
-        print("\n=== USED SLOT VARIABLES ===")
-        used_slots = []
-        for var in model.variables():
-            var_value = pulp.value(var)
-            if var.name.startswith('used_slot_') and var_value is not None and var_value > 0.5:
-                used_slots.append(f"{var.name}={var_value}")
-        print(", ".join(used_slots) if used_slots else "No active used_slot variables")
-        
-        print("=======================================\n")
-        current_app.logger.debug(f"Selected variables: {selected_vars}")
-        
-        # Calculate objective components using helper methods
-        professor_preference_value = self._calculate_professor_preference(model, x, y, I, idx_to_code)
-        
-        # Use the pre-calculated values from _extract_solution if available
-        if 'objective_components' in solution_data:
-            timeslot_preference_value = solution_data['objective_components'].get('timeslot_preference_value', 0)
-            gap_penalty = solution_data['objective_components'].get('gap_penalty', 0)
-        else:
-            # Otherwise, calculate them
-            timeslot_preference_value = 0
-            gap_penalty = 0
-            
-            # Only calculate if we have a valid schedule
-            if schedule and isinstance(schedule, list):
-                try:
-                    timeslot_preference_value = self._calculate_timeslot_preference(schedule)
-                    gap_penalty = self._calculate_gap_penalty(schedule)
-                except Exception as e:
-                    current_app.logger.error(f"Error calculating preferences: {str(e)}")
-                    # Use default values if calculation fails
-        
-        # Total objective value
-        total_objective = professor_preference_value + timeslot_preference_value - gap_penalty
+        schedule = solution_data['schedule']
         
         # Verify chronological ordering of lectures
         lectures_by_course = {}
@@ -1229,11 +2112,11 @@ class ScheduleOptimizer:
                 lectures.sort(key=lambda l: l['session_number'])
                 # Check if time slots are in order
                 for i in range(len(lectures) - 1):
-                    # Convert time slots to integers for comparison
+                    # Compare time slots by their place in the week
                     current_slot = int(lectures[i]['time_slot'])
                     next_slot = int(lectures[i+1]['time_slot'])
                     
-                    if current_slot >= next_slot:
+                    if self.timetable.grid.order[current_slot] >= self.timetable.grid.order[next_slot]:
                         current_app.logger.warning(
                             f"Ordering issue for course {course_code}: lecture {lectures[i]['session_number']} " +
                             f"(slot {current_slot}) should be before lecture {lectures[i+1]['session_number']} " +
@@ -1246,37 +2129,36 @@ class ScheduleOptimizer:
             current_app.logger.warning("Empty schedule despite successful optimization")
             
             # Check why the schedule is empty
-            selected_x_vars = [v.name for v in model.variables() if v.name.startswith('x_') and pulp.value(v) > 0.5]
-            if selected_x_vars:
+            if solution.x:
                 current_app.logger.warning(f"Selected x-variables exist but schedule is empty - possible data issue")
-                current_app.logger.debug(f"Selected x-variables: {selected_x_vars}")
+                current_app.logger.debug(f"Selected x-variables: {solution.x}")
             else:
                 current_app.logger.warning("No x-variables were selected by the optimizer")
         else:
             current_app.logger.info(f"Successfully generated schedule with {len(schedule)} sessions")
         
         # Return the optimized schedule with detailed information
-        return {
+        result = {
             'success': True,
             'schedule': schedule,
-            'objective_components': {
-                'professor_preference_value': professor_preference_value,
-                'timeslot_preference_value': timeslot_preference_value,
-                'gap_penalty': gap_penalty
-            },
-            'total_objective_value': total_objective,
+            'objective_components': solution.objective_components(),
+            'total_objective_value': solution.total_objective_value,
             'model_objective_value': pulp.value(model.objective),
             'has_issues': solution_data.get('has_issues', has_issues),
             'message': "Schedule generated successfully" if len(schedule) > 0 else "No valid schedule could be generated - try adjusting preferences",
             'FixSlotroup_sessions': len(self.FixSlot) > 0,
             'student_group': self.student_group if len(self.FixSlot) > 0 else None,
             'lecture_groups': self.lecture_groups if len(self.FixSlot) > 0 else {},
-            'tutorial_groups': self.tutorial_groups if len(self.FixSlot) > 0 else {}
+            'tutorial_groups': self.tutorial_groups if len(self.FixSlot) > 0 else {},
+            'model_size': self._model_size(num_vars, num_constraints)
         }
+        get_result_cache().put(result_key, self.timetable.version, result)
+        return result
 
-    def _extract_solution(self, model, x, y, I, idx_to_code):
-        """Extract a solution from the solved model"""
+    def _extract_solution(self, solution):
+        """Schedule rows and objective components of a ModelSolution"""
         schedule = []
+        idx_to_code = self.model_sets['idx_to_code']
         
         # First, collect all the selected time slots from x variables
         selected_slots = []
@@ -1284,40 +2166,17 @@ class ScheduleOptimizer:
         fixslot_set = set(self.FixSlot)
         fixprof_set = set(self.FixProf)
         
-        for var in model.variables():
-            var_name = var.name
-            var_value = pulp.value(var)
-            # Check if var_value is not None before comparing
-            if var_name.startswith('x_') and var_value is not None and var_value > 0.5:
-                # Parse the variable name to extract i, k, l
-                parts = var_name.split('_')
-                if len(parts) >= 4:
-                    i = int(parts[1])
-                    k = int(parts[2])
-                    l = int(parts[3])
-                    
-                    # Get the course code from the index
-                    course_code = idx_to_code.get(i)
-                    if not course_code:
-                        current_app.logger.warning(f"No course code found for index {i}")
-                        continue
-                    
-                    selected_slots.append((course_code, k, l, i))
+        for i, k, l in solution.x:
+            # Get the course code from the index
+            course_code = idx_to_code.get(i)
+            if not course_code:
+                current_app.logger.warning(f"No course code found for index {i}")
+                continue
+            
+            selected_slots.append((course_code, k, l, i))
         
         if not selected_slots:
             current_app.logger.warning("No schedule slots selected in the solution")
-            # Log all variables with non-zero values to help debug
-            non_zero_vars = []
-            for var in model.variables():
-                var_value = pulp.value(var)
-                if var_value is not None and abs(var_value) > 1e-6:
-                    non_zero_vars.append(f"{var.name}={var_value}")
-            
-            if non_zero_vars:
-                current_app.logger.debug(f"Non-zero variables in solution: {', '.join(non_zero_vars)}")
-            else:
-                current_app.logger.warning("No non-zero variables found in solution")
-            
             return {
                 'schedule': [],
                 'objective_components': {
@@ -1329,75 +2188,25 @@ class ScheduleOptimizer:
                 'has_issues': False
             }
         
-        # Build a query to fetch all schedule data in a single database call
-        query_parts = []
-        query_params = []
+        # Look up the full option rows for the selected (course, session, slot) triples
+        # in the loaded options, which come from the timetable snapshot
+        selected_keys = {(course_code, session_number, time_slot) for course_code, session_number, time_slot, _ in selected_slots}
+        schedule_options = {}
         
-        for course_code, session_number, time_slot, _ in selected_slots:
-            query_parts.append("(course_code = %s AND session_number_index = %s AND time_slot_index = %s)")
-            query_params.extend([course_code, session_number, time_slot])
+        # Create a lookup dictionary keyed by (course_code, session_number, time_slot)
+        for option in self.schedule_options:
+            key = (option['course_code'], option['session_number_index'], option['time_slot_index'])
+            if key in selected_keys:
+                schedule_options.setdefault(key, []).append(option)
         
-        # Execute a single query to get all schedule options
-        cursor = self.db.cursor()
-        try:
-            # Ensure we get ALL relevant details for accurate matching
-            query = f"""
-                SELECT id, course_code, week_day, start_time, end_time, 
-                       professor, classroom, `group`, session_type,
-                       course_index, session_number_index, time_slot_index, 
-                       professor_index, Tutprof_index, lect_prof_index
-                FROM schedule 
-                WHERE {" OR ".join(query_parts)}
-            """
-            cursor.execute(query, query_params)
-            columns = [col[0] for col in cursor.description]
-            schedule_options = {}
-            
-            # Create a lookup dictionary keyed by (course_code, session_number, time_slot)
-            for row in cursor.fetchall():
-                option = dict(zip(columns, row))
-                key = (option['course_code'], option['session_number_index'], option['time_slot_index'])
-                if key not in schedule_options:
-                    schedule_options[key] = []
-                schedule_options[key].append(option)
-            
-            current_app.logger.debug(f"Fetched {len(schedule_options)} unique schedule options from database")
-        except Exception as e:
-            current_app.logger.error(f"Error querying schedule table: {e}")
-            return {
-                'schedule': [],
-                'objective_components': {
-                    'professor_preference_value': 0,
-                    'timeslot_preference_value': 0,
-                    'gap_penalty': 0
-                },
-                'total_objective_value': 0,
-                'has_issues': True
-            }
-        finally:
-            cursor.close()
+        current_app.logger.debug(f"Matched {len(schedule_options)} unique schedule options from the timetable snapshot")
         
-        # Find professor assignments from y variables
+        # Find professor assignments from y variables, keyed by (course_code, session_number)
         professor_assignments = {}
-        
-        for var in model.variables():
-            var_name = var.name
-            var_value = pulp.value(var)
-            # Check if var_value is not None before comparing
-            if var_name.startswith('y_') and var_value is not None and var_value > 0.5:
-                parts = var_name.split('_')
-                if len(parts) >= 4:
-                    i = int(parts[1])  # course index
-                    k = int(parts[2])  # session number
-                    p = int(parts[3])  # professor index
-                    
-                    course_code = idx_to_code.get(i)
-                    if not course_code:
-                        continue
-                    
-                    # Use (course_code, session_number) as key without time slot
-                    key = (course_code, k)
-                    professor_assignments[key] = p
+        for i, k, p in solution.y:
+            course_code = idx_to_code.get(i)
+            if course_code:
+                professor_assignments[(course_code, k)] = p
         
         # Now create the schedule items using the fetched data
         for course_code, session_number, time_slot, i in selected_slots:
@@ -1582,29 +2391,18 @@ class ScheduleOptimizer:
         else:
             current_app.logger.warning("Empty schedule after extraction")
         
-        # Calculate objective components
-        professor_preference_value = self._calculate_professor_preference(model, x, y, I, idx_to_code)
-        timeslot_preference_value = self._calculate_timeslot_preference(schedule)
-        gap_penalty = self._calculate_gap_penalty(schedule)
-        
         return {
             'schedule': schedule,
-            'objective_components': {
-                'professor_preference_value': professor_preference_value,
-                'timeslot_preference_value': timeslot_preference_value,
-                'gap_penalty': gap_penalty
-            },
-            'total_objective_value': professor_preference_value + timeslot_preference_value - gap_penalty,
+            'objective_components': solution.objective_components(),
+            'total_objective_value': solution.total_objective_value,
             'has_issues': False
         }
 
     def find_all_optimal_solutions(self, random_seed=None, preferences=None):
         """Find all optimal solutions using an iterative approach"""
-        # Import time module for generating unique constraint IDs
-        import time
-        
         # Set preferences if provided
         self.preferences = preferences
+        self.tracing = get_solver_trace().is_enabled(self.student_id)
         
         if self.preferences:
             current_app.logger.debug(f"Finding all optimal solutions with preferences: {self.preferences}")
@@ -1625,13 +2423,20 @@ class ScheduleOptimizer:
                 'solutions': []
             }
         
-        # Create reverse mapping from course index to course code
-        idx_to_code = {idx: code for code, idx in I.items()}
+        # Students with the same model share one solve; a traced solve always runs
+        result_key = self.result_cache_key(find_all=True)
+        cached = None if self.tracing else get_result_cache().get(result_key)
+        if cached is not None:
+            current_app.logger.info("Using the cached solutions of an identical model")
+            return cached
         
         # Check if the model has variables and constraints
-        num_vars = len(model.variables())
+        num_vars = model.numVariables()
         num_constraints = len(model.constraints)
         current_app.logger.debug(f"Model has {num_vars} variables and {num_constraints} constraints")
+        self._trace('model', variables=num_vars, constraints=num_constraints,
+                    solver_engine=self.solver_engine, gap_formulation=self.gap_formulation,
+                    reused=self.model_reused, presolve=self.model_sets.get('presolve'))
         
         # Log some of the constraints for debugging
         if num_constraints > 0:
@@ -1656,14 +2461,18 @@ class ScheduleOptimizer:
             current_app.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        solver = pulp.PULP_CBC_CMD(msg=True, timeLimit=solver_time)
+        # A reused model still holds its last solution, which CBC starts from
+        solver = pulp.PULP_CBC_CMD(msg=current_app.config.get('SOLVER_MSG', False), timeLimit=solver_time,
+                                   warmStart=self.model_reused, threads=self.solver_threads)
         
         # Store all solutions
         all_solutions = []
         
-        # Solve the initial model
+        # Solve the initial model; later iterations reuse it through the enumerator
         current_app.logger.info("Starting to find all optimal solutions...")
-        result = model.solve(solver)
+        enumerator = self._solution_enumerator(model, x, y, solver, parallel=True)
+        result = enumerator.solve_optimum()
+        self._trace('status', status=pulp.LpStatus[result], objective_value=enumerator.optimal_value)
         
         if result != pulp.LpStatusOptimal:
             return {
@@ -1673,17 +2482,12 @@ class ScheduleOptimizer:
             }
         
         # Store the optimal objective value
-        optimal_objective_value = pulp.value(model.objective)
+        optimal_objective_value = enumerator.optimal_value
         if optimal_objective_value is None:
             current_app.logger.warning("Objective value is None")
             
         current_app.logger.info(f"Found initial optimal solution with objective value: {optimal_objective_value}")
         
-        # Print detailed breakdown of objective value components
-        print("\n" + "="*80)
-        print("OBJECTIVE VALUE COMPONENT BREAKDOWN")
-        print("="*80)
-        
         # Keep track of how many solutions we've found
         solution_count = 0
         if not hasattr(self, 'maximum_solutions'):
@@ -1692,64 +2496,20 @@ class ScheduleOptimizer:
             raise ValueError(error_msg)
 
         max_solutions = self.maximum_solutions  # Strictly use DB value
-        
-        # Print header for solution scores in terminal
-        print("\n" + "="*80)
-        print("OPTIMAL SCHEDULE SOLUTIONS WEIGHTED SCORES")
-        print("="*80)
-        print(f"{'#':<3} {'Total Score':<12} {'Prof Pref':<12} {'Time Pref':<12} {'Gap Penalty':<12} {'Sessions':<8}")
-        print("-"*80)
+        # Top-K mode: the best max_solutions schedules within solution_tolerance
+        # of the optimum, each at least solution_distance apart
+        top_k = self.solution_tolerance > 0 or self.solution_distance > 2
         
         while solution_count < max_solutions:
             # Extract the current solution
-            current_solution = self._extract_solution(model, x, y, I, idx_to_code)
+            solution = self._read_solution(x, y)
+            current_solution = self._extract_solution(solution)
             
             if not current_solution['schedule']:
                 current_app.logger.warning("Empty schedule in solution, stopping iteration")
                 break
                 
-            # Print all active decision variables for this solution
-            print(f"\n=== SOLUTION {solution_count + 1} ACTIVE DECISION VARIABLES (VALUE=1) ===")
-            active_x_vars = []
-            active_y_vars = []
-            
-            for var in model.variables():
-                var_value = pulp.value(var)
-                if var_value is not None and var_value > 0.5:
-                    if var.name.startswith('x_'):
-                        # Parse x_i_k_l
-                        parts = var.name.split('_')
-                        if len(parts) >= 4:
-                            i = parts[1]
-                            k = parts[2]
-                            l = parts[3]
-                            course_code = idx_to_code.get(int(i), i)
-                            active_x_vars.append(f"x({course_code},{k},{l})=1")
-                    
-                    elif var.name.startswith('y_'):
-                        # Parse y_i_k_p
-                        parts = var.name.split('_')
-                        if len(parts) >= 4:
-                            i = parts[1]
-                            k = parts[2]
-                            p = parts[3]
-                            course_code = idx_to_code.get(int(i), i)
-                            active_y_vars.append(f"y({course_code},{k},{p})=1")
-            
-            print(f"SOLUTION {solution_count + 1} - ACTIVE X VARIABLES (SCHEDULE ASSIGNMENTS):")
-            if active_x_vars:
-                for var in sorted(active_x_vars):
-                    print(f"  {var}")
-            else:
-                print("  None")
-                
-            print(f"\nSOLUTION {solution_count + 1} - ACTIVE Y VARIABLES (PROFESSOR ASSIGNMENTS):")
-            if active_y_vars:
-                for var in sorted(active_y_vars):
-                    print(f"  {var}")
-            else:
-                print("  None")
-            print("="*50)
+            self._trace_solution(solution_count + 1, solution)
             
             # Add debug logging to check the solution format
             current_app.logger.debug(f"Solution {solution_count + 1} details: {len(current_solution['schedule'])} sessions")
@@ -1773,191 +2533,117 @@ class ScheduleOptimizer:
             gap_penalty = current_solution['objective_components']['gap_penalty']
             if gap_penalty > 0:
                 current_app.logger.warning(f"Solution {solution_count + 1} has gaps with penalty {gap_penalty}")
-                # Log the schedule to help debug
-                for session in current_solution['schedule']:
-                    current_app.logger.debug(f"Session: {session['course_code']} on {session['day']} at {session['start_time']}, slot {session['time_slot']}")
+            
+            if top_k and optimal_objective_value is not None:
+                # Distance from the optimum on the model's weighted objective
+                current_solution['objective_gap'] = round(
+                    optimal_objective_value - pulp.value(model.objective), 6)
             
             # Add the solution to our list
             all_solutions.append(current_solution)
             solution_count += 1
             
-            # Print solution scores in terminal
             total_score = current_solution['total_objective_value']
             prof_pref = current_solution['objective_components']['professor_preference_value']
             time_pref = current_solution['objective_components']['timeslot_preference_value']
             gap_pen = current_solution['objective_components']['gap_penalty']
-            sessions_count = len(current_solution['schedule'])
-            
-            print(f"{solution_count:<3} {total_score:<12.2f} {prof_pref:<12.2f} {time_pref:<12.2f} {gap_pen:<12.2f} {sessions_count:<8}")
             
             current_app.logger.info(f"Found solution {solution_count} with {len(current_solution['schedule'])} sessions, objective value: {total_score}")
             current_app.logger.info(f"  Prof pref: {prof_pref}, Time pref: {time_pref}, Gap penalty: {gap_pen}")
             
-            # Add a constraint to exclude this solution
-            # We need to identify all active x variables in the current solution
-            active_x_vars = []
-            for var in model.variables():
-                var_value = pulp.value(var)
-                if var.name.startswith('x_') and var_value is not None and var_value > 0.5:
-                    active_x_vars.append(var)
-            
-            if not active_x_vars:
-                current_app.logger.warning("No active x decision variables in solution, stopping iteration")
+            if solution_count >= max_solutions:
                 break
-                
-            # Create a constraint that ensures we don't get the same solution again
-            # Sum of all active decision variables must be less than the number of active variables
-            unique_id = int(time.time() * 1000) % 10000  # Get milliseconds as unique ID
-            constraint_name = f"exclude_solution_{solution_count}_{unique_id}"
-            model += pulp.lpSum(active_x_vars) <= len(active_x_vars) - 1, constraint_name
-            
-            # Add a constraint to maintain optimality
-            model += model.objective >= optimal_objective_value, f"maintain_optimality_{solution_count}_{unique_id}"
             
+            # Exclude this solution with a cut and search the same model for
+            # another solution within the objective tolerance
             current_app.logger.info(f"Added constraints to exclude solution {solution_count} and searching for next solution...")
-            
-            # Solve again
-            result = model.solve(solver)
-            
-            # Check if we found another optimal solution
-            if result != pulp.LpStatusOptimal:
-                current_app.logger.info(f"No more optimal solutions found. Status: {pulp.LpStatus[result]}")
-                break
-            
-            # Check if the objective value is still optimal
-            new_obj_value = pulp.value(model.objective)
-            if new_obj_value is None or new_obj_value < optimal_objective_value - 0.001:  # Allow for small numerical differences
-                current_app.logger.info(f"Next solution has lower objective value ({new_obj_value}), stopping search")
+            if not enumerator.next_solution():
                 break
         
-        # Print footer
-        print("-"*80)
-        print(f"Total optimal solutions found: {len(all_solutions)}")
-        print("="*80 + "\n")
-        
         current_app.logger.info(f"Found {len(all_solutions)} optimal solutions")
+        self._trace('summary', solutions=len(all_solutions), objective_value=optimal_objective_value)
         
         # If only one solution was found, make sure to mention that in the message
         message = f"Found {len(all_solutions)} optimal schedule"
-        if len(all_solutions) == 1:
+        if top_k:
+            message = (f"Found {len(all_solutions)} schedule{'' if len(all_solutions) == 1 else 's'} "
+                       f"within {self.solution_tolerance:g} of the best score")
+        elif len(all_solutions) == 1:
             message += ". There is only one optimal solution for this configuration."
         else:
             message += "s"
         
-        return {
+        result = {
             'success': True,
             'message': message,
             'solutions': all_solutions,
-            'objective_value': optimal_objective_value
+            'objective_value': optimal_objective_value,
+            'model_size': self._model_size(num_vars, num_constraints)
         }
+        get_result_cache().put(result_key, self.timetable.version, result)
+        return result
     
-    def _calculate_professor_preference(self, model, x, y, I, idx_to_code):
-        """Calculate professor preference value from the model solution"""
-        professor_preference_value = 0
-        
-        # Process each active y variable to calculate professor preference
-        for var in model.variables():
-            var_name = var.name
-            var_value = pulp.value(var)
-            # Check if var_value is not None before comparing
-            if var_name.startswith('y_') and var_value is not None and var_value > 0.5:
-                parts = var_name.split('_')
-                if len(parts) >= 4:
-                    i = int(parts[1])  # course index
-                    k = int(parts[2])  # session number
-                    p = int(parts[3])  # professor index
-                    
-                    # Get course code from index
-                    course_code = idx_to_code.get(i)
-                    if not course_code:
-                        continue
-                    
-                    # Default weight is 1 (no preference)
-                    weight = 1
-                    
-                    # Check if we have preference data for this course and professor
-                    if course_code in self.professor_preferences and p in self.professor_preferences[course_code]:
-                        # Get all professor preferences for this course
-                        profs_ranked = 0
-                        rank_of_p = self.professor_preferences[course_code][p]
-                        
-                        # Count ranked professors
-                        for prof_idx, rank in self.professor_preferences[course_code].items():
-                            if rank > 0:
-                                profs_ranked += 1
-                        
-                        # Calculate weight if professor p was ranked
-                        if rank_of_p is not None and rank_of_p > 0 and profs_ranked > 0:
-                            weight = profs_ranked - rank_of_p + 1
-                    
-                    professor_preference_value += weight
+    def _model_size(self, variables, constraints):
+        """Rows and columns of the model as solved, with what presolve removed before building it"""
+        return dict(variables=variables, constraints=constraints, **(self.model_sets.get('presolve') or {}))
+
+    def _read_solution(self, x, y):
+        """ModelSolution of the values the x and y variables currently hold, in one pass"""
+        idx_to_code = self.model_sets['idx_to_code']
+        active_x = [key for key, var in x.items() if var.varValue is not None and var.varValue > 0.5]
+        active_y = [key for key, var in y.items() if var.varValue is not None and var.varValue > 0.5]
         
-        return professor_preference_value
+        # Professor preference: the rank weight of each assigned session, 1 when unranked
+        professor_preference_value = 0
+        for i, k, p in active_y:
+            course_code = idx_to_code.get(i)
+            if not course_code:
+                continue
+            ranks = self.professor_preferences.get(course_code, {})
+            rank_of_p = ranks.get(p)
+            profs_ranked = sum(1 for rank in ranks.values() if rank > 0)
+            if rank_of_p is not None and rank_of_p > 0 and profs_ranked > 0:
+                professor_preference_value += profs_ranked - rank_of_p + 1
+            else:
+                professor_preference_value += 1
+        
+        # Time slot preference: one point per session in a preferred slot
+        timeslot_preference_value = sum(1 for _, _, l in active_x if self.timeslot_preferences.get(l))
+        
+        # Gap penalty: empty grid slots between consecutive used slots of a day
+        grid = self.model_sets['grid']
+        used_by_day = defaultdict(list)
+        for _, _, l in active_x:
+            used_by_day[grid.day_of[l]].append(grid.position[l])
+        gaps = 0
+        for positions in used_by_day.values():
+            positions.sort()
+            gaps += sum(later - earlier - 1 for earlier, later in zip(positions, positions[1:]))
+        if gaps:
+            current_app.logger.debug(f"Solution leaves {gaps} empty slots between sessions")
+        
+        return ModelSolution(active_x, active_y, professor_preference_value, timeslot_preference_value,
+                             gaps * self.model_sets['lambda_weight'])
     
-    def _calculate_timeslot_preference(self, schedule):
-        """Calculate timeslot preference value for a given schedule"""
-        timeslot_preference_value = 0
-        
-        for session in schedule:
-            time_slot = session['time_slot']
-            if time_slot in self.timeslot_preferences and self.timeslot_preferences[time_slot]:
-                timeslot_preference_value += 1
-        
-        return timeslot_preference_value
+    def _trace(self, event, **data):
+        """Record an entry in the solver trace if tracing is on for this solve"""
+        if self.tracing:
+            get_solver_trace().record(self.student_id, event, **data)
+    
+    def _trace_solution(self, number, solution):
+        """Trace the active x and y variables of a solution, with course codes, and its scores"""
+        if not self.tracing:
+            return
+        idx_to_code = self.model_sets['idx_to_code']
+        self._trace(
+            'solution',
+            number=number,
+            x=sorted((str(idx_to_code.get(i, i)), k, l) for i, k, l in solution.x),
+            y=sorted((str(idx_to_code.get(i, i)), k, p) for i, k, p in solution.y),
+            objective_components=solution.objective_components(),
+            total_objective_value=solution.total_objective_value
+        )
     
-    def _calculate_gap_penalty(self, schedule, lambda_weight=100):
-        """Calculate gap penalty for a given schedule"""
-        # Create a dictionary to track used time slots by day
-        used_slots_by_day = {}
-        for session in schedule:
-            day = session['day']
-            time_slot = int(session['time_slot'])
-            
-            if day not in used_slots_by_day:
-                used_slots_by_day[day] = set()
-            used_slots_by_day[day].add(time_slot)
-        
-        # Count gaps in each day
-        gap_penalty = 0
-        gaps_found = []
-        
-        for day, time_slots in used_slots_by_day.items():
-            # Skip days with 0 or 1 session
-            if len(time_slots) <= 1:
-                continue
-            
-            # Get day index (0-5)
-            day_idx = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'].index(day)
-            
-            # Get the day's slots (1-5)
-            day_slots = [day_idx*5 + slot + 1 for slot in range(5)]
-            
-            # For each possible gap pattern
-            for start_idx in range(4):  # First 4 slots
-                for end_idx in range(start_idx + 2, 5):  # At least 2 slots later
-                    first_slot = day_slots[start_idx]
-                    last_slot = day_slots[end_idx]
-                    
-                    # The slots in between (the potential gap)
-                    middle_slots = [day_slots[i] for i in range(start_idx + 1, end_idx)]
-                    
-                    # Check if this is a gap: first and last slots used, all middle slots empty
-                    if (first_slot in time_slots and 
-                        last_slot in time_slots and 
-                        all(mid not in time_slots for mid in middle_slots)):
-                        
-                        # Gap size is the number of empty slots
-                        gap_size = len(middle_slots)
-                        gap_penalty += gap_size
-                        gaps_found.append(f"{gap_size}-slot gap on {day}: slots {first_slot}-{last_slot}")
-        
-        # Log any gaps found
-        if gaps_found:
-            current_app.logger.warning(f"Found {len(gaps_found)} gaps in schedule: {', '.join(gaps_found)}")
-        
-        # Apply the weight to the gap penalty
-        return gap_penalty * lambda_weight
-
     def _format_time(self, time_obj):
         """Format time object to HH:MM string format"""
         if isinstance(time_obj, time):
@@ -1984,7 +2670,8 @@ class ScheduleOptimizer:
             # For any other type, convert to string
             return str(time_obj)
 
-def optimize_student_schedule(student_id, db_connection=None, random_seed=None, preferences=None, find_all=False):
+def optimize_student_schedule(student_id, db_connection=None, random_seed=None, preferences=None, find_all=False,
+                              course_selection=None):
   
     close_connection = False
     
@@ -2000,70 +2687,9 @@ def optimize_student_schedule(student_id, db_connection=None, random_seed=None,
             close_connection = True
         
         # Create and run optimizer
-        optimizer = ScheduleOptimizer(db_connection, student_id)
+        optimizer = ScheduleOptimizer(db_connection, student_id, course_selection)
         optimizer.load_data()
-        
-        # Check if student has enrolled courses
-        if not optimizer.enrolled_courses:
-            return {
-                'success': False,
-                'message': 'No enrolled courses found'
-            }
-        
-        # Check if we have schedule options for the enrolled courses
-        if not optimizer.schedule_options:
-            return {
-                'success': False,
-                'message': 'No schedule options available for the enrolled courses'
-            }
-        
-        # Check if we have session information for the enrolled courses
-        missing_sessions = [c for c in optimizer.enrolled_courses if c not in optimizer.course_sessions]
-        if missing_sessions:
-            return {
-                'success': False,
-                'message': f'Missing session information for courses: {", ".join(missing_sessions)}'
-            }
-        
-        # Build and solve the model
-        if find_all:
-            result = optimizer.find_all_optimal_solutions(random_seed, preferences)
-            # If we found solutions, add semester and year info to the solutions
-            if result['success'] and 'solutions' in result and result['solutions'] and len(result['solutions']) > 0 and 'schedule' in result['solutions'][0]:
-                cursor = db_connection.cursor()
-                cursor.execute("""
-                    SELECT DISTINCT ac.semester, ac.year 
-                    FROM add_course ac
-                    WHERE ac.student_id = %s AND ac.status = 'enrolled'
-                    ORDER BY ac.year DESC, ac.semester DESC
-                    LIMIT 1
-                """, (student_id,))
-                semester_info = cursor.fetchone()
-                if semester_info:
-                    for solution in result['solutions']:
-                        solution['semester'] = semester_info[0]
-                        solution['year'] = semester_info[1]
-                cursor.close()
-        else:
-            result = optimizer.solve(preferences)
-            
-            # Get semester and year info for display
-            if result['success'] and 'schedule' in result and result['schedule']:
-                cursor = db_connection.cursor()
-                cursor.execute("""
-                    SELECT DISTINCT ac.semester, ac.year 
-                    FROM add_course ac
-                    WHERE ac.student_id = %s AND ac.status = 'enrolled'
-                    ORDER BY ac.year DESC, ac.semester DESC
-                    LIMIT 1
-                """, (student_id,))
-                semester_info = cursor.fetchone()
-                if semester_info:
-                    result['semester'] = semester_info[0]
-                    result['year'] = semester_info[1]
-                cursor.close()
-            
-        return result
+        return _optimize_loaded(optimizer, db_connection, student_id, random_seed, preferences, find_all)
         
     except Exception as e:
         current_app.logger.error(f"Error in schedule optimization: {str(e)}", exc_info=True)
@@ -2074,4 +2700,110 @@ def optimize_student_schedule(student_id, db_connection=None, random_seed=None,
     finally:
         # Close connection if we created it
         if close_connection and db_connection:
-            db_connection.close() 
\ No newline at end of file
+            db_connection.close()
+
+
+def _optimize_loaded(optimizer, db_connection, student_id, random_seed=None, preferences=None, find_all=False):
+    """Solve for an optimizer whose data is loaded; the body of optimize_student_schedule"""
+    # Check if student has enrolled courses
+    if not optimizer.enrolled_courses:
+        return {
+            'success': False,
+            'message': 'No enrolled courses found'
+        }
+    
+    # Check if we have schedule options for the enrolled courses
+    if not optimizer.schedule_options:
+        return {
+            'success': False,
+            'message': 'No schedule options available for the enrolled courses'
+        }
+    
+    # Check if we have session information for the enrolled courses
+    missing_sessions = [c for c in optimizer.enrolled_courses if c not in optimizer.course_sessions]
+    if missing_sessions:
+        return {
+            'success': False,
+            'message': f'Missing session information for courses: {", ".join(missing_sessions)}'
+        }
+    
+    # Build and solve the model; the student's next solve can reuse it
+    if find_all:
+        result = optimizer.find_all_optimal_solutions(random_seed, preferences)
+        optimizer.cache_model()
+        # If we found solutions, add semester and year info to the solutions
+        if result['success'] and 'solutions' in result and result['solutions'] and len(result['solutions']) > 0 and 'schedule' in result['solutions'][0]:
+            cursor = db_connection.cursor()
+            cursor.execute("""
+                SELECT DISTINCT ac.semester, ac.year 
+                FROM add_course ac
+                WHERE ac.student_id = %s AND ac.status = 'enrolled'
+                ORDER BY ac.year DESC, ac.semester DESC
+                LIMIT 1
+            """, (student_id,))
+            semester_info = cursor.fetchone()
+            if semester_info:
+                for solution in result['solutions']:
+                    solution['semester'] = semester_info[0]
+                    solution['year'] = semester_info[1]
+            cursor.close()
+    else:
+        result = optimizer.solve(preferences)
+        optimizer.cache_model()
+        
+        # Get semester and year info for display
+        if result['success'] and 'schedule' in result and result['schedule']:
+            cursor = db_connection.cursor()
+            cursor.execute("""
+                SELECT DISTINCT ac.semester, ac.year 
+                FROM add_course ac
+                WHERE ac.student_id = %s AND ac.status = 'enrolled'
+                ORDER BY ac.year DESC, ac.semester DESC
+                LIMIT 1
+            """, (student_id,))
+            semester_info = cursor.fetchone()
+            if semester_info:
+                result['semester'] = semester_info[0]
+                result['year'] = semester_info[1]
+            cursor.close()
+        
+    return result
+
+
+def check_selection_feasibility(student_id, db_connection, course_selection):
+    """Whether a course selection (see ScheduleOptimizer.course_selection) has a valid schedule.
+
+    Runs ScheduleOptimizer.check_feasibility, so only the timing constraints
+    are checked; a failed answer carries the minimal set of clashing courses
+    under 'conflicts' and the time slots they compete for under 'clashes'.
+    Nothing is written to add_course. Answers are memoized in the feasibility
+    cache on the timetable version and ScheduleOptimizer.feasibility_key, so
+    toggling back to a selection already checked costs no solve.
+    """
+    try:
+        optimizer = ScheduleOptimizer(db_connection, student_id, course_selection)
+        optimizer.load_data()
+
+        cache = get_feasibility_cache()
+        version = optimizer.timetable.version
+        key = optimizer.feasibility_key()
+        cached = cache.get(version, key)
+        if cached is not None:
+            current_app.logger.debug(f"Feasibility cache hit for student {student_id}")
+            return cached
+
+        check = optimizer.check_feasibility()
+        feasibility = {'success': check['feasible']}
+        if not check['feasible']:
+            feasibility['message'] = check.get('message') or 'No conflict-free schedule exists for the selected courses'
+            feasibility['conflicts'] = check['conflicts']
+            feasibility['clashes'] = check['clashes']
+        cache.put(version, key, feasibility)
+        return feasibility
+
+    except Exception as e:
+        current_app.logger.error(f"Error checking schedule feasibility: {str(e)}", exc_info=True)
+        return {
+            'success': False,
+            'message': f'Error optimizing schedule: {str(e)}'
+        }
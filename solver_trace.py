@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import deque
+from flask import g, has_request_context, request
+
+# Trace entries kept per process; the oldest are dropped first
+TRACE_BUFFER_SIZE = 2000
+
+
+def trace_requested():
+    """Whether the current request or job asked for a solver trace.
+
+    A request asks with ?trace=1; a background job runs traced when its
+    handler sets g.solver_trace from the flag captured at submission.
+    """
+    if g.get('solver_trace'):
+        return True
+    return has_request_context() and request.args.get('trace') in ('1', 'true')
+
+
+class SolverTrace:
+    """In-memory ring buffer of optimizer trace entries, off unless asked for.
+
+    Tracing is on for a solve when the request asks for it (trace_requested)
+    or when an admin enabled it for the student. Both the buffer and the
+    traced students belong to one process, so under several app workers an
+    admin sees the entries of the worker that answers.
+    """
+
+    def __init__(self, maxlen=TRACE_BUFFER_SIZE):
+        self._entries = deque(maxlen=maxlen)
+        self._students = set()
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    # Student ids are compared as strings: routes and sessions pass both forms
+    def is_enabled(self, student_id):
+        return str(student_id) in self._students or trace_requested()
+
+    def enable_student(self, student_id):
+        with self._lock:
+            self._students.add(str(student_id))
+
+    def disable_student(self, student_id):
+        with self._lock:
+            self._students.discard(str(student_id))
+
+    def traced_students(self):
+        with self._lock:
+            return sorted(self._students)
+
+    def record(self, student_id, event, **data):
+        with self._lock:
+            self._sequence += 1
+            self._entries.append({
+                'sequence': self._sequence,
+                'time': time.time(),
+                'student_id': student_id,
+                'event': event,
+                'data': data,
+            })
+
+    def entries(self, student_id=None, limit=None):
+        """Newest entries first, optionally for one student only"""
+        with self._lock:
+            entries = [entry for entry in reversed(self._entries)
+                       if student_id is None or str(entry['student_id']) == str(student_id)]
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_trace = SolverTrace()
+
+
+def get_solver_trace():
+    """Return the process-wide solver trace"""
+    return _trace
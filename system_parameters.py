@@ -0,0 +1,200 @@
+import threading
+from flask import current_app
+from cache_versions import get_cache_version, bump_cache_version, PARAMETERS
+
+# Columns of system_parameters read by the application, in table order
+PARAMETER_COLUMNS = (
+    "max_courses_per_semester", "min_credit_percentage_major",
+    "min_gpa_acct", "min_gpa_ba", "min_gpa_fin", "min_gpa_it", "min_gpa_mrk",
+    "max_forgiveness_uses", "max_probation_board", "max_probation_total",
+    "min_cumulative_gpa", "minimum_grad_credit", "minimum_grad_cgpa", "maximum_forgive_grade",
+)
+
+# Columns a student_parameters_overrides row can override, in table order
+OVERRIDE_COLUMNS = (
+    "max_courses_per_semester", "min_credit_percentage_major",
+    "min_gpa_acct", "min_gpa_ba", "min_gpa_fin", "min_gpa_it", "min_gpa_mrk",
+    "max_forgiveness_uses", "max_probation_board", "max_probation_total",
+)
+
+# Minimum specialized GPA column of each major
+MIN_GPA_COLUMNS = {
+    'ACCT': 'min_gpa_acct',
+    'BA': 'min_gpa_ba',
+    'FIN': 'min_gpa_fin',
+    'IT': 'min_gpa_it',
+    'MRK': 'min_gpa_mrk',
+}
+
+
+def _int(value):
+    return int(value) if value is not None else None
+
+
+def _float(value):
+    return float(value) if value is not None else None
+
+
+class Parameters:
+    """Typed, read-only view of one set of parameter values.
+
+    Integer columns are ints and DECIMAL columns floats; a column that is
+    NULL (or has no system_parameters row at all) reads as None, so callers
+    keep applying their own defaults. configured is False when there was
+    neither a system_parameters row nor an override to read from.
+    """
+
+    def __init__(self, values, configured):
+        self.values = values
+        self.configured = configured
+
+    @property
+    def max_courses_per_semester(self):
+        return _int(self.values.get('max_courses_per_semester'))
+
+    @property
+    def min_credit_percentage_major(self):
+        return _float(self.values.get('min_credit_percentage_major'))
+
+    @property
+    def min_gpa_acct(self):
+        return _float(self.values.get('min_gpa_acct'))
+
+    @property
+    def min_gpa_ba(self):
+        return _float(self.values.get('min_gpa_ba'))
+
+    @property
+    def min_gpa_fin(self):
+        return _float(self.values.get('min_gpa_fin'))
+
+    @property
+    def min_gpa_it(self):
+        return _float(self.values.get('min_gpa_it'))
+
+    @property
+    def min_gpa_mrk(self):
+        return _float(self.values.get('min_gpa_mrk'))
+
+    @property
+    def min_gpa_map(self):
+        """Minimum specialized GPA of each major code, None where unset"""
+        return {major: _float(self.values.get(column)) for major, column in MIN_GPA_COLUMNS.items()}
+
+    @property
+    def max_forgiveness_uses(self):
+        return _int(self.values.get('max_forgiveness_uses'))
+
+    @property
+    def max_probation_board(self):
+        return _int(self.values.get('max_probation_board'))
+
+    @property
+    def max_probation_total(self):
+        return _int(self.values.get('max_probation_total'))
+
+    @property
+    def min_cumulative_gpa(self):
+        return _float(self.values.get('min_cumulative_gpa'))
+
+    @property
+    def minimum_grad_credit(self):
+        return _int(self.values.get('minimum_grad_credit'))
+
+    @property
+    def minimum_grad_cgpa(self):
+        return _float(self.values.get('minimum_grad_cgpa'))
+
+    @property
+    def maximum_forgive_grade(self):
+        return _float(self.values.get('maximum_forgive_grade'))
+
+
+class ParameterSnapshot:
+    """Read-only, in-memory copy of system_parameters and student_parameters_overrides.
+
+    One snapshot is shared by every request in the process and is replaced
+    only when the 'parameters' version stamp in cache_versions changes.
+    system holds the current system_parameters row (the most recently
+    updated one) and overrides maps a student id to the non-NULL columns of
+    their override row; for_student merges the two column by column, an
+    override winning over the system value.
+    """
+
+    def __init__(self, version, system_row, override_rows):
+        self.version = version
+        self.system = Parameters(dict(zip(PARAMETER_COLUMNS, system_row)) if system_row else {},
+                                 system_row is not None)
+        self.overrides = {}
+        for student_id, *values in override_rows:
+            self.overrides[student_id] = {column: value for column, value in zip(OVERRIDE_COLUMNS, values)
+                                          if value is not None}
+
+    def for_student(self, student_id):
+        """The system parameters with the student's overrides applied"""
+        try:
+            override = self.overrides.get(int(student_id))
+        except (TypeError, ValueError):
+            override = None
+        if override is None:
+            return self.system
+        return Parameters(dict(self.system.values, **override), True)
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_parameter_snapshot(db_connection):
+    """Return the process-wide parameter snapshot, reloading it if the version stamp moved.
+
+    Costs one primary-key lookup on cache_versions when the snapshot is current.
+    If the version cannot be read a fresh, uncached snapshot is loaded.
+    """
+    global _snapshot
+    cursor = db_connection.cursor()
+    try:
+        version = get_cache_version(cursor, PARAMETERS)
+        snapshot = _snapshot
+        if version is not None and snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if version is not None and snapshot is not None and snapshot.version == version:
+                return snapshot
+            snapshot = _load_snapshot(cursor, version)
+            if version is not None:
+                _snapshot = snapshot
+            return snapshot
+    finally:
+        cursor.close()
+
+
+def resolve_parameters(db_connection, student_id=None):
+    """The system parameters, with the student's overrides applied if a student id is given"""
+    snapshot = get_parameter_snapshot(db_connection)
+    if student_id is None:
+        return snapshot.system
+    return snapshot.for_student(student_id)
+
+
+def invalidate_system_parameters(cursor):
+    """Bump the parameters version so every worker reloads its snapshot on next use"""
+    bump_cache_version(cursor, PARAMETERS)
+
+
+def _load_snapshot(cursor, version):
+    columns = ", ".join(f"`{column}`" for column in PARAMETER_COLUMNS)
+    cursor.execute(f"SELECT {columns} FROM system_parameters ORDER BY last_updated DESC LIMIT 1")
+    system_row = cursor.fetchone()
+    columns = ", ".join(f"`{column}`" for column in OVERRIDE_COLUMNS)
+    cursor.execute(f"SELECT student_id, {columns} FROM student_parameters_overrides")
+    snapshot = ParameterSnapshot(version, system_row, cursor.fetchall())
+
+    if system_row is None:
+        current_app.logger.warning("No system_parameters row found")
+    current_app.logger.info(
+        f"Loaded system parameters version {version}: {len(snapshot.overrides)} student overrides")
+
+    return snapshot
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+# Days in calendar order; the days of a grid are sorted by it
+WEEK_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# The calendar the timetable used before the time_grid table: six days of
+# five slots, numbered day by day from 1. Used when the table is missing.
+DEFAULT_DAYS = WEEK_DAYS[:6]
+DEFAULT_SLOT_TIMES = (
+    (timedelta(hours=8, minutes=30), timedelta(hours=10)),
+    (timedelta(hours=10), timedelta(hours=11, minutes=30)),
+    (timedelta(hours=11, minutes=30), timedelta(hours=13)),
+    (timedelta(hours=13, minutes=30), timedelta(hours=15)),
+    (timedelta(hours=15), timedelta(hours=16, minutes=30)),
+)
+
+
+class TimeGrid:
+    """The weekly calendar of time slots the timetable is laid out on.
+
+    Built from time_grid rows (time_slot, week_day, start_time, end_time).
+    Days follow WEEK_DAYS and a day's slots their start time, so slot numbers
+    only identify slots: a slot added to a day later can take the next free
+    number. days holds each day's slots in order; position is a slot's place
+    in its day, and order its place in the week (1-based), which is what
+    lecture chronology (C3) compares. Days may have different slot counts.
+    """
+
+    def __init__(self, rows):
+        def calendar(row):
+            time_slot, week_day, start_time, _ = row
+            day_rank = WEEK_DAYS.index(week_day) if week_day in WEEK_DAYS else len(WEEK_DAYS)
+            return day_rank, week_day, start_time, time_slot
+
+        self.day_names = []
+        self.days = []
+        self.day_of = {}
+        self.position = {}
+        self.order = {}
+        self.times = {}
+        for time_slot, week_day, start_time, end_time in sorted(rows, key=calendar):
+            time_slot = int(time_slot)
+            if not self.day_names or self.day_names[-1] != week_day:
+                self.day_names.append(week_day)
+                self.days.append([])
+            self.day_of[time_slot] = len(self.days) - 1
+            self.position[time_slot] = len(self.days[-1])
+            self.days[-1].append(time_slot)
+            self.order[time_slot] = len(self.order) + 1
+            self.times[time_slot] = (week_day, start_time, end_time)
+        self.slots = [time_slot for day in self.days for time_slot in day]
+        self.slots_per_day = max((len(day) for day in self.days), default=0)
+
+    def __contains__(self, time_slot):
+        return time_slot in self.order
+
+    def __len__(self):
+        return len(self.slots)
+
+
+def default_time_grid():
+    """The six-day, five-slot grid the time_grid table is seeded with"""
+    rows = []
+    for day, week_day in enumerate(DEFAULT_DAYS):
+        for position, (start_time, end_time) in enumerate(DEFAULT_SLOT_TIMES):
+            rows.append((day * len(DEFAULT_SLOT_TIMES) + position + 1, week_day, start_time, end_time))
+    return TimeGrid(rows)
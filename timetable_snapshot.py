@@ -0,0 +1,155 @@
+import threading
+from collections import defaultdict
+from flask import current_app
+from cache_versions import get_cache_version, bump_cache_version, TIMETABLE
+from time_grid import TimeGrid, default_time_grid
+
+# Columns loaded from the schedule table; the optimizer and the solution
+# extraction both read their options from these rows.
+SCHEDULE_COLUMNS = (
+    "id", "course_code", "week_day", "start_time", "end_time",
+    "professor", "classroom", "group", "session_type",
+    "course_index", "session_number_index", "time_slot_index",
+    "professor_index", "Tutprof_index", "lect_prof_index",
+)
+
+
+class TimetableSnapshot:
+    """Read-only, in-memory copy of the schedule, course_sessions, schedule_parameters and time_grid tables.
+
+    One snapshot is shared by every ScheduleOptimizer in the process and is
+    replaced only when the 'timetable' version stamp in cache_versions changes.
+    The option dicts it hands out are shared: callers must not mutate them.
+    Options in a time slot the grid does not have are left out.
+    """
+
+    def __init__(self, version, schedule_rows, course_sessions, schedule_parameters, grid=None):
+        self.version = version
+        self.course_sessions = course_sessions
+        self.schedule_parameters = schedule_parameters
+        self.grid = grid if grid is not None else default_time_grid()
+
+        self.options_by_course = defaultdict(list)
+        self.course_indices = {}
+        off_grid = 0
+        for option in schedule_rows:
+            if option['time_slot_index'] not in self.grid:
+                off_grid += 1
+                continue
+            course_code = option['course_code']
+            self.options_by_course[course_code].append(option)
+            if course_code not in self.course_indices and option.get('course_index') is not None:
+                self.course_indices[course_code] = option['course_index']
+        if off_grid:
+            current_app.logger.warning(f"{off_grid} schedule rows are in time slots missing from time_grid")
+
+    def options_for(self, course_codes):
+        """All schedule options of the given courses, in table order per course"""
+        options = []
+        for course_code in course_codes:
+            options.extend(self.options_by_course.get(course_code, ()))
+        return options
+
+    def sessions_for(self, course_codes):
+        return {code: self.course_sessions[code] for code in course_codes if code in self.course_sessions}
+
+    def indices_for(self, course_codes):
+        return {code: self.course_indices[code] for code in course_codes if code in self.course_indices}
+
+    @property
+    def row_count(self):
+        return sum(len(options) for options in self.options_by_course.values())
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_timetable_snapshot(db_connection):
+    """Return the process-wide timetable snapshot, reloading it if the version stamp moved.
+
+    Costs one primary-key lookup on cache_versions when the snapshot is current.
+    If the version cannot be read (e.g. the table is missing) a fresh, uncached
+    snapshot is loaded so results are never stale.
+    """
+    global _snapshot
+    cursor = db_connection.cursor()
+    try:
+        version = get_cache_version(cursor, TIMETABLE)
+        snapshot = _snapshot
+        if version is not None and snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if version is not None and snapshot is not None and snapshot.version == version:
+                return snapshot
+            snapshot = _load_snapshot(cursor, version)
+            if version is not None:
+                _snapshot = snapshot
+            return snapshot
+    finally:
+        cursor.close()
+
+
+def invalidate_timetable_snapshot(cursor):
+    """Bump the timetable version so every worker reloads its snapshot on next use"""
+    bump_cache_version(cursor, TIMETABLE)
+
+
+def _load_snapshot(cursor, version):
+    columns = ", ".join(f"`{column}`" for column in SCHEDULE_COLUMNS)
+    cursor.execute(f"SELECT {columns} FROM schedule ORDER BY id")
+    schedule_rows = []
+    for row in cursor.fetchall():
+        option = dict(zip(SCHEDULE_COLUMNS, row))
+        # Make sure time_slot_index is an integer
+        if option['time_slot_index'] is not None:
+            try:
+                option['time_slot_index'] = int(option['time_slot_index'])
+            except (ValueError, TypeError):
+                current_app.logger.warning(f"Invalid time_slot_index value: {option['time_slot_index']} for course {option.get('course_code')}")
+        schedule_rows.append(option)
+
+    cursor.execute("""
+        SELECT course_code, lecture_sessions, tutorial_sessions, total_sessions
+        FROM course_sessions
+    """)
+    course_sessions = {}
+    for row in cursor.fetchall():
+        course_sessions[row[0]] = {
+            'lecture_sessions': row[1],
+            'tutorial_sessions': row[2],
+            'total_sessions': row[3]
+        }
+
+    # Read the whole row by column name so optional columns added later are
+    # picked up without breaking deployments that do not have them yet
+    cursor.execute("SELECT * FROM schedule_parameters LIMIT 1")
+    parameters_row = cursor.fetchone()
+    schedule_parameters = None
+    if parameters_row:
+        parameter_columns = [col[0] for col in cursor.description]
+        schedule_parameters = dict(zip(parameter_columns, parameters_row))
+
+    grid = _load_time_grid(cursor)
+
+    current_app.logger.info(
+        f"Loaded timetable snapshot version {version}: {len(schedule_rows)} schedule rows, "
+        f"{len(course_sessions)} course session definitions, {len(grid)} time slots")
+
+    return TimetableSnapshot(version, schedule_rows, course_sessions, schedule_parameters, grid)
+
+
+def _load_time_grid(cursor):
+    """The time_grid table as a TimeGrid, or the default grid if the table is missing or empty"""
+    try:
+        cursor.execute("SELECT time_slot, week_day, start_time, end_time FROM time_grid")
+        rows = cursor.fetchall()
+    except Exception as e:
+        current_app.logger.warning(f"Could not read time_grid, using the default grid: {str(e)}")
+        return default_time_grid()
+    if not rows:
+        current_app.logger.warning("time_grid is empty, using the default grid")
+        return default_time_grid()
+    return TimeGrid(rows)